@@ -0,0 +1,73 @@
+"""Compare per-target curve dicts with a float32 altitude matrix.
+
+Builds altitude curves for every forecast candidate over one night, either
+as ``[{time, alt}]`` lists for every target (how the telescope matcher stores
+them) or as one ``AltitudeMatrix`` with curves sliced for the emitted top
+``--emit`` only, and reports time and peak allocated memory:
+
+    python examples/perf_benchmark_altitude_matrix.py --emit 20
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pytz
+from _bootstrap import ensure_project_root
+from astropy.time import Time
+
+ensure_project_root()
+
+from src.altitude_matrix import compute_altitude_matrix, night_grid  # noqa: E402
+from src.celestial import _load_objects  # noqa: E402
+from src.observer_frame import ObserverFrame  # noqa: E402
+from src.utils import create_earth_location  # noqa: E402
+
+
+def _measure(func) -> tuple[float, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = (time.perf_counter() - started) * 1000
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Altitude matrix benchmark')
+    parser.add_argument('--objects', type=int, default=4000)
+    parser.add_argument('--emit', type=int, default=20)
+    args = parser.parse_args()
+
+    location = create_earth_location(lat=40.7, lon=-74.0)
+    moment = pytz.timezone('America/New_York').localize(datetime(2024, 1, 20, 22))
+    catalog = _load_objects()
+    ra = catalog.column('ra')[: args.objects].astype(np.float64)
+    dec = catalog.column('dec')[: args.objects].astype(np.float64)
+    grid = night_grid(location, moment)
+
+    def dict_curves():
+        alt, _ = ObserverFrame(location, Time(grid, format='unix')).altaz(ra, dec)
+        curves = [
+            [{'time': float(t), 'alt': round(float(a), 1)} for t, a in zip(grid, row, strict=True)]
+            for row in alt
+        ]
+        return curves[: args.emit]
+
+    def matrix_curves():
+        matrix = compute_altitude_matrix(ra, dec, location, grid)
+        return [matrix.curve(index) for index in range(args.emit)]
+
+    matrix_curves()  # load ERFA tables outside the timed runs
+    dict_ms, dict_mb = _measure(dict_curves)
+    matrix_ms, matrix_mb = _measure(matrix_curves)
+    print(f'{len(ra)} objects x {len(grid)} steps, emitting {args.emit}')
+    print(f'  dict curves for all : {dict_ms:7.1f} ms  peak {dict_mb:6.1f} MB')
+    print(f'  float32 matrix      : {matrix_ms:7.1f} ms  peak {matrix_mb:6.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Compare cold-start cost of the JSON and memory-mapped binary catalogs.
+
+Each measurement runs in a fresh interpreter so load time and resident memory
+reflect what a newly started worker pays:
+
+    python examples/perf_benchmark_catalog.py --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from _bootstrap import ensure_project_root
+
+PROJECT_ROOT = ensure_project_root()
+
+_PROBE = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+import numpy
+from src.catalog import load_columnar_catalog
+from src.paths import DATA_DIR
+
+def rss_kb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * resource.getpagesize() // 1024
+
+mode = {mode!r}
+before = rss_kb()
+start = time.perf_counter()
+if mode == 'json':
+    with (DATA_DIR / 'objects.json').open(encoding='utf-8') as f:
+        objects = json.load(f)
+    ra = [obj['ra'] for obj in objects]
+else:
+    objects = load_columnar_catalog(DATA_DIR / 'objects.bin')
+    ra = objects.column('ra')
+load_ms = (time.perf_counter() - start) * 1000
+scan_start = time.perf_counter()
+near = sum(1 for value in ra if abs(value - 180.0) <= 120) if mode == 'json' else int(
+    (abs(ra - 180.0) <= 120).sum()
+)
+scan_ms = (time.perf_counter() - scan_start) * 1000
+print(json.dumps({{'load_ms': load_ms, 'scan_ms': scan_ms, 'rss_kb': rss_kb() - before,
+                   'objects': len(objects)}}))
+"""
+
+
+def measure(mode: str) -> dict:
+    """Run one probe in a clean interpreter and return its metrics."""
+    code = _PROBE.format(root=str(PROJECT_ROOT), mode=mode)
+    output = subprocess.run(
+        [sys.executable, '-c', code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Catalog load benchmark')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for mode in ('json', 'binary'):
+        runs = [measure(mode) for _ in range(args.repeat)]
+        print(
+            f'{mode:>6}: objects={runs[0]["objects"]} '
+            f'load_ms={statistics.median(r["load_ms"] for r in runs):.2f} '
+            f'scan_ms={statistics.median(r["scan_ms"] for r in runs):.2f} '
+            f'rss_delta_kb={statistics.median(r["rss_kb"] for r in runs):.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
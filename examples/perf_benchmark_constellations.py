@@ -0,0 +1,70 @@
+"""Constellation lookups: per-coordinate vs batched, and indexed catalog queries.
+
+Identifies the constellation of ``--points`` random coordinates one
+``get_constellation`` call at a time and in one batched call, then times
+finding Cygnus' catalog objects from the precomputed column against
+computing every object's constellation per request, and the full
+"objects in Cygnus above 30°" query:
+
+    python examples/perf_benchmark_constellations.py --points 2000
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+import astropy.units as u
+import numpy as np
+import pytz
+from _bootstrap import ensure_project_root
+from astropy.coordinates import SkyCoord, get_constellation
+
+ensure_project_root()
+
+from src.celestial import _load_objects, constellation_objects  # noqa: E402
+from src.constellations import identify_constellations  # noqa: E402
+from src.utils import create_earth_location  # noqa: E402
+
+
+def _ms(func, repeat: int = 1) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return 1000 * (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Constellation lookup benchmark')
+    parser.add_argument('--points', type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    ra = rng.uniform(0.0, 360.0, args.points)
+    dec = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, args.points)))
+    identify_constellations(ra[:1], dec[:1])  # load the boundary table
+
+    scalar = _ms(
+        lambda: [get_constellation(SkyCoord(r * u.deg, d * u.deg)) for r, d in zip(ra, dec)]
+    )
+    batch = _ms(lambda: identify_constellations(ra, dec), repeat=5)
+    print(f'{args.points} coordinates')
+    print(f'  one call each : {scalar:8.1f} ms')
+    print(f'  one batch     : {batch:8.1f} ms  ({scalar / batch:.0f}x)')
+
+    location = create_earth_location(lat=40.7, lon=-74.0)
+    moment = pytz.timezone('America/New_York').localize(datetime(2024, 8, 10, 22))
+    catalog = _load_objects()
+    catalog.constellation_index
+    lookup = _ms(lambda: catalog.in_constellation('Cyg'), repeat=1000)
+    scan = _ms(
+        lambda: identify_constellations(catalog.values('ra'), catalog.values('dec'), True) == 'Cyg'
+    )
+    query = _ms(lambda: constellation_objects('Cygnus', location, moment, 30.0), repeat=20)
+    print(f'Objects in Cygnus ({len(catalog)} catalog objects)')
+    print(f'  members, precomputed column : {lookup * 1000:8.1f} µs')
+    print(f'  members, computed per call  : {scan:8.1f} ms')
+    print(f'  full query above 30°        : {query:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
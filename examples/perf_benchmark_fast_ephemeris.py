@@ -0,0 +1,69 @@
+"""Compare the astropy ('full') and analytic ('fast') precision modes.
+
+Runs the nightly forecast and a batched position query for a number of
+distinct nights, so the shared ephemeris cache cannot hide the cost:
+
+    python examples/perf_benchmark_fast_ephemeris.py --nights 10
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+
+import astropy.units as u
+import numpy as np
+from _bootstrap import ensure_project_root
+from astropy.coordinates import EarthLocation
+
+ensure_project_root()
+
+from src.celestial import calculate_nightly_forecast, celestial_positions  # noqa: E402
+from src.ephemeris import get_ephemeris_cache  # noqa: E402
+
+OBJECTS = ['sun', 'moon', 'mars', 'jupiter', 'saturn', 'M31', 'M42', 'vega', 'sirius']
+
+
+def _run(precision: str, nights: list[datetime], location: EarthLocation) -> tuple[float, float]:
+    get_ephemeris_cache().clear()
+    start = time.perf_counter()
+    for night in nights:
+        calculate_nightly_forecast(location, night, limit=20, precision=precision)
+    forecast_ms = (time.perf_counter() - start) * 1000 / len(nights)
+
+    start = time.perf_counter()
+    for night in nights:
+        times = [night + timedelta(minutes=15 * i) for i in range(48)]
+        celestial_positions(OBJECTS, location, times, precision=precision)
+    positions_ms = (time.perf_counter() - start) * 1000 / len(nights)
+    return forecast_ms, positions_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precision mode benchmark')
+    parser.add_argument('--nights', type=int, default=10)
+    args = parser.parse_args()
+
+    location = EarthLocation(lat=40.0 * u.deg, lon=-74.0 * u.deg)
+    first = datetime(2024, 6, 16, 2, 0, tzinfo=UTC)
+    nights = [first + timedelta(days=int(d)) for d in np.arange(args.nights) * 37]
+
+    # Warm up catalog, IERS tables and name resolution outside the timed runs.
+    calculate_nightly_forecast(location, first - timedelta(days=400), limit=20)
+    celestial_positions(OBJECTS, location, [first - timedelta(days=400)])
+
+    full_forecast, full_positions = _run('full', nights, location)
+    fast_forecast, fast_positions = _run('fast', nights, location)
+
+    print(f'{args.nights} nights, {len(OBJECTS)} objects x 48 times for positions')
+    print(
+        f'  forecast  full: {full_forecast:7.1f} ms  fast: {fast_forecast:7.1f} ms'
+        f'  ({full_forecast / fast_forecast:.1f}x)'
+    )
+    print(
+        f'  positions full: {full_positions:7.1f} ms  fast: {fast_positions:7.1f} ms'
+        f'  ({full_positions / fast_positions:.1f}x)'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Compare a multi-night forecast with one forecast call per night.
+
+Both sides read the same warm almanac and ephemeris caches, so the numbers
+show the per-night pipeline work that ``nights=N`` shares:
+
+    python examples/perf_benchmark_multi_night.py --nights 14 --precision full
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import pytz
+from _bootstrap import ensure_project_root
+
+ensure_project_root()
+
+from src.celestial import calculate_nightly_forecast  # noqa: E402
+from src.utils import create_earth_location  # noqa: E402
+
+
+def _best_of(runs: int, func) -> float:
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Multi-night forecast benchmark')
+    parser.add_argument('--nights', type=int, default=14)
+    parser.add_argument('--precision', choices=['full', 'fast'], default='full')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    location = create_earth_location(lat=40.7, lon=-74.0)
+    first = pytz.timezone('America/New_York').localize(datetime(2024, 3, 1, 22))
+
+    def looped():
+        for day in range(args.nights):
+            calculate_nightly_forecast(
+                location, first + timedelta(days=day), limit=20, precision=args.precision
+            )
+
+    def batched():
+        calculate_nightly_forecast(
+            location, first, limit=20, precision=args.precision, nights=args.nights
+        )
+
+    # Fill the almanac/ephemeris caches and load the catalog outside the timed runs.
+    batched()
+    looped()
+
+    loop_ms = _best_of(args.runs, looped)
+    batch_ms = _best_of(args.runs, batched)
+    print(f'{args.nights} nights, precision={args.precision}')
+    print(f'  one call per night: {loop_ms:7.1f} ms')
+    print(f'  nights={args.nights:<2}         : {batch_ms:7.1f} ms  ({loop_ms / batch_ms:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Compare closed-form catalog visibility with the altitude-grid approach.
+
+For one night, computes transit time/altitude and the hours above 20° inside
+astronomical darkness for every catalog object, three ways:
+
+- analytic: ``src.observability.catalog_observability`` (one NumPy pass)
+- observer-frame grid: every object at every 15-minute step through
+  ``ObserverFrame`` (the fastest grid the forecast has)
+- astropy grid: ``SkyCoord.transform_to(AltAz)`` per step, as the telescope
+  matcher builds its altitude curves (run on a subset and scaled up)
+
+    python examples/perf_benchmark_observability.py --step-minutes 15
+"""
+
+import argparse
+import time
+from datetime import date, datetime
+
+import astropy.units as u
+import numpy as np
+import pytz
+from _bootstrap import ensure_project_root
+from astropy.coordinates import AltAz, EarthLocation, SkyCoord
+from astropy.time import Time
+
+ensure_project_root()
+
+from src.almanac import compute_night_almanac  # noqa: E402
+from src.celestial import _load_objects  # noqa: E402
+from src.observability import catalog_observability, night_windows  # noqa: E402
+from src.observer_frame import ObserverFrame  # noqa: E402
+
+LAT, LON = 40.7, -74.0
+ZONE = pytz.timezone('America/New_York')
+ASTROPY_SUBSET = 500
+
+
+def _grid_summary(alt: np.ndarray, grid: np.ndarray, step_hours: float):
+    peak = np.argmax(alt, axis=1)
+    return grid[peak], alt.max(axis=1), (alt > 20.0).sum(axis=1) * step_hours
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Catalog observability benchmark')
+    parser.add_argument('--step-minutes', type=float, default=15.0)
+    args = parser.parse_args()
+
+    catalog = _load_objects()
+    ra = catalog.column('ra').astype(np.float64)
+    dec = catalog.column('dec').astype(np.float64)
+    location = EarthLocation.from_geodetic(LON * u.deg, LAT * u.deg)
+    almanac = compute_night_almanac(LAT, LON, date(2024, 1, 20), ZONE)
+    windows = night_windows(almanac)
+    start, end = windows[0]
+    midnight = ZONE.localize(datetime(2024, 1, 21)).timestamp()
+    step = args.step_minutes * 60.0
+    grid = np.arange(start, end, step) + step / 2
+
+    catalog_observability(catalog, LAT, LON, midnight, windows)  # import/JIT warm-up
+    started = time.perf_counter()
+    analytic = catalog_observability(catalog, LAT, LON, midnight, windows)
+    analytic_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    alt, _ = ObserverFrame(location, Time(grid, format='unix')).altaz(ra, dec)
+    grid_transit, grid_peak, grid_hours = _grid_summary(alt, grid, step / 3600.0)
+    frame_ms = (time.perf_counter() - started) * 1000
+
+    subset = slice(0, ASTROPY_SUBSET)
+    coords = SkyCoord(ra=ra[subset] * u.deg, dec=dec[subset] * u.deg)
+    started = time.perf_counter()
+    for moment in Time(grid, format='unix'):
+        coords.transform_to(AltAz(obstime=moment, location=location))
+    astropy_ms = (time.perf_counter() - started) * 1000 * len(ra) / ASTROPY_SUBSET
+
+    # Objects that culminate inside the window, where the grid peak is a transit.
+    inside = (analytic.transit > start + step) & (analytic.transit < end - step)
+    transit_error = np.abs(grid_transit - analytic.transit)[inside] / 60.0
+    hours_error = np.abs(grid_hours - analytic.observable_hours)
+
+    print(f'{len(ra)} objects, {len(grid)} steps of {args.step_minutes:g} min')
+    print(f'  analytic            : {analytic_ms:8.1f} ms')
+    print(f'  observer-frame grid : {frame_ms:8.1f} ms  ({frame_ms / analytic_ms:.0f}x)')
+    print(f'  astropy grid (est.) : {astropy_ms:8.1f} ms  ({astropy_ms / analytic_ms:.0f}x)')
+    print(
+        f'  grid vs analytic    : transit within {transit_error.max():.1f} min, '
+        f'dark hours within {hours_error.max():.2f} h, '
+        f'peak altitude within {np.abs(grid_peak - analytic.transit_altitude)[inside].max():.2f}°'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Compare per-object position calls with the batched object × time transform.
+
+Mirrors a dashboard polling a few dozen objects at several timestamps:
+
+    python examples/perf_benchmark_positions.py --objects 30 --times 10
+"""
+
+import argparse
+import time
+
+import astropy.units as u
+from _bootstrap import ensure_project_root
+from astropy.coordinates import EarthLocation
+from astropy.time import Time
+
+ensure_project_root()
+
+from src.celestial import _load_objects, celestial_pos, celestial_positions  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch position benchmark')
+    parser.add_argument('--objects', type=int, default=30)
+    parser.add_argument('--times', type=int, default=10)
+    args = parser.parse_args()
+
+    location = EarthLocation(lat=40.0 * u.deg, lon=-74.0 * u.deg)
+    names = ['sun', 'moon', 'jupiter', 'saturn'] + [
+        obj['name'] for obj in _load_objects()[: max(args.objects - 4, 0)]
+    ]
+    names = names[: args.objects]
+    times = Time('2024-06-16 02:00:00') + list(range(args.times)) * u.min * 30
+
+    celestial_positions(names[:1], location, times[:1])  # warm up IERS/ephemeris caches
+
+    start = time.perf_counter()
+    for name in names:
+        for t in times:
+            celestial_pos(name, location, t)
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    celestial_positions(names, location, list(times))
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    print(f'{len(names)} objects x {len(times)} times')
+    print(f'  per-call loop: {loop_ms:8.1f} ms')
+    print(f'  batched      : {batch_ms:8.1f} ms  ({loop_ms / batch_ms:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Time to the first useful answer: one-shot vs streamed nightly forecast.
+
+Steps ``iter_nightly_forecast`` — what ``stream_nightly_forecast`` sends as
+notifications — and reports when the Moon/planet context, the first ranked
+deep-sky batch and the final result arrive, next to the one-shot
+``calculate_nightly_forecast``.  Each run uses a different night so the
+almanac and ephemeris caches do not hide the work:
+
+    python examples/perf_benchmark_streaming.py --batch-size 500 --repeat 5
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import pytz
+from _bootstrap import ensure_project_root
+
+ensure_project_root()
+
+from src.celestial import calculate_nightly_forecast, iter_nightly_forecast  # noqa: E402
+from src.utils import create_earth_location  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Streamed forecast latency benchmark')
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    location = create_earth_location(lat=40.7, lon=-74.0)
+    first = pytz.timezone('America/New_York').localize(datetime(2024, 3, 1, 22))
+    calculate_nightly_forecast(location, first - timedelta(days=1), args.limit)  # warm-up
+
+    one_shot, context, first_batch, complete = [], [], [], []
+    for day in range(args.repeat):
+        moment = first + timedelta(days=2 * day)
+        started = time.perf_counter()
+        calculate_nightly_forecast(location, moment + timedelta(days=1), args.limit)
+        one_shot.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for event in iter_nightly_forecast(location, moment, args.limit, None, args.batch_size):
+            elapsed = time.perf_counter() - started
+            if event['stage'] == 'context':
+                context.append(elapsed)
+            elif event['stage'] == 'deep_sky' and len(first_batch) <= day:
+                first_batch.append(elapsed)
+        complete.append(time.perf_counter() - started)
+
+    def ms(values: list[float]) -> str:
+        return f'{1000 * sum(values) / len(values):7.1f} ms'
+
+    print(f'Nightly forecast, limit={args.limit}, batch_size={args.batch_size}')
+    print(f'  one-shot result     : {ms(one_shot)}')
+    print(f'  streamed context    : {ms(context)}')
+    print(f'  streamed 1st batch  : {ms(first_batch)}')
+    print(f'  streamed complete   : {ms(complete)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Throughput of concurrent nightly forecasts: thread vs worker-process pools.
+
+Fires ``--requests`` forecasts at once through ``ComputeExecutor`` — the
+path the MCP tools take — with no pool (one thread per call, sharing the
+GIL) and with pools of each size in ``--workers``.  Pools are pre-warmed
+before timing, as the server does at startup:
+
+    python examples/perf_benchmark_workers.py --workers 1,4,8 --requests 32
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytz
+from _bootstrap import ensure_project_root
+
+ensure_project_root()
+
+from src.celestial import calculate_nightly_forecast  # noqa: E402
+from src.executor import ComputeExecutor  # noqa: E402
+from src.utils import create_earth_location  # noqa: E402
+
+
+async def _throughput(pool: ComputeExecutor, requests: int) -> float:
+    location = create_earth_location(lat=40.7, lon=-74.0)
+    first = pytz.timezone('America/New_York').localize(datetime(2024, 3, 1, 22))
+    # Different nights, so per-process almanac caches do not flatter either side.
+    moments = [first + timedelta(days=day) for day in range(requests)]
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(pool.run(calculate_nightly_forecast, location, moment, 20) for moment in moments)
+    )
+    return requests / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Worker pool throughput benchmark')
+    parser.add_argument('--workers', default='1,4,8', help='Comma-separated pool sizes')
+    parser.add_argument('--requests', type=int, default=32)
+    args = parser.parse_args()
+
+    print(f'{args.requests} concurrent forecasts on {os.cpu_count()} CPU(s)')
+    baseline = asyncio.run(_throughput(ComputeExecutor(0), args.requests))
+    print(f'  threads    : {baseline:6.1f} req/s')
+    for workers in (int(value) for value in args.workers.split(',')):
+        pool = ComputeExecutor(workers)
+        try:
+            pool.prewarm()
+            rate = asyncio.run(_throughput(pool, args.requests))
+        finally:
+            pool.shutdown()
+        print(f'  {workers:2d} workers : {rate:6.1f} req/s  ({rate / baseline:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,24 @@
+import argparse
+import importlib.util
 import json
+import re
+import sys
 from pathlib import Path
 from typing import Any
 
 import astropy.units as u
 import numpy as np
-from astropy.coordinates import SkyCoord
+from astropy.coordinates import SkyCoord, get_constellation
 from astroquery.simbad import Simbad
+from astroquery.vizier import Vizier
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.catalog import load_columnar_catalog, write_columnar_catalog
+
+DATA_DIR = PROJECT_ROOT / 'src' / 'data'
 
 # SIMBAD object types that indicate stars (point sources), not deep-sky objects.
 # When SIMBAD resolves an NGC/IC number to a star, we discard it.
@@ -365,6 +378,370 @@ def _download_catalog_objects(
     return result
 
 
+# ── bright stars ──────────────────────────────────────────────────────
+# Yale Bright Star Catalogue (VizieR V/50) joined with IAU proper names.
+
+# IAU (WGSN) proper names keyed by Harvard Revised (HR) number.
+_STAR_PROPER_NAMES: dict[int, str] = {
+    15: 'Alpheratz',
+    21: 'Caph',
+    39: 'Algenib',
+    99: 'Ankaa',
+    168: 'Schedar',
+    188: 'Diphda',
+    337: 'Mirach',
+    403: 'Ruchbah',
+    424: 'Polaris',
+    472: 'Achernar',
+    542: 'Segin',
+    553: 'Sheratan',
+    603: 'Almach',
+    617: 'Hamal',
+    681: 'Mira',
+    897: 'Acamar',
+    911: 'Menkar',
+    936: 'Algol',
+    1017: 'Mirfak',
+    1165: 'Alcyone',
+    1231: 'Zaurak',
+    1457: 'Aldebaran',
+    1577: 'Hassaleh',
+    1605: 'Almaaz',
+    1666: 'Cursa',
+    1708: 'Capella',
+    1713: 'Rigel',
+    1790: 'Bellatrix',
+    1791: 'Elnath',
+    1829: 'Nihal',
+    1852: 'Mintaka',
+    1865: 'Arneb',
+    1879: 'Meissa',
+    1903: 'Alnilam',
+    1948: 'Alnitak',
+    1956: 'Phact',
+    2004: 'Saiph',
+    2061: 'Betelgeuse',
+    2088: 'Menkalinan',
+    2286: 'Tejat',
+    2294: 'Mirzam',
+    2326: 'Canopus',
+    2421: 'Alhena',
+    2473: 'Mebsuta',
+    2491: 'Sirius',
+    2618: 'Adhara',
+    2693: 'Wezen',
+    2827: 'Aludra',
+    2845: 'Gomeisa',
+    2891: 'Castor',
+    2943: 'Procyon',
+    2990: 'Pollux',
+    3165: 'Naos',
+    3307: 'Avior',
+    3634: 'Suhail',
+    3685: 'Miaplacidus',
+    3699: 'Aspidiske',
+    3748: 'Alphard',
+    3982: 'Regulus',
+    4057: 'Algieba',
+    4295: 'Merak',
+    4301: 'Dubhe',
+    4357: 'Zosma',
+    4534: 'Denebola',
+    4554: 'Phecda',
+    4660: 'Megrez',
+    4662: 'Gienah',
+    4730: 'Acrux',
+    4757: 'Algorab',
+    4763: 'Gacrux',
+    4786: 'Kraz',
+    4825: 'Porrima',
+    4853: 'Mimosa',
+    4905: 'Alioth',
+    4915: 'Cor Caroli',
+    4932: 'Vindemiatrix',
+    5054: 'Mizar',
+    5056: 'Spica',
+    5062: 'Alcor',
+    5191: 'Alkaid',
+    5267: 'Hadar',
+    5288: 'Menkent',
+    5291: 'Thuban',
+    5340: 'Arcturus',
+    5459: 'Rigil Kentaurus',
+    5506: 'Izar',
+    5531: 'Zubenelgenubi',
+    5563: 'Kochab',
+    5685: 'Zubeneschamali',
+    5793: 'Alphecca',
+    5854: 'Unukalhai',
+    5953: 'Dschubba',
+    5984: 'Acrab',
+    6134: 'Antares',
+    6217: 'Atria',
+    6378: 'Sabik',
+    6406: 'Rasalgethi',
+    6527: 'Shaula',
+    6536: 'Rastaban',
+    6553: 'Sargas',
+    6556: 'Rasalhague',
+    6705: 'Eltanin',
+    6746: 'Alnasl',
+    6859: 'Kaus Media',
+    6879: 'Kaus Australis',
+    6913: 'Kaus Borealis',
+    7001: 'Vega',
+    7121: 'Nunki',
+    7194: 'Ascella',
+    7417: 'Albireo',
+    7525: 'Tarazed',
+    7557: 'Altair',
+    7790: 'Peacock',
+    7796: 'Sadr',
+    7924: 'Deneb',
+    8162: 'Alderamin',
+    8232: 'Sadalsuud',
+    8308: 'Enif',
+    8322: 'Deneb Algedi',
+    8414: 'Sadalmelik',
+    8425: 'Alnair',
+    8728: 'Fomalhaut',
+    8775: 'Scheat',
+    8781: 'Markab',
+    8974: 'Errai',
+}
+
+# BSC Greek-letter abbreviations → SIMBAD-style Bayer prefixes.
+_BSC_GREEK = {
+    'Alp': 'alf',
+    'Bet': 'bet',
+    'Gam': 'gam',
+    'Del': 'del',
+    'Eps': 'eps',
+    'Zet': 'zet',
+    'Eta': 'eta',
+    'The': 'tet',
+    'Iot': 'iot',
+    'Kap': 'kap',
+    'Lam': 'lam',
+    'Mu': 'mu',
+    'Nu': 'nu',
+    'Xi': 'ksi',
+    'Omi': 'omi',
+    'Pi': 'pi',
+    'Rho': 'rho',
+    'Sig': 'sig',
+    'Tau': 'tau',
+    'Ups': 'ups',
+    'Phi': 'phi',
+    'Chi': 'chi',
+    'Psi': 'psi',
+    'Ome': 'ome',
+}
+
+_BSC_NAME = re.compile(r'^\s*(\d+)?\s*([A-Z][a-z]{1,2})?\s*(\d)?\s*([A-Z][A-Za-z]{2})\s*$')
+
+
+def _parse_bsc_name(field: str) -> tuple[str | None, str | None]:
+    """Split a BSC ``Name`` field (e.g. ``' 9Alp CMa'``) into (flamsteed, bayer)."""
+    match = _BSC_NAME.match(field or '')
+    if not match:
+        return None, None
+    number, greek, index, constellation = match.groups()
+    flamsteed = f'{number} {constellation}' if number else None
+    bayer = None
+    if greek in _BSC_GREEK:
+        bayer = f'{_BSC_GREEK[greek]}{index or ""} {constellation}'
+    return flamsteed, bayer
+
+
+def _assign_constellations(records: list[dict[str, Any]]) -> None:
+    """Add the IAU constellation abbreviation of each star or object in-place (offline)."""
+    if not records:
+        return
+    coords = SkyCoord(
+        ra=[r['ra'] for r in records] * u.deg, dec=[r['dec'] for r in records] * u.deg
+    )
+    for record, constellation in zip(
+        records, get_constellation(coords, short_name=True), strict=True
+    ):
+        record['constellation'] = str(constellation)
+
+
+def download_bright_stars(max_magnitude: float = 6.5) -> list[dict[str, Any]]:
+    """Fetch BSC stars brighter than ``max_magnitude`` via VizieR."""
+    print(f'Downloading bright stars (V <= {max_magnitude}) via VizieR …')
+    vizier = Vizier(columns=['HR', 'Name', '_RAJ2000', '_DEJ2000', 'Vmag'], row_limit=-1)
+    try:
+        tables = vizier.query_constraints(catalog='V/50/catalog', Vmag=f'<={max_magnitude}')
+    except Exception as e:
+        print(f'Failed to download bright stars: {e}')
+        return []
+    if not tables:
+        print('Error: No results from VizieR for V/50.')
+        return []
+
+    stars: list[dict[str, Any]] = []
+    for row in tables[0]:
+        ra = _parse_float(row['_RAJ2000'])
+        dec = _parse_float(row['_DEJ2000'])
+        if ra is None or dec is None:
+            continue
+        hr = int(row['HR'])
+        flamsteed, bayer = _parse_bsc_name(str(row['Name']))
+        stars.append(
+            {
+                'name': _STAR_PROPER_NAMES.get(hr),
+                'bayer': bayer,
+                'flamsteed': flamsteed,
+                'hr': hr,
+                'ra': ra,
+                'dec': dec,
+                'magnitude': _parse_float(row['Vmag']),
+            }
+        )
+    print(f'{len(stars):,} stars found.')
+    return stars
+
+
+# Greek letters of the IAU designations bundled with starplot → SIMBAD abbreviations.
+_GREEK_LETTERS = dict(
+    zip(
+        'αβγδεζηθικλμνξοπρστυφχψω',
+        [
+            'alf', 'bet', 'gam', 'del', 'eps', 'zet', 'eta', 'tet', 'iot', 'kap', 'lam', 'mu',
+            'nu', 'ksi', 'omi', 'pi', 'rho', 'sig', 'tau', 'ups', 'phi', 'chi', 'psi', 'ome',
+        ],
+        strict=True,
+    )
+)  # fmt: skip
+_SUPERSCRIPT_DIGITS = str.maketrans('¹²³⁴⁵⁶⁷⁸⁹', '123456789')
+
+
+def load_starplot_bright_stars(max_magnitude: float = 6.5) -> list[dict[str, Any]]:
+    """Build the table offline from the star data bundled with ``starplot``.
+
+    Positions and magnitudes come from its Hipparcos/Tycho-2 "Big Sky" table
+    (epoch J2000), proper names and Bayer/Flamsteed designations from its IAU
+    star designations, keyed by Hipparcos number.  It has no HR numbers; see
+    :func:`_carry_over_bsc`.  Needs ``starplot`` (with ``duckdb`` and
+    ``pyarrow``) installed, but no network.
+    """
+    spec = importlib.util.find_spec('starplot')
+    if spec is None:
+        print('starplot is not installed; no offline bright-star source.')
+        return []
+    import duckdb
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    library = Path(spec.submodule_search_locations[0]) / 'data' / 'library'
+    print(f'Reading bright stars (V <= {max_magnitude}) from {library} …')
+    table = pq.read_table(next(library.glob('bigsky*.stars.mag11.parquet')))
+    table = table.filter(pc.less_equal(table['magnitude'], max_magnitude))
+    with duckdb.connect(str(library / 'sky.db'), read_only=True) as con:
+        designations = {
+            hip: (name, bayer, flamsteed)
+            for hip, name, bayer, flamsteed in con.execute(
+                'SELECT hip, name, bayer, flamsteed FROM star_designations'
+            ).fetchall()
+        }
+
+    # One row per Hipparcos star, preferring the primary (CCDM component A or
+    # unresolved) over Tycho-2 rows of its companions.
+    rows = sorted(
+        table.to_pylist(), key=lambda row: bool(row['ccdm']) and not row['ccdm'].startswith('A')
+    )
+    stars: list[dict[str, Any]] = []
+    seen: set[int] = set()
+    for row in rows:
+        if row['hip'] is None or np.isnan(row['hip']) or int(row['hip']) in seen:
+            continue
+        hip = int(row['hip'])
+        seen.add(hip)
+        name, bayer, flamsteed = designations.get(hip, (None, None, None))
+        stars.append(
+            {
+                'name': name or None,
+                'bayer': bayer or None,
+                'flamsteed': flamsteed,
+                'hip': hip,
+                'ra': row['ra_degrees'],
+                'dec': row['dec_degrees'],
+                'magnitude': row['magnitude'],
+            }
+        )
+
+    # Designations carry the constellation the star lies in.
+    _assign_constellations(stars)
+    for star in stars:
+        constellation = star.pop('constellation')
+        if star['bayer']:
+            letter, index = star['bayer'][0], star['bayer'][1:].translate(_SUPERSCRIPT_DIGITS)
+            star['bayer'] = f'{_GREEK_LETTERS[letter]}{index} {constellation}'
+        if star['flamsteed']:
+            star['flamsteed'] = f'{star["flamsteed"]} {constellation}'
+    print(f'{len(stars):,} stars found.')
+    return stars
+
+
+def _carry_over_bsc(stars: list[dict[str, Any]], previous: list[dict[str, Any]]) -> None:
+    """Copy HR numbers and BSC designations of the existing table to the same stars in-place.
+
+    Stars match within 36".  The BSC names win, so component suffixes such as
+    ``alf1 Cen`` survive a rebuild from starplot's data.
+    """
+    previous = [star for star in previous if star.get('hr') is not None]
+    if not stars or not previous:
+        return
+    coords = SkyCoord(ra=[s['ra'] for s in stars] * u.deg, dec=[s['dec'] for s in stars] * u.deg)
+    known = SkyCoord(
+        ra=[s['ra'] for s in previous] * u.deg, dec=[s['dec'] for s in previous] * u.deg
+    )
+    index, separation, _ = known.match_to_catalog_sky(coords)
+    for star, match, sep in zip(previous, index, separation.deg, strict=True):
+        if sep <= 0.01:
+            stars[match].update(
+                {key: star[key] for key in ('name', 'bayer', 'flamsteed', 'hr') if star.get(key)}
+            )
+
+
+def write_bright_stars(stars: list[dict[str, Any]]) -> Path:
+    """Write ``bright_stars.json`` sorted by brightness, dropping empty fields."""
+    _assign_constellations(stars)
+    _round_floats(stars)
+    stars = sorted(stars, key=lambda s: (s.get('magnitude') is None, s.get('magnitude') or 0))
+    compact = [{k: v for k, v in star.items() if v is not None} for star in stars]
+
+    output_path = DATA_DIR / 'bright_stars.json'
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open('w') as f:
+        json.dump(compact, f, separators=(',', ':'))
+    size_kb = output_path.stat().st_size / 1024
+    print(f'Saved {len(compact):,} stars to {output_path} ({size_kb:.0f} KB)')
+    return output_path
+
+
+def update_bright_stars() -> None:
+    """Refresh ``bright_stars.json`` from the Yale BSC (VizieR).
+
+    If VizieR is unreachable the table is built from starplot's bundled star
+    data instead, keeping the BSC designations of the existing file; with neither
+    source the existing file is kept.
+    """
+    stars = download_bright_stars()
+    if not stars:
+        stars = load_starplot_bright_stars()
+        if stars:
+            output_path = DATA_DIR / 'bright_stars.json'
+            if output_path.exists():
+                with output_path.open(encoding='utf-8') as f:
+                    _carry_over_bsc(stars, json.load(f))
+    if stars:
+        write_bright_stars(stars)
+    else:
+        print('Keeping the existing bright_stars.json.')
+
+
 def _build_spatial_index(
     objects: list[dict[str, Any]], grid_size: float = 1.0
 ) -> dict[tuple[int, int], list[int]]:
@@ -449,11 +826,14 @@ def main():
         f'({with_size / len(final_list) * 100:.1f}%)'
     )
 
+    # Constellation of every object, so queries never compute it per request
+    _assign_constellations(final_list)
+
     # ── Compact: round floats and strip whitespace ───────────────────
     _round_floats(final_list)
 
     # Save to file
-    output_path = Path(__file__).resolve().parents[1] / 'src' / 'data' / 'objects.json'
+    output_path = DATA_DIR / 'objects.json'
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     with output_path.open('w') as f:
@@ -462,6 +842,59 @@ def main():
     size_kb = output_path.stat().st_size / 1024
     print(f'Saved to {output_path} ({size_kb:.0f} KB)')
 
+    write_binary_catalog(final_list)
+    update_bright_stars()
+
+
+def write_binary_catalog(objects: list[dict[str, Any]]) -> Path:
+    """Write the memory-mappable columnar twin of ``objects.json``."""
+    output_path = write_columnar_catalog(objects, DATA_DIR / 'objects.bin')
+    # Read it back so a broken file never ships next to a good JSON.
+    if len(load_columnar_catalog(output_path)) != len(objects):
+        raise RuntimeError(f'Binary catalog at {output_path} failed verification.')
+    size_kb = output_path.stat().st_size / 1024
+    print(f'Saved to {output_path} ({size_kb:.0f} KB)')
+    return output_path
+
+
+def rebuild_binary_catalog() -> Path:
+    """Regenerate ``objects.bin`` from the existing ``objects.json`` (no network).
+
+    Objects without a ``constellation`` (older files, hand edits) get one, and
+    ``objects.json`` is rewritten with it.
+    """
+    json_path = DATA_DIR / 'objects.json'
+    with json_path.open(encoding='utf-8') as f:
+        objects = json.load(f)
+    missing = [obj for obj in objects if not obj.get('constellation')]
+    if missing:
+        _assign_constellations(missing)
+        with json_path.open('w') as f:
+            json.dump(objects, f, separators=(',', ':'))
+        print(f'Assigned constellations to {len(missing):,} objects in {json_path}')
+    return write_binary_catalog(objects)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Download and build the deep-sky catalog.')
+    parser.add_argument(
+        '--binary-only',
+        action='store_true',
+        help='Skip SIMBAD and rebuild objects.bin from the existing objects.json.',
+    )
+    parser.add_argument(
+        '--bright-stars-only',
+        action='store_true',
+        help='Only refresh bright_stars.json (VizieR, or starplot data when offline).',
+    )
+    return parser.parse_args()
+
 
 if __name__ == '__main__':
-    main()
+    args = parse_args()
+    if args.binary_only:
+        rebuild_binary_catalog()
+    elif args.bright_stars_only:
+        update_bright_stars()
+    else:
+        main()
@@ -0,0 +1,319 @@
+"""Name and alias indexes for catalog objects and bright stars.
+
+Lets ``M31``, ``messier 31``, ``NGC 224`` and ``Andromeda Galaxy`` all resolve
+to the same ``objects.json`` row, and ``Sirius``, ``alpha CMa``, ``α CMa`` and
+``9 CMa`` to the same ``bright_stars.json`` row, without asking SIMBAD.
+"""
+
+import re
+from collections.abc import Iterable
+
+# Messier ↔ NGC/IC/other designations.  The catalog names most Messier objects
+# ``M n`` but some by their NGC/IC main id, and NGC/IC duplicates of Messier
+# objects were dropped during download, so both directions are needed.
+MESSIER_CROSS_REFERENCE: dict[str, str] = {
+    'M 1': 'NGC 1952',
+    'M 2': 'NGC 7089',
+    'M 3': 'NGC 5272',
+    'M 4': 'NGC 6121',
+    'M 5': 'NGC 5904',
+    'M 6': 'NGC 6405',
+    'M 7': 'NGC 6475',
+    'M 8': 'NGC 6523',
+    'M 9': 'NGC 6333',
+    'M 10': 'NGC 6254',
+    'M 11': 'NGC 6705',
+    'M 12': 'NGC 6218',
+    'M 13': 'NGC 6205',
+    'M 14': 'NGC 6402',
+    'M 15': 'NGC 7078',
+    'M 16': 'NGC 6611',
+    'M 17': 'NGC 6618',
+    'M 18': 'NGC 6613',
+    'M 19': 'NGC 6273',
+    'M 20': 'NGC 6514',
+    'M 21': 'NGC 6531',
+    'M 22': 'NGC 6656',
+    'M 23': 'NGC 6494',
+    'M 24': 'IC 4715',
+    'M 25': 'IC 4725',
+    'M 26': 'NGC 6694',
+    'M 27': 'NGC 6853',
+    'M 28': 'NGC 6626',
+    'M 29': 'NGC 6913',
+    'M 30': 'NGC 7099',
+    'M 31': 'NGC 224',
+    'M 32': 'NGC 221',
+    'M 33': 'NGC 598',
+    'M 34': 'NGC 1039',
+    'M 35': 'NGC 2168',
+    'M 36': 'NGC 1960',
+    'M 37': 'NGC 2099',
+    'M 38': 'NGC 1912',
+    'M 39': 'NGC 7092',
+    'M 41': 'NGC 2287',
+    'M 42': 'NGC 1976',
+    'M 43': 'NGC 1982',
+    'M 44': 'NGC 2632',
+    'M 45': 'Cl Melotte 22',
+    'M 46': 'NGC 2437',
+    'M 47': 'NGC 2422',
+    'M 48': 'NGC 2548',
+    'M 49': 'NGC 4472',
+    'M 50': 'NGC 2323',
+    'M 51': 'NGC 5194',
+    'M 52': 'NGC 7654',
+    'M 53': 'NGC 5024',
+    'M 54': 'NGC 6715',
+    'M 55': 'NGC 6809',
+    'M 56': 'NGC 6779',
+    'M 57': 'NGC 6720',
+    'M 58': 'NGC 4579',
+    'M 59': 'NGC 4621',
+    'M 60': 'NGC 4649',
+    'M 61': 'NGC 4303',
+    'M 62': 'NGC 6266',
+    'M 63': 'NGC 5055',
+    'M 64': 'NGC 4826',
+    'M 65': 'NGC 3623',
+    'M 66': 'NGC 3627',
+    'M 67': 'NGC 2682',
+    'M 68': 'NGC 4590',
+    'M 69': 'NGC 6637',
+    'M 70': 'NGC 6681',
+    'M 71': 'NGC 6838',
+    'M 72': 'NGC 6981',
+    'M 73': 'NGC 6994',
+    'M 74': 'NGC 628',
+    'M 75': 'NGC 6864',
+    'M 76': 'NGC 650',
+    'M 77': 'NGC 1068',
+    'M 78': 'NGC 2068',
+    'M 79': 'NGC 1904',
+    'M 80': 'NGC 6093',
+    'M 81': 'NGC 3031',
+    'M 82': 'NGC 3034',
+    'M 83': 'NGC 5236',
+    'M 84': 'NGC 4374',
+    'M 85': 'NGC 4382',
+    'M 86': 'NGC 4406',
+    'M 87': 'NGC 4486',
+    'M 88': 'NGC 4501',
+    'M 89': 'NGC 4552',
+    'M 90': 'NGC 4569',
+    'M 91': 'NGC 4548',
+    'M 92': 'NGC 6341',
+    'M 93': 'NGC 2447',
+    'M 94': 'NGC 4736',
+    'M 95': 'NGC 3351',
+    'M 96': 'NGC 3368',
+    'M 97': 'NGC 3587',
+    'M 98': 'NGC 4192',
+    'M 99': 'NGC 4254',
+    'M 100': 'NGC 4321',
+    'M 101': 'NGC 5457',
+    'M 102': 'NGC 5866',
+    'M 103': 'NGC 581',
+    'M 104': 'NGC 4594',
+    'M 105': 'NGC 3379',
+    'M 106': 'NGC 4258',
+    'M 107': 'NGC 6171',
+    'M 108': 'NGC 3556',
+    'M 109': 'NGC 3992',
+    'M 110': 'NGC 205',
+}
+
+# Common names → catalog designation.  Aliases whose target is not in the
+# catalog are skipped when the index is built.
+COMMON_NAMES: dict[str, str] = {
+    'andromeda': 'M 31',
+    'andromeda galaxy': 'M 31',
+    'andromeda nebula': 'M 31',
+    'triangulum galaxy': 'M 33',
+    'orion nebula': 'M 42',
+    'great orion nebula': 'M 42',
+    'crab nebula': 'M 1',
+    'ring nebula': 'M 57',
+    'dumbbell nebula': 'M 27',
+    'little dumbbell nebula': 'M 76',
+    'whirlpool galaxy': 'M 51',
+    'pinwheel galaxy': 'M 101',
+    'southern pinwheel galaxy': 'M 83',
+    'sombrero galaxy': 'M 104',
+    'lagoon nebula': 'M 8',
+    'trifid nebula': 'M 20',
+    'eagle nebula': 'M 16',
+    'omega nebula': 'M 17',
+    'swan nebula': 'M 17',
+    'pleiades': 'M 45',
+    'seven sisters': 'M 45',
+    'beehive cluster': 'M 44',
+    'praesepe': 'M 44',
+    'hercules cluster': 'M 13',
+    'great hercules cluster': 'M 13',
+    "bode's galaxy": 'M 81',
+    'cigar galaxy': 'M 82',
+    'black eye galaxy': 'M 64',
+    'owl nebula': 'M 97',
+    'wild duck cluster': 'M 11',
+    'butterfly cluster': 'M 6',
+    'ptolemy cluster': 'M 7',
+    'sunflower galaxy': 'M 63',
+    'north america nebula': 'NGC 7000',
+    'pelican nebula': 'IC 5070',
+    'veil nebula': 'NGC 6960',
+    'western veil nebula': 'NGC 6960',
+    'eastern veil nebula': 'NGC 6992',
+    'helix nebula': 'NGC 7293',
+    'rosette nebula': 'NGC 2237',
+    'horsehead nebula': 'IC 434',
+    'flame nebula': 'NGC 2024',
+    'running man nebula': 'NGC 1977',
+    'double cluster': 'NGC 869',
+    "cat's eye nebula": 'NGC 6543',
+    'california nebula': 'NGC 1499',
+    'heart nebula': 'IC 1805',
+    'soul nebula': 'IC 1848',
+    'cocoon nebula': 'IC 5146',
+    'iris nebula': 'NGC 7023',
+    'bubble nebula': 'NGC 7635',
+    'eskimo nebula': 'NGC 2392',
+    "thor's helmet": 'NGC 2359',
+    'elephant trunk nebula': 'IC 1396',
+    'jellyfish nebula': 'IC 443',
+    'pacman nebula': 'NGC 281',
+    'wizard nebula': 'NGC 7380',
+    'ghost of jupiter': 'NGC 3242',
+    'saturn nebula': 'NGC 7009',
+    'blue snowball nebula': 'NGC 7662',
+    'blinking planetary': 'NGC 6826',
+    'spirograph nebula': 'IC 418',
+    'southern ring nebula': 'NGC 3132',
+    'christmas tree cluster': 'NGC 2264',
+    'cone nebula': 'NGC 2264',
+    'omega centauri': 'NGC 5139',
+    '47 tucanae': 'NGC 104',
+    'carina nebula': 'NGC 3372',
+    'tarantula nebula': 'NGC 2070',
+    'sculptor galaxy': 'NGC 253',
+    'silver dollar galaxy': 'NGC 253',
+    'needle galaxy': 'NGC 4565',
+    'whale galaxy': 'NGC 4631',
+    'hamburger galaxy': 'NGC 3628',
+    'fireworks galaxy': 'NGC 6946',
+    'centaurus a': 'NGC 5128',
+    'jewel box': 'NGC 4755',
+    'small magellanic cloud': 'NAME SMC',
+}
+
+# Popular star names that are not IAU proper names → IAU proper name.
+STAR_COMMON_NAMES: dict[str, str] = {
+    'alpha centauri': 'Rigil Kentaurus',
+    'north star': 'Polaris',
+    'pole star': 'Polaris',
+    'dog star': 'Sirius',
+}
+
+# Spelled-out and Unicode Greek letters → SIMBAD Bayer abbreviations.
+_GREEK_LETTERS = {
+    'alpha': 'alf',
+    'beta': 'bet',
+    'gamma': 'gam',
+    'delta': 'del',
+    'epsilon': 'eps',
+    'zeta': 'zet',
+    'theta': 'tet',
+    'iota': 'iot',
+    'kappa': 'kap',
+    'lambda': 'lam',
+    'xi': 'ksi',
+    'omicron': 'omi',
+    'sigma': 'sig',
+    'upsilon': 'ups',
+    'omega': 'ome',
+}
+_GREEK_SYMBOLS = dict(
+    zip(
+        'αβγδεζηθικλμνξοπρστυφχψω',
+        'alf bet gam del eps zet eta tet iot kap lam mu nu ksi omi pi rho sig tau ups phi chi '
+        'psi ome'.split(),
+        strict=True,
+    )
+)
+_LEADING_WORD = re.compile(r'^([a-z]+)(?=\d|\b)')
+
+_DESIGNATION = re.compile(r'(messier|m|ngc|ic)0*(\d+[a-z]?)')
+# SIMBAD prefixes that carry no identity ("NAME SMC", "Cl Melotte 22").
+_NOISE_PREFIXES = ('name ', 'cl ', 'the ')
+
+
+def normalize_object_name(name: str) -> str:
+    """Return the lookup key for an object name.
+
+    Case, spacing, underscores and punctuation are ignored, ``messier`` is
+    folded to ``m``, leading zeros of catalog numbers are dropped and a
+    leading Greek letter is abbreviated the SIMBAD way, so ``'Messier 031'``,
+    ``'m_31'`` and ``'M31'`` share the key ``'m31'`` and ``'Alpha CMa'`` and
+    ``'α CMa'`` share ``'alfcma'``.
+    """
+    key = name.strip().lower()
+    for prefix in _NOISE_PREFIXES:
+        if key.startswith(prefix):
+            key = key[len(prefix) :]
+    if key[:1] in _GREEK_SYMBOLS:
+        key = _GREEK_SYMBOLS[key[0]] + ' ' + key[1:]
+    key = _LEADING_WORD.sub(lambda m: _GREEK_LETTERS.get(m.group(1), m.group(1)), key)
+    key = re.sub(r'[^a-z0-9+]', '', key)
+    match = _DESIGNATION.fullmatch(key)
+    if match:
+        prefix, number = match.groups()
+        key = ('m' if prefix == 'messier' else prefix) + number
+    return key
+
+
+def build_alias_index(names: Iterable[str]) -> dict[str, int]:
+    """Map normalized names, designations and common names to catalog rows."""
+    index: dict[str, int] = {}
+    for row, name in enumerate(names):
+        index.setdefault(normalize_object_name(name), row)
+
+    for messier, other in MESSIER_CROSS_REFERENCE.items():
+        messier_key = normalize_object_name(messier)
+        other_key = normalize_object_name(other)
+        if messier_key in index:
+            index.setdefault(other_key, index[messier_key])
+        elif other_key in index:
+            index[messier_key] = index[other_key]
+
+    for alias, target in COMMON_NAMES.items():
+        row = index.get(normalize_object_name(target))
+        if row is not None:
+            index.setdefault(normalize_object_name(alias), row)
+    return index
+
+
+def build_star_index(stars: list[dict]) -> dict[str, int]:
+    """Map proper names, Bayer/Flamsteed, HR and HIP designations to star rows.
+
+    ``stars`` is expected brightest-first, so an unsuffixed Bayer name such as
+    ``alf Cen`` points at the brightest component (``alf1 Cen``).
+    """
+    index: dict[str, int] = {}
+    for row, star in enumerate(stars):
+        keys = [star.get('name'), star.get('bayer'), star.get('flamsteed')]
+        if star.get('hr') is not None:
+            keys.append(f'HR {star["hr"]}')
+        if star.get('hip') is not None:
+            keys.append(f'HIP {star["hip"]}')
+        bayer = star.get('bayer')
+        if bayer:
+            keys.append(re.sub(r'^([a-z]+)\d+', r'\1', bayer))
+        for key in keys:
+            if key:
+                index.setdefault(normalize_object_name(key), row)
+
+    for alias, target in STAR_COMMON_NAMES.items():
+        row = index.get(normalize_object_name(target))
+        if row is not None:
+            index.setdefault(normalize_object_name(alias), row)
+    return index
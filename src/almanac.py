@@ -0,0 +1,359 @@
+"""Per-night almanac: twilight, Sun/Moon rise-set and dark-time windows.
+
+The nightly forecast, ``get_moon_info``, the shooting planner and the
+stargazing planner all need the same night context for a site.  Entries are
+computed once per (lat/lon cell, local night) and shared: one vectorised
+Sun+Moon altitude scan over the night (local noon to the next local noon),
+then every threshold crossing is refined together with the same regula-falsi
+search ``celestial_rise_set`` uses.
+
+A "night" is named by the local date on which it starts, so 02:00 on the 15th
+belongs to the night of the 14th.  Every site inside a cell shares the
+almanac computed at the cell centre; at the default 0.1° cell size times
+differ from the exact site by well under a minute.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, tzinfo
+from datetime import time as dt_time
+from typing import Any
+
+import astropy.units as u
+import numpy as np
+import pytz
+from astropy.coordinates import AltAz, EarthLocation
+from astropy.time import Time
+
+from src.env import env_number
+from src.ephemeris import get_ephemeris_cache
+
+# Altitudes (degrees) of each event; rise/set use the conventional almanac
+# values for refraction, semi-diameter and (for the Moon) mean parallax.
+SUNRISE_ALTITUDE = -0.833
+MOONRISE_ALTITUDE = 0.125
+TWILIGHT_ALTITUDES = {'civil': -6.0, 'nautical': -12.0, 'astronomical': -18.0}
+
+DEFAULT_CELL_DEG = 0.1
+DEFAULT_MAX_ENTRIES = 4096
+
+_SCAN_MINUTES = 10
+_NOON = dt_time(12)
+
+# (body, altitude, name of the descending event, name of the ascending event)
+_EVENTS = (
+    ('sun', SUNRISE_ALTITUDE, 'sunset', 'sunrise'),
+    ('sun', TWILIGHT_ALTITUDES['civil'], 'civil_dusk', 'civil_dawn'),
+    ('sun', TWILIGHT_ALTITUDES['nautical'], 'nautical_dusk', 'nautical_dawn'),
+    ('sun', TWILIGHT_ALTITUDES['astronomical'], 'astronomical_dusk', 'astronomical_dawn'),
+    ('moon', MOONRISE_ALTITUDE, 'moonset', 'moonrise'),
+)
+
+
+@dataclass(frozen=True)
+class NightAlmanac:
+    """Night context for one site cell and local night.
+
+    Event times are timezone-aware datetimes in the site's zone, or ``None``
+    when the event does not happen during the night (polar day/night, or a
+    Moon that stays up or down).  Dusk/set events are the first of the night;
+    dawn/rise events the first after the matching dusk/set where there is one.
+    """
+
+    night_of: date
+    latitude: float
+    longitude: float
+    time_zone: str
+    sunset: datetime | None
+    sunrise: datetime | None
+    civil_dusk: datetime | None
+    civil_dawn: datetime | None
+    nautical_dusk: datetime | None
+    nautical_dawn: datetime | None
+    astronomical_dusk: datetime | None
+    astronomical_dawn: datetime | None
+    moonrise: datetime | None
+    moonset: datetime | None
+    moon_illumination: float
+    moon_phase_name: str
+    dark_intervals: list[tuple[datetime, datetime]] = field(default_factory=list)
+    astronomical_hours: float = 0.0
+    zone: tzinfo = field(default=pytz.UTC, repr=False, compare=False)
+
+    @property
+    def dark_hours(self) -> float:
+        """Total Moon-free astronomical darkness, in hours."""
+        return sum((end - start).total_seconds() for start, end in self.dark_intervals) / 3600.0
+
+    @property
+    def darkness_score(self) -> float:
+        return darkness_score(self.dark_hours, self.astronomical_hours)
+
+    def astronomical_night(self) -> tuple[datetime, datetime] | None:
+        """Start and end of astronomical darkness, or ``None`` if it never gets dark.
+
+        A missing dusk or dawn (the Sun stays below -18° past local noon, as
+        in polar night) is replaced by the noon that bounds the night.
+        """
+        if self.astronomical_hours <= 0:
+            return None
+        start = self.astronomical_dusk or localize(
+            self.zone, datetime.combine(self.night_of, _NOON)
+        )
+        end = self.astronomical_dawn or localize(
+            self.zone, datetime.combine(self.night_of + timedelta(days=1), _NOON)
+        )
+        return start, end
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly form: datetimes as ISO-8601 strings."""
+
+        def iso(value: datetime | None) -> str | None:
+            return value.isoformat() if value is not None else None
+
+        return {
+            'night_of': self.night_of.isoformat(),
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'time_zone': self.time_zone,
+            **{name: iso(getattr(self, name)) for name in _EVENT_FIELDS},
+            'moon_illumination': self.moon_illumination,
+            'moon_phase_name': self.moon_phase_name,
+            'dark_intervals': [
+                {'start': start.isoformat(), 'end': end.isoformat()}
+                for start, end in self.dark_intervals
+            ],
+            'dark_hours': round(self.dark_hours, 2),
+            'astronomical_hours': round(self.astronomical_hours, 2),
+            'darkness_score': self.darkness_score,
+        }
+
+
+_EVENT_FIELDS = (
+    'sunset',
+    'sunrise',
+    'civil_dusk',
+    'civil_dawn',
+    'nautical_dusk',
+    'nautical_dawn',
+    'astronomical_dusk',
+    'astronomical_dawn',
+    'moonrise',
+    'moonset',
+)
+
+
+def darkness_score(dark_hours: float, astronomical_hours: float) -> float:
+    """Percentage (0-100) of the astronomical night that is free of moonlight.
+
+    A night without astronomical darkness scores 0.
+    """
+    if astronomical_hours <= 0:
+        return 0.0
+    return round(100.0 * min(1.0, dark_hours / astronomical_hours), 1)
+
+
+def night_of(when: datetime) -> date:
+    """Local date on which the night containing ``when`` began."""
+    if when.tzinfo is None:
+        raise ValueError('Input datetime must be timezone-aware.')
+    return (when - timedelta(hours=12)).date()
+
+
+def compute_night_almanac(
+    latitude: float, longitude: float, night: date, zone: tzinfo
+) -> NightAlmanac:
+    """Compute the almanac for ``night`` at an exact site (no caching)."""
+    from src.celestial import _find_horizon_crossings, _refine_crossings, calculate_moon_info
+
+    location = EarthLocation.from_geodetic(longitude * u.deg, latitude * u.deg)
+    start = localize(zone, datetime.combine(night, _NOON))
+    end = localize(zone, datetime.combine(night + timedelta(days=1), _NOON))
+    origin = Time(start)
+    span = (end - start).total_seconds()
+    offsets = np.linspace(0.0, span, int(span // (_SCAN_MINUTES * 60)) + 1)
+
+    def altitudes(body: str, seconds: np.ndarray) -> np.ndarray:
+        times = origin + seconds * u.s
+        coord = get_ephemeris_cache().body(body, times)
+        return np.atleast_1d(coord.transform_to(AltAz(obstime=times, location=location)).alt.deg)
+
+    grid = {body: altitudes(body, offsets) for body in ('sun', 'moon')}
+
+    events: dict[str, datetime | None] = {}
+    crossings: dict[tuple[str, float], list[tuple[str, float]]] = {}
+    for body in ('sun', 'moon'):
+        specs = [spec for spec in _EVENTS if spec[0] == body]
+        brackets = [
+            (index, threshold, *_find_horizon_crossings(grid[body] - threshold))
+            for index, (_, threshold, _, _) in enumerate(specs)
+        ]
+        lo = np.concatenate([b[2] for b in brackets])
+        hi = np.concatenate([b[3] for b in brackets])
+        levels = np.concatenate([np.full(len(b[2]), b[1]) for b in brackets])
+
+        def height_at(seconds: np.ndarray, body=body, levels=levels) -> np.ndarray:
+            return altitudes(body, seconds) - levels
+
+        refined = _refine_crossings(
+            height_at, offsets[lo], offsets[hi], grid[body][lo] - levels, grid[body][hi] - levels
+        )
+        position = 0
+        for index, threshold, b_lo, _ in brackets:
+            kinds = ['up' if grid[body][i] <= threshold else 'down' for i in b_lo.tolist()]
+            seconds = refined[position : position + len(b_lo)].tolist()
+            position += len(b_lo)
+            crossings[(body, threshold)] = list(zip(kinds, seconds, strict=True))
+            _, _, down_name, up_name = specs[index]
+            down = next((s for kind, s in crossings[(body, threshold)] if kind == 'down'), None)
+            ups = [s for kind, s in crossings[(body, threshold)] if kind == 'up']
+            up = next((s for s in ups if down is None or s > down), ups[0] if ups else None)
+            events[down_name] = _to_local(start, down)
+            events[up_name] = _to_local(start, up)
+
+    # Both conditions are constant between consecutive crossings, so one
+    # Sun/Moon evaluation at the middle of each segment classifies it.
+    edges = [s for _, s in crossings[('sun', TWILIGHT_ALTITUDES['astronomical'])]]
+    edges += [s for _, s in crossings[('moon', MOONRISE_ALTITUDE)]]
+    points = np.array(sorted({0.0, span, *edges}))
+    middles = (points[:-1] + points[1:]) / 2
+    is_night = altitudes('sun', middles) < TWILIGHT_ALTITUDES['astronomical']
+    is_dark = is_night & (altitudes('moon', middles) < MOONRISE_ALTITUDE)
+    dark = _merge_intervals(points, is_dark)
+    night_seconds = float(np.sum(np.diff(points)[is_night]))
+
+    midnight = events.get('civil_dusk') or start
+    if events.get('civil_dusk') and events.get('civil_dawn'):
+        midnight = events['civil_dusk'] + (events['civil_dawn'] - events['civil_dusk']) / 2
+    moon = calculate_moon_info(midnight)
+
+    return NightAlmanac(
+        night_of=night,
+        latitude=latitude,
+        longitude=longitude,
+        time_zone=_zone_name(zone),
+        **events,
+        moon_illumination=float(moon['illumination']),
+        moon_phase_name=moon['phase_name'],
+        dark_intervals=[(_to_local(start, a), _to_local(start, b)) for a, b in dark],
+        astronomical_hours=night_seconds / 3600.0,
+        zone=zone,
+    )
+
+
+def _merge_intervals(points: np.ndarray, selected: np.ndarray) -> list[tuple[float, float]]:
+    """Join the selected ``[points[i], points[i + 1]]`` segments into maximal intervals."""
+    intervals: list[tuple[float, float]] = []
+    for index in np.flatnonzero(selected).tolist():
+        a, b = float(points[index]), float(points[index + 1])
+        if intervals and intervals[-1][1] == a:
+            intervals[-1] = (intervals[-1][0], b)
+        else:
+            intervals.append((a, b))
+    return intervals
+
+
+class AlmanacCache:
+    """LRU cache of :class:`NightAlmanac` keyed by site cell, night and zone.
+
+    Thread-safe; a miss is computed outside the lock, so two threads racing on
+    the same new key may both compute it (the results are identical).
+    """
+
+    def __init__(self, cell_deg: float = DEFAULT_CELL_DEG, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cell_deg = cell_deg
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, NightAlmanac] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, location: EarthLocation, when: datetime) -> NightAlmanac:
+        """Almanac for the night containing ``when`` (timezone-aware) at ``location``."""
+        night = night_of(when)
+        lat_cell = round(float(location.lat.deg) / self.cell_deg)
+        lon_cell = round(float(location.lon.deg) / self.cell_deg)
+        key = (lat_cell, lon_cell, night, _zone_name(when.tzinfo))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        latitude = max(-90.0, min(90.0, lat_cell * self.cell_deg))
+        longitude = lon_cell * self.cell_deg
+        entry = compute_night_almanac(latitude, longitude, night, when.tzinfo)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def create_almanac_cache() -> AlmanacCache:
+    """Build the almanac cache described by the environment.
+
+    - ``STARGAZING_ALMANAC_CELL_DEG``: site cell size in degrees (default 0.1).
+    - ``STARGAZING_ALMANAC_CACHE_SIZE``: maximum nights kept (default 4096).
+
+    Raises:
+        ValueError: If either variable is set but not a positive number.
+    """
+    cell_deg = env_number('STARGAZING_ALMANAC_CELL_DEG', DEFAULT_CELL_DEG)
+    max_entries = env_number('STARGAZING_ALMANAC_CACHE_SIZE', DEFAULT_MAX_ENTRIES, int)
+    return AlmanacCache(cell_deg, max_entries)
+
+
+_almanac_cache: AlmanacCache | None = None
+_almanac_cache_lock = threading.Lock()
+
+
+def get_almanac_cache() -> AlmanacCache:
+    """Return the process-wide almanac cache, creating it on first use."""
+    global _almanac_cache
+    if _almanac_cache is not None:
+        return _almanac_cache
+
+    with _almanac_cache_lock:
+        if _almanac_cache is None:
+            _almanac_cache = create_almanac_cache()
+    return _almanac_cache
+
+
+def get_night_almanac(location: EarthLocation, when: datetime) -> NightAlmanac:
+    """Shorthand for ``get_almanac_cache().get(location, when)``."""
+    return get_almanac_cache().get(location, when)
+
+
+def localize(zone: tzinfo, naive: datetime) -> datetime:
+    """Attach ``zone`` to a naive datetime, using pytz's ``localize`` when available."""
+    if hasattr(zone, 'localize'):
+        return zone.localize(naive)
+    return naive.replace(tzinfo=zone)
+
+
+def _zone_name(zone: tzinfo) -> str:
+    return getattr(zone, 'zone', None) or str(zone)
+
+
+def _to_local(start: datetime, seconds: float | None) -> datetime | None:
+    if seconds is None:
+        return None
+    moment = (start + timedelta(seconds=float(seconds))).astimezone(pytz.UTC)
+    zone = start.tzinfo
+    local = moment.astimezone(zone)
+    return zone.normalize(local) if hasattr(zone, 'normalize') else local
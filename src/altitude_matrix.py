@@ -0,0 +1,157 @@
+"""Objects × times horizontal coordinates in compact float32 storage.
+
+An :class:`AltitudeMatrix` holds altitude, azimuth and airmass for N fixed
+objects at T time steps as ``(N, T)`` float32 arrays, filled in one
+vectorised pass (``ObserverFrame`` or the analytic engine in
+``src.fast_ephemeris``).  Response curves (``altitude_curve[{time, alt}]``)
+are sliced from it only for the rows that are actually emitted, instead of
+building a list of dicts for every candidate.
+
+float32 keeps ~7 significant digits — far below the 0.1° the curves are
+rounded to — at half the memory of float64.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import EarthLocation
+from astropy.coordinates.erfa_astrom import ErfaAstromInterpolator, erfa_astrom
+from astropy.time import Time
+
+from src import fast_ephemeris
+from src.almanac import TWILIGHT_ALTITUDES, NightAlmanac
+from src.observability import night_midnight, solar_dark_window
+from src.observer_frame import ObserverFrame
+
+CURVE_STEP_MINUTES = 15
+
+# Objects transformed per ObserverFrame call; bounds the float64 (n, T, 3)
+# intermediates while the float32 result is filled in place.
+_CHUNK_ROWS = 2048
+# Observer-frame parameters are interpolated between samples this far apart;
+# over a night the error is microarcseconds, and a multi-night grid needs a
+# handful of ERFA evaluations instead of one per time step.
+_ASTROM_RESOLUTION = 1 * u.hour
+_UNIX_EPOCH_JD = 2440587.5
+_SECONDS_PER_DAY = 86400.0
+
+
+@dataclass(frozen=True)
+class AltitudeMatrix:
+    """Horizontal coordinates of N objects at T times.
+
+    ``times`` are UTC unix seconds (float64, length T); ``altitude``,
+    ``azimuth`` (degrees) and ``airmass`` are ``(N, T)`` float32 arrays.
+    Airmass is NaN wherever the object is below the horizon.
+    """
+
+    times: np.ndarray
+    altitude: np.ndarray
+    azimuth: np.ndarray
+    airmass: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.altitude)
+
+    @property
+    def nbytes(self) -> int:
+        return self.altitude.nbytes + self.azimuth.nbytes + self.airmass.nbytes
+
+    def take(self, indices: np.ndarray) -> 'AltitudeMatrix':
+        """Rows for a subset of the objects, in ``indices`` order."""
+        return AltitudeMatrix(
+            times=self.times,
+            altitude=self.altitude[indices],
+            azimuth=self.azimuth[indices],
+            airmass=self.airmass[indices],
+        )
+
+    def curve(self, index: int, columns: slice = slice(None)) -> list[dict[str, Any]]:
+        """``[{time, alt}]`` for one object, shaped like the telescope tools' curves."""
+        times = np.round(self.times[columns]).tolist()
+        altitudes = np.round(self.altitude[index, columns].astype(np.float64), 1).tolist()
+        return [{'time': t, 'alt': alt} for t, alt in zip(times, altitudes, strict=True)]
+
+
+def compute_altitude_matrix(
+    ra_deg: np.ndarray,
+    dec_deg: np.ndarray,
+    location: EarthLocation,
+    times: np.ndarray,
+    fast: bool = False,
+) -> AltitudeMatrix:
+    """Build the matrix for J2000 positions at UTC unix ``times``.
+
+    Args:
+        ra_deg: ICRS/J2000 right ascensions in degrees.
+        dec_deg: ICRS/J2000 declinations in degrees.
+        location: Observer's EarthLocation.
+        times: UTC unix seconds, one per column.
+        fast: Use the analytic engine instead of :class:`ObserverFrame`.
+    """
+    ra = np.atleast_1d(np.asarray(ra_deg, dtype=np.float64))
+    dec = np.atleast_1d(np.asarray(dec_deg, dtype=np.float64))
+    times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+    altitude = np.empty((len(ra), len(times)), dtype=np.float32)
+    azimuth = np.empty_like(altitude)
+
+    if len(ra) and len(times):
+        if fast:
+            jd = times / _SECONDS_PER_DAY + _UNIX_EPOCH_JD
+            # One precession epoch serves a night: the drift is sub-arcsecond.
+            ra_date, dec_date = fast_ephemeris.precess_from_j2000(ra, dec, jd[len(jd) // 2])
+            lat, lon = location.lat.deg, location.lon.deg
+            for rows in _chunks(len(ra)):
+                altitude[rows], azimuth[rows] = fast_ephemeris.horizontal(
+                    ra_date[rows, np.newaxis], dec_date[rows, np.newaxis], jd, lat, lon
+                )
+        else:
+            with erfa_astrom.set(ErfaAstromInterpolator(_ASTROM_RESOLUTION)):
+                frame = ObserverFrame(location, Time(times, format='unix'))
+            for rows in _chunks(len(ra)):
+                altitude[rows], azimuth[rows] = frame.altaz(ra[rows], dec[rows])
+
+    return AltitudeMatrix(
+        times=times, altitude=altitude, azimuth=azimuth, airmass=_airmass(altitude)
+    )
+
+
+def night_grid(
+    location: EarthLocation,
+    moment: datetime,
+    almanac: NightAlmanac | None = None,
+    step_minutes: float = CURVE_STEP_MINUTES,
+) -> np.ndarray:
+    """UTC unix times every ``step_minutes`` from civil dusk to civil dawn.
+
+    Dusk and dawn come from the almanac or, without one, the analytic Sun;
+    on nights that never get civilly dark the grid spans local midnight ±6 h.
+    """
+    midnight = night_midnight(moment)
+    window = None
+    if almanac is not None and almanac.civil_dusk and almanac.civil_dawn:
+        window = almanac.civil_dusk.timestamp(), almanac.civil_dawn.timestamp()
+    elif almanac is None:
+        window = solar_dark_window(
+            location.lat.deg, location.lon.deg, midnight, TWILIGHT_ALTITUDES['civil']
+        )
+    start, end = window if window is not None else (midnight - 6 * 3600, midnight + 6 * 3600)
+    step = step_minutes * 60.0
+    return np.append(np.arange(start, end, step), end)
+
+
+def _chunks(count: int):
+    for start in range(0, count, _CHUNK_ROWS):
+        yield slice(start, start + _CHUNK_ROWS)
+
+
+def _airmass(altitude: np.ndarray) -> np.ndarray:
+    """Kasten & Young (1989) relative airmass; NaN below the horizon."""
+    alt = altitude.astype(np.float32)
+    above = alt > 0
+    safe = np.where(above, alt, np.float32(90.0))
+    airmass = 1.0 / (np.sin(np.radians(safe)) + 0.50572 * (safe + 6.07995) ** -1.6364)
+    return np.where(above, airmass, np.nan).astype(np.float32)
@@ -1,11 +1,21 @@
 import hashlib
 import json
+import os
+import sqlite3
 import threading
 import time
+from abc import ABC, abstractmethod
 from collections import OrderedDict
+from contextlib import closing
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
+from src.env import env_number
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class AnalysisCacheItem:
@@ -56,3 +66,260 @@ def generate_cache_key(**kwargs) -> str:
     # Sort keys to ensure stability
     serialized = json.dumps(kwargs, sort_keys=True, default=str)
     return hashlib.md5(serialized.encode(), usedforsecurity=False).hexdigest()
+
+
+# ── Object-name resolution cache ──────────────────────────────────────────
+#
+# Stores SIMBAD name → ICRS coordinate results.  Positive entries never expire
+# (catalog coordinates do not change); negative entries ("SIMBAD does not know
+# this name") expire after a short TTL so typos stop costing two round-trips
+# per request without hiding objects that become resolvable later.
+
+DEFAULT_NEGATIVE_TTL_SECONDS = 600.0
+
+
+@dataclass(frozen=True)
+class ResolutionEntry:
+    """A cached resolution: ICRS degrees, or ``found=False`` for a cached miss."""
+
+    found: bool
+    ra_deg: float | None = None
+    dec_deg: float | None = None
+
+
+def normalize_resolution_key(name: str) -> str:
+    """Case- and whitespace-insensitive cache key for an object name."""
+    return ' '.join(name.lower().split())
+
+
+class ResolutionCache(ABC):
+    """Base class for name-resolution caches; subclasses provide storage.
+
+    Tracks per-process hit/miss counters.  ``lookup`` returns ``None`` when the
+    name has no (unexpired) entry, so callers must query the upstream service.
+    """
+
+    backend = 'base'
+
+    def __init__(self, negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS):
+        self.negative_ttl = negative_ttl_seconds
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def lookup(self, name: str) -> ResolutionEntry | None:
+        entry = self._read(normalize_resolution_key(name), time.time())
+        with self._stats_lock:
+            if entry is None:
+                self.misses += 1
+            elif entry.found:
+                self.hits += 1
+            else:
+                self.negative_hits += 1
+        return entry
+
+    def store(self, name: str, ra_deg: float, dec_deg: float) -> None:
+        self._write(normalize_resolution_key(name), float(ra_deg), float(dec_deg), None)
+
+    def store_negative(self, name: str) -> None:
+        expires_at = time.time() + self.negative_ttl
+        self._write(normalize_resolution_key(name), None, None, expires_at)
+
+    def seed(self, entries: list[dict[str, Any]]) -> int:
+        """Insert positive entries (``{'name', 'ra', 'dec'}`` in degrees)."""
+        count = 0
+        for item in entries:
+            self.store(item['name'], item['ra'], item['dec'])
+            count += 1
+        return count
+
+    def seed_from_file(self, path: str | Path) -> int:
+        """Pre-populate the cache from a JSON list of ``{'name', 'ra', 'dec'}`` records."""
+        with Path(path).open(encoding='utf-8') as f:
+            return self.seed(json.load(f))
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            return {
+                'backend': self.backend,
+                'hits': self.hits,
+                'negative_hits': self.negative_hits,
+                'misses': self.misses,
+                'entries': self._count(),
+            }
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+    @abstractmethod
+    def _read(self, key: str, now: float) -> ResolutionEntry | None:
+        """Entry for ``key``, or ``None`` if absent or expired at ``now``."""
+
+    @abstractmethod
+    def _write(
+        self, key: str, ra: float | None, dec: float | None, expires_at: float | None
+    ) -> None:
+        """Insert or replace ``key``; negative entries have no position and an expiry."""
+
+    @abstractmethod
+    def _count(self) -> int:
+        """Number of stored entries."""
+
+
+class MemoryResolutionCache(ResolutionCache):
+    """Process-local resolution cache (the pre-SQLite behaviour)."""
+
+    backend = 'memory'
+
+    def __init__(self, negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS):
+        super().__init__(negative_ttl_seconds)
+        self._entries: dict[str, tuple[float | None, float | None, float | None]] = {}
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _read(self, key: str, now: float) -> ResolutionEntry | None:
+        with self._lock:
+            row = self._entries.get(key)
+            if row is None:
+                return None
+            ra, dec, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                del self._entries[key]
+                return None
+        return ResolutionEntry(found=ra is not None, ra_deg=ra, dec_deg=dec)
+
+    def _write(
+        self, key: str, ra: float | None, dec: float | None, expires_at: float | None
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (ra, dec, expires_at)
+
+    def _count(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteResolutionCache(ResolutionCache):
+    """On-disk resolution cache shared by every worker process on the host.
+
+    Uses WAL journaling so concurrent readers never block on a writer, and a
+    short-lived connection per operation so it is safe from any thread.
+    """
+
+    backend = 'sqlite'
+
+    def __init__(
+        self, path: str | Path, negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS
+    ):
+        super().__init__(negative_ttl_seconds)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS resolutions ('
+                'name TEXT PRIMARY KEY, ra REAL, dec REAL, expires_at REAL)'
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM resolutions')
+
+    def _read(self, key: str, now: float) -> ResolutionEntry | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                'SELECT ra, dec FROM resolutions '
+                'WHERE name = ? AND (expires_at IS NULL OR expires_at > ?)',
+                (key, now),
+            ).fetchone()
+        if row is None:
+            return None
+        ra, dec = row
+        return ResolutionEntry(found=ra is not None, ra_deg=ra, dec_deg=dec)
+
+    def _write(
+        self, key: str, ra: float | None, dec: float | None, expires_at: float | None
+    ) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO resolutions (name, ra, dec, expires_at) '
+                'VALUES (?, ?, ?, ?)',
+                (key, ra, dec, expires_at),
+            )
+
+    def _count(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                'SELECT COUNT(*) FROM resolutions WHERE expires_at IS NULL OR expires_at > ?',
+                (time.time(),),
+            ).fetchone()[0]
+
+
+def _default_resolution_cache_path() -> Path:
+    cache_home = os.getenv('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(cache_home) / 'mcp-stargazing' / 'resolutions.sqlite3'
+
+
+def create_resolution_cache() -> ResolutionCache:
+    """Build the resolution cache described by the environment.
+
+    - ``STARGAZING_RESOLVER_CACHE``: ``sqlite`` (default) or ``memory``.
+    - ``STARGAZING_RESOLVER_CACHE_PATH``: SQLite file shared by all workers.
+    - ``STARGAZING_RESOLVER_NEGATIVE_TTL``: seconds to remember unknown names.
+    - ``STARGAZING_RESOLVER_SEED``: JSON file of ``{'name', 'ra', 'dec'}`` to preload.
+
+    Falls back to the in-memory backend when the SQLite file cannot be opened.
+
+    Raises:
+        ValueError: If ``STARGAZING_RESOLVER_NEGATIVE_TTL`` is not a non-negative number.
+    """
+    backend = os.getenv('STARGAZING_RESOLVER_CACHE', 'sqlite').strip().lower()
+    negative_ttl = env_number(
+        'STARGAZING_RESOLVER_NEGATIVE_TTL', DEFAULT_NEGATIVE_TTL_SECONDS, allow_zero=True
+    )
+
+    cache: ResolutionCache
+    if backend == 'memory':
+        cache = MemoryResolutionCache(negative_ttl)
+    else:
+        if backend != 'sqlite':
+            logger.warning('Unknown STARGAZING_RESOLVER_CACHE %r, using sqlite', backend)
+        path = os.getenv('STARGAZING_RESOLVER_CACHE_PATH') or _default_resolution_cache_path()
+        try:
+            cache = SQLiteResolutionCache(path, negative_ttl)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning('Resolution cache at %s unavailable (%s); using memory', path, e)
+            cache = MemoryResolutionCache(negative_ttl)
+
+    seed_path = os.getenv('STARGAZING_RESOLVER_SEED')
+    if seed_path:
+        try:
+            seeded = cache.seed_from_file(seed_path)
+            logger.info('Seeded %d resolutions from %s', seeded, seed_path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning('Could not seed resolution cache from %s: %s', seed_path, e)
+    return cache
+
+
+_resolution_cache: ResolutionCache | None = None
+_resolution_cache_lock = threading.Lock()
+
+
+def get_resolution_cache() -> ResolutionCache:
+    """Return the process-wide resolution cache, creating it on first use."""
+    global _resolution_cache
+    if _resolution_cache is not None:
+        return _resolution_cache
+
+    with _resolution_cache_lock:
+        if _resolution_cache is None:
+            _resolution_cache = create_resolution_cache()
+    return _resolution_cache
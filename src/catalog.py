@@ -0,0 +1,367 @@
+"""Columnar binary deep-sky catalog.
+
+``objects.json`` stays the interchange format; ``objects.bin`` is derived from
+it by ``scripts/download_data.py`` and stores the same records column by
+column so the server can memory-map it without parsing::
+
+    magic (8 bytes) | version (uint32) | header length (uint32) | JSON header
+    | column 0 | column 1 | ...
+
+Each column is a contiguous, 16-byte aligned little-endian array: fixed-width
+UTF-8 byte strings for ``name``/``type``/``catalog``/``constellation`` (the
+IAU abbreviation) and ``float32`` for the numeric fields (``NaN`` encodes a
+missing value).  Every worker process that maps the file shares the same
+read-only pages.
+"""
+
+import json
+import math
+import struct
+from collections.abc import Iterable, Mapping, Sequence
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import numpy as np
+
+from src.aliases import build_alias_index, normalize_object_name
+
+CATALOG_MAGIC = b'SGCOLCAT'
+CATALOG_VERSION = 2
+
+_PREAMBLE = struct.Struct('<8sII')
+_ALIGNMENT = 16
+
+STRING_COLUMNS = ('name', 'type', 'catalog', 'constellation')
+
+# Numeric columns and the decimal precision ``download_data._round_floats``
+# writes to JSON; rows are rounded back to it so they match the JSON records.
+FLOAT_COLUMNS: dict[str, int] = {
+    'ra': 4,
+    'dec': 4,
+    'magnitude': 2,
+    'angular_size_maj_arcmin': 1,
+    'angular_size_min_arcmin': 1,
+    'angular_size_pa_deg': 0,
+}
+
+# Columns whose missing values are ``None`` in JSON (magnitude keeps ``NaN``).
+NULLABLE_COLUMNS = frozenset(
+    {'angular_size_maj_arcmin', 'angular_size_min_arcmin', 'angular_size_pa_deg'}
+)
+
+RECORD_FIELDS = (
+    'name',
+    'type',
+    'ra',
+    'dec',
+    'magnitude',
+    'catalog',
+    'angular_size_maj_arcmin',
+    'angular_size_min_arcmin',
+    'angular_size_pa_deg',
+    'constellation',
+)
+
+
+class ColumnarCatalog(Sequence):
+    """Read-only deep-sky catalog backed by NumPy column arrays.
+
+    Behaves like the list of dicts ``objects.json`` decodes to (indexing and
+    iteration yield JSON-shaped records), while vectorised callers read the
+    typed columns directly through :meth:`column` and :meth:`values`, and look
+    rows up by designation or common name through :meth:`find` and
+    :meth:`record`.  Loaded once per process, so per-request code only
+    decodes the rows it returns.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray]):
+        missing = [name for name in RECORD_FIELDS if name not in columns]
+        if missing:
+            raise ValueError(f'Catalog is missing columns: {missing}')
+        lengths = {len(columns[name]) for name in RECORD_FIELDS}
+        if len(lengths) > 1:
+            raise ValueError('Catalog columns have inconsistent lengths.')
+        for array in columns.values():
+            array.flags.writeable = False
+        self._columns = columns
+        self._size = lengths.pop() if lengths else 0
+        self._values: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> 'ColumnarCatalog':
+        """Build an in-memory catalog from JSON-shaped records."""
+        records = list(records)
+        columns: dict[str, np.ndarray] = {}
+        for name in STRING_COLUMNS:
+            encoded = [str(obj.get(name) or '').encode('utf-8') for obj in records]
+            width = max((len(value) for value in encoded), default=0) or 1
+            columns[name] = np.array(encoded, dtype=f'S{width}')
+        for name in FLOAT_COLUMNS:
+            columns[name] = np.array(
+                [_encode_float(obj.get(name)) for obj in records], dtype=np.float32
+            )
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.rows(range(*index.indices(self._size)))
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('catalog index out of range')
+        return self.rows([index])[0]
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the raw column array (a view into the mapped file)."""
+        return self._columns[name]
+
+    def values(self, name: str) -> np.ndarray:
+        """Return a numeric column as ``float64`` with the values records carry.
+
+        Decoded (rounded as in ``objects.json``, ``NaN`` where missing) once
+        per catalog and cached; the array is read-only.
+        """
+        values = self._values.get(name)
+        if values is None:
+            if name not in FLOAT_COLUMNS:
+                raise KeyError(f'{name!r} is not a numeric catalog column.')
+            digits = FLOAT_COLUMNS[name]
+            values = np.array(
+                [v if math.isnan(v) else round(v, digits) for v in self.column(name).tolist()],
+                dtype=np.float64,
+            )
+            values.flags.writeable = False
+            self._values[name] = values
+        return values
+
+    @cached_property
+    def alias_index(self) -> Mapping[str, int]:
+        """Read-only normalized name/designation/common-name → row map, built on first use."""
+        return MappingProxyType(
+            build_alias_index(value.decode('utf-8') for value in self.column('name').tolist())
+        )
+
+    def find(self, name: str) -> int | None:
+        """Return the row index of ``name`` (any known alias), or ``None``."""
+        key = normalize_object_name(name)
+        return self.alias_index.get(key) if key else None
+
+    def record(self, name: str) -> dict[str, Any] | None:
+        """Return the record for a designation or common name (``M31``, ``NGC 224``)."""
+        row = self.find(name)
+        return self.rows([row])[0] if row is not None else None
+
+    @cached_property
+    def constellation_index(self) -> Mapping[str, np.ndarray]:
+        """Read-only IAU abbreviation → catalog rows (ascending) map, built on first use."""
+        codes = self.column('constellation')
+        order = np.argsort(codes, kind='stable')
+        names, starts = np.unique(codes[order], return_index=True)
+        groups = {}
+        for name, rows in zip(names.tolist(), np.split(order, starts[1:]), strict=True):
+            if name:
+                rows.flags.writeable = False
+                groups[name.decode('utf-8')] = rows
+        return MappingProxyType(groups)
+
+    def in_constellation(self, abbreviation: str) -> np.ndarray:
+        """Row indices of the objects in a constellation (IAU abbreviation), in catalog order."""
+        return self.constellation_index.get(abbreviation, np.empty(0, dtype=np.intp))
+
+    @cached_property
+    def sky_index(self) -> 'SkyIndex':
+        """RA-hour × Dec-band bucket index over this catalog, built on first use."""
+        return SkyIndex(self.column('ra'), self.column('dec'))
+
+    def rows(self, indices: Iterable[int] | np.ndarray) -> list[dict[str, Any]]:
+        """Materialise JSON-shaped records for the given row indices."""
+        idx = np.asarray(indices, dtype=np.intp)
+        if idx.size == 0:
+            return []
+        values = {name: _decode_column(name, self._columns[name][idx]) for name in RECORD_FIELDS}
+        return [
+            dict(zip(RECORD_FIELDS, row, strict=True))
+            for row in zip(*(values[name] for name in RECORD_FIELDS), strict=True)
+        ]
+
+
+class SkyIndex:
+    """Catalog row indices bucketed by RA hour and declination band.
+
+    Rows are stored sorted by ``(dec band, RA hour)`` with CSR-style bucket
+    offsets, so a sky-region query only touches the buckets that overlap it:
+    within one declination band a range of RA hours is at most two contiguous
+    slices (two when it wraps through 0h).
+    """
+
+    RA_BUCKETS = 24
+
+    def __init__(self, ra: np.ndarray, dec: np.ndarray, dec_band_deg: float = 10.0):
+        ra = np.asarray(ra, dtype=np.float64)
+        dec = np.asarray(dec, dtype=np.float64)
+        self.dec_band_deg = dec_band_deg
+        self.dec_bands = math.ceil(180.0 / dec_band_deg)
+        n_buckets = self.dec_bands * self.RA_BUCKETS
+
+        finite = np.isfinite(ra) & np.isfinite(dec)
+        ra_bucket = (np.floor(np.mod(np.where(finite, ra, 0.0), 360.0) / 15.0) % 24).astype(np.intp)
+        dec_bucket = self._dec_band(np.where(finite, dec, 0.0))
+        # Rows without usable coordinates go to a trailing bucket no query reads.
+        bucket = np.where(finite, dec_bucket * self.RA_BUCKETS + ra_bucket, n_buckets)
+
+        self.order = np.argsort(bucket, kind='stable')
+        self.offsets = np.searchsorted(bucket[self.order], np.arange(n_buckets + 1))
+        self._ra = ra[self.order]
+        self._dec = dec[self.order]
+
+    def _dec_band(self, dec: np.ndarray | float) -> np.ndarray:
+        band = np.floor((np.asarray(dec) + 90.0) / self.dec_band_deg).astype(np.intp)
+        return np.clip(band, 0, self.dec_bands - 1)
+
+    def query(
+        self,
+        lst_deg: float,
+        latitude_deg: float,
+        max_hour_angle_deg: float = 120.0,
+        min_altitude_deg: float = 0.0,
+    ) -> np.ndarray:
+        """Return catalog row indices near the meridian that can rise high enough.
+
+        Selects rows within ``max_hour_angle_deg`` of RA from the local sidereal
+        time whose transit altitude (``90 - |lat - dec|``) reaches
+        ``min_altitude_deg``.  Indices are returned in catalog order.
+        """
+        reach = 90.0 - min_altitude_deg
+        dec_lo = max(-90.0, latitude_deg - reach)
+        dec_hi = min(90.0, latitude_deg + reach)
+        if dec_lo > dec_hi:
+            return np.empty(0, dtype=np.intp)
+
+        if max_hour_angle_deg >= 180.0:
+            hour_ranges = [(0, self.RA_BUCKETS)]
+        else:
+            first = math.floor((lst_deg - max_hour_angle_deg) / 15.0)
+            last = math.floor((lst_deg + max_hour_angle_deg) / 15.0)
+            if last - first + 1 >= self.RA_BUCKETS:
+                hour_ranges = [(0, self.RA_BUCKETS)]
+            else:
+                first %= self.RA_BUCKETS
+                last %= self.RA_BUCKETS
+                if first <= last:
+                    hour_ranges = [(first, last + 1)]
+                else:
+                    hour_ranges = [(first, self.RA_BUCKETS), (0, last + 1)]
+
+        slices = []
+        for band in range(int(self._dec_band(dec_lo)), int(self._dec_band(dec_hi)) + 1):
+            base = band * self.RA_BUCKETS
+            for start, stop in hour_ranges:
+                lo, hi = self.offsets[base + start], self.offsets[base + stop]
+                if hi > lo:
+                    slices.append(np.arange(lo, hi))
+        if not slices:
+            return np.empty(0, dtype=np.intp)
+
+        positions = np.concatenate(slices)
+        ra = self._ra[positions]
+        dec = self._dec[positions]
+        diff = np.abs(ra - lst_deg) % 360.0
+        diff = np.where(diff > 180.0, 360.0 - diff, diff)
+        keep = (diff <= max_hour_angle_deg) & (dec >= dec_lo) & (dec <= dec_hi)
+        return np.sort(self.order[positions[keep]])
+
+
+def write_columnar_catalog(records: Iterable[dict[str, Any]], path: str | Path) -> Path:
+    """Serialise JSON-shaped catalog records to the columnar binary format."""
+    catalog = ColumnarCatalog.from_records(records)
+    header_columns = []
+    payloads = []
+    offset = 0
+    for name in RECORD_FIELDS:
+        array = np.ascontiguousarray(catalog.column(name))
+        if array.dtype.kind == 'f':
+            array = array.astype('<f4', copy=False)
+        offset = _align(offset)
+        header_columns.append(
+            {'name': name, 'dtype': array.dtype.str, 'offset': offset, 'nbytes': array.nbytes}
+        )
+        payloads.append((offset, array.tobytes()))
+        offset += array.nbytes
+
+    header = json.dumps(
+        {'count': len(catalog), 'columns': header_columns}, separators=(',', ':')
+    ).encode('utf-8')
+    data_start = _align(_PREAMBLE.size + len(header))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('wb') as f:
+        f.write(_PREAMBLE.pack(CATALOG_MAGIC, CATALOG_VERSION, len(header)))
+        f.write(header)
+        for column_offset, payload in payloads:
+            f.write(b'\0' * (data_start + column_offset - f.tell()))
+            f.write(payload)
+    return path
+
+
+def load_columnar_catalog(path: str | Path) -> ColumnarCatalog:
+    """Memory-map a columnar catalog file without copying or parsing rows."""
+    mapped = np.memmap(path, dtype=np.uint8, mode='r')
+    if mapped.size < _PREAMBLE.size:
+        raise ValueError(f'{path} is not a columnar catalog (file too short).')
+
+    magic, version, header_len = _PREAMBLE.unpack(mapped[: _PREAMBLE.size].tobytes())
+    if magic != CATALOG_MAGIC:
+        raise ValueError(f'{path} is not a columnar catalog (bad magic).')
+    if version != CATALOG_VERSION:
+        raise ValueError(f'Unsupported catalog version {version} in {path}.')
+
+    header_end = _PREAMBLE.size + header_len
+    header = json.loads(mapped[_PREAMBLE.size : header_end].tobytes())
+    data_start = _align(header_end)
+
+    columns: dict[str, np.ndarray] = {}
+    for spec in header['columns']:
+        start = data_start + spec['offset']
+        end = start + spec['nbytes']
+        if end > mapped.size:
+            raise ValueError(f'Catalog column {spec["name"]!r} is truncated in {path}.')
+        columns[spec['name']] = mapped[start:end].view(np.dtype(spec['dtype']))
+    catalog = ColumnarCatalog(columns)
+    if len(catalog) != header['count']:
+        raise ValueError(f'Catalog row count mismatch in {path}.')
+    return catalog
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _encode_float(value: Any) -> float:
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _decode_column(name: str, values: np.ndarray) -> list[Any]:
+    if name in STRING_COLUMNS:
+        return [value.decode('utf-8') for value in values.tolist()]
+
+    digits = FLOAT_COLUMNS[name]
+    decoded: list[Any] = []
+    for value in values.tolist():
+        if math.isnan(value):
+            decoded.append(None if name in NULLABLE_COLUMNS else value)
+        elif digits == 0:
+            decoded.append(int(round(value)))
+        else:
+            decoded.append(round(value, digits))
+    return decoded
@@ -1,8 +1,12 @@
 import json
+import math
 import os
 import threading
-from datetime import datetime
+from collections.abc import Callable, Iterator, Sequence
+from datetime import datetime, timedelta
+from datetime import time as dt_time
 from importlib import resources
+from types import MappingProxyType
 from typing import Any
 
 import astropy.units as u
@@ -11,9 +15,8 @@ import pytz
 from astropy.coordinates import (
     AltAz,
     EarthLocation,
+    GeocentricTrueEcliptic,
     SkyCoord,
-    get_body,
-    get_sun,
     solar_system_ephemeris,
 )
 from astropy.time import Time
@@ -21,25 +24,58 @@ from astroquery.simbad import Simbad
 from stargazing_core import (
     calculate_moon_info,
     get_moon_altaz,  # noqa: F401 — re-exported for impl.py
-    get_visible_planets,
     identify_constellation,  # noqa: F401 — re-exported for external use
 )
 from stargazing_core import (
-    filter_candidates_by_lst as _filter_candidates_by_lst,
-)
-from stargazing_core import (
-    score_deep_sky_objects as _score_deep_sky_objects,
+    filter_candidates_by_lst as _filter_candidates_by_lst,  # noqa: F401 — re-exported
 )
 
+from src import fast_ephemeris
+from src.aliases import build_star_index, normalize_object_name
+from src.almanac import (
+    MOONRISE_ALTITUDE,
+    TWILIGHT_ALTITUDES,
+    darkness_score,
+    get_night_almanac,
+    localize,
+    night_of,
+)
+from src.altitude_matrix import compute_altitude_matrix, night_grid
+from src.cache import get_resolution_cache
+from src.catalog import ColumnarCatalog, load_columnar_catalog
+from src.constellations import constellation_names, resolve_constellation
+from src.deadline import check_deadline
+from src.ephemeris import get_ephemeris_cache
+from src.fast_ephemeris import resolve_precision
 from src.logging_config import get_logger
+from src.observability import Observability, night_observability
+from src.observer_frame import ObserverFrame
 
 logger = get_logger(__name__)
 
 solar_system_ephemeris.set('builtin')
 
+SOLAR_SYSTEM_BODIES = ('mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune')
+
+# Rise/set search: coarse scan step, then refinement to this tolerance.
+_RISE_SET_SCAN_MINUTES = 30
+_RISE_SET_TOLERANCE_S = 1.0
+
+# Upper bound on objects × times for one batch position request.
+MAX_POSITION_CELLS = 10_000
+
+# Upper bound on nights for one multi-night forecast.
+MAX_FORECAST_NIGHTS = 31
+
+# Sampling step of the fast-mode darkness scan.
+_DARKNESS_SCAN_MINUTES = 10
+
 
 def celestial_pos(
-    celestial_object: str, observer_location: EarthLocation, time: Time | datetime
+    celestial_object: str,
+    observer_location: EarthLocation,
+    time: Time | datetime,
+    precision: str | None = None,
 ) -> tuple[float, float]:
     """
     Calculate the altitude and azimuth angles of a celestial object.
@@ -47,6 +83,8 @@ def celestial_pos(
         celestial_object: Name of the object ("sun", "moon", or planet name).
         observer_location: Observer's EarthLocation.
         time: Observation time (Astropy Time or timezone-aware datetime in LOCAL TIME).
+        precision: ``'full'`` (astropy) or ``'fast'`` (analytic, ~arcminute);
+            ``None`` uses ``STARGAZING_PRECISION``.
     Returns:
         Tuple[float, float]: (altitude_degrees, azimuth_degrees).
         - Altitude: Elevation above the horizon (0° = horizon, 90° = zenith).
@@ -60,24 +98,149 @@ def celestial_pos(
             raise ValueError('Input datetime must be timezone-aware for local time.')
         time = Time(time.astimezone(pytz.UTC))  # Convert to UTC
 
+    if resolve_precision(precision) == 'fast':
+        alt, az = _fast_altaz(
+            [celestial_object], observer_location, fast_ephemeris.julian_date(time)
+        )
+        return float(alt[0]), float(az[0])
+
     obj_coord = _get_celestial_object(celestial_object, time)
     altaz_frame = AltAz(obstime=time, location=observer_location)
     altaz = obj_coord.transform_to(altaz_frame)
     return altaz.alt.deg, altaz.az.deg  # Return (altitude, azimuth)
 
 
+def celestial_positions(
+    celestial_objects: Sequence[str],
+    observer_location: EarthLocation,
+    times: Sequence[Time | datetime],
+    precision: str | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate altitude and azimuth for many objects at many times in one pass.
+
+    Fixed objects are resolved once and rotated into the horizon frame by an
+    :class:`ObserverFrame` (one rotation matrix per time); the Sun, Moon and
+    planets come from the shared ephemeris cache as one geocentric coordinate
+    array and take a single transform into an ``AltAz`` frame whose
+    ``obstime`` is the time array.
+    Args:
+        celestial_objects: Object names, as accepted by ``celestial_pos``.
+        observer_location: Observer's EarthLocation.
+        times: Observation times (Astropy Time or timezone-aware datetimes).
+        precision: ``'full'`` or ``'fast'``; ``None`` uses ``STARGAZING_PRECISION``.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (altitudes, azimuths) in degrees, each of
+        shape ``(len(celestial_objects), len(times))``.
+    Raises:
+        ValueError: If an object cannot be resolved, a datetime is naive, or the
+            request is empty or exceeds ``MAX_POSITION_CELLS``.
+    """
+    if not celestial_objects or not len(times):
+        raise ValueError('At least one object and one time are required.')
+    if len(celestial_objects) * len(times) > MAX_POSITION_CELLS:
+        raise ValueError(
+            f'Too many positions requested ({len(celestial_objects)} objects × '
+            f'{len(times)} times); the limit is {MAX_POSITION_CELLS}.'
+        )
+
+    utc_times = []
+    for t in times:
+        if isinstance(t, datetime):
+            if t.tzinfo is None:
+                raise ValueError('Input datetime must be timezone-aware for local time.')
+            t = Time(t.astimezone(pytz.UTC))
+        utc_times.append(t)
+    obstime = Time(utc_times)
+    if resolve_precision(precision) == 'fast':
+        return _fast_altaz(
+            celestial_objects, observer_location, fast_ephemeris.julian_date(obstime)
+        )
+    altaz_frame = AltAz(obstime=obstime, location=observer_location)
+
+    altitudes = np.empty((len(celestial_objects), len(obstime)))
+    azimuths = np.empty_like(altitudes)
+    body_rows: list[int] = []
+    body_names: list[str] = []
+    fixed_rows: list[int] = []
+    fixed_coords: list[SkyCoord] = []
+    for row, name in enumerate(celestial_objects):
+        key = name.lower()
+        if key in ('sun', 'moon', *SOLAR_SYSTEM_BODIES):
+            body_rows.append(row)
+            body_names.append(key)
+        else:
+            fixed_rows.append(row)
+            fixed_coords.append(_get_celestial_object(name, obstime))
+
+    if body_rows:
+        # (n_bodies, n_times) geocentric positions sharing the obstime array.
+        bodies = get_ephemeris_cache().bodies(body_names, obstime)
+        altaz = bodies.transform_to(altaz_frame)
+        altitudes[body_rows] = altaz.alt.deg
+        azimuths[body_rows] = altaz.az.deg
+    if fixed_rows:
+        fixed = SkyCoord(fixed_coords).icrs
+        alt, az = ObserverFrame(observer_location, obstime).altaz(fixed.ra.deg, fixed.dec.deg)
+        altitudes[fixed_rows] = alt
+        azimuths[fixed_rows] = az
+    return altitudes, azimuths
+
+
+class RiseSetTimes(tuple):
+    """``(rise_time, set_time)`` pair that also carries every crossing in the window.
+
+    Unpacks like the plain two-tuple ``celestial_rise_set`` always returned;
+    ``events`` lists each ``('rise' | 'set', datetime)`` crossing in time order,
+    which matters for the Moon (which can set and rise on the same day) and for
+    objects that only just clear the horizon.
+    """
+
+    events: list[tuple[str, datetime]]
+
+    def __new__(
+        cls,
+        rise_time: datetime | None,
+        set_time: datetime | None,
+        events: Sequence[tuple[str, datetime]] = (),
+    ) -> 'RiseSetTimes':
+        self = super().__new__(cls, (rise_time, set_time))
+        self.events = list(events)
+        return self
+
+    def __getnewargs__(self):
+        # Pickle through __new__ so results cross into compute worker processes.
+        return self[0], self[1], self.events
+
+    @property
+    def rise_time(self) -> datetime | None:
+        return self[0]
+
+    @property
+    def set_time(self) -> datetime | None:
+        return self[1]
+
+
 def celestial_rise_set(
     celestial_object: str, observer_location: EarthLocation, date: datetime, horizon: float = 0.0
-) -> tuple[Time | None, Time | None]:
+) -> RiseSetTimes:
     """
     Calculate rise and set times of a celestial object.
+
+    The day is scanned at ``_RISE_SET_SCAN_MINUTES`` resolution and only the
+    intervals that straddle the horizon are refined, so the result is accurate
+    to about a second while transforming a few dozen timestamps instead of a
+    fine grid over the whole day.
     Args:
         celestial_object: Name of the object ("sun", "moon", or planet name).
         observer_location: Observer's EarthLocation.
         date: Date for calculation (timezone-aware datetime).
         horizon: Horizon elevation in degrees (default: 0).
     Returns:
-        Tuple[Optional[Time], Optional[Time]]: (rise_time, set_time) in UTC.
+        RiseSetTimes: ``(rise_time, set_time)`` as datetimes in the input
+        timezone. ``rise_time`` is the first rise of the day and ``set_time``
+        the first set after it (or the first set, if it never rises again);
+        ``events`` holds every crossing.
     Raises:
         ValueError: If the object is not supported or horizon is invalid.
     """
@@ -91,30 +254,33 @@ def celestial_rise_set(
     except (pytz.UnknownTimeZoneError, KeyError):
         time_zone = date.tzinfo
     origin_zone = pytz.timezone(zone='UTC')
-    time_grid = _generate_time_grid(date)
-    name = celestial_object.lower()
-    altaz_frame = AltAz(obstime=time_grid, location=observer_location)
-    if name == 'sun':
-        obj_coord = get_sun(time_grid)
-    elif name == 'moon':
-        obj_coord = get_body('moon', time_grid)
-    elif name in ['mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune']:
-        obj_coord = get_body(name, time_grid)
-    else:
-        base_coord = _resolve_simbad_object(celestial_object)
-        obj_coord = base_coord
-    altaz = obj_coord.transform_to(altaz_frame)
-    altitudes = np.array(altaz.alt.deg)
+
+    altitude_at = _altitude_function(celestial_object, observer_location)
+    time_grid = _generate_time_grid(date, step_minutes=_RISE_SET_SCAN_MINUTES)
+    offsets = (time_grid - time_grid[0]).to_value(u.s)
+    heights = altitude_at(time_grid) - horizon
+
+    def height_at(seconds: np.ndarray) -> np.ndarray:
+        return altitude_at(time_grid[0] + seconds * u.s) - horizon
+
+    lo, hi = _find_horizon_crossings(heights)
+    crossings = _refine_crossings(height_at, offsets[lo], offsets[hi], heights[lo], heights[hi])
 
     def __convert_timezone(time):
         t = time.to_datetime()
         t = origin_zone.localize(t)
         return t.astimezone(time_zone)
 
-    rise_idx, set_idx = _find_rise_set_indices(altitudes, horizon)
-    rise_time = __convert_timezone(time_grid[rise_idx]) if rise_idx is not None else None
-    set_time = __convert_timezone(time_grid[set_idx]) if set_idx is not None else None
-    return rise_time, set_time
+    events = [
+        ('rise' if heights[i] <= 0 else 'set', __convert_timezone(time_grid[0] + seconds * u.s))
+        for i, seconds in zip(lo, crossings, strict=True)
+    ]
+    rise_time = next((t for kind, t in events if kind == 'rise'), None)
+    sets = [t for kind, t in events if kind == 'set']
+    set_time = next((t for t in sets if rise_time is None or t > rise_time), None)
+    if set_time is None and sets:
+        set_time = sets[0]
+    return RiseSetTimes(rise_time, set_time, events)
 
 
 # calculate_moon_info is re-exported from stargazing_core (imported at top of file)
@@ -123,7 +289,53 @@ def celestial_rise_set(
 # get_moon_altaz is re-exported from stargazing_core (imported at top of file)
 
 
-# get_visible_planets is re-exported from stargazing_core (imported at top of file)
+def get_visible_planets(
+    observer_location: EarthLocation, time: Time | datetime, precision: str | None = None
+) -> list[dict[str, Any]]:
+    """
+    Get a list of planets currently above the horizon.
+
+    Same contract as ``stargazing_core.get_visible_planets``, but all seven
+    planets come from the shared ephemeris cache and take one ``AltAz``
+    transform together.
+    Args:
+        observer_location: Observer's EarthLocation.
+        time: Observation time (Astropy Time or timezone-aware datetime).
+        precision: ``'full'`` or ``'fast'``; ``None`` uses ``STARGAZING_PRECISION``.
+    Returns:
+        List of dicts with planet name, altitude, azimuth, and constellation.
+    """
+    if isinstance(time, datetime):
+        if time.tzinfo is None:
+            raise ValueError('Input datetime must be timezone-aware for local time.')
+        time = Time(time.astimezone(pytz.UTC))
+
+    alts, azs = _planet_altaz(observer_location, time, resolve_precision(precision) == 'fast')
+    return _visible_planets(alts, azs)
+
+
+def _planet_altaz(
+    observer_location: EarthLocation, time: Time, fast: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Planet ``(altitudes, azimuths)`` of shape ``(len(SOLAR_SYSTEM_BODIES), *time.shape)``."""
+    if fast:
+        return _fast_altaz(SOLAR_SYSTEM_BODIES, observer_location, fast_ephemeris.julian_date(time))
+    planets = get_ephemeris_cache().bodies(SOLAR_SYSTEM_BODIES, time)
+    altaz = planets.transform_to(AltAz(obstime=time, location=observer_location))
+    return altaz.alt.deg, altaz.az.deg
+
+
+def _visible_planets(alts: np.ndarray, azs: np.ndarray) -> list[dict[str, Any]]:
+    return [
+        {
+            'name': planet.capitalize(),
+            'altitude': float(alt),
+            'azimuth': float(az),
+            'constellation': None,
+        }
+        for planet, alt, az in zip(SOLAR_SYSTEM_BODIES, alts, azs, strict=True)
+        if alt > 0
+    ]
 
 
 def get_constellation_center(
@@ -138,12 +350,11 @@ def get_constellation_center(
             raise ValueError('Input datetime must be timezone-aware for local time.')
         time = Time(time.astimezone(pytz.UTC))
 
-    centers = _load_constellation_centers()
-    centers_map = {item['name'].lower(): item for item in centers}
+    center = _constellation_center(constellation_name)
     key = constellation_name.lower()
-    if key in centers_map:
-        ra = float(centers_map[key]['ra'])
-        dec = float(centers_map[key]['dec'])
+    if center is not None:
+        ra = float(center['ra'])
+        dec = float(center['dec'])
         center_coord = SkyCoord(ra=ra * u.deg, dec=dec * u.deg, frame='icrs')
     else:
         fallback = {
@@ -160,9 +371,9 @@ def get_constellation_center(
             'canis major': 'Sirius',
         }
         if key in fallback:
-            center_coord = _resolve_simbad_object(fallback[key])
+            center_coord = _resolve_fixed_object(fallback[key])
         else:
-            center_coord = _resolve_simbad_object(constellation_name)
+            center_coord = _resolve_fixed_object(constellation_name)
 
     altaz_frame = AltAz(obstime=time, location=observer_location)
     altaz = center_coord.transform_to(altaz_frame)
@@ -174,10 +385,74 @@ def get_constellation_center(
     }
 
 
+def constellation_objects(
+    constellation: str,
+    observer_location: EarthLocation,
+    time: datetime,
+    min_altitude: float = 0.0,
+    limit: int = 50,
+    precision: str | None = None,
+) -> dict[str, Any]:
+    """Catalog objects in ``constellation`` above ``min_altitude`` at ``time``.
+
+    Rows come from the catalog's constellation index and only those are
+    transformed.  Objects are listed brightest first, those without a
+    magnitude last; ``total`` counts the constellation's catalog objects and
+    ``visible`` those above ``min_altitude``.
+
+    Raises:
+        ValueError: If the constellation is unknown, ``limit`` is below 1, or
+            ``time`` is not timezone-aware.
+    """
+    if time.tzinfo is None:
+        raise ValueError('Input datetime must be timezone-aware.')
+    if limit < 1:
+        raise ValueError('limit must be at least 1.')
+    abbreviation = resolve_constellation(constellation)
+    if abbreviation is None:
+        raise ValueError(f"Unknown constellation '{constellation}'.")
+
+    catalog = _load_objects()
+    rows = catalog.in_constellation(abbreviation)
+    fast = resolve_precision(precision) == 'fast'
+    altaz = _fixed_altaz(
+        observer_location, Time(time), fast_ephemeris.julian_date(time) if fast else None, fast
+    )
+    alt, az = altaz(catalog.values('ra')[rows], catalog.values('dec')[rows])
+
+    visible = np.flatnonzero(alt >= min_altitude)
+    magnitude = catalog.values('magnitude')[rows]
+    rank = np.where(np.isnan(magnitude), np.inf, magnitude)
+    order = visible[np.argsort(rank[visible], kind='stable')][:limit]
+    objects = [
+        {
+            'name': row['name'],
+            'type': row['type'],
+            'magnitude': None if math.isnan(row['magnitude']) else row['magnitude'],
+            'catalog': row['catalog'],
+            'altitude': round(float(alt[i]), 1),
+            'azimuth': round(float(az[i]), 1),
+            'angular_size_arcmin': row['angular_size_maj_arcmin'],
+        }
+        for i, row in zip(order.tolist(), catalog.rows(rows[order]), strict=True)
+    ]
+    return {
+        'constellation': constellation_names()[abbreviation],
+        'abbreviation': abbreviation,
+        'min_altitude': min_altitude,
+        'total': len(rows),
+        'visible': len(visible),
+        'objects': objects,
+    }
+
+
 OBJECTS_CACHE = None
 CONSTELLATIONS_CACHE = None
+CONSTELLATION_CENTERS_BY_NAME = None
+BRIGHT_STARS_CACHE = None
 _objects_lock = threading.Lock()
 _constellations_lock = threading.Lock()
+_bright_stars_lock = threading.Lock()
 
 
 def _load_data_resource(filename: str) -> list[dict[str, Any]]:
@@ -186,7 +461,20 @@ def _load_data_resource(filename: str) -> list[dict[str, Any]]:
     return json.loads(resource.read_text(encoding='utf-8'))
 
 
-def _load_objects():
+def _load_catalog_resource(filename: str) -> ColumnarCatalog:
+    """Memory-map a packaged columnar catalog from the `src/data` resource directory."""
+    resource = resources.files('src').joinpath('data').joinpath(filename)
+    with resources.as_file(resource) as path:
+        return load_columnar_catalog(path)
+
+
+def _load_objects() -> ColumnarCatalog:
+    """Return the deep-sky catalog, memory-mapping ``objects.bin`` when available.
+
+    Falls back to parsing ``objects.json`` (the interchange format) when the
+    binary file is missing or unreadable, and to an empty catalog when neither
+    resource exists.
+    """
     global OBJECTS_CACHE
     if OBJECTS_CACHE is not None:
         return OBJECTS_CACHE
@@ -196,11 +484,17 @@ def _load_objects():
         if OBJECTS_CACHE is not None:
             return OBJECTS_CACHE
 
+        try:
+            OBJECTS_CACHE = _load_catalog_resource('objects.bin')
+            return OBJECTS_CACHE
+        except (FileNotFoundError, ValueError) as e:
+            logger.debug('Binary catalog unavailable (%s); falling back to objects.json', e)
+
         data_path = os.path.join(os.path.dirname(__file__), 'data/objects.json')
         try:
-            OBJECTS_CACHE = _load_data_resource('objects.json')
+            OBJECTS_CACHE = ColumnarCatalog.from_records(_load_data_resource('objects.json'))
         except FileNotFoundError:
-            OBJECTS_CACHE = []  # Should handle gracefully
+            OBJECTS_CACHE = ColumnarCatalog.from_records([])  # Should handle gracefully
             logger.warning('Objects data file not found at %s', data_path)
 
     return OBJECTS_CACHE
@@ -223,104 +517,523 @@ def _load_constellation_centers():
     return CONSTELLATIONS_CACHE
 
 
+def _constellation_center(name: str) -> dict[str, Any] | None:
+    """Packaged center of a constellation, by full name or IAU abbreviation (any case)."""
+    global CONSTELLATION_CENTERS_BY_NAME
+    if CONSTELLATION_CENTERS_BY_NAME is None:
+        centers = _load_constellation_centers()
+        with _constellations_lock:
+            if CONSTELLATION_CENTERS_BY_NAME is None:
+                CONSTELLATION_CENTERS_BY_NAME = MappingProxyType(
+                    {item['name'].strip().lower(): item for item in centers}
+                )
+
+    center = CONSTELLATION_CENTERS_BY_NAME.get(name.lower())
+    if center is None:
+        abbreviation = resolve_constellation(name)
+        if abbreviation is not None:
+            full_name = constellation_names()[abbreviation]
+            center = CONSTELLATION_CENTERS_BY_NAME.get(full_name.lower())
+    return center
+
+
+def _load_bright_stars() -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """Return the packaged bright-star table and its name/designation index."""
+    global BRIGHT_STARS_CACHE
+    if BRIGHT_STARS_CACHE is not None:
+        return BRIGHT_STARS_CACHE
+
+    with _bright_stars_lock:
+        if BRIGHT_STARS_CACHE is not None:
+            return BRIGHT_STARS_CACHE
+
+        try:
+            stars = _load_data_resource('bright_stars.json')
+        except FileNotFoundError:
+            stars = []
+            logger.warning('Bright star data file bright_stars.json not found')
+        BRIGHT_STARS_CACHE = (stars, build_star_index(stars))
+
+    return BRIGHT_STARS_CACHE
+
+
+def _find_bright_star(name: str) -> dict[str, Any] | None:
+    """Look up a star by proper name, Bayer/Flamsteed or HR designation."""
+    stars, index = _load_bright_stars()
+    row = index.get(normalize_object_name(name))
+    return stars[row] if row is not None else None
+
+
 # _filter_candidates_by_lst is re-exported from stargazing_core (imported at top)
-# _score_deep_sky_objects is re-exported from stargazing_core (imported at top)
+
+
+# ``_score_candidates`` drops everything below 20° altitude; objects whose
+# transit altitude cannot reach that are skipped up front (1° slack covers
+# precession of the J2000 catalog coordinates).
+_CANDIDATE_MIN_ALTITUDE_DEG = 19.0
+
+
+def _filter_candidate_indices(
+    catalog: ColumnarCatalog, lst_deg: float, latitude_deg: float | None = None
+) -> np.ndarray:
+    """Index-backed equivalent of ``_filter_candidates_by_lst`` returning row indices.
+
+    Keeps objects within ±8h of RA from the local sidereal time and drops faint
+    (mag > 10) NGC entries.  When ``latitude_deg`` is given, objects that never
+    climb high enough to be scored at that latitude are skipped as well.  Only
+    the sky-index buckets overlapping the region are read.
+    """
+    if len(catalog) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    if latitude_deg is None:
+        # A -90° altitude floor admits every declination band.
+        indices = catalog.sky_index.query(lst_deg, 0.0, min_altitude_deg=-90.0)
+    else:
+        indices = catalog.sky_index.query(
+            lst_deg, latitude_deg, min_altitude_deg=_CANDIDATE_MIN_ALTITUDE_DEG
+        )
+    faint_ngc = (catalog.column('catalog')[indices] == b'NGC') & (
+        catalog.column('magnitude')[indices] > 10.0
+    )
+    return indices[~faint_ngc]
 
 
 def calculate_nightly_forecast(
-    observer_location: EarthLocation, date: datetime, limit: int = 50
+    observer_location: EarthLocation,
+    date: datetime,
+    limit: int = 50,
+    precision: str | None = None,
+    nights: int = 1,
+    include_curves: bool = False,
 ) -> dict[str, Any]:
     """Generate a curated list of best objects to view for a given night.
 
     Pipeline: time validation → moon/planet data → LST coarse filter →
-    detailed altitude+moon-glare scoring → sort & trim.
+    detailed altitude+moon-glare scoring → sort & trim.  With
+    ``precision='fast'`` every step uses the analytic engine in
+    ``src.fast_ephemeris`` instead of astropy.
+
+    With ``nights > 1`` the same local clock time on each following night is
+    forecast as well (see :func:`_forecast_nights`); the result then also has
+    a ``nights`` list of per-night summaries and the ``best_night``.
+
+    ``include_curves`` adds an ``altitude_curve`` (civil dusk to civil dawn)
+    to every emitted deep-sky target; it is off by default because the
+    curves make up most of the response.
+    """
+    if date.tzinfo is None:
+        raise ValueError('Input datetime must be timezone-aware.')
+    if not 1 <= nights <= MAX_FORECAST_NIGHTS:
+        raise ValueError(f'nights must be between 1 and {MAX_FORECAST_NIGHTS}.')
+
+    if nights > 1:
+        fast = resolve_precision(precision) == 'fast'
+        return _forecast_nights(observer_location, date, limit, fast, nights, include_curves)
+
+    *_, complete = iter_nightly_forecast(
+        observer_location, date, limit, precision, None, include_curves
+    )
+    return complete['forecast']
+
+
+# Candidates scored per step of :func:`iter_nightly_forecast`.
+FORECAST_BATCH_SIZE = 500
+
+
+def iter_nightly_forecast(
+    observer_location: EarthLocation,
+    date: datetime,
+    limit: int = 50,
+    precision: str | None = None,
+    batch_size: int | None = FORECAST_BATCH_SIZE,
+    include_curves: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Single-night :func:`calculate_nightly_forecast`, yielded as it is computed.
+
+    Yields ``{'stage', 'progress', 'forecast'}`` events (``progress`` 0–1):
+
+    - ``'context'``: Moon, planets and the night almanac; ``deep_sky`` empty.
+    - ``'deep_sky'``: after each batch of ``batch_size`` candidates, the best
+      ``limit`` targets so far, with ``scored`` and ``total`` candidate counts.
+    - ``'complete'``: the final forecast, with altitude curves when
+      ``include_curves`` is set.
+
+    Batches share one observer frame and Moon position.  The running top list
+    is ordered by (score, catalog position), exactly like the one-shot sort,
+    so the final ranking does not depend on ``batch_size`` (``None`` scores
+    every candidate in one batch).
     """
     if date.tzinfo is None:
         raise ValueError('Input datetime must be timezone-aware.')
 
+    fast = resolve_precision(precision) == 'fast'
     time = Time(date)
+    jd = fast_ephemeris.julian_date(date)
 
     # 1. Moon and planet context
-    moon_info = calculate_moon_info(date)
-    moon_coord = get_body('moon', time)
-    planets = get_visible_planets(observer_location, time)
+    if fast:
+        moon_info = fast_ephemeris.moon_info(jd)
+    else:
+        moon_info = calculate_moon_info(date)
+    planets = get_visible_planets(observer_location, time, precision='fast' if fast else 'full')
+    almanac = None if fast else get_night_almanac(observer_location, date)
+    forecast = {
+        'moon_phase': moon_info,
+        'planets': planets,
+        'deep_sky': [],
+        'night': almanac.to_dict() if almanac is not None else None,
+    }
+    check_deadline('moon and planets')
+    yield {'stage': 'context', 'progress': 0.0, 'forecast': dict(forecast)}
 
     # 2. Coarse LST filter — keep only objects near the meridian
-    lst = time.sidereal_time('mean', longitude=observer_location.lon)
-    raw_objects = _load_objects()
-    candidates = _filter_candidates_by_lst(raw_objects, lst.deg)
-
-    # 3. Fine-grained scoring with altitude and moon-glare
-    scored_objects = _score_deep_sky_objects(
-        candidates, time, observer_location, moon_coord, moon_info['illumination']
+    if fast:
+        lst_deg = float(fast_ephemeris.sidereal_time_deg(jd) + observer_location.lon.deg) % 360
+    else:
+        lst_deg = time.sidereal_time('mean', longitude=observer_location.lon).deg
+    catalog = _load_objects()
+    candidate_idx = _filter_candidate_indices(catalog, lst_deg, observer_location.lat.deg)
+    check_deadline('candidate filter')
+
+    # 3. Closed-form visibility: skip objects never up during astronomical darkness
+    visibility = night_observability(
+        catalog.column('ra')[candidate_idx],
+        catalog.column('dec')[candidate_idx],
+        observer_location,
+        date,
+        almanac,
     )
+    eligible = ~(visibility.observable_hours <= 0)
+    check_deadline('visibility')
+
+    # 4. Fine-grained scoring with altitude and moon-glare, batch by batch
+    altaz, moon_alt, moon_az = _horizontal_transform(observer_location, time, jd, fast)
+    total = len(candidate_idx)
+    step = batch_size or max(total, 1)
+    best: list[dict[str, Any]] = []
+    for start in range(0, total, step):
+        stop = min(start + step, total)
+        batch = candidate_idx[start:stop]
+        alt, az = altaz(*_candidate_coordinates(catalog, batch))
+        scored = _score_candidates(
+            catalog,
+            batch,
+            alt,
+            az,
+            moon_alt,
+            moon_az,
+            moon_info['illumination'],
+            limit,
+            eligible[start:stop],
+            offset=start,
+        )
+        check_deadline('scoring')
+        best = _merge_targets(best, _annotate_targets(scored, visibility), limit)
+        forecast['deep_sky'] = list(best)
+        yield {
+            'stage': 'deep_sky',
+            'progress': stop / total,
+            'scored': stop,
+            'total': total,
+            'forecast': dict(forecast),
+        }
+
+    if include_curves:
+        _attach_altitude_curves(
+            [best], [night_grid(observer_location, date, almanac)], observer_location, fast
+        )
+    forecast['deep_sky'] = best
+    yield {'stage': 'complete', 'progress': 1.0, 'forecast': forecast}
 
-    # Enrich with catalog data (angular size) and transit estimate
-    _obj_index = {o['name']: o for o in raw_objects}
-    for obj in scored_objects[:limit]:
-        orig = _obj_index.get(obj['name'])
-        if orig:
-            obj['angular_size_arcmin'] = orig.get('angular_size_maj_arcmin')
-            # The altitude at scoring time (near midnight) ≈ transit altitude
-            obj['transit_alt'] = obj.get('altitude')
 
+def _merge_targets(
+    best: list[dict[str, Any]], scored: list[dict[str, Any]], limit: int
+) -> list[dict[str, Any]]:
+    """Best ``limit`` of two ranked lists, ties kept in catalog order."""
+    return sorted(best + scored, key=lambda obj: (_rank(obj['score']), obj['_index']))[:limit]
+
+
+def _rank(score: float) -> float:
+    """Sort key for a score: NaN (unknown magnitude) after every real score."""
+    return math.inf if math.isnan(score) else score
+
+
+def _annotate_targets(
+    targets: list[dict[str, Any]], visibility: Observability
+) -> list[dict[str, Any]]:
+    """Enrich scored targets with closed-form visibility (row ``_index`` of ``visibility``)."""
+    for obj in targets:
+        obj.update(visibility.row(obj['_index']))
+    return targets
+
+
+def _attach_altitude_curves(
+    target_lists: list[list[dict[str, Any]]],
+    grids: list[np.ndarray],
+    observer_location: EarthLocation,
+    fast: bool,
+) -> None:
+    """Fill ``altitude_curve`` on emitted targets from one altitude matrix.
+
+    Rows are the distinct emitted objects and columns every night's grid back
+    to back, so only targets that reach the response get a curve.
+    """
+    positions = {}
+    for targets in target_lists:
+        for obj in targets:
+            positions.setdefault(obj['name'], (obj['_ra'], obj['_dec']))
+    if not positions:
+        return
+
+    ra, dec = np.array(list(positions.values())).T
+    matrix = compute_altitude_matrix(ra, dec, observer_location, np.concatenate(grids), fast)
+    row = {name: index for index, name in enumerate(positions)}
+    start = 0
+    for targets, grid in zip(target_lists, grids, strict=True):
+        columns = slice(start, start + len(grid))
+        for obj in targets:
+            obj['altitude_curve'] = matrix.curve(row[obj['name']], columns)
+        start += len(grid)
+
+
+def _forecast_nights(
+    observer_location: EarthLocation,
+    date: datetime,
+    limit: int,
+    fast: bool,
+    nights: int,
+    include_curves: bool = False,
+) -> dict[str, Any]:
+    """Forecast ``nights`` consecutive nights at the clock time of ``date``.
+
+    The per-night work is shared: Moon phase, planets and the altitude of
+    every candidate on every night each come from one array evaluation over
+    the nightly times.  LST advances only ~4 minutes a day, so one candidate
+    set — the coarse filter at the first and last night, which between them
+    cover every window in between — serves all nights.  Each night is ranked
+    by its darkness score, the share of astronomical night without the Moon.
+    """
+    moments = [_days_later(date, days) for days in range(nights)]
+    time = Time([moment.astimezone(pytz.UTC) for moment in moments])
+    jd = fast_ephemeris.julian_date(time)
+    lat = observer_location.lat.deg
+    lon = observer_location.lon.deg
+
+    # 1. Moon and planet context for every night
+    moon_infos = fast_ephemeris.moon_phases(jd) if fast else _moon_phases(time)
+    planet_alt, planet_az = _planet_altaz(observer_location, time, fast)
+
+    # 2. One coarse LST filter for all nights
+    if fast:
+        lst_deg = np.mod(fast_ephemeris.sidereal_time_deg(jd) + lon, 360.0)
+    else:
+        lst_deg = time.sidereal_time('mean', longitude=observer_location.lon).deg
+    catalog = _load_objects()
+    candidate_idx = np.union1d(
+        _filter_candidate_indices(catalog, float(lst_deg[0]), lat),
+        _filter_candidate_indices(catalog, float(lst_deg[-1]), lat),
+    )
+
+    # 3. Candidate and Moon altitudes on every night
+    ra, dec = _candidate_coordinates(catalog, candidate_idx)
+    if fast:
+        # Precession over a month is a few arcseconds: one epoch serves all nights.
+        ra_date, dec_date = fast_ephemeris.precess_from_j2000(ra, dec, jd[nights // 2])
+        alt, az = fast_ephemeris.horizontal(
+            ra_date[:, np.newaxis], dec_date[:, np.newaxis], jd, lat, lon
+        )
+        moon_ra, moon_dec, moon_distance = fast_ephemeris.moon_position(jd)
+        moon_alt, moon_az = fast_ephemeris.horizontal(
+            moon_ra, moon_dec, jd, lat, lon, moon_distance
+        )
+    else:
+        alt, az = ObserverFrame(observer_location, time).altaz(ra, dec)
+        moon = get_ephemeris_cache().body('moon', time)
+        moon_altaz = moon.transform_to(AltAz(obstime=time, location=observer_location))
+        moon_alt, moon_az = moon_altaz.alt.deg, moon_altaz.az.deg
+    alt = np.reshape(alt, (len(candidate_idx), nights))
+    az = np.reshape(az, (len(candidate_idx), nights))
+    check_deadline('candidate altitudes')
+
+    # 4. Darkness of every night
+    if fast:
+        almanacs = [None] * nights
+        darkness = _fast_darkness(observer_location, moments)
+    else:
+        almanacs = [get_night_almanac(observer_location, moment) for moment in moments]
+        darkness = [(a.dark_hours, a.astronomical_hours) for a in almanacs]
+
+    summaries = []
+    for index, moment in enumerate(moments):
+        check_deadline(f'night {index + 1} of {nights}')
+        moon_info = moon_infos[index]
+        almanac = almanacs[index]
+        visibility = night_observability(ra, dec, observer_location, moment, almanac)
+        scored_objects = _score_candidates(
+            catalog,
+            candidate_idx,
+            alt[:, index],
+            az[:, index],
+            float(moon_alt[index]),
+            float(moon_az[index]),
+            moon_info['illumination'],
+            limit,
+            ~(visibility.observable_hours <= 0),
+        )
+        dark_hours, astronomical_hours = darkness[index]
+        summaries.append(
+            {
+                'night_of': night_of(moment).isoformat(),
+                'time': moment.isoformat(),
+                'moon_phase': moon_info,
+                'planets': _visible_planets(planet_alt[:, index], planet_az[:, index]),
+                'deep_sky': _annotate_targets(scored_objects, visibility),
+                'night': almanac.to_dict() if almanac is not None else None,
+                'dark_hours': round(dark_hours, 2),
+                'darkness_score': darkness_score(dark_hours, astronomical_hours),
+            }
+        )
+
+    if include_curves:
+        _attach_altitude_curves(
+            [night['deep_sky'] for night in summaries],
+            [night_grid(observer_location, m, a) for m, a in zip(moments, almanacs, strict=True)],
+            observer_location,
+            fast,
+        )
+
+    # max() keeps the earliest of equally dark nights.
+    best = max(summaries, key=lambda night: (night['darkness_score'], night['dark_hours']))
+    first = summaries[0]
     return {
-        'moon_phase': moon_info,
-        'planets': planets,
-        'deep_sky': scored_objects[:limit],
+        'moon_phase': first['moon_phase'],
+        'planets': first['planets'],
+        'deep_sky': first['deep_sky'],
+        'night': first['night'],
+        'nights': summaries,
+        'best_night': best['night_of'],
     }
 
 
-# identify_constellation is re-exported from stargazing_core (imported at top of file)
+def _days_later(moment: datetime, days: int) -> datetime:
+    """The same local clock time ``days`` later, with the UTC offset of that date."""
+    return localize(moment.tzinfo, moment.replace(tzinfo=None) + timedelta(days=days))
+
+
+def _moon_phases(time: Time) -> list[dict[str, Any]]:
+    """``calculate_moon_info`` for every instant of ``time``, from the shared ephemeris."""
+    sun, moon = get_ephemeris_cache().bodies(['sun', 'moon'], time)
+    elongation = sun.separation(moon).deg
+    ecliptic = GeocentricTrueEcliptic(obstime=time)
+    lon_diff = np.mod(moon.transform_to(ecliptic).lon.deg - sun.transform_to(ecliptic).lon.deg, 360)
+    distance = moon.distance.to(u.km).value
+    return [
+        {
+            'illumination': float((1 - np.cos(np.radians(e))) / 2.0),
+            'phase_name': fast_ephemeris.phase_name(d),
+            'age_days': d / 360.0 * 29.53059,
+            'elongation': e,
+            'earth_distance': r,
+        }
+        for e, d, r in zip(elongation.tolist(), lon_diff.tolist(), distance.tolist(), strict=True)
+    ]
 
 
-_simbad_cache: dict[str, SkyCoord] = {}
-_simbad_cache_lock = threading.Lock()
+def _fast_darkness(
+    observer_location: EarthLocation, moments: list[datetime]
+) -> list[tuple[float, float]]:
+    """``(dark_hours, astronomical_hours)`` per night from one analytic Sun/Moon scan.
+
+    Each night (local noon to local noon) is sampled every
+    ``_DARKNESS_SCAN_MINUTES``; this is the fast-mode stand-in for the
+    almanac's refined crossings and agrees with it to about one step.
+    """
+    lat = observer_location.lat.deg
+    lon = observer_location.lon.deg
+    noons = fast_ephemeris.julian_date(
+        [localize(m.tzinfo, datetime.combine(night_of(m), dt_time(12))) for m in moments]
+    )
+    step_days = _DARKNESS_SCAN_MINUTES / 1440.0
+    jd = noons[:, np.newaxis] + (np.arange(round(1 / step_days)) + 0.5) * step_days
+
+    sun_ra, sun_dec, _ = fast_ephemeris.sun_position(jd)
+    sun_alt, _ = fast_ephemeris.horizontal(sun_ra, sun_dec, jd, lat, lon)
+    moon_ra, moon_dec, moon_distance = fast_ephemeris.moon_position(jd)
+    moon_alt, _ = fast_ephemeris.horizontal(moon_ra, moon_dec, jd, lat, lon, moon_distance)
+
+    is_night = sun_alt < TWILIGHT_ALTITUDES['astronomical']
+    is_dark = is_night & (moon_alt < MOONRISE_ALTITUDE)
+    hours = _DARKNESS_SCAN_MINUTES / 60.0
+    dark_hours = is_dark.sum(axis=1) * hours
+    night_hours = is_night.sum(axis=1) * hours
+    return list(zip(dark_hours.tolist(), night_hours.tolist(), strict=True))
+
+
+# identify_constellation is re-exported from stargazing_core (imported at top of file)
 
 
 def _resolve_simbad_object(name: str) -> SkyCoord:
     """Resolve deep-space object name to SkyCoord using SIMBAD with caching.
 
-    Only caches successful results — transient network errors are NOT cached,
-    unlike ``@lru_cache`` which would permanently poison the cache.
+    Results go through the shared resolution cache (see
+    :func:`src.cache.get_resolution_cache`): coordinates are cached
+    permanently and names SIMBAD does not know are cached for a short TTL.
+    Transient network errors propagate and are NOT cached.
     """
-    # Fast path: cache hit (no lock needed for read-only check, and SkyCoord
-    # objects are immutable once constructed)
-    cached = _simbad_cache.get(name)
+    cache = get_resolution_cache()
+    cached = cache.lookup(name)
     if cached is not None:
-        return cached
+        if not cached.found:
+            raise ValueError(f"Object '{name}' not found in SIMBAD.")
+        return SkyCoord(ra=cached.ra_deg * u.deg, dec=cached.dec_deg * u.deg, frame='icrs')
 
     logger.debug("Resolving object '%s' via Simbad...", name)
     # Query SIMBAD for the object
     # Note: Simbad query involves network request which can be SLOW.
     result = Simbad.query_object(name)
-    if result is None:
+    if result is None or len(result) == 0:
         # Try capitalizing first letter (e.g. "sirius" -> "Sirius")
         logger.debug("'%s' not found, trying '%s'...", name, name.capitalize())
         result = Simbad.query_object(name.capitalize())
 
-    if result is None:
+    if result is None or len(result) == 0:
         logger.debug("Object '%s' not found in Simbad.", name)
+        cache.store_negative(name)
         raise ValueError(f"Object '{name}' not found in SIMBAD.")
 
     logger.debug("Successfully resolved '%s'.", name)
 
-    # Check if we got any results
-    if len(result) == 0:
-        raise ValueError(f"Simbad returned empty result for '{name}'.")
-
     # Extract RA and Dec from the query result
     ra = result['ra'][0]
     dec = result['dec'][0]
-    coord = SkyCoord(ra, dec, unit=(u.hourangle, u.deg), frame='icrs')
-
-    # Only cache successful results — exceptions propagate without poisoning the cache
-    with _simbad_cache_lock:
-        _simbad_cache[name] = coord
+    if isinstance(ra, str):
+        coord = SkyCoord(ra, dec, unit=(u.hourangle, u.deg), frame='icrs')
+    else:
+        coord = SkyCoord(ra=float(ra) * u.deg, dec=float(dec) * u.deg, frame='icrs')
 
+    cache.store(name, coord.ra.deg, coord.dec.deg)
     return coord
 
 
+def _resolve_fixed_object(name: str) -> SkyCoord:
+    """Resolve a non-solar-system object, trying local data before SIMBAD.
+
+    Messier/NGC/IC designations in any spacing or case, and common names such
+    as "orion nebula", are answered from the packaged catalog's alias index;
+    star names and Bayer/Flamsteed designations from the bright-star table.
+    Only names neither knows go over the network.
+    """
+    record = _load_objects().record(name)
+    if record is not None:
+        return SkyCoord(ra=record['ra'] * u.deg, dec=record['dec'] * u.deg, frame='icrs')
+
+    star = _find_bright_star(name)
+    if star is not None:
+        return SkyCoord(ra=star['ra'] * u.deg, dec=star['dec'] * u.deg, frame='icrs')
+    return _resolve_simbad_object(name)
+
+
 def _get_celestial_object(name: str, time: Time) -> SkyCoord:
     """Resolve a celestial object name to its SkyCoord.
     Supports:
@@ -330,33 +1043,263 @@ def _get_celestial_object(name: str, time: Time) -> SkyCoord:
     """
     name = name.lower()
 
-    # Solar system objects
-    if name == 'sun':
-        return get_sun(time)
-    elif name == 'moon':
-        return get_body('moon', time)
-    elif name in ['mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune']:
-        return get_body(name, time)
+    # Solar system objects (geocentric positions are shared across requests)
+    if name in ('sun', 'moon', *SOLAR_SYSTEM_BODIES):
+        return get_ephemeris_cache().body(name, time)
 
     # Deep-space objects (stars, galaxies, nebulae)
     try:
-        return _resolve_simbad_object(name)
+        return _resolve_fixed_object(name)
 
     except Exception as e:
         raise ValueError(f"Failed to resolve object '{name}': {str(e)}")
 
 
-def _generate_time_grid(date: datetime) -> Time:
-    """Generate a grid of Time objects for the given date (5-minute intervals)."""
-    start = Time(date.replace(hour=0, minute=0, second=0))
-    end = Time(date.replace(hour=23, minute=59, second=59))
-    return start + np.linspace(0, 1, 288) * (end - start)  # 288 = 24h / 5min
+def _fast_altaz(
+    celestial_objects: Sequence[str], observer_location: EarthLocation, jd: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Analytic ``(altitudes, azimuths)`` of shape ``(len(objects), *jd.shape)``."""
+    lat = observer_location.lat.deg
+    lon = observer_location.lon.deg
+    jd = np.asarray(jd, dtype=np.float64)
+    altitudes = np.empty((len(celestial_objects), *jd.shape))
+    azimuths = np.empty_like(altitudes)
+    for row, name in enumerate(celestial_objects):
+        key = name.lower()
+        if key in fast_ephemeris.FAST_BODIES:
+            ra, dec, distance = fast_ephemeris.body_position(key, jd)
+        else:
+            coord = _get_celestial_object(name, time=None)
+            ra, dec = fast_ephemeris.precess_from_j2000(coord.ra.deg, coord.dec.deg, jd)
+            distance = None
+        altitudes[row], azimuths[row] = fast_ephemeris.horizontal(ra, dec, jd, lat, lon, distance)
+    return altitudes, azimuths
+
+
+def _fixed_altaz(
+    observer_location: EarthLocation, time: Time | None, jd: float | None, fast: bool
+) -> Callable[[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]:
+    """``altaz(ra, dec)`` mapping J2000 coordinates (degrees) to altitude/azimuth.
+
+    Uses one :class:`ObserverFrame` rotation at ``time``, or the analytic
+    engine at ``jd`` when ``fast``.
+    """
+    if not fast:
+        return ObserverFrame(observer_location, time).altaz
+
+    lat = observer_location.lat.deg
+    lon = observer_location.lon.deg
+
+    def altaz(ra: np.ndarray, dec: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        ra_date, dec_date = fast_ephemeris.precess_from_j2000(ra, dec, jd)
+        return fast_ephemeris.horizontal(ra_date, dec_date, jd, lat, lon)
+
+    return altaz
+
+
+def _horizontal_transform(
+    observer_location: EarthLocation, time: Time | None, jd: float | None, fast: bool
+) -> tuple[Callable[[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]], float, float]:
+    """``(altaz, moon_alt, moon_az)`` at one instant (see :func:`_fixed_altaz`)."""
+    altaz = _fixed_altaz(observer_location, time, jd, fast)
+    if fast:
+        moon_ra, moon_dec, moon_distance = fast_ephemeris.moon_position(jd)
+        moon_alt, moon_az = fast_ephemeris.horizontal(
+            moon_ra,
+            moon_dec,
+            jd,
+            observer_location.lat.deg,
+            observer_location.lon.deg,
+            moon_distance,
+        )
+        return altaz, float(moon_alt), float(moon_az)
+
+    moon = get_ephemeris_cache().body('moon', time)
+    moon_altaz = moon.transform_to(AltAz(obstime=time, location=observer_location))
+    return altaz, float(moon_altaz.alt.deg), float(moon_altaz.az.deg)
+
+
+def _score_deep_sky_objects(
+    catalog: ColumnarCatalog,
+    candidate_idx: np.ndarray,
+    time: Time,
+    observer_location: EarthLocation,
+    moon_illum: float,
+    eligible: np.ndarray | None = None,
+) -> list[dict[str, Any]]:
+    """Score catalog rows ``candidate_idx`` at ``time`` using one :class:`ObserverFrame` rotation.
+
+    The whole candidate list is transformed with a single matmul instead of a
+    per-call astropy ``AltAz`` transform; the Moon comes from the shared
+    ephemeris cache.
+    """
+    if len(candidate_idx) == 0:
+        return []
+
+    altaz, moon_alt, moon_az = _horizontal_transform(observer_location, time, None, False)
+    alt, az = altaz(*_candidate_coordinates(catalog, candidate_idx))
+    return _score_candidates(
+        catalog, candidate_idx, alt, az, moon_alt, moon_az, moon_illum, eligible=eligible
+    )
 
 
-def _find_rise_set_indices(altitudes: np.ndarray, horizon: float) -> tuple[int | None, int | None]:
-    """Find indices where altitude crosses the horizon."""
-    above = altitudes > horizon
-    crossings = np.where(np.diff(above))[0]
-    rise_idx = crossings[0] if len(crossings) > 0 else None
-    set_idx = crossings[-1] if len(crossings) > 1 else None
-    return rise_idx, set_idx
+def _candidate_coordinates(
+    catalog: ColumnarCatalog, candidate_idx: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    return catalog.values('ra')[candidate_idx], catalog.values('dec')[candidate_idx]
+
+
+def _score_candidates(
+    catalog: ColumnarCatalog,
+    candidate_idx: np.ndarray,
+    alt: np.ndarray,
+    az: np.ndarray,
+    moon_alt: float,
+    moon_az: float,
+    moon_illum: float,
+    limit: int | None = None,
+    eligible: np.ndarray | None = None,
+    offset: int = 0,
+) -> list[dict[str, Any]]:
+    """Apply the forecast scoring rules to precomputed horizontal coordinates.
+
+    Same rules as ``stargazing_core.score_deep_sky_objects``: keep objects at
+    altitude ≥ 20°, drop those within 15° of a risen Moon brighter than 10%,
+    dim those within 60° by 0.1 mag per degree, subtract an altitude bonus of
+    up to 2 and a Messier bonus of 5.  Moon separation is measured on the
+    observer's sky.  ``limit`` keeps only the best-scoring objects; objects
+    outside the boolean mask ``eligible`` are skipped.
+
+    Scoring reads the catalog columns; only the returned rows are decoded.
+    ``_index`` is each row's position in ``candidate_idx`` plus ``offset``.
+    """
+    mag = catalog.values('magnitude')[candidate_idx]
+    is_messier = catalog.column('catalog')[candidate_idx] == b'Messier'
+
+    effective_mag = mag
+    moon_skip = np.zeros(len(candidate_idx), dtype=bool)
+    if moon_illum > 0.1 and moon_alt > 0:
+        sep = fast_ephemeris.angular_separation(az, alt, moon_az, moon_alt)
+        moon_skip = sep < 15.0
+        near_moon = ~moon_skip & (sep < 60.0)
+        effective_mag = np.where(near_moon, effective_mag + (60.0 - sep) * 0.1, effective_mag)
+
+    score = effective_mag - (alt / 90.0) * 2.0
+    score = np.where(is_messier, score - 5.0, score)
+
+    # Stable order by score before building any output rows; objects without a
+    # magnitude score NaN and rank last.
+    keep = (alt >= 20.0) & ~moon_skip
+    if eligible is not None:
+        keep &= eligible
+    kept = np.flatnonzero(keep)
+    rank = np.where(np.isnan(score), np.inf, score)
+    order = kept[np.argsort(rank[kept], kind='stable')][:limit]
+
+    ra, dec = _candidate_coordinates(catalog, candidate_idx)
+    rows = catalog.rows(candidate_idx[order])
+    return [
+        {
+            'name': row['name'],
+            'type': row['type'],
+            'magnitude': float(mag[i]),
+            'altitude': round(float(alt[i]), 1),
+            'azimuth': round(float(az[i]), 1),
+            'catalog': row['catalog'],
+            'score': float(score[i]),
+            'angular_size_arcmin': row['angular_size_maj_arcmin'],
+            'constellation': row['constellation'] or None,
+            '_ra': float(ra[i]),
+            '_dec': float(dec[i]),
+            '_index': offset + int(i),
+        }
+        for i, row in zip(order.tolist(), rows, strict=True)
+    ]
+
+
+def _altitude_function(celestial_object: str, observer_location: EarthLocation):
+    """Return ``f(times) -> altitudes (deg)`` for the object as seen from the observer.
+
+    Fixed objects are resolved once up front; solar-system bodies are
+    re-evaluated at each requested time.
+    """
+    name = celestial_object.lower()
+    if name in ('sun', 'moon', *SOLAR_SYSTEM_BODIES):
+
+        def coord_at(times):
+            return get_ephemeris_cache().body(name, times)
+
+    else:
+        fixed = _resolve_fixed_object(celestial_object)
+
+        def coord_at(times):
+            return fixed
+
+    def altitude_at(times: Time) -> np.ndarray:
+        altaz = coord_at(times).transform_to(AltAz(obstime=times, location=observer_location))
+        return np.atleast_1d(np.asarray(altaz.alt.deg, dtype=float))
+
+    return altitude_at
+
+
+def _generate_time_grid(date: datetime, step_minutes: int = 5) -> Time:
+    """Generate Time objects across the given date, ``step_minutes`` apart (default 5)."""
+    start = Time(date.replace(hour=0, minute=0, second=0))
+    end = Time(date.replace(hour=23, minute=59, second=59))
+    return start + np.linspace(0, 1, 24 * 60 // step_minutes) * (end - start)
+
+
+def _find_horizon_crossings(heights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(lo, hi)`` index pairs of grid intervals where the height changes sign."""
+    above = heights > 0
+    lo = np.flatnonzero(above[:-1] != above[1:])
+    return lo, lo + 1
+
+
+def _refine_crossings(
+    height_at,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    f_lo: np.ndarray,
+    f_hi: np.ndarray,
+    tolerance: float = _RISE_SET_TOLERANCE_S,
+    max_iterations: int = 30,
+) -> np.ndarray:
+    """Locate zeros of ``height_at`` inside each ``[lo, hi]`` bracket.
+
+    Uses the Illinois variant of regula falsi, vectorised across brackets so
+    every iteration costs one coordinate transform however many crossings
+    there are. Each bracket must have ``f_lo`` and ``f_hi`` of opposite sign
+    (or zero); iteration stops once every estimate moves by less than
+    ``tolerance`` (same units as ``lo``/``hi``).
+    """
+    lo = np.asarray(lo, dtype=float).copy()
+    hi = np.asarray(hi, dtype=float).copy()
+    f_lo = np.asarray(f_lo, dtype=float).copy()
+    f_hi = np.asarray(f_hi, dtype=float).copy()
+    if lo.size == 0:
+        return lo
+
+    # -1: ``lo`` was kept on the previous step, +1: ``hi`` was kept.
+    kept = np.zeros(lo.size, dtype=int)
+    estimate = np.full(lo.size, np.nan)
+    for _ in range(max_iterations):
+        denom = f_hi - f_lo
+        safe = np.where(denom == 0, 1.0, denom)
+        guess = np.where(denom == 0, (lo + hi) / 2, hi - f_hi * (hi - lo) / safe)
+        guess = np.clip(guess, np.minimum(lo, hi), np.maximum(lo, hi))
+        done = np.abs(guess - estimate) < tolerance
+        estimate = guess
+        if done.all():
+            break
+
+        f_guess = height_at(guess)
+        replace_hi = np.sign(f_guess) == np.sign(f_hi)
+        f_lo = np.where(replace_hi & (kept == -1), f_lo / 2, f_lo)
+        f_hi = np.where(~replace_hi & (kept == 1), f_hi / 2, f_hi)
+        hi = np.where(replace_hi, guess, hi)
+        f_hi = np.where(replace_hi, f_guess, f_hi)
+        lo = np.where(replace_hi, lo, guess)
+        f_lo = np.where(replace_hi, f_lo, f_guess)
+        kept = np.where(replace_hi, -1, 1)
+    return estimate
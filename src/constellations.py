@@ -0,0 +1,83 @@
+"""IAU constellation names and boundaries.
+
+Catalog objects carry the IAU abbreviation of their constellation, assigned
+offline by ``scripts/download_data.py``.  This module maps abbreviations to
+full names and back, and identifies the constellation of any number of
+coordinates in one vectorised pass over the Delporte boundaries (astropy's
+``get_constellation``), instead of one call per coordinate.
+"""
+
+import threading
+import warnings
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import SkyCoord, get_constellation
+from astropy.utils.data import get_pkg_data_contents
+from erfa import ErfaWarning
+
+# Upper bound on coordinates for one batch identification request.
+MAX_CONSTELLATION_LOOKUPS = 10_000
+
+_NAMES: Mapping[str, str] | None = None
+_KEYS: Mapping[str, str] | None = None
+_names_lock = threading.Lock()
+
+
+def constellation_names() -> Mapping[str, str]:
+    """IAU abbreviation → full name for the 88 modern constellations."""
+    global _NAMES, _KEYS
+    if _NAMES is not None:
+        return _NAMES
+
+    with _names_lock:
+        if _NAMES is None:
+            text = get_pkg_data_contents(
+                'data/constellation_names.dat', package='astropy.coordinates', encoding='UTF8'
+            )
+            names = {
+                line[:3]: line[4:].strip()
+                for line in text.splitlines()
+                if line.strip() and not line.startswith('#')
+            }
+            keys = {_key(abbreviation): abbreviation for abbreviation in names}
+            keys.update({_key(name): abbreviation for abbreviation, name in names.items()})
+            _KEYS = MappingProxyType(keys)
+            _NAMES = MappingProxyType(names)
+    return _NAMES
+
+
+def resolve_constellation(name: str) -> str | None:
+    """Return the IAU abbreviation for a full name or abbreviation (any case), or ``None``."""
+    constellation_names()
+    return _KEYS.get(_key(name))
+
+
+def identify_constellations(
+    ra: np.ndarray | list[float], dec: np.ndarray | list[float], short_name: bool = False
+) -> np.ndarray:
+    """Constellation of every ICRS ``(ra, dec)`` pair (degrees), as a string array.
+
+    Raises:
+        ValueError: If ``ra`` and ``dec`` differ in length, or a declination
+            is outside ±90° or a coordinate is not finite.
+    """
+    ra = np.atleast_1d(np.asarray(ra, dtype=np.float64))
+    dec = np.atleast_1d(np.asarray(dec, dtype=np.float64))
+    if ra.shape != dec.shape:
+        raise ValueError('ra and dec must have the same length.')
+    if not (np.isfinite(ra).all() and np.isfinite(dec).all()) or (np.abs(dec) > 90.0).any():
+        raise ValueError('Coordinates must be finite, with dec between -90 and 90 degrees.')
+    if ra.size == 0:
+        return np.empty(0, dtype=str)
+    coords = SkyCoord(ra=ra * u.deg, dec=dec * u.deg, frame='icrs')
+    with warnings.catch_warnings():
+        # Boundaries are defined at B1875, a "dubious year" for ERFA's UTC tables.
+        warnings.simplefilter('ignore', ErfaWarning)
+        return np.asarray(get_constellation(coords, short_name=short_name))
+
+
+def _key(name: str) -> str:
+    return ' '.join(str(name).lower().split())
@@ -0,0 +1,177 @@
+"""Per-request deadlines for offloaded computations.
+
+A tool call opens a :func:`deadline_scope`; the budget is the tool's default
+(``STARGAZING_DEADLINE_SECONDS``, 60 s, unless the tool sets its own),
+shortened to the client's ``timeout_ms`` when the request ``_meta`` carries
+one.  The deadline lives in a context variable, so it follows the call into
+``asyncio.to_thread`` and is handed explicitly to compute worker processes.
+
+Long pipelines call :func:`check_deadline` between stages; once the deadline
+has passed (or the awaiting request was cancelled) the next check raises
+:class:`DeadlineExceededError`, an :class:`MCPError` with code
+``DEADLINE_EXCEEDED``, so the work stops instead of running to completion.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from src.env import env_number
+from src.response import MCPError
+
+DEFAULT_DEADLINE_SECONDS = 60.0
+
+_current_deadline: ContextVar['Deadline | None'] = ContextVar('deadline', default=None)
+
+
+class DeadlineExceededError(MCPError):
+    """Raised when a request runs past its deadline."""
+
+    def __init__(self, stage: str, budget_seconds: float):
+        self.stage = stage
+        self.budget_seconds = budget_seconds
+        super().__init__(
+            MCPError.DEADLINE_EXCEEDED,
+            f'Request exceeded its {budget_seconds:g}s deadline ({stage}).',
+            {'stage': stage, 'deadline_seconds': budget_seconds},
+        )
+
+    def __reduce__(self):
+        # Rebuild from our own arguments when raised in a worker process.
+        return DeadlineExceededError, (self.stage, self.budget_seconds)
+
+
+class Deadline:
+    """A point in time after which a request's work should stop.
+
+    ``expires_at`` is wall-clock (unix) time so it means the same thing in
+    compute worker processes.  :meth:`cancel` expires it early for the
+    threads sharing this object (e.g. when the client disconnects).
+    """
+
+    def __init__(self, expires_at: float, budget_seconds: float):
+        self.expires_at = expires_at
+        self.budget_seconds = budget_seconds
+        self._cancelled = threading.Event()
+
+    @classmethod
+    def after(cls, seconds: float) -> 'Deadline':
+        return cls(time.time() + seconds, seconds)
+
+    def __reduce__(self):
+        return Deadline, (self.expires_at, self.budget_seconds)
+
+    def remaining(self) -> float:
+        """Seconds left, 0 once expired or cancelled."""
+        if self._cancelled.is_set():
+            return 0.0
+        return max(0.0, self.expires_at - time.time())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def check(self, stage: str) -> None:
+        """Raise :class:`DeadlineExceededError` if the deadline has passed."""
+        if self.expired:
+            raise DeadlineExceededError(stage, self.budget_seconds)
+
+
+def current_deadline() -> Deadline | None:
+    """The deadline of the request being served, if any."""
+    return _current_deadline.get()
+
+
+def check_deadline(stage: str) -> None:
+    """Stop the current request's work if its deadline has passed (no-op without one)."""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check(stage)
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None) -> Iterator[Deadline | None]:
+    """Make ``deadline`` current for the enclosed code (``None`` clears it)."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+async def run_before_deadline(stage: str, start: Callable[[], Awaitable[Any]]) -> Any:
+    """Await ``start()`` but give up when the current deadline passes.
+
+    ``start`` is only called if time remains.  On expiry (or cancellation of
+    the awaiting request) the deadline is cancelled, so a thread still
+    running the work stops at its next :func:`check_deadline`.
+
+    Raises:
+        DeadlineExceededError: If the deadline passes first.
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return await start()
+
+    deadline.check(f'{stage} not started')
+    try:
+        return await asyncio.wait_for(start(), deadline.remaining())
+    except TimeoutError:
+        deadline.cancel()
+        raise DeadlineExceededError(stage, deadline.budget_seconds) from None
+    except asyncio.CancelledError:
+        deadline.cancel()
+        raise
+
+
+def request_deadline(default_seconds: float | None = None) -> Deadline | None:
+    """Build the deadline for a tool call.
+
+    ``default_seconds`` is the tool's budget; ``None`` uses
+    ``STARGAZING_DEADLINE_SECONDS`` (0 disables deadlines).  A client
+    ``timeout_ms`` in the request ``_meta``, or an enclosing request's
+    deadline, can only shorten it.
+
+    Raises:
+        ValueError: If ``STARGAZING_DEADLINE_SECONDS`` is not a non-negative number.
+    """
+    if default_seconds is None:
+        default_seconds = env_number(
+            'STARGAZING_DEADLINE_SECONDS', DEFAULT_DEADLINE_SECONDS, allow_zero=True
+        )
+    budget = default_seconds if default_seconds > 0 else None
+    client = _client_timeout_seconds()
+    if client is not None:
+        budget = client if budget is None else min(budget, client)
+
+    enclosing = _current_deadline.get()
+    if budget is None:
+        return enclosing
+    deadline = Deadline.after(budget)
+    if enclosing is not None and enclosing.expires_at <= deadline.expires_at:
+        return enclosing
+    return deadline
+
+
+def _client_timeout_seconds() -> float | None:
+    """``_meta.timeout_ms`` of the MCP request being served, in seconds."""
+    try:
+        from fastmcp.server.dependencies import get_context
+
+        request = get_context().request_context
+    except (ImportError, RuntimeError):
+        return None
+    meta = getattr(request, 'meta', None) if request is not None else None
+    value = getattr(meta, 'timeout_ms', None) if meta is not None else None
+    try:
+        seconds = float(value) / 1000.0
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds > 0 else None
@@ -0,0 +1,30 @@
+"""Validated numeric settings read from the environment.
+
+Every ``STARGAZING_*`` tuning knob goes through :func:`env_number`, so a
+malformed or out-of-range value fails with an error naming the variable
+instead of a bare ``could not convert string to float``.
+"""
+
+import os
+from typing import Any
+
+
+def env_number(name: str, default: float, cast=float, allow_zero: bool = False) -> Any:
+    """Read a positive number (or, with ``allow_zero``, a non-negative one) from the environment.
+
+    Unset or blank variables return ``default``.
+
+    Raises:
+        ValueError: If the variable is set but not a number in range.
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == '':
+        return default
+    expected = 'a non-negative number' if allow_zero else 'a positive number'
+    try:
+        number = cast(value)
+    except ValueError:
+        raise ValueError(f'Invalid {name}={value!r}; expected {expected}.')
+    if number < 0 or (number == 0 and not allow_zero):
+        raise ValueError(f'{name} must be {">= 0" if allow_zero else "> 0"}, got {value!r}.')
+    return number
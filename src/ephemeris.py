@@ -0,0 +1,164 @@
+"""Shared geocentric ephemeris cache for the Sun, Moon and planets.
+
+Geocentric (GCRS) positions of solar-system bodies depend only on the UTC
+instant, not on the observer, so they are computed once per body per
+time bucket (one minute by default) and shared by every request.  Positions
+between bucket edges are linearly interpolated — over a minute the Moon's
+path deviates from a straight line by metres, far below anything an
+observer-facing altitude can resolve — so callers only pay for the
+topocentric ``AltAz`` step.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import GCRS, CartesianRepresentation, SkyCoord, get_body, get_sun
+from astropy.time import Time
+
+from src.env import env_number
+
+EPHEMERIS_BODIES = (
+    'sun',
+    'moon',
+    'mercury',
+    'venus',
+    'mars',
+    'jupiter',
+    'saturn',
+    'uranus',
+    'neptune',
+)
+
+DEFAULT_BUCKET_SECONDS = 60
+DEFAULT_MAX_ENTRIES = 64_000
+
+# Buckets are counted from J2000 so float64 keeps sub-millisecond precision.
+_EPOCH_JD = 2451545.0
+
+
+class EphemerisCache:
+    """LRU cache of geocentric body positions keyed by ``(body, time bucket)``.
+
+    Thread-safe: lookups and inserts are guarded by a lock; missing buckets are
+    computed outside it with one vectorised ``get_body`` call per body.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: float = DEFAULT_BUCKET_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int], np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def body(self, name: str, times: Time) -> SkyCoord:
+        """Drop-in for ``get_body(name, times)`` / ``get_sun(times)``.
+
+        Returns a GCRS ``SkyCoord`` with the same shape and ``obstime`` as ``times``.
+        """
+        return self.bodies([name], times)[0]
+
+    def bodies(self, names: Sequence[str], times: Time) -> SkyCoord:
+        """Return GCRS positions of ``names`` at ``times``, shape ``(len(names), *times.shape)``."""
+        names = [name.lower() for name in names]
+        unknown = sorted(set(names) - set(EPHEMERIS_BODIES))
+        if unknown:
+            raise ValueError(f'No ephemeris for {unknown}; expected one of {EPHEMERIS_BODIES}.')
+
+        flat = np.atleast_1d(times.utc.jd1 - _EPOCH_JD) + np.atleast_1d(times.utc.jd2)
+        position = flat.ravel() * 86400.0 / self.bucket_seconds
+        lower = np.floor(position).astype(np.int64)
+        weight = (position - lower)[np.newaxis, :]
+
+        xyz = np.empty((3, len(names), lower.size))
+        for row, name in enumerate(names):
+            table = self._lookup(name, lower)
+            xyz[:, row] = table[:, : lower.size] * (1 - weight) + table[:, lower.size :] * weight
+
+        xyz = xyz.reshape((3, len(names), *times.shape))
+        return SkyCoord(GCRS(CartesianRepresentation(xyz * u.au), obstime=times))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _lookup(self, name: str, lower: np.ndarray) -> np.ndarray:
+        """Return ``(3, 2n)`` positions at the lower then upper edge of each bucket."""
+        edges = np.concatenate([lower, lower + 1])
+        wanted = np.unique(edges)
+        found: dict[int, np.ndarray] = {}
+        with self._lock:
+            for bucket in wanted.tolist():
+                value = self._entries.get((name, bucket))
+                if value is not None:
+                    self._entries.move_to_end((name, bucket))
+                    found[bucket] = value
+            self.hits += len(found)
+            self.misses += len(wanted) - len(found)
+
+        missing = [bucket for bucket in wanted.tolist() if bucket not in found]
+        if missing:
+            computed = self._compute(name, np.asarray(missing, dtype=np.int64))
+            for bucket, value in zip(missing, computed.T, strict=True):
+                found[bucket] = value
+            with self._lock:
+                for bucket, value in zip(missing, computed.T, strict=True):
+                    self._entries[(name, bucket)] = value
+                    self._entries.move_to_end((name, bucket))
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return np.stack([found[bucket] for bucket in edges.tolist()], axis=1)
+
+    def _compute(self, name: str, buckets: np.ndarray) -> np.ndarray:
+        times = Time(
+            np.full(buckets.shape, _EPOCH_JD),
+            buckets * (self.bucket_seconds / 86400.0),
+            format='jd',
+            scale='utc',
+        )
+        coord = get_sun(times) if name == 'sun' else get_body(name, times)
+        return coord.cartesian.xyz.to_value(u.au)
+
+
+def create_ephemeris_cache() -> EphemerisCache:
+    """Build the ephemeris cache described by the environment.
+
+    - ``STARGAZING_EPHEMERIS_BUCKET_SECONDS``: time bucket width (default 60).
+    - ``STARGAZING_EPHEMERIS_CACHE_SIZE``: maximum ``(body, bucket)`` entries kept.
+
+    Raises:
+        ValueError: If either variable is set but not a positive number.
+    """
+    bucket_seconds = env_number('STARGAZING_EPHEMERIS_BUCKET_SECONDS', DEFAULT_BUCKET_SECONDS)
+    max_entries = env_number('STARGAZING_EPHEMERIS_CACHE_SIZE', DEFAULT_MAX_ENTRIES, int)
+    return EphemerisCache(bucket_seconds, max_entries)
+
+
+_ephemeris_cache: EphemerisCache | None = None
+_ephemeris_cache_lock = threading.Lock()
+
+
+def get_ephemeris_cache() -> EphemerisCache:
+    """Return the process-wide ephemeris cache, creating it on first use."""
+    global _ephemeris_cache
+    if _ephemeris_cache is not None:
+        return _ephemeris_cache
+
+    with _ephemeris_cache_lock:
+        if _ephemeris_cache is None:
+            _ephemeris_cache = create_ephemeris_cache()
+    return _ephemeris_cache
@@ -0,0 +1,230 @@
+"""Process pool for the CPU-bound astronomy tools.
+
+``asyncio.to_thread`` keeps the event loop responsive, but astropy/ERFA and
+the scoring loops hold the GIL for long stretches, so concurrent forecasts
+share one core.  :class:`ComputeExecutor` runs them in a pool of worker
+processes instead; each worker runs the startup warm-up (astropy, IERS,
+catalogs, ephemeris) in its initializer, so the first request it serves is
+not paying for it.
+
+Pool size (``--workers`` or ``STARGAZING_WORKERS``):
+
+- ``0`` (default): no pool; work runs in a thread, as before.
+- ``N``: ``N`` worker processes.
+- ``auto``: one worker per CPU.
+
+Functions and arguments crossing into a worker must pickle, so callers pass
+module-level functions.  Each worker keeps its own almanac, ephemeris and
+resolver caches.
+
+Both modes honour the request deadline (``src.deadline``): the call is
+abandoned with ``DEADLINE_EXCEEDED`` when it runs out, work still queued is
+dropped, and the running computation stops at its next deadline check.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from src.deadline import Deadline, current_deadline, deadline_scope, run_before_deadline
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_WORKERS = 0
+
+
+def resolve_worker_count(workers: int | str | None = None) -> int:
+    """Return the effective pool size; ``None`` reads ``STARGAZING_WORKERS``.
+
+    Raises:
+        ValueError: If the value is not a non-negative integer or ``'auto'``.
+    """
+    value = workers if workers is not None else os.getenv('STARGAZING_WORKERS')
+    if value is None or str(value).strip() == '':
+        return DEFAULT_WORKERS
+    if str(value).strip().lower() == 'auto':
+        return os.cpu_count() or 1
+    try:
+        count = int(value)
+    except ValueError:
+        raise ValueError(f'Invalid worker count {value!r}; expected an integer or "auto".')
+    if count < 0:
+        raise ValueError(f'Worker count must be >= 0, got {count}.')
+    return count
+
+
+# How long a warmed-up worker waits for the rest of the pool before serving.
+_READY_TIMEOUT_SECONDS = 120.0
+
+
+def _init_worker(ready) -> None:
+    """Pool initializer: same IERS policy as the server, then the warm-up steps.
+
+    Workers then wait on the shared ``ready`` barrier, so none takes a task
+    (such as a prewarm ping) until every worker has warmed up.
+    """
+    from astropy.utils.iers import conf as iers_conf
+
+    from src.warmup import PROCESS_WARMUP_STEPS, WarmupState, run_warmup
+
+    iers_conf.auto_download = os.getenv('ASTROPY_IERS_AUTO_DOWNLOAD', '0') == '1'
+    iers_conf.auto_max_age = None
+    run_warmup(WarmupState(), PROCESS_WARMUP_STEPS)
+    try:
+        ready.wait(_READY_TIMEOUT_SECONDS)
+    except threading.BrokenBarrierError:
+        pass  # a sibling failed to start; serve anyway
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+def _call_with_deadline(deadline: Deadline | None, func: Callable[..., Any], *args, **kwargs):
+    """Run ``func`` in a worker under the request's deadline."""
+    with deadline_scope(deadline):
+        if deadline is not None:
+            # Expired while queued: skip it and free the worker.
+            deadline.check(f'{_name(func)} queued')
+        return func(*args, **kwargs)
+
+
+def _name(func: Callable[..., Any]) -> str:
+    return getattr(func, '__name__', type(func).__name__)
+
+
+class ComputeExecutor:
+    """Runs blocking functions in worker processes, or in a thread when ``workers`` is 0.
+
+    The pool is created on :meth:`start` or on first use.  If a worker dies
+    the pool is discarded and rebuilt on the next call.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._spawn_pings: list[Future] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def start(self) -> None:
+        """Create the pool and start every worker warming up, without waiting."""
+        if self.enabled:
+            self._ensure_pool()
+
+    def prewarm(self) -> None:
+        """Start the pool if needed and wait until every worker has warmed up."""
+        if self.enabled:
+            self._ensure_pool()
+            wait(self._spawn_pings)
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func(*args, **kwargs)`` off the event loop and return its result.
+
+        Raises:
+            DeadlineExceededError: If the current request's deadline passes first.
+        """
+        deadline = current_deadline()
+        return await run_before_deadline(
+            _name(func), lambda: self._run(func, args, kwargs, deadline)
+        )
+
+    async def _run(self, func, args, kwargs, deadline: Deadline | None) -> Any:
+        if not self.enabled:
+            # to_thread copies the context, deadline included.
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+        pool = self._ensure_pool()
+        call = functools.partial(_call_with_deadline, deadline, func, *args, **kwargs)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, call)
+        except BrokenProcessPool:
+            logger.warning('Worker process died; the pool will be rebuilt')
+            self._discard_pool(pool)
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'mode': 'process' if self.enabled else 'thread',
+            'workers': self.workers,
+            'started': self._pool is not None,
+        }
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        pool = self._pool
+        if pool is not None:
+            return pool
+        with self._lock:
+            if self._pool is None:
+                # spawn, not fork: the server process already runs threads.
+                context = multiprocessing.get_context('spawn')
+                pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(context.Barrier(self.workers),),
+                )
+                # Workers spawn on demand; one task each before any is idle
+                # spawns them all now rather than as requests arrive.
+                self._spawn_pings = [pool.submit(_worker_pid) for _ in range(self.workers)]
+                self._pool = pool
+                logger.info('Started compute worker pool', workers=self.workers)
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def create_compute_executor(workers: int | str | None = None) -> ComputeExecutor:
+    """Build an executor sized by ``workers`` or ``STARGAZING_WORKERS``."""
+    return ComputeExecutor(resolve_worker_count(workers))
+
+
+_compute_executor: ComputeExecutor | None = None
+_compute_executor_lock = threading.Lock()
+
+
+def get_compute_executor() -> ComputeExecutor:
+    """Return the process-wide executor, creating it on first use."""
+    global _compute_executor
+    if _compute_executor is not None:
+        return _compute_executor
+
+    with _compute_executor_lock:
+        if _compute_executor is None:
+            _compute_executor = create_compute_executor()
+    return _compute_executor
+
+
+def configure_compute_executor(workers: int | str | None = None) -> ComputeExecutor:
+    """Replace the process-wide executor (e.g. from the ``--workers`` flag)."""
+    global _compute_executor
+    with _compute_executor_lock:
+        previous, _compute_executor = _compute_executor, create_compute_executor(workers)
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return _compute_executor
+
+
+async def run_cpu_bound(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run ``func`` on the process-wide executor."""
+    return await get_compute_executor().run(func, *args, **kwargs)
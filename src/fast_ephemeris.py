@@ -0,0 +1,540 @@
+"""Low-precision analytic ephemeris in pure NumPy (``precision='fast'``).
+
+Planning-grade answers — which planets are up, which deep-sky objects score
+best tonight — only need arcminute accuracy, so this module skips the
+astropy/ERFA pipeline entirely:
+
+- Sun: Meeus, *Astronomical Algorithms* ch. 25 (low accuracy), ~0.01°.
+- Moon: Meeus ch. 47, largest periodic terms, ~ a few arcminutes.
+- Planets: JPL "Approximate Positions of the Planets" Keplerian elements
+  (valid 1800-2050) with one light-time iteration, ~1'-3'; Jupiter and Saturn
+  add their largest mutual perturbations (the "Great Inequality").
+- Stars/DSOs: IAU 1976 precession from J2000 to the equinox of date.
+- Horizon coordinates from mean sidereal time and a spherical rotation, with
+  diurnal parallax applied from the body's distance (matters for the Moon).
+
+Nutation, aberration and refraction are ignored; they stay well under an
+arcminute. Every function broadcasts over NumPy arrays of Julian dates.
+The accuracy bounds are enforced against astropy in
+``tests/test_fast_ephemeris.py``.
+"""
+
+import math
+import os
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+from astropy.time import Time
+
+PRECISION_MODES = ('full', 'fast')
+DEFAULT_PRECISION = 'full'
+
+FAST_BODIES = (
+    'sun',
+    'moon',
+    'mercury',
+    'venus',
+    'mars',
+    'jupiter',
+    'saturn',
+    'uranus',
+    'neptune',
+)
+
+AU_KM = 149_597_870.7
+EARTH_RADIUS_KM = 6378.14
+
+_J2000 = 2451545.0
+_UNIX_EPOCH_JD = 2440587.5
+_LIGHT_DAYS_PER_AU = 0.0057755183
+_OBLIQUITY_J2000 = math.radians(23.43928)
+_SYNODIC_MONTH_DAYS = 29.53059
+
+# JPL approximate Keplerian elements, J2000 ecliptic (Standish, table 1):
+# (a au, e, I deg, L deg, long. perihelion deg, long. node deg) and rates per century.
+# Jupiter and Saturn use _GAS_GIANT_ELEMENTS instead (see _great_inequality).
+_PLANET_ELEMENTS: dict[str, tuple[tuple[float, ...], tuple[float, ...]]] = {
+    'mercury': (
+        (0.38709927, 0.20563593, 7.00497902, 252.25032350, 77.45779628, 48.33076593),
+        (0.00000037, 0.00001906, -0.00594749, 149472.67411175, 0.16047689, -0.12534081),
+    ),
+    'venus': (
+        (0.72333566, 0.00677672, 3.39467605, 181.97909950, 131.60246718, 76.67984255),
+        (0.00000390, -0.00004107, -0.00078890, 58517.81538729, 0.00268329, -0.27769418),
+    ),
+    'earth': (
+        (1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0),
+        (0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0),
+    ),
+    'mars': (
+        (1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891),
+        (0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343),
+    ),
+    'uranus': (
+        (19.18916464, 0.04725744, 0.77263783, 313.23810451, 170.95427630, 74.01692503),
+        (-0.00196176, -0.00004397, -0.00242939, 428.48202785, 0.40805281, 0.04240589),
+    ),
+    'neptune': (
+        (30.06992276, 0.00859048, 1.77004347, -55.12002969, 44.96476227, 131.78422574),
+        (0.00026291, 0.00005105, 0.00035372, 218.45945325, -0.32241464, -0.00508664),
+    ),
+}
+
+# Jupiter/Saturn mean elements for the equinox of date (P. Schlyter, "How to compute
+# planetary positions"), as (value at 1999-12-31 0h TT, rate per day) for
+# (long. node, inclination, arg. perihelion, a au, e, mean anomaly). Unlike the fitted
+# JPL elements these are unperturbed means, so the Great Inequality terms can be added.
+_GAS_GIANT_ELEMENTS: dict[str, tuple[tuple[float, float], ...]] = {
+    'jupiter': (
+        (100.4542, 2.76854e-5),
+        (1.3030, -1.557e-7),
+        (273.8777, 1.64505e-5),
+        (5.20256, 0.0),
+        (0.048498, 4.469e-9),
+        (19.8950, 0.0830853001),
+    ),
+    'saturn': (
+        (113.6634, 2.38980e-5),
+        (2.4886, -1.081e-7),
+        (339.3939, 2.97661e-5),
+        (9.55475, 0.0),
+        (0.055546, -9.499e-9),
+        (316.9670, 0.0334442282),
+    ),
+}
+_GAS_GIANT_EPOCH_JD = 2451543.5
+# General precession in longitude, deg per Julian century.
+_PRECESSION_DEG_PER_CENTURY = 1.396971
+
+# Meeus table 47.A: multiples of (D, M, M', F), longitude (1e-6 deg), distance (1e-3 km).
+_MOON_LR_TERMS = np.array(
+    [
+        (0, 0, 1, 0, 6288774, -20905355),
+        (2, 0, -1, 0, 1274027, -3699111),
+        (2, 0, 0, 0, 658314, -2955968),
+        (0, 0, 2, 0, 213618, -569925),
+        (0, 1, 0, 0, -185116, 48888),
+        (0, 0, 0, 2, -114332, -3149),
+        (2, 0, -2, 0, 58793, 246158),
+        (2, -1, -1, 0, 57066, -152138),
+        (2, 0, 1, 0, 53322, -170733),
+        (2, -1, 0, 0, 45758, -204586),
+        (0, 1, -1, 0, -40923, -129620),
+        (1, 0, 0, 0, -34720, 108743),
+        (0, 1, 1, 0, -30383, 104755),
+        (2, 0, 0, -2, 15327, 10321),
+        (0, 0, 1, 2, -12528, 0),
+        (0, 0, 1, -2, 10980, 79661),
+        (4, 0, -1, 0, 10675, -34782),
+        (0, 0, 3, 0, 10034, -23210),
+        (4, 0, -2, 0, 8548, -21636),
+        (2, 1, -1, 0, -7888, 24208),
+        (2, 1, 0, 0, -6766, 30824),
+        (1, 0, -1, 0, -5163, -8379),
+        (1, 1, 0, 0, 4987, -16675),
+        (2, -1, 1, 0, 4036, -12831),
+        (2, 0, 2, 0, 3994, -10445),
+        (4, 0, 0, 0, 3861, -11650),
+        (2, 0, -3, 0, 3665, 14403),
+        (0, 1, -2, 0, -2689, -7003),
+        (2, 0, -1, 2, -2602, 0),
+        (2, -1, -2, 0, 2390, 10056),
+        (1, 0, 1, 0, -2348, 6322),
+        (2, -2, 0, 0, 2236, -9884),
+    ],
+    dtype=np.float64,
+)
+
+# Meeus table 47.B: multiples of (D, M, M', F), latitude (1e-6 deg).
+_MOON_B_TERMS = np.array(
+    [
+        (0, 0, 0, 1, 5128122),
+        (0, 0, 1, 1, 280602),
+        (0, 0, 1, -1, 277693),
+        (2, 0, 0, -1, 173237),
+        (2, 0, -1, 1, 55413),
+        (2, 0, -1, -1, 46271),
+        (2, 0, 0, 1, 32573),
+        (0, 0, 2, 1, 17198),
+        (2, 0, 1, -1, 9266),
+        (0, 0, 2, -1, 8822),
+        (2, -1, 0, -1, 8216),
+        (2, 0, -2, -1, 4324),
+        (2, 0, 1, 1, 4200),
+        (2, 1, 0, -1, -3359),
+        (2, -1, -1, 1, 2463),
+        (2, -1, 0, 1, 2211),
+        (2, -1, -1, -1, 2065),
+        (0, 1, -1, -1, -1870),
+        (4, 0, -1, -1, 1828),
+        (0, 1, 0, 1, -1794),
+    ],
+    dtype=np.float64,
+)
+
+
+def resolve_precision(precision: str | None = None) -> str:
+    """Return the effective precision mode.
+
+    ``None`` falls back to ``STARGAZING_PRECISION`` (default ``'full'``).
+
+    Raises:
+        ValueError: If the mode is neither ``'full'`` nor ``'fast'``.
+    """
+    mode = precision if precision is not None else os.getenv('STARGAZING_PRECISION')
+    mode = (mode or DEFAULT_PRECISION).strip().lower()
+    if mode not in PRECISION_MODES:
+        raise ValueError(f'Unknown precision {mode!r}; expected one of {PRECISION_MODES}.')
+    return mode
+
+
+def julian_date(times: Time | datetime | Iterable[Time | datetime]) -> np.ndarray:
+    """Convert UTC instants (astropy ``Time`` or timezone-aware datetimes) to Julian dates."""
+    if isinstance(times, Time):
+        return np.asarray(times.utc.jd1 + times.utc.jd2, dtype=np.float64)
+    if isinstance(times, datetime):
+        if times.tzinfo is None:
+            raise ValueError('Input datetime must be timezone-aware for local time.')
+        return np.float64(times.timestamp() / 86400.0 + _UNIX_EPOCH_JD)
+    return np.array([julian_date(t) for t in times], dtype=np.float64)
+
+
+def sidereal_time_deg(jd: np.ndarray | float) -> np.ndarray:
+    """Greenwich mean sidereal time in degrees (IAU 1982, UT1 ≈ UTC)."""
+    d = np.asarray(jd, dtype=np.float64) - _J2000
+    t = d / 36525.0
+    gmst = 280.46061837 + 360.98564736629 * d + t * t * (0.000387933 - t / 38710000.0)
+    return np.mod(gmst, 360.0)
+
+
+def sun_position(jd: np.ndarray | float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Apparent geocentric Sun: ``(ra_deg, dec_deg, distance_au)`` of date."""
+    t = _centuries(jd)
+    lon, distance, obliquity = _sun_ecliptic(t)
+    ra, dec = _ecliptic_to_equatorial(lon, np.zeros_like(lon), obliquity)
+    return ra, dec, distance
+
+
+def moon_position(jd: np.ndarray | float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Geocentric Moon: ``(ra_deg, dec_deg, distance_km)`` of date."""
+    t = _centuries(jd)
+    lon, lat, distance = _moon_ecliptic(t)
+    ra, dec = _ecliptic_to_equatorial(lon, lat, _mean_obliquity(t))
+    return ra, dec, distance
+
+
+def planet_position(name: str, jd: np.ndarray | float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Geocentric planet: ``(ra_deg, dec_deg, distance_au)`` of date, light-time corrected."""
+    if name == 'earth' or (name not in _PLANET_ELEMENTS and name not in _GAS_GIANT_ELEMENTS):
+        raise ValueError(f'No fast ephemeris for planet {name!r}.')
+    jd = np.asarray(jd, dtype=np.float64)
+    earth = _heliocentric_equatorial('earth', jd)
+    geo = _heliocentric_equatorial(name, jd) - earth
+    light_time = np.linalg.norm(geo, axis=0) * _LIGHT_DAYS_PER_AU
+    geo = _heliocentric_equatorial(name, jd - light_time) - earth
+    ra, dec, distance = _cartesian_to_spherical(_precession_matrix(jd), geo)
+    return ra, dec, distance
+
+
+def body_position(name: str, jd: np.ndarray | float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Geocentric ``(ra_deg, dec_deg, distance_km)`` of date for any of ``FAST_BODIES``."""
+    name = name.lower()
+    if name == 'sun':
+        ra, dec, distance = sun_position(jd)
+        return ra, dec, distance * AU_KM
+    if name == 'moon':
+        return moon_position(jd)
+    ra, dec, distance = planet_position(name, jd)
+    return ra, dec, distance * AU_KM
+
+
+def precess_from_j2000(
+    ra_deg: np.ndarray | float, dec_deg: np.ndarray | float, jd: np.ndarray | float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Precess ICRS/J2000 coordinates to the mean equinox of ``jd`` (IAU 1976)."""
+    ra = np.radians(ra_deg)
+    dec = np.radians(dec_deg)
+    xyz = np.stack(
+        np.broadcast_arrays(np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec))
+    )
+    ra_date, dec_date, _ = _cartesian_to_spherical(_precession_matrix(jd), xyz)
+    return ra_date, dec_date
+
+
+def horizontal(
+    ra_deg: np.ndarray | float,
+    dec_deg: np.ndarray | float,
+    jd: np.ndarray | float,
+    latitude_deg: float,
+    longitude_deg: float,
+    distance_km: np.ndarray | float | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rotate equatorial coordinates of date to ``(altitude_deg, azimuth_deg)``.
+
+    Azimuth is measured from north through east. When ``distance_km`` is
+    given, the diurnal parallax of a nearby body (the Moon: up to ~1°) is
+    removed from the geocentric altitude. All arguments broadcast.
+    """
+    lat = math.radians(latitude_deg)
+    hour_angle = np.radians(sidereal_time_deg(jd) + longitude_deg - np.asarray(ra_deg))
+    dec = np.radians(dec_deg)
+
+    sin_alt = math.sin(lat) * np.sin(dec) + math.cos(lat) * np.cos(dec) * np.cos(hour_angle)
+    alt = np.arcsin(np.clip(sin_alt, -1.0, 1.0))
+    az = np.arctan2(
+        -np.cos(dec) * np.sin(hour_angle),
+        np.sin(dec) * math.cos(lat) - np.cos(dec) * np.cos(hour_angle) * math.sin(lat),
+    )
+    if distance_km is not None:
+        alt = alt - np.arcsin(EARTH_RADIUS_KM / np.asarray(distance_km) * np.cos(alt))
+    return np.degrees(alt), np.mod(np.degrees(az), 360.0)
+
+
+def angular_separation(
+    ra1_deg: np.ndarray | float,
+    dec1_deg: np.ndarray | float,
+    ra2_deg: np.ndarray | float,
+    dec2_deg: np.ndarray | float,
+) -> np.ndarray:
+    """Great-circle separation in degrees (Vincenty formula, stable at all angles)."""
+    ra1, dec1, ra2, dec2 = (np.radians(v) for v in (ra1_deg, dec1_deg, ra2_deg, dec2_deg))
+    delta = ra2 - ra1
+    num = np.hypot(
+        np.cos(dec2) * np.sin(delta),
+        np.cos(dec1) * np.sin(dec2) - np.sin(dec1) * np.cos(dec2) * np.cos(delta),
+    )
+    den = np.sin(dec1) * np.sin(dec2) + np.cos(dec1) * np.cos(dec2) * np.cos(delta)
+    return np.degrees(np.arctan2(num, den))
+
+
+def moon_info(jd: float) -> dict[str, Any]:
+    """Fast equivalent of ``calculate_moon_info`` (same keys and phase names)."""
+    return moon_phases(np.atleast_1d(jd))[0]
+
+
+def moon_phases(jd: np.ndarray) -> list[dict[str, Any]]:
+    """:func:`moon_info` for every Julian date in ``jd``, in one array evaluation."""
+    t = _centuries(np.ravel(jd))
+    sun_lon, _, obliquity = _sun_ecliptic(t)
+    moon_lon, moon_lat, distance = _moon_ecliptic(t)
+    sun_ra, sun_dec = _ecliptic_to_equatorial(sun_lon, np.zeros_like(sun_lon), obliquity)
+    moon_ra, moon_dec = _ecliptic_to_equatorial(moon_lon, moon_lat, _mean_obliquity(t))
+
+    elongation = np.broadcast_to(angular_separation(sun_ra, sun_dec, moon_ra, moon_dec), t.shape)
+    lon_diff = np.broadcast_to(np.mod(moon_lon - sun_lon, 360.0), t.shape)
+    distance = np.broadcast_to(distance, t.shape)
+    return [
+        {
+            'illumination': (1 - math.cos(math.radians(e))) / 2.0,
+            'phase_name': phase_name(d),
+            'age_days': d / 360.0 * _SYNODIC_MONTH_DAYS,
+            'elongation': e,
+            'earth_distance': r,
+        }
+        for e, d, r in zip(elongation.tolist(), lon_diff.tolist(), distance.tolist(), strict=True)
+    ]
+
+
+def phase_name(lon_diff: float) -> str:
+    # Same boundaries as stargazing_core.calculate_moon_info.
+    if lon_diff < 1 or lon_diff > 359:
+        return 'New Moon'
+    if lon_diff < 89:
+        return 'Waxing Crescent'
+    if lon_diff <= 91:
+        return 'First Quarter'
+    if lon_diff < 179:
+        return 'Waxing Gibbous'
+    if lon_diff <= 181:
+        return 'Full Moon'
+    if lon_diff < 269:
+        return 'Waning Gibbous'
+    if lon_diff <= 271:
+        return 'Last Quarter'
+    return 'Waning Crescent'
+
+
+def _centuries(jd: np.ndarray | float) -> np.ndarray:
+    return (np.asarray(jd, dtype=np.float64) - _J2000) / 36525.0
+
+
+def _mean_obliquity(t: np.ndarray) -> np.ndarray:
+    return np.radians(23.439291 - 0.0130042 * t)
+
+
+def _sun_ecliptic(t: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Apparent ecliptic longitude (deg), distance (au) and true obliquity (rad)."""
+    l0 = 280.46646 + t * (36000.76983 + 0.0003032 * t)
+    m = np.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+    e = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+    center = (
+        (1.914602 - t * (0.004817 + 0.000014 * t)) * np.sin(m)
+        + (0.019993 - 0.000101 * t) * np.sin(2 * m)
+        + 0.000289 * np.sin(3 * m)
+    )
+    true_anomaly = m + np.radians(center)
+    distance = 1.000001018 * (1 - e * e) / (1 + e * np.cos(true_anomaly))
+    omega = np.radians(125.04 - 1934.136 * t)
+    lon = np.mod(l0 + center - 0.00569 - 0.00478 * np.sin(omega), 360.0)
+    obliquity = _mean_obliquity(t) + np.radians(0.00256) * np.cos(omega)
+    return lon, distance, obliquity
+
+
+def _moon_ecliptic(t: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Geocentric ecliptic longitude/latitude (deg) and distance (km) of date."""
+    lp = 218.3164477 + t * (481267.88123421 + t * (-0.0015786 + t * (1 / 538841 - t / 65194000)))
+    d = 297.8501921 + t * (445267.1114034 + t * (-0.0018819 + t * (1 / 545868 - t / 113065000)))
+    m = 357.5291092 + t * (35999.0502909 + t * (-0.0001536 + t / 24490000))
+    mp = 134.9633964 + t * (477198.8675055 + t * (0.0087414 + t * (1 / 69699 - t / 14712000)))
+    f = 93.2720950 + t * (483202.0175233 + t * (-0.0036539 + t * (-1 / 3526000 + t / 863310000)))
+    a1 = np.radians(119.75 + 131.849 * t)
+    a2 = np.radians(53.09 + 479264.290 * t)
+    a3 = np.radians(313.45 + 481266.484 * t)
+    ecc = 1 - t * (0.002516 + 0.0000074 * t)
+
+    fundamentals = np.radians(np.stack(np.broadcast_arrays(d, m, mp, f)))
+    lr_args = np.tensordot(_MOON_LR_TERMS[:, :4], fundamentals, axes=1)
+    b_args = np.tensordot(_MOON_B_TERMS[:, :4], fundamentals, axes=1)
+    # Terms involving the Sun's anomaly M shrink with Earth's orbital eccentricity.
+    lr_scale = ecc ** np.abs(_MOON_LR_TERMS[:, 1]).reshape(-1, *([1] * np.ndim(t)))
+    b_scale = ecc ** np.abs(_MOON_B_TERMS[:, 1]).reshape(-1, *([1] * np.ndim(t)))
+    coeff_shape = (-1, *([1] * np.ndim(t)))
+
+    lp_rad = np.radians(lp)
+    f_rad = np.radians(f)
+    mp_rad = np.radians(mp)
+    sum_l = np.sum(_MOON_LR_TERMS[:, 4].reshape(coeff_shape) * lr_scale * np.sin(lr_args), axis=0)
+    sum_r = np.sum(_MOON_LR_TERMS[:, 5].reshape(coeff_shape) * lr_scale * np.cos(lr_args), axis=0)
+    sum_b = np.sum(_MOON_B_TERMS[:, 4].reshape(coeff_shape) * b_scale * np.sin(b_args), axis=0)
+    sum_l = sum_l + 3958 * np.sin(a1) + 1962 * np.sin(lp_rad - f_rad) + 318 * np.sin(a2)
+    sum_b = (
+        sum_b
+        - 2235 * np.sin(lp_rad)
+        + 382 * np.sin(a3)
+        + 175 * np.sin(a1 - f_rad)
+        + 175 * np.sin(a1 + f_rad)
+        + 127 * np.sin(lp_rad - mp_rad)
+        - 115 * np.sin(lp_rad + mp_rad)
+    )
+    lon = np.mod(lp + sum_l / 1e6, 360.0)
+    lat = sum_b / 1e6
+    distance = 385000.56 + sum_r / 1000.0
+    return lon, lat, distance
+
+
+def _heliocentric_equatorial(name: str, jd: np.ndarray) -> np.ndarray:
+    """Heliocentric J2000 equatorial position (au), shape ``(3, *jd.shape)``."""
+    t = _centuries(jd)
+    if name in _GAS_GIANT_ELEMENTS:
+        days = np.asarray(jd, dtype=np.float64) - _GAS_GIANT_EPOCH_JD
+        node, inc, arg_peri, a, e, mean_anomaly = (
+            b + r * days for b, r in _GAS_GIANT_ELEMENTS[name]
+        )
+        # Refer the node to the J2000 equinox (ecliptic motion itself is negligible here).
+        node = node - _PRECESSION_DEG_PER_CENTURY * t
+    else:
+        base, rate = _PLANET_ELEMENTS[name]
+        a, e, inc, mean_lon, peri, node = (b + r * t for b, r in zip(base, rate, strict=True))
+        arg_peri = peri - node
+        mean_anomaly = mean_lon - peri
+    inc, node, arg_peri = np.radians(inc), np.radians(node), np.radians(arg_peri)
+    mean_anomaly = np.radians(np.mod(mean_anomaly + 180.0, 360.0) - 180.0)
+
+    ecc_anomaly = mean_anomaly + e * np.sin(mean_anomaly)
+    for _ in range(6):
+        ecc_anomaly = ecc_anomaly - (ecc_anomaly - e * np.sin(ecc_anomaly) - mean_anomaly) / (
+            1 - e * np.cos(ecc_anomaly)
+        )
+    xp = a * (np.cos(ecc_anomaly) - e)
+    yp = a * np.sqrt(1 - e * e) * np.sin(ecc_anomaly)
+
+    cw, sw = np.cos(arg_peri), np.sin(arg_peri)
+    cn, sn = np.cos(node), np.sin(node)
+    ci, si = np.cos(inc), np.sin(inc)
+    x = (cw * cn - sw * sn * ci) * xp + (-sw * cn - cw * sn * ci) * yp
+    y = (cw * sn + sw * cn * ci) * xp + (-sw * sn + cw * cn * ci) * yp
+    z = sw * si * xp + cw * si * yp
+    if name in _GAS_GIANT_ELEMENTS:
+        x, y, z = _great_inequality(name, t, x, y, z)
+
+    ce, se = math.cos(_OBLIQUITY_J2000), math.sin(_OBLIQUITY_J2000)
+    return np.stack([x, y * ce - z * se, y * se + z * ce])
+
+
+def _great_inequality(
+    name: str, t: np.ndarray, x: np.ndarray, y: np.ndarray, z: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Add the largest Jupiter-Saturn mutual perturbations to an ecliptic position."""
+    mj = np.radians(_mean_anomaly('jupiter', t))
+    ms = np.radians(_mean_anomaly('saturn', t))
+    deg = math.radians
+    if name == 'jupiter':
+        dlon = (
+            -0.332 * np.sin(2 * mj - 5 * ms - deg(67.6))
+            - 0.056 * np.sin(2 * mj - 2 * ms + deg(21))
+            + 0.042 * np.sin(3 * mj - 5 * ms + deg(21))
+            - 0.036 * np.sin(mj - 2 * ms)
+            + 0.022 * np.cos(mj - ms)
+            + 0.023 * np.sin(2 * mj - 3 * ms + deg(52))
+            - 0.016 * np.sin(mj - 5 * ms - deg(69))
+        )
+        dlat = 0.0
+    else:
+        dlon = (
+            0.812 * np.sin(2 * mj - 5 * ms - deg(67.6))
+            - 0.229 * np.cos(2 * mj - 4 * ms - deg(2))
+            + 0.119 * np.sin(mj - 2 * ms - deg(3))
+            + 0.046 * np.sin(2 * mj - 6 * ms - deg(69))
+            + 0.014 * np.sin(mj - 3 * ms + deg(32))
+        )
+        dlat = -0.020 * np.cos(2 * mj - 4 * ms - deg(2)) + 0.018 * np.sin(2 * mj - 6 * ms - deg(49))
+    r = np.sqrt(x * x + y * y + z * z)
+    lon = np.arctan2(y, x) + np.radians(dlon)
+    lat = np.arcsin(z / r) + np.radians(dlat)
+    return r * np.cos(lat) * np.cos(lon), r * np.cos(lat) * np.sin(lon), r * np.sin(lat)
+
+
+def _mean_anomaly(name: str, t: np.ndarray) -> np.ndarray:
+    base, rate = _GAS_GIANT_ELEMENTS[name][5]
+    return base + rate * (t * 36525.0 + _J2000 - _GAS_GIANT_EPOCH_JD)
+
+
+def _precession_matrix(jd: np.ndarray | float) -> np.ndarray:
+    """J2000 → mean equinox of date rotation, shape ``(3, 3, *jd.shape)``."""
+    t = _centuries(jd)
+    arcsec = math.pi / (180.0 * 3600.0)
+    zeta = (2306.2181 + (0.30188 + 0.017998 * t) * t) * t * arcsec
+    z = (2306.2181 + (1.09468 + 0.018203 * t) * t) * t * arcsec
+    theta = (2004.3109 - (0.42665 + 0.041833 * t) * t) * t * arcsec
+    cz, sz = np.cos(zeta), np.sin(zeta)
+    cZ, sZ = np.cos(z), np.sin(z)  # noqa: N806 — Meeus notation
+    ct, st = np.cos(theta), np.sin(theta)
+    return np.array(
+        [
+            [cz * ct * cZ - sz * sZ, -sz * ct * cZ - cz * sZ, -st * cZ],
+            [cz * ct * sZ + sz * cZ, -sz * ct * sZ + cz * cZ, -st * sZ],
+            [cz * st, -sz * st, ct],
+        ]
+    )
+
+
+def _cartesian_to_spherical(
+    rotation: np.ndarray, xyz: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Apply a (possibly time-dependent) rotation, then return ``(ra, dec, r)`` in degrees."""
+    x, y, z = np.einsum('ij...,j...->i...', rotation, xyz)
+    r = np.sqrt(x * x + y * y + z * z)
+    ra = np.mod(np.degrees(np.arctan2(y, x)), 360.0)
+    dec = np.degrees(np.arcsin(np.clip(z / r, -1.0, 1.0)))
+    return ra, dec, r
+
+
+def _ecliptic_to_equatorial(
+    lon_deg: np.ndarray, lat_deg: np.ndarray, obliquity: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    lon, lat = np.radians(lon_deg), np.radians(lat_deg)
+    ra = np.arctan2(np.sin(lon) * np.cos(obliquity) - np.tan(lat) * np.sin(obliquity), np.cos(lon))
+    dec = np.arcsin(np.sin(lat) * np.cos(obliquity) + np.cos(lat) * np.sin(obliquity) * np.sin(lon))
+    return np.mod(np.degrees(ra), 360.0), np.degrees(dec)
@@ -1,40 +1,60 @@
 import asyncio
-from typing import Any
+from typing import Any, Literal
 
+from src.almanac import get_night_almanac
 from src.celestial import (
     calculate_moon_info,
     calculate_nightly_forecast,
     celestial_pos,
+    celestial_positions,
     celestial_rise_set,
+    constellation_objects,
     get_constellation_center,
     get_moon_altaz,
+    iter_nightly_forecast,
 )
+from src.constellations import MAX_CONSTELLATION_LOOKUPS, constellation_names
+from src.constellations import identify_constellations as find_constellations
+from src.deadline import deadline_scope, request_deadline, run_before_deadline
+from src.executor import run_cpu_bound
 from src.logging_config import set_request_id
 from src.response import MCPError, format_response
 from src.schemas import (
     CelestialPosition,
+    CelestialPositions,
     ConstellationInfo,
+    ConstellationLookup,
+    ConstellationObjects,
     MoonInfo,
     NightlyForecast,
-    RiseSet,
+    RiseSetEvent,
+    RiseSetEvents,
     VisiblePlanet,
 )
 from src.server_instance import mcp
-from src.utils import parse_observation_time, process_location_and_time
+from src.utils import create_earth_location, parse_observation_time, process_location_and_time
+
+Precision = Literal['full', 'fast']
 
 
 async def _respond_with_mcp_error(operation) -> dict[str, Any]:
     """Convert domain validation errors into the standard MCP response shape."""
     set_request_id()
     try:
-        return await operation
+        with deadline_scope(request_deadline()):
+            return await operation
     except MCPError as exc:
         return exc.to_response()
 
 
 @mcp.tool()
 async def get_celestial_pos(
-    celestial_object: str, lon: float, lat: float, time: str, time_zone: str
+    celestial_object: str,
+    lon: float,
+    lat: float,
+    time: str,
+    time_zone: str,
+    precision: Precision | None = None,
 ) -> dict[str, Any]:
     """Calculate the altitude and azimuth angles of a celestial object.
 
@@ -44,6 +64,7 @@ async def get_celestial_pos(
         lat: Observer latitude in degrees
         time: Observation time string "YYYY-MM-DD HH:MM:SS"
         time_zone: IANA timezone string
+        precision: "full" (astropy, default) or "fast" (analytic, ~arcminute accuracy)
 
     Returns:
         Dict with keys "data", "_meta". "data" contains "altitude" and "azimuth" (degrees).
@@ -52,13 +73,56 @@ async def get_celestial_pos(
     async def operation() -> dict[str, Any]:
         location, time_info = process_location_and_time(lon, lat, time, time_zone)
         # Run synchronous celestial calculations in a thread to avoid blocking the event loop.
-        alt, az = await asyncio.to_thread(celestial_pos, celestial_object, location, time_info)
+        alt, az = await asyncio.to_thread(
+            celestial_pos, celestial_object, location, time_info, precision
+        )
         pos = CelestialPosition(altitude=alt, azimuth=az)
         return format_response(pos.model_dump())
 
     return await _respond_with_mcp_error(operation())
 
 
+@mcp.tool()
+async def get_celestial_positions(
+    celestial_objects: list[str],
+    lon: float,
+    lat: float,
+    times: list[str],
+    time_zone: str,
+    precision: Precision | None = None,
+) -> dict[str, Any]:
+    """Calculate altitude and azimuth for several objects at several times in one call.
+
+    Args:
+        celestial_objects: Object names (e.g. ["sun", "moon", "M31", "vega"])
+        lon: Observer longitude in degrees
+        lat: Observer latitude in degrees
+        times: Observation time strings "YYYY-MM-DD HH:MM:SS"
+        time_zone: IANA timezone string
+        precision: "full" (astropy, default) or "fast" (analytic, ~arcminute accuracy)
+
+    Returns:
+        Dict with keys "data", "_meta". "data" contains "objects", "times", and
+        "altitude"/"azimuth" matrices (degrees) indexed [object][time].
+    """
+
+    async def operation() -> dict[str, Any]:
+        location = create_earth_location(lat=lat, lon=lon)
+        observation_times = [parse_observation_time(t, time_zone) for t in times]
+        alt, az = await asyncio.to_thread(
+            celestial_positions, celestial_objects, location, observation_times, precision
+        )
+        positions = CelestialPositions(
+            objects=list(celestial_objects),
+            times=[t.isoformat() for t in observation_times],
+            altitude=alt.tolist(),
+            azimuth=az.tolist(),
+        )
+        return format_response(positions.model_dump())
+
+    return await _respond_with_mcp_error(operation())
+
+
 @mcp.tool()
 async def get_celestial_rise_set(
     celestial_object: str, lon: float, lat: float, time: str, time_zone: str
@@ -73,18 +137,22 @@ async def get_celestial_rise_set(
         time_zone: IANA timezone string
 
     Returns:
-        Dict with keys "data", "_meta". "data" contains "rise_time" and "set_time".
+        Dict with keys "data", "_meta". "data" contains "rise_time", "set_time",
+        and "events" (every rise/set crossing that day, e.g. for the Moon).
     """
 
     async def operation() -> dict[str, Any]:
         location, time_info = process_location_and_time(lon, lat, time, time_zone)
-        # Run synchronous celestial calculations in a separate thread
-        rise_time, set_time = await asyncio.to_thread(
-            celestial_rise_set, celestial_object, location, time_info
-        )
-        rise_set = RiseSet(
+        # CPU-bound: runs in the compute worker pool when one is configured
+        result = await run_cpu_bound(celestial_rise_set, celestial_object, location, time_info)
+        rise_time, set_time = result
+        rise_set = RiseSetEvents(
             rise_time=rise_time.isoformat() if rise_time else None,
             set_time=set_time.isoformat() if set_time else None,
+            events=[
+                RiseSetEvent(event=kind, time=t.isoformat())
+                for kind, t in getattr(result, 'events', ())
+            ],
         )
         return format_response(rise_set.model_dump())
 
@@ -127,14 +195,11 @@ async def get_moon_info(
             moon_info.altitude = alt
             moon_info.azimuth = az
 
-            # Also compute moonrise / moonset for the observer's night
-            try:
-                rise_t, set_t = await asyncio.to_thread(celestial_rise_set, 'moon', location, dt)
-                moon_info.moonrise = rise_t.utc.unix if rise_t is not None else None
-                moon_info.moonset = set_t.utc.unix if set_t is not None else None
-            except Exception:  # nosec B110 — moon may be circumpolar
-                # Moon may be circumpolar — leave rise/set as None
-                pass
+            # Moonrise / moonset for the observer's night come from the shared
+            # almanac; None when the Moon stays up or down all night.
+            almanac = await asyncio.to_thread(get_night_almanac, location, dt)
+            moon_info.moonrise = almanac.moonrise.timestamp() if almanac.moonrise else None
+            moon_info.moonset = almanac.moonset.timestamp() if almanac.moonset else None
 
         return format_response(moon_info.model_dump())
 
@@ -142,7 +207,9 @@ async def get_moon_info(
 
 
 @mcp.tool()
-async def list_visible_planets(lon: float, lat: float, time: str, time_zone: str) -> dict[str, Any]:
+async def list_visible_planets(
+    lon: float, lat: float, time: str, time_zone: str, precision: Precision | None = None
+) -> dict[str, Any]:
     """Get a list of solar system planets currently visible (above horizon).
 
     Args:
@@ -150,6 +217,7 @@ async def list_visible_planets(lon: float, lat: float, time: str, time_zone: str
         lat: Observer latitude in degrees
         time: Observation time string "YYYY-MM-DD HH:MM:SS"
         time_zone: IANA timezone string
+        precision: "full" (astropy, default) or "fast" (analytic, ~arcminute accuracy)
 
     Returns:
         Dict with keys "data", "_meta". "data" is a list of planet dicts (name, altitude, azimuth).
@@ -161,7 +229,7 @@ async def list_visible_planets(lon: float, lat: float, time: str, time_zone: str
         # `get_visible_planets = list_visible_planets` backward-compat alias (line below).
         from src.celestial import get_visible_planets as calc_visible_planets
 
-        planets = await asyncio.to_thread(calc_visible_planets, location, time_info)
+        planets = await asyncio.to_thread(calc_visible_planets, location, time_info, precision)
         models = [VisiblePlanet(**p) for p in planets]
         return format_response([m.model_dump() for m in models])
 
@@ -200,9 +268,90 @@ async def get_constellation(
     return await _respond_with_mcp_error(operation())
 
 
+@mcp.tool()
+async def get_constellation_objects(
+    constellation: str,
+    lon: float,
+    lat: float,
+    time: str,
+    time_zone: str,
+    min_altitude: float = 0.0,
+    limit: int = 50,
+    precision: Precision | None = None,
+) -> dict[str, Any]:
+    """List catalog objects in a constellation that are above an altitude now.
+
+    Args:
+        constellation: Constellation full name or IAU abbreviation (e.g. "Cygnus", "Cyg")
+        lon: Observer longitude in degrees
+        lat: Observer latitude in degrees
+        time: Observation time string "YYYY-MM-DD HH:MM:SS"
+        time_zone: IANA timezone string
+        min_altitude: Minimum altitude in degrees (default 0, the horizon)
+        limit: Max number of objects to return (default 50)
+        precision: "full" (astropy, default) or "fast" (analytic, ~arcminute accuracy)
+
+    Returns:
+        Dict with keys "data", "_meta". "data" contains constellation, abbreviation,
+        total, visible and "objects" (brightest first; name, type, magnitude,
+        catalog, altitude, azimuth, angular_size_arcmin).
+    """
+
+    async def operation() -> dict[str, Any]:
+        location, time_info = process_location_and_time(lon, lat, time, time_zone)
+        result = await asyncio.to_thread(
+            constellation_objects,
+            constellation,
+            location,
+            time_info,
+            min_altitude,
+            limit,
+            precision,
+        )
+        return format_response(ConstellationObjects.model_validate(result).model_dump())
+
+    return await _respond_with_mcp_error(operation())
+
+
+@mcp.tool()
+async def identify_constellations(ra: list[float], dec: list[float]) -> dict[str, Any]:
+    """Find the constellation containing each of a batch of sky coordinates.
+
+    Args:
+        ra: Right ascensions in degrees (ICRS/J2000)
+        dec: Declinations in degrees (ICRS/J2000), same length as ``ra``
+
+    Returns:
+        Dict with keys "data", "_meta". "data" contains "constellations" (full
+        names) and "abbreviations" (IAU), one per coordinate.
+    """
+
+    async def operation() -> dict[str, Any]:
+        if len(ra) > MAX_CONSTELLATION_LOOKUPS:
+            raise ValueError(
+                f'Too many coordinates ({len(ra)}); the limit is {MAX_CONSTELLATION_LOOKUPS}.'
+            )
+        abbreviations = await asyncio.to_thread(find_constellations, ra, dec, True)
+        names = constellation_names()
+        lookup = ConstellationLookup(
+            constellations=[names[code] for code in abbreviations.tolist()],
+            abbreviations=abbreviations.tolist(),
+        )
+        return format_response(lookup.model_dump())
+
+    return await _respond_with_mcp_error(operation())
+
+
 @mcp.tool()
 async def get_nightly_forecast(
-    lon: float, lat: float, time: str, time_zone: str, limit: int = 20
+    lon: float,
+    lat: float,
+    time: str,
+    time_zone: str,
+    limit: int = 20,
+    precision: Precision | None = None,
+    nights: int = 1,
+    include_curves: bool = False,
 ) -> dict[str, Any]:
     """Get a curated list of best objects to view for the night.
 
@@ -212,27 +361,107 @@ async def get_nightly_forecast(
         time: Date string "YYYY-MM-DD HH:MM:SS" (Time of observation, or just date)
         time_zone: IANA timezone string
         limit: Max number of deep-sky objects to return (default 20)
+        precision: "full" (astropy, default) or "fast" (analytic, ~arcminute accuracy)
+        nights: Number of consecutive nights to forecast, at the same clock time (1-31)
+        include_curves: Add each deep-sky object's altitude_curve (civil dusk to dawn)
 
     Returns:
         Dict with keys:
         - moon_phase: Moon details
         - planets: List of visible planets
         - deep_sky: Sorted list of deep sky objects (Messier/NGC)
+        - night: Almanac for the night (full precision only)
+        - nights / best_night: Per-night forecasts and the darkest night (nights > 1)
     """
 
     async def operation() -> dict[str, Any]:
         location, time_info = process_location_and_time(lon, lat, time, time_zone)
 
-        # Run in thread
-        result = await asyncio.to_thread(calculate_nightly_forecast, location, time_info, limit)
+        result = await run_cpu_bound(
+            calculate_nightly_forecast,
+            location,
+            time_info,
+            limit,
+            precision,
+            nights,
+            include_curves,
+        )
+
+        forecast = NightlyForecast.model_validate(result)
+        return format_response(forecast.model_dump())
+
+    return await _respond_with_mcp_error(operation())
+
+
+@mcp.tool()
+async def stream_nightly_forecast(
+    lon: float,
+    lat: float,
+    time: str,
+    time_zone: str,
+    limit: int = 20,
+    precision: Precision | None = None,
+    include_curves: bool = False,
+) -> dict[str, Any]:
+    """Single-night nightly forecast that reports partial results while it runs.
+
+    Sends MCP progress notifications (when the request carries a
+    ``progressToken``) and, as log notifications on the
+    ``stream_nightly_forecast`` logger, partial forecasts: first the Moon,
+    planets and night almanac, then the best deep-sky objects after each
+    scored batch.  Each partial has the final response shape, with
+    ``_meta.progress`` below 1.
 
-        from src.schemas.celestial import DeepSkyObject
+    Args:
+        lon: Observer longitude in degrees
+        lat: Observer latitude in degrees
+        time: Date string "YYYY-MM-DD HH:MM:SS" (Time of observation, or just date)
+        time_zone: IANA timezone string
+        limit: Max number of deep-sky objects to return (default 20)
+        precision: "full" (astropy, default) or "fast" (analytic, ~arcminute accuracy)
+        include_curves: Add each deep-sky object's altitude_curve to the final result
 
-        forecast = NightlyForecast(
-            moon_phase=MoonInfo(**result['moon_phase']),
-            planets=[VisiblePlanet(**p) for p in result['planets']],
-            deep_sky=[DeepSkyObject(**o) for o in result['deep_sky']],
+    Returns:
+        The same response as ``get_nightly_forecast`` for one night, with
+        ``_meta.progress`` 1.0.
+    """
+
+    async def operation() -> dict[str, Any]:
+        location, time_info = process_location_and_time(lon, lat, time, time_zone)
+        ctx = _request_context()
+        # Stepped in threads (not the worker pool) so partials reach the client as they come.
+        events = iter_nightly_forecast(
+            location, time_info, limit, precision, include_curves=include_curves
         )
-        return format_response(forecast.model_dump())
+        while True:
+            event = await run_before_deadline(
+                'nightly forecast', lambda: asyncio.to_thread(next, events)
+            )
+            response = format_response(
+                NightlyForecast.model_validate(event['forecast']).model_dump(),
+                progress=event['progress'],
+            )
+            if event['stage'] == 'complete':
+                return response
+            if ctx is not None:
+                message = _progress_message(event)
+                await ctx.report_progress(event['progress'], 1.0, message)
+                await ctx.info(message, logger_name='stream_nightly_forecast', extra=response)
 
     return await _respond_with_mcp_error(operation())
+
+
+def _request_context():
+    """FastMCP context of the request being served; ``None`` for direct calls."""
+    try:
+        from fastmcp.server.dependencies import get_context
+
+        return get_context()
+    except (ImportError, RuntimeError):
+        return None
+
+
+def _progress_message(event: dict[str, Any]) -> str:
+    if event['stage'] == 'context':
+        return 'Moon, planets and night almanac ready'
+    return f'Scored {event["scored"]} of {event["total"]} candidates'
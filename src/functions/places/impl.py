@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from src.cache import ANALYSIS_CACHE, generate_cache_key
+from src.deadline import check_deadline, deadline_scope, request_deadline, run_before_deadline
 from src.logging_config import get_logger, get_request_id, set_request_id
 from src.placefinder import StargazingPlaceFinder, get_light_pollution_grid
 from src.response import MCPError, format_error, format_response
@@ -17,6 +18,10 @@ from src.server_instance import mcp
 
 logger = get_logger(__name__)
 
+# Area analysis may download road networks, so it gets a longer budget than
+# the default deadline (a client ``timeout_ms`` can still shorten it).
+ANALYSIS_DEADLINE_SECONDS = 300.0
+
 # Lazy-loaded SPF exception classes (populated on first use)
 _spf_exc_classes: dict[str, type] | None = None
 
@@ -132,7 +137,10 @@ async def light_pollution_map(
             raise _translate_spf_error(exc) from exc
 
     try:
-        raw = await asyncio.to_thread(_compute)
+        with deadline_scope(request_deadline()):
+            raw = await run_before_deadline(
+                'light pollution grid', lambda: asyncio.to_thread(_compute)
+            )
     except MCPError:
         raise
     except Exception as exc:
@@ -229,6 +237,7 @@ async def analysis_area(
                     resolved_db_path = os.environ.get('STARGAZING_DB_CONFIG')
                 db_config_p = Path(resolved_db_path) if resolved_db_path else None
                 stargazing_place_finder = StargazingPlaceFinder(db_config_path=db_config_p)
+                check_deadline('place finder setup')
                 results = stargazing_place_finder.analyze_area(
                     south=south,
                     west=west,
@@ -239,6 +248,7 @@ async def analysis_area(
                     max_locations=max_locations,
                     network_type=network_type,
                 )
+                check_deadline('area analysis')
                 # Convert spf StargazingLocation objects to our models
                 return [StargazingLocation.from_spf_location(item) for item in results]
             except ModuleNotFoundError:
@@ -247,11 +257,16 @@ async def analysis_area(
                     'stargazing-place-finder is not installed — '
                     'place analysis features are unavailable',
                 )
+            except MCPError:
+                raise
             except Exception as exc:
                 raise _translate_spf_error(exc) from exc
 
         try:
-            cached = await asyncio.to_thread(_compute)
+            with deadline_scope(request_deadline(ANALYSIS_DEADLINE_SECONDS)):
+                cached = await run_before_deadline(
+                    'area analysis', lambda: asyncio.to_thread(_compute)
+                )
         except MCPError:
             raise
         except Exception as exc:
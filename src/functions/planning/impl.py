@@ -2,7 +2,8 @@ import asyncio
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from src.functions.celestial.impl import get_nightly_forecast
+from src.deadline import deadline_scope, request_deadline
+from src.functions.celestial.impl import Precision, get_nightly_forecast
 from src.functions.places.impl import analysis_area
 from src.functions.weather.impl import get_weather_by_position
 from src.logging_config import set_request_id
@@ -69,7 +70,8 @@ async def _respond_with_mcp_error(operation) -> dict[str, Any]:
     """Convert MCPError exceptions into the standard structured payload."""
     set_request_id()
     try:
-        return await operation
+        with deadline_scope(request_deadline()):
+            return await operation
     except MCPError as exc:
         return exc.to_response()
 
@@ -95,13 +97,41 @@ def _parse_forecast_time(value: str, time_zone: str):
     return ensure_timezone(parse_time_string(value), time_zone)
 
 
+def _night_bounds(night: dict[str, Any] | None) -> tuple[datetime, datetime] | None:
+    """Darkest dusk/dawn pair the almanac has for the night, if any."""
+    if not night:
+        return None
+    for kind in ('astronomical', 'nautical', 'civil'):
+        dusk, dawn = night.get(f'{kind}_dusk'), night.get(f'{kind}_dawn')
+        if dusk and dawn:
+            return datetime.fromisoformat(dusk), datetime.fromisoformat(dawn)
+    return None
+
+
 def _pick_best_observation_window(
-    hourly_items: list[dict[str, Any]], requested_time: str, time_zone: str
+    hourly_items: list[dict[str, Any]],
+    requested_time: str,
+    time_zone: str,
+    night: dict[str, Any] | None = None,
 ) -> ObservationWindow | None:
-    """Pick the most promising hourly observation slot from the near-term forecast."""
+    """Pick the most promising hourly observation slot from the near-term forecast.
+
+    When the nightly almanac is available, only hours between dusk and dawn
+    are considered (falling back to any hour if none of them are).
+    """
     if not hourly_items:
         return None
 
+    bounds = _night_bounds(night)
+    if bounds is not None:
+        window = _pick_best_observation_window(
+            [item for item in hourly_items if _within(item, bounds, time_zone)],
+            requested_time,
+            time_zone,
+        )
+        if window is not None:
+            return window
+
     requested_dt = parse_observation_time(requested_time, time_zone)
     cutoff_dt = requested_dt + timedelta(hours=12)
     best_item = None
@@ -143,6 +173,13 @@ def _pick_best_observation_window(
     )
 
 
+def _within(item: dict[str, Any], bounds: tuple[datetime, datetime], time_zone: str) -> bool:
+    time_value = item.get('time')
+    if not time_value:
+        return False
+    return bounds[0] <= _parse_forecast_time(time_value, time_zone) <= bounds[1]
+
+
 def _build_weather_summary(weather_data: dict[str, Any] | None) -> WeatherPlanningSummary | None:
     """Condense aggregated weather into a small planning-oriented summary."""
     if weather_data is None:
@@ -249,17 +286,23 @@ async def _evaluate_candidate(
     time_zone: str,
     target_limit: int,
     weather_provider: str,
+    precision: Precision | None = None,
 ) -> PlannedLocationCandidate:
     """Evaluate one candidate place by attaching weather and target summaries."""
+    forecast_kwargs = {} if precision is None else {'precision': precision}
     weather_result, forecast_result = await asyncio.gather(
-        asyncio.to_thread(
-            get_weather_by_position.fn,
+        get_weather_by_position.fn(
             lat=location.lat,
             lon=location.lon,
             provider=weather_provider,
         ),
         get_nightly_forecast.fn(
-            lon=location.lon, lat=location.lat, time=time, time_zone=time_zone, limit=target_limit
+            lon=location.lon,
+            lat=location.lat,
+            time=time,
+            time_zone=time_zone,
+            limit=target_limit,
+            **forecast_kwargs,
         ),
     )
 
@@ -275,7 +318,8 @@ async def _evaluate_candidate(
     best_window = None
     if weather_data is not None:
         hourly_items = weather_data.get('summary', {}).get('hourly', [])
-        best_window = _pick_best_observation_window(hourly_items, time, time_zone)
+        night = forecast_data.get('night') if forecast_data is not None else None
+        best_window = _pick_best_observation_window(hourly_items, time, time_zone, night)
 
     top_targets = _build_top_targets(forecast_data, target_limit)
     moon_phase = None
@@ -321,6 +365,7 @@ async def get_best_stargazing_plan(
     road_radius_km: float = 10.0,
     network_type: str = 'drive',
     db_config_path: str = None,
+    precision: Precision | None = None,
 ) -> dict[str, Any]:
     """Create a composite stargazing plan for a region and time.
 
@@ -341,6 +386,7 @@ async def get_best_stargazing_plan(
         road_radius_km: Search radius for road access.
         network_type: Type of road network to analyze.
         db_config_path: Optional path to database config.
+        precision: Ephemeris precision for the nightly forecast ("full" or "fast").
 
     Returns:
         Dict with keys ``data`` and ``_meta``. ``data`` contains the normalized
@@ -380,6 +426,7 @@ async def get_best_stargazing_plan(
                     time_zone=time_zone,
                     target_limit=target_limit,
                     weather_provider=weather_provider,
+                    precision=precision,
                 )
                 for item in place_items
             ]
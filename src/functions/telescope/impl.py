@@ -1,12 +1,18 @@
 import asyncio
+from datetime import datetime
 from typing import Any
 
 import astropy.units as u
+import numpy as np
 from astropy.coordinates import EarthLocation
 from astropy.time import Time
 from stargazing_core import TelescopeConfig, match_telescope_targets
 
+from src.almanac import get_night_almanac
+from src.deadline import check_deadline, deadline_scope, request_deadline
+from src.executor import run_cpu_bound
 from src.logging_config import set_request_id
+from src.observability import DEFAULT_MIN_ALTITUDE, night_observability
 from src.response import MCPError, format_response
 from src.server_instance import mcp
 from src.utils import parse_observation_time, validate_coordinates
@@ -15,11 +21,49 @@ from src.utils import parse_observation_time, validate_coordinates
 async def _respond_with_mcp_error(operation) -> dict[str, Any]:
     set_request_id()
     try:
-        return await operation
+        with deadline_scope(request_deadline()):
+            return await operation
     except MCPError as exc:
         return exc.to_response()
 
 
+def _utc_isot(moment) -> str | None:
+    """Format a datetime the way ``match_telescope_targets`` reports dusk/dawn."""
+    return Time(moment).isot if moment is not None else None
+
+
+def _rank_by_observability(
+    targets: list[dict[str, Any]],
+    observer: EarthLocation,
+    moment: datetime,
+    min_altitude: float = DEFAULT_MIN_ALTITUDE,
+) -> list[dict[str, Any]]:
+    """Attach closed-form dark-time visibility and use it to break score ties.
+
+    Each target gains ``observable_hours`` (time above ``min_altitude`` inside
+    astronomical darkness).  The suitability order is kept; among equal
+    scores the target observable longest comes first.
+    """
+    located = [t for t in targets if t.get('ra') is not None and t.get('dec') is not None]
+    if not located:
+        return targets
+
+    visibility = night_observability(
+        np.array([t['ra'] for t in located], dtype=np.float64),
+        np.array([t['dec'] for t in located], dtype=np.float64),
+        observer,
+        moment,
+        get_night_almanac(observer, moment),
+        min_altitude,
+    )
+    for index, target in enumerate(located):
+        target['observable_hours'] = visibility.row(index)['observable_hours']
+    return sorted(
+        targets,
+        key=lambda t: (-t.get('suitability_score', 0.0), -(t.get('observable_hours') or 0.0)),
+    )
+
+
 @mcp.tool()
 async def get_telescope_targets(
     focal_length_mm: float,
@@ -68,6 +112,7 @@ async def get_telescope_targets(
             surface_brightness (mag/arcmin²), fov_fit_score, fov_fill_ratio
             suitability_score (0-100), mosaic_recommended, optimal_rotation_deg
             rise_time, set_time, transit_time, transit_alt (UTC unix timestamps)
+            observable_hours (hours above 20° during astronomical darkness)
             altitude_curve[{time, alt}]
             civil_dusk, civil_dawn, observation_time
         data.moon — {illumination, phase, altitude_curve, always_down,
@@ -144,21 +189,23 @@ async def _get_telescope_targets(
     # Convert to astropy Time
     t = Time(dt)
 
-    # Run matching in thread (astropy is blocking)
-    results = await asyncio.to_thread(
+    # Run matching off the event loop (in the worker pool when configured)
+    results = await run_cpu_bound(
         match_telescope_targets,
         config,
         observer,
         t,
         limit,
     )
+    check_deadline('matching telescope targets')
+    targets = await asyncio.to_thread(_rank_by_observability, results['targets'], observer, dt)
 
     return format_response(
         {
-            'targets': results['targets'],
+            'targets': targets,
             'moon': results['moon'],
             'config': config.model_dump(exclude_none=True),
-            'total': len(results['targets']),
+            'total': len(targets),
         }
     )
 
@@ -196,8 +243,6 @@ async def get_shooting_plan(
         data.config — the TelescopeConfig used
         data.total — number of matched targets
     """
-    from datetime import datetime
-
     import pytz
     from stargazing_core._shooting_plan import generate_shooting_schedule
 
@@ -224,24 +269,37 @@ async def get_shooting_plan(
 
     observer = EarthLocation(lat=lat * u.deg, lon=lon * u.deg)
 
-    tz = pytz.timezone(time_zone)
-    dt = tz.localize(datetime.fromisoformat(time))
-    t = Time(dt)
+    with deadline_scope(request_deadline()):
+        tz = pytz.timezone(time_zone)
+        dt = tz.localize(datetime.fromisoformat(time))
+        t = Time(dt)
 
-    results = await asyncio.to_thread(
-        match_telescope_targets,
-        config,
-        observer,
-        t,
-        limit,
-    )
+        results = await run_cpu_bound(
+            match_telescope_targets,
+            config,
+            observer,
+            t,
+            limit,
+        )
+        check_deadline('matching telescope targets')
 
-    targets = results['targets']
-    moon = results['moon']
-    dusk = targets[0]['civil_dusk'] if targets else t.iso
-    dawn = targets[0]['civil_dawn'] if targets else t.iso
+        targets = await asyncio.to_thread(
+            _rank_by_observability, results['targets'], observer, dt, min_altitude
+        )
+        moon = results['moon']
+        if targets:
+            dusk = targets[0]['civil_dusk']
+            dawn = targets[0]['civil_dawn']
+        else:
+            # No targets to read the night from: fall back to the shared almanac.
+            almanac = await asyncio.to_thread(get_night_almanac, observer, dt)
+            dusk = _utc_isot(almanac.civil_dusk) or t.iso
+            dawn = _utc_isot(almanac.civil_dawn) or t.iso
 
-    plan = generate_shooting_schedule(targets, moon, dusk, dawn, min_alt=min_altitude)
+        check_deadline('ranking by observability')
+        plan = await run_cpu_bound(
+            generate_shooting_schedule, targets, moon, dusk, dawn, min_alt=min_altitude
+        )
 
     return format_response(
         {
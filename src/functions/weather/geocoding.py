@@ -18,6 +18,7 @@ which is the correct tool for resolving place names like "浙江安吉".
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 
@@ -25,18 +26,48 @@ import requests
 from geopy.exc import GeocoderServiceError, GeocoderTimedOut
 from geopy.geocoders import Nominatim
 
+from src.http_client import async_http_get, http_get, raise_for_status
 from src.logging_config import get_logger
 from src.response import MCPError
 from src.schemas.weather import LocationInfo
+from src.singleflight import single_flight
 
 logger = get_logger(__name__)
 
+_geocode_flight = single_flight('geocoding')
+
 # ── public entry point ────────────────────────────────────────────
 
 
 def resolve_place_name(place_name: str) -> LocationInfo:
-    """将地点名称解析为标准位置对象。"""
+    """将地点名称解析为标准位置对象。
+
+    Concurrent lookups of the same name (ignoring case and spacing), sync or
+    async, share one geocoding cascade.
+    """
+
+    cleaned = _clean_place_name(place_name)
+    return _geocode_flight.do(
+        _flight_key(cleaned), lambda: _to_location(cleaned, _geocode(cleaned))
+    )
+
+
+async def resolve_place_name_async(place_name: str) -> LocationInfo:
+    """`resolve_place_name` 的异步版本：Amap/Photon 走事件循环，Nominatim 走线程。"""
+
+    cleaned = _clean_place_name(place_name)
+
+    async def resolve() -> LocationInfo:
+        return _to_location(cleaned, await _geocode_async(cleaned))
+
+    return await _geocode_flight.do_async(_flight_key(cleaned), resolve)
+
+
+def _flight_key(cleaned: str) -> str:
+    return ' '.join(cleaned.split()).casefold()
+
 
+def _clean_place_name(place_name: str) -> str:
     cleaned = place_name.strip()
     if not cleaned:
         raise MCPError(
@@ -44,8 +75,10 @@ def resolve_place_name(place_name: str) -> LocationInfo:
             'place_name 不能为空。',
             {'place_name': place_name},
         )
+    return cleaned
 
-    result = _geocode(cleaned)
+
+def _to_location(cleaned: str, result: tuple[str, float, float, str] | None) -> LocationInfo:
     if result is None:
         raise MCPError(
             MCPError.EXTERNAL_API_ERROR,
@@ -100,6 +133,25 @@ def _geocode(place_name: str) -> tuple[str, float, float, str] | None:
     return _geocode_nominatim(place_name)
 
 
+async def _geocode_async(place_name: str) -> tuple[str, float, float, str] | None:
+    """Async :func:`_geocode`; same tiers, Nominatim (geopy) runs in a thread."""
+
+    if _contains_cjk(place_name):
+        amap_key = os.getenv('AMAP_KEY')
+        if amap_key:
+            result = await _geocode_amap_async(place_name, amap_key)
+            if result is not None:
+                return result
+            logger.debug('Amap failed for %r, falling back to Photon', place_name)
+
+    result = await _geocode_photon_async(place_name)
+    if result is not None:
+        return result
+
+    logger.debug('Photon failed for %r, falling back to Nominatim', place_name)
+    return await asyncio.to_thread(_geocode_nominatim, place_name)
+
+
 def _contains_cjk(text: str) -> bool:
     """Return True when *text* contains any CJK character."""
     return bool(re.search(r'[一-鿿㐀-䶿豈-﫿가-힯]', text))
@@ -119,13 +171,32 @@ def _geocode_amap(place_name: str, amap_key: str) -> tuple[str, float, float, st
     params: dict[str, str] = {'key': amap_key, 'address': place_name}
 
     try:
-        resp = requests.get(_AMAP_GEOCODE_API, params=params, timeout=5)
+        resp = http_get(_AMAP_GEOCODE_API, params=params, timeout=5)
         resp.raise_for_status()
         data = resp.json()
     except (requests.RequestException, ValueError) as exc:
         logger.debug('Amap geocode request failed for %r: %s', place_name, exc)
         return None
+    return _parse_amap(data, place_name)
+
+
+async def _geocode_amap_async(
+    place_name: str, amap_key: str
+) -> tuple[str, float, float, str] | None:
+    """Async :func:`_geocode_amap`."""
+    params: dict[str, str] = {'key': amap_key, 'address': place_name}
 
+    try:
+        resp = await async_http_get(_AMAP_GEOCODE_API, params=params, timeout=5)
+        raise_for_status(resp)
+        data = resp.json()
+    except (requests.RequestException, ValueError) as exc:
+        logger.debug('Amap geocode request failed for %r: %s', place_name, exc)
+        return None
+    return _parse_amap(data, place_name)
+
+
+def _parse_amap(data: dict, place_name: str) -> tuple[str, float, float, str] | None:
     if data.get('status') != '1':
         logger.debug('Amap geocode non-success for %r: %s', place_name, data.get('info', 'unknown'))
         return None
@@ -152,15 +223,30 @@ def _geocode_amap(place_name: str, amap_key: str) -> tuple[str, float, float, st
 def _geocode_photon(place_name: str) -> tuple[str, float, float, str] | None:
     """Query Photon forward-geocoding. Returns (name, lat, lon, "photon") or None."""
     params = {'q': place_name, 'limit': 1}
-    headers = {'User-Agent': 'mcp-stargazing/1.0'}
     try:
-        resp = requests.get(_PHOTON_API, params=params, timeout=5, headers=headers)
+        resp = http_get(_PHOTON_API, params=params, timeout=5)
         resp.raise_for_status()
         data = resp.json()
     except (requests.RequestException, ValueError) as exc:
         logger.debug('Photon request failed for %r: %s', place_name, exc)
         return None
+    return _parse_photon(data, place_name)
+
+
+async def _geocode_photon_async(place_name: str) -> tuple[str, float, float, str] | None:
+    """Async :func:`_geocode_photon`."""
+    params = {'q': place_name, 'limit': 1}
+    try:
+        resp = await async_http_get(_PHOTON_API, params=params, timeout=5)
+        raise_for_status(resp)
+        data = resp.json()
+    except (requests.RequestException, ValueError) as exc:
+        logger.debug('Photon request failed for %r: %s', place_name, exc)
+        return None
+    return _parse_photon(data, place_name)
+
 
+def _parse_photon(data: dict, place_name: str) -> tuple[str, float, float, str] | None:
     features = data.get('features')
     if not features:
         return None
@@ -1,7 +1,7 @@
 from src.functions.weather.providers.qweather import get_qweather_auth_from_env
 from src.functions.weather.service import (
-    get_aggregated_weather_by_name,
-    get_aggregated_weather_by_position,
+    get_aggregated_weather_by_name_async,
+    get_aggregated_weather_by_position_async,
 )
 from src.logging_config import set_request_id
 from src.response import MCPError, format_error, format_response
@@ -47,11 +47,11 @@ def _validate_weather_coordinates(lat: float, lon: float) -> None:
         )
 
 
-def _respond_with_mcp_error(operation):
+async def _respond_with_mcp_error(operation):
     """Convert MCPError exceptions into the standard response payload."""
     set_request_id()
     try:
-        return operation()
+        return await operation
     except MCPError as exc:
         return exc.to_response()
 
@@ -59,22 +59,23 @@ def _respond_with_mcp_error(operation):
 def _format_weather_result(result: AggregatedWeatherResponse | dict) -> dict:
     """Serialize weather results into the standard MCP success payload."""
     if isinstance(result, AggregatedWeatherResponse):
-        return format_response(result.model_dump())
+        meta = {'cache': result.cache.model_dump()} if result.cache is not None else None
+        return format_response(result.model_dump(), meta)
     return format_response(result)
 
 
-def _execute_weather_fetch(fetch_weather, error_details: dict) -> dict:
+async def _execute_weather_fetch(fetch_weather, error_details: dict) -> dict:
     """Run a retried weather fetch and translate external failures once."""
 
     @retry_on_failure(
         RetryConfig(max_attempts=3, base_delay=1.0, max_delay=10.0),
         retryable_errors=(ConnectionError, TimeoutError, OSError),
     )
-    def _fetch_weather():
-        return fetch_weather()
+    async def _fetch_weather():
+        return await fetch_weather()
 
     try:
-        return _format_weather_result(_fetch_weather())
+        return _format_weather_result(await _fetch_weather())
     except MCPError as exc:
         return exc.to_response()
     except Exception as exc:
@@ -92,7 +93,7 @@ def _get_qweather_auth_from_env() -> tuple[str | None, str | None, str | None]:
 
 
 @mcp.tool()
-def get_weather_by_name(place_name: str, provider: str = 'all'):
+async def get_weather_by_name(place_name: str, provider: str = 'all'):
     """
     通过地点名称获取综合天气（当前 + 小时预报 + 日预报）。
 
@@ -112,19 +113,21 @@ def get_weather_by_name(place_name: str, provider: str = 'all'):
         Dict，包含 keys: "data", "_meta"（成功时）或 "error", "_meta"（失败时）。
     """
 
-    def operation() -> dict:
+    async def operation() -> dict:
         cleaned_name = _normalize_place_name(place_name)
         normalized_provider = _normalize_provider(provider)
-        return _execute_weather_fetch(
-            lambda: get_aggregated_weather_by_name(cleaned_name, provider=normalized_provider),
+        return await _execute_weather_fetch(
+            lambda: get_aggregated_weather_by_name_async(
+                cleaned_name, provider=normalized_provider
+            ),
             {'place_name': cleaned_name},
         )
 
-    return _respond_with_mcp_error(operation)
+    return await _respond_with_mcp_error(operation())
 
 
 @mcp.tool()
-def get_weather_by_position(lat: float, lon: float, provider: str = 'all'):
+async def get_weather_by_position(lat: float, lon: float, provider: str = 'all'):
     """
     通过经纬度获取综合天气（当前 + 小时预报 + 日预报）。
 
@@ -140,12 +143,14 @@ def get_weather_by_position(lat: float, lon: float, provider: str = 'all'):
         Dict，包含 keys: "data", "_meta"（成功时）或 "error", "_meta"（失败时）。
     """
 
-    def operation() -> dict:
+    async def operation() -> dict:
         _validate_weather_coordinates(lat, lon)
         normalized_provider = _normalize_provider(provider)
-        return _execute_weather_fetch(
-            lambda: get_aggregated_weather_by_position(lat, lon, provider=normalized_provider),
+        return await _execute_weather_fetch(
+            lambda: get_aggregated_weather_by_position_async(
+                lat, lon, provider=normalized_provider
+            ),
             {'lat': lat, 'lon': lon},
         )
 
-    return _respond_with_mcp_error(operation)
+    return await _respond_with_mcp_error(operation())
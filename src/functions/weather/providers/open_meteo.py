@@ -1,7 +1,11 @@
 """Open-Meteo provider adapter."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 import requests
 
+from src.http_client import async_http_get, http_get, raise_for_status
 from src.response import MCPError
 from src.schemas.weather import (
     CurrentWeather,
@@ -39,6 +43,25 @@ def get_weather_by_position(
     return ProviderSuccess(provider='open-meteo', data=normalized)
 
 
+async def get_weather_by_position_async(
+    lat: float,
+    lon: float,
+    location_name: str | None = None,
+    timezone: str | None = None,
+) -> ProviderSuccess:
+    """异步查询 Open-Meteo 并返回标准化后的 provider 结果。"""
+
+    raw_data = await fetch_open_meteo_raw_weather_async(lat, lon, timezone=timezone)
+    normalized = normalize_open_meteo_weather(
+        raw_data,
+        lat,
+        lon,
+        location_name=location_name,
+        timezone=timezone,
+    )
+    return ProviderSuccess(provider='open-meteo', data=normalized)
+
+
 def build_open_meteo_url(
     lat: float,
     lon: float,
@@ -66,13 +89,33 @@ def fetch_open_meteo_raw_weather(
 ) -> dict:
     """查询 Open-Meteo 原始天气数据。"""
 
-    try:
-        response = requests.get(
-            OPEN_METEO_URL,
-            params=_build_open_meteo_params(lat, lon, timezone),
-            timeout=15.0,
+    with _open_meteo_errors(lat, lon):
+        response = http_get(OPEN_METEO_URL, params=_build_open_meteo_params(lat, lon, timezone))
+        raise_for_status(response)
+    return _decode_open_meteo_json(response, lat, lon)
+
+
+async def fetch_open_meteo_raw_weather_async(
+    lat: float,
+    lon: float,
+    timezone: str | None = None,
+) -> dict:
+    """异步查询 Open-Meteo 原始天气数据。"""
+
+    with _open_meteo_errors(lat, lon):
+        response = await async_http_get(
+            OPEN_METEO_URL, params=_build_open_meteo_params(lat, lon, timezone)
         )
-        response.raise_for_status()
+        raise_for_status(response)
+    return _decode_open_meteo_json(response, lat, lon)
+
+
+@contextmanager
+def _open_meteo_errors(lat: float, lon: float) -> Iterator[None]:
+    """将 HTTP 传输错误映射为 MCPError。"""
+
+    try:
+        yield
     except requests.exceptions.Timeout as exc:
         raise MCPError(
             MCPError.API_TIMEOUT,
@@ -86,10 +129,11 @@ def fetch_open_meteo_raw_weather(
             {'lat': lat, 'lon': lon},
         ) from exc
     except requests.exceptions.HTTPError as exc:
+        status_code = exc.response.status_code
         raise MCPError(
             MCPError.EXTERNAL_API_ERROR,
-            f'Open-Meteo 返回 HTTP {response.status_code}。',
-            {'lat': lat, 'lon': lon, 'status_code': response.status_code},
+            f'Open-Meteo 返回 HTTP {status_code}。',
+            {'lat': lat, 'lon': lon, 'status_code': status_code},
         ) from exc
     except requests.exceptions.RequestException as exc:
         raise MCPError(
@@ -98,6 +142,8 @@ def fetch_open_meteo_raw_weather(
             {'lat': lat, 'lon': lon},
         ) from exc
 
+
+def _decode_open_meteo_json(response, lat: float, lon: float) -> dict:
     try:
         return response.json()
     except ValueError as exc:
@@ -1,12 +1,16 @@
-"""QWeather provider adapter."""
+"""QWeather provider adapter.
 
+Current conditions, the 10-day and the 24-hour forecast are separate QWeather
+endpoints.  They are requested concurrently over the pooled async client; if
+some fail, the others are still returned and the failures are listed in
+``ProviderSuccess.partial_errors``.
+"""
+
+import asyncio
 import os
 
-from src.qweather_interaction import (
-    qweather_get_weather_by_coord_in_ten_days,
-    qweather_get_weather_by_coord_in_twenty_four_hours,
-    qweather_get_weather_by_coord_real_time,
-)
+from src.http_client import run_sync
+from src.qweather_interaction import qweather_get_weather_by_coord_async
 from src.response import MCPError
 from src.schemas.weather import (
     CurrentWeather,
@@ -14,12 +18,16 @@ from src.schemas.weather import (
     HourlyForecastItem,
     LocationInfo,
     NormalizedWeatherData,
+    ProviderErrorDetail,
     ProviderSuccess,
 )
 
 from ._common import to_float as _to_float
 from ._common import to_ratio as _to_ratio
 
+# Raw-data section → QWeather `/v7/weather/{endpoint}`.
+QWEATHER_ENDPOINTS = {'current': 'now', 'daily': '10d', 'hourly': '24h'}
+
 
 def get_qweather_auth_from_env() -> tuple[str | None, str | None, str | None]:
     """从环境变量读取 QWeather 鉴权与 Host 配置。"""
@@ -42,9 +50,28 @@ def get_weather_by_position(
     location_name: str | None = None,
     timezone: str | None = None,
 ) -> ProviderSuccess:
-    """查询 QWeather 并返回标准化后的 provider 结果。"""
+    """查询 QWeather 并返回标准化后的 provider 结果（同步包装）。"""
+
+    return run_sync(
+        get_weather_by_position_async(lat, lon, location_name=location_name, timezone=timezone)
+    )
+
+
+def fetch_qweather_raw_weather(lat: float, lon: float) -> dict:
+    """查询 QWeather 原始天气数据（同步包装）。"""
+
+    return run_sync(fetch_qweather_raw_weather_async(lat, lon))
+
+
+async def get_weather_by_position_async(
+    lat: float,
+    lon: float,
+    location_name: str | None = None,
+    timezone: str | None = None,
+) -> ProviderSuccess:
+    """异步查询 QWeather 并返回标准化后的 provider 结果。"""
 
-    raw_data = fetch_qweather_raw_weather(lat, lon)
+    raw_data = await fetch_qweather_raw_weather_async(lat, lon)
     normalized = normalize_qweather_weather(
         raw_data,
         lat,
@@ -52,36 +79,55 @@ def get_weather_by_position(
         location_name=location_name,
         timezone=timezone,
     )
-    return ProviderSuccess(provider='qweather', data=normalized)
+    return ProviderSuccess(
+        provider='qweather',
+        data=normalized,
+        partial_errors={
+            section: _error_detail(exc) for section, exc in raw_data.get('errors', {}).items()
+        },
+    )
 
 
-def fetch_qweather_raw_weather(lat: float, lon: float) -> dict:
-    """查询 QWeather 原始天气数据。"""
+async def fetch_qweather_raw_weather_async(lat: float, lon: float) -> dict:
+    """并发查询 QWeather 的 now / 10d / 24h 接口。
+
+    部分接口失败时返回其余成功的部分，失败的接口异常记录在 ``errors`` 中；
+    全部失败时抛出 ``current`` 接口的错误。
+    """
 
     api_key, jwt_token, api_host = get_qweather_auth_from_env()
-    return {
-        'current': qweather_get_weather_by_coord_real_time(
-            lon,
-            lat,
-            api_key,
-            api_host=api_host,
-            jwt_token=jwt_token,
-        ),
-        'daily': qweather_get_weather_by_coord_in_ten_days(
-            lon,
-            lat,
-            api_key,
-            api_host=api_host,
-            jwt_token=jwt_token,
-        ),
-        'hourly': qweather_get_weather_by_coord_in_twenty_four_hours(
-            lon,
-            lat,
-            api_key,
-            api_host=api_host,
-            jwt_token=jwt_token,
+    responses = await asyncio.gather(
+        *(
+            qweather_get_weather_by_coord_async(
+                endpoint, lon, lat, api_key, api_host=api_host, jwt_token=jwt_token
+            )
+            for endpoint in QWEATHER_ENDPOINTS.values()
         ),
-    }
+        return_exceptions=True,
+    )
+
+    raw_data: dict = {}
+    errors: dict[str, Exception] = {}
+    for section, response in zip(QWEATHER_ENDPOINTS, responses, strict=True):
+        if isinstance(response, Exception):
+            errors[section] = response
+        elif isinstance(response, BaseException):
+            raise response
+        else:
+            raw_data[section] = response
+    if not raw_data:
+        raise errors['current']
+    if errors:
+        raw_data['errors'] = errors
+    return raw_data
+
+
+def _error_detail(exc: Exception) -> ProviderErrorDetail:
+    if isinstance(exc, MCPError):
+        return ProviderErrorDetail(code=exc.code, message=exc.message, details=exc.details)
+    return ProviderErrorDetail(
+        code=MCPError.EXTERNAL_API_ERROR, message=f'QWeather 查询失败: {exc}'
+    )
 
 
 def normalize_qweather_weather(
@@ -1,7 +1,11 @@
 """wttr.in provider adapter."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 import requests
 
+from src.http_client import async_http_get, http_get, raise_for_status
 from src.response import MCPError
 from src.schemas.weather import (
     CurrentWeather,
@@ -35,6 +39,25 @@ def get_weather_by_position(
     return ProviderSuccess(provider='wttr', data=normalized)
 
 
+async def get_weather_by_position_async(
+    lat: float,
+    lon: float,
+    location_name: str | None = None,
+    timezone: str | None = None,
+) -> ProviderSuccess:
+    """异步查询 wttr.in 并返回标准化后的 provider 结果。"""
+
+    raw_data = await fetch_wttr_raw_weather_async(lat, lon)
+    normalized = normalize_wttr_weather(
+        raw_data,
+        lat,
+        lon,
+        location_name=location_name,
+        timezone=timezone,
+    )
+    return ProviderSuccess(provider='wttr', data=normalized)
+
+
 def build_wttr_query(lat: float, lon: float) -> str:
     """构造 wttr.in 查询字符串。"""
 
@@ -44,13 +67,31 @@ def build_wttr_query(lat: float, lon: float) -> str:
 def fetch_wttr_raw_weather(lat: float, lon: float) -> dict:
     """查询 wttr.in 原始天气数据。"""
 
+    with _wttr_errors(lat, lon):
+        response = http_get(_wttr_url(lat, lon), params={'format': 'j1'})
+        raise_for_status(response)
+    return _decode_wttr_json(response, lat, lon)
+
+
+async def fetch_wttr_raw_weather_async(lat: float, lon: float) -> dict:
+    """异步查询 wttr.in 原始天气数据。"""
+
+    with _wttr_errors(lat, lon):
+        response = await async_http_get(_wttr_url(lat, lon), params={'format': 'j1'})
+        raise_for_status(response)
+    return _decode_wttr_json(response, lat, lon)
+
+
+def _wttr_url(lat: float, lon: float) -> str:
+    return f'https://wttr.in/{build_wttr_query(lat, lon)}'
+
+
+@contextmanager
+def _wttr_errors(lat: float, lon: float) -> Iterator[None]:
+    """将 HTTP 传输错误映射为 MCPError。"""
+
     try:
-        response = requests.get(
-            f'https://wttr.in/{build_wttr_query(lat, lon)}',
-            params={'format': 'j1'},
-            timeout=15.0,
-        )
-        response.raise_for_status()
+        yield
     except requests.exceptions.Timeout as exc:
         raise MCPError(
             MCPError.API_TIMEOUT,
@@ -64,10 +105,11 @@ def fetch_wttr_raw_weather(lat: float, lon: float) -> dict:
             {'lat': lat, 'lon': lon},
         ) from exc
     except requests.exceptions.HTTPError as exc:
+        status_code = exc.response.status_code
         raise MCPError(
             MCPError.EXTERNAL_API_ERROR,
-            f'wttr.in 返回 HTTP {response.status_code}。',
-            {'lat': lat, 'lon': lon, 'status_code': response.status_code},
+            f'wttr.in 返回 HTTP {status_code}。',
+            {'lat': lat, 'lon': lon, 'status_code': status_code},
         ) from exc
     except requests.exceptions.RequestException as exc:
         raise MCPError(
@@ -76,6 +118,8 @@ def fetch_wttr_raw_weather(lat: float, lon: float) -> dict:
             {'lat': lat, 'lon': lon},
         ) from exc
 
+
+def _decode_wttr_json(response, lat: float, lon: float) -> dict:
     try:
         return response.json()
     except ValueError as exc:
@@ -2,35 +2,274 @@
 
 Internally uses Pydantic models for type-safe data handling.
 Public API functions return AggregatedWeatherResponse (a Pydantic model).
+
+The pipeline is async: providers are queried concurrently with
+``asyncio.gather`` over the event loop's pooled HTTP client.  The
+synchronous functions are thin wrappers that run it on the shared background
+loop (``src.http_client.run_sync``).
+
+Provider results are cached by :class:`WeatherCache`, keyed on the provider,
+the location rounded to a ~0.05° cell and the UTC hour.  A result stays fresh
+for its provider's TTL; after that (or once the hour rolls over) it is still
+served for a while as stale data while a background task fetches a new one.
+Partial results (some provider sections failed) are not cached.  The cache
+status and age are reported in the response ``_meta``.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
 
-from src.functions.weather.geocoding import resolve_place_name
+from src.env import env_number
+from src.functions.weather.geocoding import resolve_place_name_async
 from src.functions.weather.providers import open_meteo, qweather, wttr
+from src.http_client import run_sync
 from src.response import MCPError
 from src.schemas import ProviderType
 from src.schemas.weather import (
     AggregatedWeatherResponse,
     LocationInfo,
+    ProviderCacheStatus,
     ProviderError,
     ProviderErrorDetail,
     ProviderSuccess,
     SourceMeta,
+    WeatherCacheInfo,
     WeatherSummary,
 )
+from src.singleflight import single_flight
 
 PROVIDER_ORDER = ['open-meteo', 'qweather', 'wttr']
 
+_PROVIDER_MODULES = {'open-meteo': open_meteo, 'qweather': qweather, 'wttr': wttr}
+
+_aggregation_flight = single_flight('weather')
+
+# Cache cell size in degrees (~5 km of latitude).
+WEATHER_CELL_DEG = 0.05
+# Open-Meteo models update hourly; QWeather and wttr.in publish observations more often.
+DEFAULT_PROVIDER_TTL_SECONDS = {'open-meteo': 3600.0, 'qweather': 1800.0, 'wttr': 1800.0}
+DEFAULT_MAX_STALE_SECONDS = 3600.0
+DEFAULT_WEATHER_CACHE_SIZE = 2048
+
+_SECONDS_PER_HOUR = 3600
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    result: ProviderSuccess
+    fetched_at: float
+
+
+@dataclass(frozen=True)
+class CacheLookup:
+    """Outcome of :meth:`WeatherCache.lookup`; ``entry`` is ``None`` on a miss."""
+
+    key: tuple
+    status: str
+    entry: _CacheEntry | None
+    now: float
+
+    @property
+    def age_seconds(self) -> float:
+        return 0.0 if self.entry is None else max(0.0, self.now - self.entry.fetched_at)
+
+
+class WeatherCache:
+    """Provider results keyed on (provider, lat/lon cell, timezone, UTC hour).
+
+    A result is fresh for its provider's TTL within the hour it was fetched.
+    Past that, or from the previous hour, it is served as stale for up to
+    ``max_stale_seconds`` more while one background task refreshes it.
+    Thread-safe, with LRU eviction beyond ``maxsize`` entries.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: dict[str, float] | None = None,
+        max_stale_seconds: float = DEFAULT_MAX_STALE_SECONDS,
+        maxsize: int = DEFAULT_WEATHER_CACHE_SIZE,
+        cell_deg: float = WEATHER_CELL_DEG,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl_seconds = {**DEFAULT_PROVIDER_TTL_SECONDS, **(ttl_seconds or {})}
+        self.max_stale_seconds = max_stale_seconds
+        self.maxsize = maxsize
+        self.cell_deg = cell_deg
+        self._clock = clock
+        self._entries: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        self._refreshing: set[tuple] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def _key(self, provider: str, lat: float, lon: float, timezone: str | None, hour: int):
+        cell = (round(lat / self.cell_deg), round(lon / self.cell_deg))
+        return (provider, *cell, timezone, hour)
+
+    def lookup(
+        self, provider: str, lat: float, lon: float, timezone: str | None = None
+    ) -> CacheLookup:
+        """Find a fresh or still-servable stale result for this provider and place."""
+        now = self._clock()
+        hour = int(now // _SECONDS_PER_HOUR)
+        key = self._key(provider, lat, lon, timezone, hour)
+        ttl = self.ttl_seconds.get(provider, 0.0)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry.fetched_at < ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return CacheLookup(key, 'hit', entry, now)
+            if entry is None:
+                entry = self._entries.get(self._key(provider, lat, lon, timezone, hour - 1))
+            if entry is not None and now - entry.fetched_at < ttl + self.max_stale_seconds:
+                self.stale_hits += 1
+                return CacheLookup(key, 'stale', entry, now)
+            self.misses += 1
+            return CacheLookup(key, 'miss', None, now)
+
+    def store(self, key: tuple, result: ProviderSuccess) -> None:
+        with self._lock:
+            self._entries[key] = _CacheEntry(result, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def refresh(
+        self,
+        key: tuple,
+        fetch: Callable[[], Awaitable[tuple[str, ProviderSuccess | ProviderError]]],
+    ) -> None:
+        """Refresh ``key`` in a background task unless a refresh is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self.refreshes += 1
+        task = asyncio.get_running_loop().create_task(self._refresh(key, fetch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: tuple, fetch) -> None:
+        try:
+            _, result = await fetch()
+            if isinstance(result, ProviderSuccess) and not result.partial_errors:
+                self.store(key, result)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def drain(self) -> None:
+        """Wait for the background refreshes started on the running loop."""
+        loop = asyncio.get_running_loop()
+        tasks = [task for task in list(self._tasks) if task.get_loop() is loop]
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+            }
+
+
+def create_weather_cache() -> WeatherCache | None:
+    """Build the cache from the environment; ``None`` when disabled.
+
+    ``STARGAZING_WEATHER_CACHE_SIZE`` (0 disables), ``STARGAZING_WEATHER_MAX_STALE_SECONDS``
+    and per-provider ``STARGAZING_WEATHER_TTL_OPEN_METEO`` / ``_QWEATHER`` / ``_WTTR``.
+
+    Raises:
+        ValueError: If a variable is set but malformed or out of range (TTLs must be > 0).
+    """
+    maxsize = env_number(
+        'STARGAZING_WEATHER_CACHE_SIZE', DEFAULT_WEATHER_CACHE_SIZE, int, allow_zero=True
+    )
+    if maxsize == 0:
+        return None
+    ttl_seconds = {
+        provider: env_number(
+            f'STARGAZING_WEATHER_TTL_{provider.replace("-", "_").upper()}',
+            DEFAULT_PROVIDER_TTL_SECONDS[provider],
+        )
+        for provider in PROVIDER_ORDER
+    }
+    return WeatherCache(
+        ttl_seconds=ttl_seconds,
+        max_stale_seconds=env_number(
+            'STARGAZING_WEATHER_MAX_STALE_SECONDS', DEFAULT_MAX_STALE_SECONDS, allow_zero=True
+        ),
+        maxsize=maxsize,
+    )
+
+
+_weather_cache: WeatherCache | None = None
+_weather_cache_ready = False
+_weather_cache_lock = threading.Lock()
+
+
+def get_weather_cache() -> WeatherCache | None:
+    """Return the process-wide weather cache (``None`` when disabled)."""
+    global _weather_cache, _weather_cache_ready
+    if _weather_cache_ready:
+        return _weather_cache
+
+    with _weather_cache_lock:
+        if not _weather_cache_ready:
+            _weather_cache = create_weather_cache()
+            _weather_cache_ready = True
+    return _weather_cache
+
 
 def get_aggregated_weather_by_name(
     place_name: str,
     provider: str = 'all',
+) -> AggregatedWeatherResponse:
+    """根据地点名称查询并聚合多个天气提供商的结果（同步包装）。"""
+
+    return run_sync(get_aggregated_weather_by_name_async(place_name, provider=provider))
+
+
+def get_aggregated_weather_by_position(
+    lat: float,
+    lon: float,
+    provider: str = 'all',
+    location_name: str | None = None,
+    timezone: str | None = None,
+) -> AggregatedWeatherResponse:
+    """根据经纬度查询并聚合多个天气提供商的结果（同步包装）。"""
+
+    return run_sync(
+        get_aggregated_weather_by_position_async(
+            lat, lon, provider=provider, location_name=location_name, timezone=timezone
+        )
+    )
+
+
+async def get_aggregated_weather_by_name_async(
+    place_name: str,
+    provider: str = 'all',
 ) -> AggregatedWeatherResponse:
     """根据地点名称查询并聚合多个天气提供商的结果。"""
 
-    location = resolve_place_name(place_name)
-    return get_aggregated_weather_by_position(
+    location = await resolve_place_name_async(place_name)
+    return await get_aggregated_weather_by_position_async(
         location.lat,
         location.lon,
         provider=provider,
@@ -39,55 +278,43 @@ def get_aggregated_weather_by_name(
     )
 
 
-def _query_provider_safe(
-    provider_name: str,
+async def get_aggregated_weather_by_position_async(
     lat: float,
     lon: float,
+    provider: str = 'all',
     location_name: str | None = None,
     timezone: str | None = None,
-) -> tuple[str, ProviderSuccess | ProviderError]:
-    """Query a single provider, always returning (provider_name, result_or_error)."""
-    try:
-        return provider_name, _query_single_provider(
-            provider_name,
-            lat,
-            lon,
-            location_name=location_name,
-            timezone=timezone,
-        )
-    except MCPError as exc:
-        return provider_name, ProviderError(
-            provider=provider_name,
-            error=ProviderErrorDetail(code=exc.code, message=exc.message, details=exc.details),
-        )
-    except Exception as exc:
-        return provider_name, ProviderError(
-            provider=provider_name,
-            error=ProviderErrorDetail(
-                code=MCPError.EXTERNAL_API_ERROR,
-                message=f'{provider_name} provider 查询失败: {exc}',
-                details={'lat': lat, 'lon': lon},
-            ),
-        )
+) -> AggregatedWeatherResponse:
+    """根据经纬度并发查询并聚合多个天气提供商的结果。
 
+    Identical concurrent queries (same rounded coordinates, provider, name
+    and timezone) share one upstream round, whichever thread or loop they
+    come from.
+    """
 
-def get_aggregated_weather_by_position(
+    provider_type = ProviderType.from_str(provider)
+    key = (round(lat, 4), round(lon, 4), provider_type.value, location_name, timezone)
+    return await _aggregation_flight.do_async(
+        key,
+        lambda: _aggregate_weather(lat, lon, provider, provider_type, location_name, timezone),
+    )
+
+
+async def _aggregate_weather(
     lat: float,
     lon: float,
-    provider: str = 'all',
-    location_name: str | None = None,
-    timezone: str | None = None,
+    provider: str,
+    provider_type: ProviderType,
+    location_name: str | None,
+    timezone: str | None,
 ) -> AggregatedWeatherResponse:
-    """根据经纬度查询并聚合多个天气提供商的结果。"""
-
-    provider_type = ProviderType.from_str(provider)
     provider_names = _get_enabled_providers(provider_type)
 
-    provider_results: dict[str, ProviderSuccess | ProviderError] = {}
-    with ThreadPoolExecutor(max_workers=len(provider_names)) as executor:
-        futures = [
-            executor.submit(
-                _query_provider_safe,
+    cache = get_weather_cache()
+    results = await asyncio.gather(
+        *(
+            _query_provider_cached(
+                cache,
                 pname,
                 lat,
                 lon,
@@ -95,10 +322,11 @@ def get_aggregated_weather_by_position(
                 timezone=timezone,
             )
             for pname in provider_names
-        ]
-        for future in as_completed(futures):
-            name, result = future.result()
-            provider_results[name] = result
+        )
+    )
+    provider_results: dict[str, ProviderSuccess | ProviderError] = {
+        name: result for name, result, _ in results
+    }
 
     _ensure_any_provider_success(provider_results)
 
@@ -113,9 +341,109 @@ def get_aggregated_weather_by_position(
         summary=summary,
         providers=provider_results,
         source=source,
+        cache=_build_cache_info(results) if cache is not None else None,
+    )
+
+
+async def _query_provider_cached(
+    cache: WeatherCache | None,
+    provider_name: str,
+    lat: float,
+    lon: float,
+    location_name: str | None = None,
+    timezone: str | None = None,
+) -> tuple[str, ProviderSuccess | ProviderError, ProviderCacheStatus | None]:
+    """Serve a provider from the cache when possible, otherwise query and store it."""
+
+    def fetch():
+        return _query_provider_safe(
+            provider_name, lat, lon, location_name=location_name, timezone=timezone
+        )
+
+    if cache is None:
+        name, result = await fetch()
+        return name, result, None
+
+    lookup = cache.lookup(provider_name, lat, lon, timezone)
+    if lookup.entry is not None:
+        if lookup.status == 'stale':
+            cache.refresh(lookup.key, fetch)
+        result = _relocate(lookup.entry.result, lat, lon, location_name, timezone)
+        status = ProviderCacheStatus(status=lookup.status, age_seconds=lookup.age_seconds)
+        return provider_name, result, status
+
+    name, result = await fetch()
+    if isinstance(result, ProviderSuccess) and not result.partial_errors:
+        cache.store(lookup.key, result)
+    return name, result, ProviderCacheStatus(status='miss', age_seconds=0.0)
+
+
+def _relocate(
+    result: ProviderSuccess,
+    lat: float,
+    lon: float,
+    location_name: str | None,
+    timezone: str | None,
+) -> ProviderSuccess:
+    """A cached result re-labelled with the requesting coordinates (same cache cell)."""
+
+    cached = result.data.location
+    location = LocationInfo(
+        name=location_name if location_name is not None else cached.name,
+        lat=lat,
+        lon=lon,
+        timezone=timezone if timezone is not None else cached.timezone,
+    )
+    data = result.data.model_copy(update={'location': location})
+    return result.model_copy(update={'data': data})
+
+
+def _build_cache_info(
+    results: list[tuple[str, Any, ProviderCacheStatus | None]],
+) -> WeatherCacheInfo:
+    """Summarize per-provider cache statuses for the response ``_meta``."""
+
+    providers = {name: status for name, _, status in results if status is not None}
+    return WeatherCacheInfo(
+        hit=all(status.status != 'miss' for status in providers.values()),
+        stale=any(status.status == 'stale' for status in providers.values()),
+        age_seconds=round(max((s.age_seconds for s in providers.values()), default=0.0), 1),
+        providers=providers,
     )
 
 
+async def _query_provider_safe(
+    provider_name: str,
+    lat: float,
+    lon: float,
+    location_name: str | None = None,
+    timezone: str | None = None,
+) -> tuple[str, ProviderSuccess | ProviderError]:
+    """Query a single provider, always returning (provider_name, result_or_error)."""
+    try:
+        return provider_name, await _query_single_provider(
+            provider_name,
+            lat,
+            lon,
+            location_name=location_name,
+            timezone=timezone,
+        )
+    except MCPError as exc:
+        return provider_name, ProviderError(
+            provider=provider_name,
+            error=ProviderErrorDetail(code=exc.code, message=exc.message, details=exc.details),
+        )
+    except Exception as exc:
+        return provider_name, ProviderError(
+            provider=provider_name,
+            error=ProviderErrorDetail(
+                code=MCPError.EXTERNAL_API_ERROR,
+                message=f'{provider_name} provider 查询失败: {exc}',
+                details={'lat': lat, 'lon': lon},
+            ),
+        )
+
+
 def _get_enabled_providers(provider_type: ProviderType) -> list[str]:
     """根据 provider 类型返回需要查询的 provider 列表。"""
 
@@ -130,7 +458,7 @@ def _get_enabled_providers(provider_type: ProviderType) -> list[str]:
     )
 
 
-def _query_single_provider(
+async def _query_single_provider(
     provider_name: str,
     lat: float,
     lon: float,
@@ -139,22 +467,15 @@ def _query_single_provider(
 ) -> ProviderSuccess:
     """查询单个 provider 并返回 ProviderSuccess 模型。"""
 
-    if provider_name == 'open-meteo':
-        return open_meteo.get_weather_by_position(
-            lat, lon, location_name=location_name, timezone=timezone
+    module = _PROVIDER_MODULES.get(provider_name)
+    if module is None:
+        raise MCPError(
+            MCPError.CONFIGURATION_ERROR,
+            f'未知 provider: {provider_name}',
+            {'provider': provider_name},
         )
-    if provider_name == 'qweather':
-        return qweather.get_weather_by_position(
-            lat, lon, location_name=location_name, timezone=timezone
-        )
-    if provider_name == 'wttr':
-        return wttr.get_weather_by_position(
-            lat, lon, location_name=location_name, timezone=timezone
-        )
-    raise MCPError(
-        MCPError.CONFIGURATION_ERROR,
-        f'未知 provider: {provider_name}',
-        {'provider': provider_name},
+    return await module.get_weather_by_position_async(
+        lat, lon, location_name=location_name, timezone=timezone
     )
 
 
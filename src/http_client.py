@@ -0,0 +1,353 @@
+"""Shared HTTP clients for the weather and geocoding providers.
+
+Every provider used to call ``requests.get`` directly, opening a new TCP and
+TLS connection per request.  :class:`HttpClient` wraps one
+``requests.Session`` whose adapter keeps a connection pool per host, so
+repeat calls to Open-Meteo, wttr.in, QWeather, Amap and Photon reuse an open
+keep-alive connection instead of handshaking again.
+
+The session's connection pools (urllib3) are thread-safe, so one client
+serves every thread.  Cookies are never stored, so no state leaks between
+requests.
+
+:class:`AsyncHttpClient` is the ``httpx`` counterpart used by the async
+weather pipeline: one pooled client per event loop, raising the same
+``requests`` exceptions so each provider keeps a single error mapping.
+:func:`run_sync` runs a coroutine on a shared background loop, which is how
+the synchronous weather API reuses the async pipeline and its pool.  When the
+optional ``h2`` package is installed the async client also negotiates HTTP/2,
+so concurrent requests to one host (e.g. QWeather's three weather endpoints)
+share a single multiplexed connection.
+
+Configuration (environment):
+
+- ``STARGAZING_HTTP_POOL_HOSTS``: hosts whose pools are kept (default 16).
+- ``STARGAZING_HTTP_POOL_SIZE``: connections kept per host (default 10).
+- ``STARGAZING_HTTP_CONNECT_TIMEOUT`` / ``STARGAZING_HTTP_READ_TIMEOUT``:
+  default timeouts in seconds (5 and 15) for calls that do not pass one.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import time
+import weakref
+from collections import defaultdict
+from collections.abc import Coroutine
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.env import env_number
+
+DEFAULT_POOL_HOSTS = 16
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 15.0
+
+USER_AGENT = 'mcp-stargazing/1.0'
+
+
+class _HostUsage:
+    """Thread-safe per-host request, failure and latency counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: dict[str, int] = defaultdict(int)
+        self._failures: dict[str, int] = defaultdict(int)
+        self._seconds: dict[str, float] = defaultdict(float)
+
+    def record(self, host: str, seconds: float, failed: bool) -> None:
+        with self._lock:
+            self._requests[host] += 1
+            self._seconds[host] += seconds
+            if failed:
+                self._failures[host] += 1
+
+    def snapshot(self, pools: dict[str, dict[str, int]]) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                host: {
+                    'requests': count,
+                    'failures': self._failures[host],
+                    'mean_ms': round(1000.0 * self._seconds[host] / count, 1),
+                    **pools.get(host, {}),
+                }
+                for host, count in self._requests.items()
+            }
+
+
+class HttpClient:
+    """Pooled, keep-alive HTTP client with per-host usage counters."""
+
+    def __init__(
+        self,
+        pool_hosts: int = DEFAULT_POOL_HOSTS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ):
+        self.pool_hosts = pool_hosts
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self._adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size)
+        self._session = requests.Session()
+        self._session.mount('https://', self._adapter)
+        self._session.mount('http://', self._adapter)
+        self._session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self._session.headers['User-Agent'] = USER_AGENT
+        self._usage = _HostUsage()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """``requests.get`` over the pooled session; same arguments and exceptions.
+
+        ``timeout`` defaults to the client's ``(connect, read)`` timeouts.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = self._session.get(url, **kwargs)
+            failed = False
+            return response
+        finally:
+            self._usage.record(urlsplit(url).netloc, time.perf_counter() - started, failed)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self._session.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Pool configuration and per-host usage.
+
+        ``connections_opened`` counts the connections each live host pool has
+        created; ``requests - connections_opened`` were served on a reused
+        keep-alive connection.
+        """
+        return {
+            'pool_hosts': self.pool_hosts,
+            'pool_size': self.pool_size,
+            'timeout_seconds': list(self.timeout),
+            'hosts': self._usage.snapshot(self._live_pools()),
+        }
+
+    def _live_pools(self) -> dict[str, dict[str, int]]:
+        manager = self._adapter.poolmanager
+        pools = {}
+        for key in list(manager.pools.keys()):
+            pool = manager.pools.get(key)
+            if pool is None:
+                continue
+            # Match urlsplit().netloc, which omits the scheme's default port.
+            host = key.key_host
+            if key.key_port not in (None, 443 if key.key_scheme == 'https' else 80):
+                host = f'{host}:{key.key_port}'
+            # The queue is pre-filled with None placeholders for unopened slots.
+            idle = list(pool.pool.queue) if pool.pool is not None else []
+            pools[host] = {
+                'connections_opened': pool.num_connections,
+                'idle_connections': sum(conn is not None for conn in idle),
+            }
+        return pools
+
+
+class AsyncHttpClient:
+    """``httpx.AsyncClient`` with the same pooling, timeouts and counters as :class:`HttpClient`.
+
+    An instance belongs to the event loop it is first used on.  Transport
+    errors are re-raised as the matching ``requests`` exceptions.
+    """
+
+    def __init__(
+        self,
+        pool_hosts: int = DEFAULT_POOL_HOSTS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ):
+        self.pool_hosts = pool_hosts
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        # httpx pools are not per host; cap the total at what the sync client allows.
+        limits = httpx.Limits(
+            max_connections=pool_hosts * pool_size,
+            max_keepalive_connections=pool_hosts * pool_size,
+        )
+        self.http2 = importlib.util.find_spec('h2') is not None
+        self._client = httpx.AsyncClient(
+            limits=limits, headers={'User-Agent': USER_AGENT}, http2=self.http2
+        )
+        self._client.cookies.jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self._usage = _HostUsage()
+        self._connections: dict[str, int] = defaultdict(int)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Async GET with ``requests``-style ``params``/``headers``/``timeout`` arguments.
+
+        Raises:
+            requests.exceptions.RequestException: The ``requests`` equivalent
+                of the ``httpx`` transport error.
+        """
+        timeout = kwargs.pop('timeout', self.timeout)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        host = urlsplit(url).netloc
+
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            if event == 'connection.connect_tcp.complete':
+                self._connections[host] += 1
+
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = await self._client.get(
+                url, timeout=timeout, extensions={'trace': trace}, **kwargs
+            )
+            failed = False
+            return response
+        except httpx.TimeoutException as exc:
+            raise requests.exceptions.Timeout(str(exc)) from exc
+        except (httpx.ConnectError, httpx.NetworkError) as exc:
+            raise requests.exceptions.ConnectionError(str(exc)) from exc
+        except httpx.HTTPError as exc:
+            raise requests.exceptions.RequestException(str(exc)) from exc
+        finally:
+            self._usage.record(host, time.perf_counter() - started, failed)
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        await self._client.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        """Pool configuration and per-host usage, as :meth:`HttpClient.stats`."""
+        pools = {host: {'connections_opened': count} for host, count in self._connections.items()}
+        return {
+            'pool_hosts': self.pool_hosts,
+            'pool_size': self.pool_size,
+            'timeout_seconds': list(self.timeout),
+            'http2': self.http2,
+            'hosts': self._usage.snapshot(pools),
+        }
+
+
+def raise_for_status(response: requests.Response | httpx.Response) -> None:
+    """Raise ``requests.HTTPError`` for a 4xx/5xx response from either client."""
+    if response.status_code >= 400:
+        raise requests.exceptions.HTTPError(
+            f'HTTP {response.status_code} for {response.url}', response=response
+        )
+
+
+def _client_settings() -> dict[str, Any]:
+    return {
+        'pool_hosts': env_number('STARGAZING_HTTP_POOL_HOSTS', DEFAULT_POOL_HOSTS, int),
+        'pool_size': env_number('STARGAZING_HTTP_POOL_SIZE', DEFAULT_POOL_SIZE, int),
+        'connect_timeout': env_number('STARGAZING_HTTP_CONNECT_TIMEOUT', DEFAULT_CONNECT_TIMEOUT),
+        'read_timeout': env_number('STARGAZING_HTTP_READ_TIMEOUT', DEFAULT_READ_TIMEOUT),
+    }
+
+
+def create_http_client() -> HttpClient:
+    """Build a client configured from the ``STARGAZING_HTTP_*`` environment."""
+    return HttpClient(**_client_settings())
+
+
+def create_async_http_client() -> AsyncHttpClient:
+    """Build an async client configured from the ``STARGAZING_HTTP_*`` environment."""
+    return AsyncHttpClient(**_client_settings())
+
+
+_http_client: HttpClient | None = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide client, creating it on first use."""
+    global _http_client
+    if _http_client is not None:
+        return _http_client
+
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = create_http_client()
+    return _http_client
+
+
+def http_get(url: str, **kwargs: Any) -> requests.Response:
+    """GET ``url`` through the process-wide pooled client."""
+    return get_http_client().get(url, **kwargs)
+
+
+_async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHttpClient]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_http_client() -> AsyncHttpClient:
+    """Return the running event loop's client, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = create_async_http_client()
+    return client
+
+
+async def async_http_get(url: str, **kwargs: Any) -> httpx.Response:
+    """GET ``url`` through the running loop's pooled async client."""
+    return await get_async_http_client().get(url, **kwargs)
+
+
+def http_stats() -> dict[str, Any]:
+    """Usage of the process-wide sync client and the current loop's async client."""
+    try:
+        client = get_async_http_client()
+    except RuntimeError:  # no running loop
+        client = None
+    return {
+        'sync': get_http_client().stats(),
+        'async': client.stats() if client is not None else None,
+    }
+
+
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop
+    if _background_loop is not None:
+        return _background_loop
+
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name='stargazing-http-loop', daemon=True
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def run_sync(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``coroutine`` on the shared background loop and return its result.
+
+    Blocking callers get the async pipeline and its connection pool without
+    starting an event loop per call.
+
+    Raises:
+        RuntimeError: If called from the background loop itself.
+    """
+    loop = _get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coroutine.close()
+        raise RuntimeError('run_sync() cannot be called from the HTTP background loop.')
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
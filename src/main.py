@@ -14,22 +14,46 @@ import src.functions.planning.impl  # noqa: F401
 import src.functions.telescope.impl  # noqa: F401
 import src.functions.time.impl  # noqa: F401
 import src.functions.weather.impl  # noqa: F401
+from src.executor import configure_compute_executor
+from src.http_client import http_stats
 from src.logging_config import get_logger, setup_logging
 from src.server_instance import mcp
+from src.singleflight import single_flight_stats
+from src.warmup import WARMUP_MODES, get_warmup_state, start_warmup
 
 
 @mcp.custom_route('/health', methods=['GET'])
 async def health_check(request: Request) -> JSONResponse:
-    """Health check endpoint for container probes and load balancers."""
+    """Health check endpoint for container probes and load balancers.
+
+    Always 200 while the process is alive (liveness); ``ready`` tells whether
+    the startup warm-up has finished (readiness, see ``/ready``); ``http`` is
+    the outbound connection-pool usage of the weather and geocoding providers
+    (``sync`` client and this event loop's ``async`` client); ``coalesced``
+    counts identical in-flight weather and geocoding calls that were shared.
+    """
     return JSONResponse(
         {
             'status': 'healthy',
             'version': version('mcp-stargazing'),
             'service': 'mcp-stargazing',
+            'ready': get_warmup_state().ready,
+            'http': http_stats(),
+            'coalesced': single_flight_stats(),
         }
     )
 
 
+@mcp.custom_route('/ready', methods=['GET'])
+async def readiness_check(request: Request) -> JSONResponse:
+    """Readiness endpoint: 503 until the startup warm-up has completed."""
+    warmup = get_warmup_state().snapshot()
+    return JSONResponse(
+        {'status': 'ready' if warmup['ready'] else 'warming_up', 'warmup': warmup},
+        status_code=200 if warmup['ready'] else 503,
+    )
+
+
 def arg_parse():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='MCP Server')
@@ -39,6 +63,17 @@ def arg_parse():
     parser.add_argument('--port', type=int, default=3001, help='Port to run the server on')
     parser.add_argument('--path', type=str, default='/shttp')
     parser.add_argument('--proxy', type=str, help='Proxy URL (e.g., http://127.0.0.1:7890)')
+    parser.add_argument(
+        '--warmup',
+        choices=WARMUP_MODES,
+        help='Startup warm-up: off, blocking, or background (default: $STARGAZING_WARMUP or off)',
+    )
+    parser.add_argument(
+        '--workers',
+        type=str,
+        help='Worker processes for CPU-bound tools: N, auto, or 0 for threads '
+        '(default: $STARGAZING_WORKERS or 0)',
+    )
     return parser.parse_args()
 
 
@@ -60,6 +95,11 @@ def main():
         os.environ['https_proxy'] = arg.proxy
         logger.info('Proxy configured', proxy=arg.proxy)
 
+    # After the IERS policy is set, so warm-up loads tables the same way requests will.
+    # Workers start warming up now; the warm-up (if enabled) waits for them.
+    configure_compute_executor(arg.workers).start()
+    start_warmup(arg.warmup)
+
     if arg.mode == 'local':
         mcp.run()
     elif arg.mode == 'shttp':
@@ -0,0 +1,254 @@
+"""Closed-form transit, rise/set and dark-time visibility for fixed objects.
+
+For an object at fixed (RA, Dec) the hour angle advances at the sidereal
+rate, so it transits where the hour angle is zero and crosses altitude ``h``
+at the hour angle ``H`` given by
+
+    cos H = (sin h - sin φ sin δ) / (cos φ cos δ)
+
+:func:`compute_observability` evaluates this for any number of objects in one
+NumPy pass — the whole packaged catalog takes a few milliseconds, where the
+grid approach transforms every object at every step of the night.
+
+Coordinates are precessed to the equinox of date and sidereal time is GMST,
+so times agree with astropy to within a few seconds for non-polar objects.
+Refraction is ignored, matching the geometric ``AltAz`` frames the forecast
+and telescope scoring use.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from datetime import time as dt_time
+from typing import Any
+
+import numpy as np
+from astropy.coordinates import EarthLocation
+
+from src import fast_ephemeris
+from src.almanac import TWILIGHT_ALTITUDES, NightAlmanac, localize, night_of
+from src.catalog import ColumnarCatalog
+
+# Hour angle advance in degrees per day of a fixed object and of the mean Sun.
+SIDEREAL_RATE_DEG = 360.98564736629
+SOLAR_RATE_DEG = 360.0
+
+DEFAULT_MIN_ALTITUDE = 20.0
+DEFAULT_HORIZON = 0.0
+
+_UNIX_EPOCH_JD = 2440587.5
+_SECONDS_PER_DAY = 86400.0
+
+
+@dataclass(frozen=True)
+class Observability:
+    """Per-object results; every field is an array as long as the input.
+
+    Times are UTC unix seconds.  ``rise``/``set`` are NaN for objects that
+    never set (circumpolar) or never rise; ``observable_hours`` is the time
+    spent above the minimum altitude inside the dark windows, NaN when no
+    windows were given.
+    """
+
+    transit: np.ndarray
+    transit_altitude: np.ndarray
+    rise: np.ndarray
+    set: np.ndarray
+    observable_hours: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.transit)
+
+    def take(self, indices: np.ndarray) -> 'Observability':
+        """Results for a subset of the objects, in ``indices`` order."""
+        return Observability(
+            transit=self.transit[indices],
+            transit_altitude=self.transit_altitude[indices],
+            rise=self.rise[indices],
+            set=self.set[indices],
+            observable_hours=self.observable_hours[indices],
+        )
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Fields for one object, named like the forecast's target fields."""
+
+        def value(values: np.ndarray, digits: int) -> float | None:
+            number = float(values[index])
+            return round(number, digits) if np.isfinite(number) else None
+
+        return {
+            'transit_time': value(self.transit, 0),
+            'transit_alt': value(self.transit_altitude, 1),
+            'rise_time': value(self.rise, 0),
+            'set_time': value(self.set, 0),
+            'observable_hours': value(self.observable_hours, 2),
+        }
+
+
+def compute_observability(
+    ra_deg: np.ndarray,
+    dec_deg: np.ndarray,
+    latitude_deg: float,
+    longitude_deg: float,
+    reference: float,
+    windows: Sequence[tuple[float, float]] | None = None,
+    min_altitude_deg: float = DEFAULT_MIN_ALTITUDE,
+    horizon_deg: float = DEFAULT_HORIZON,
+) -> Observability:
+    """Transit, rise/set and time above ``min_altitude_deg`` for J2000 positions.
+
+    Args:
+        ra_deg: ICRS/J2000 right ascensions in degrees.
+        dec_deg: ICRS/J2000 declinations in degrees.
+        latitude_deg: Observer latitude in degrees.
+        longitude_deg: Observer longitude in degrees (east positive).
+        reference: UTC unix time; each object's transit is the one nearest to
+            it, and its rise/set the crossings either side of that transit.
+        windows: ``(start, end)`` UTC unix intervals (e.g. astronomical
+            darkness) over which ``observable_hours`` is measured; ``None``
+            leaves it NaN, an empty sequence makes it 0.
+        min_altitude_deg: Altitude an object must exceed to count as observable.
+        horizon_deg: Altitude of the rise/set crossings.
+    """
+    jd = reference / _SECONDS_PER_DAY + _UNIX_EPOCH_JD
+    ra, dec = fast_ephemeris.precess_from_j2000(
+        np.asarray(ra_deg, dtype=np.float64), np.asarray(dec_deg, dtype=np.float64), jd
+    )
+    lst = fast_ephemeris.sidereal_time_deg(jd) + longitude_deg
+    hour_angle = np.mod(lst - ra + 180.0, 360.0) - 180.0
+    transit = reference - hour_angle / SIDEREAL_RATE_DEG * _SECONDS_PER_DAY
+
+    half_arc = _half_arc_seconds(dec, latitude_deg, horizon_deg, SIDEREAL_RATE_DEG)
+    crosses = np.isfinite(half_arc)
+    rise = np.where(crosses, transit - half_arc, np.nan)
+    set_ = np.where(crosses, transit + half_arc, np.nan)
+
+    above = _half_arc_seconds(dec, latitude_deg, min_altitude_deg, SIDEREAL_RATE_DEG)
+    observable = np.zeros_like(transit)
+    sidereal_day = 360.0 / SIDEREAL_RATE_DEG * _SECONDS_PER_DAY
+    for start, end in windows or ():
+        # Objects that never drop below the limit are observable all window.
+        observable += np.where(above == np.inf, end - start, 0.0)
+        finite = np.where(np.isfinite(above), above, 0.0)
+        for cycle in (-2, -1, 0, 1, 2):
+            centre = transit + cycle * sidereal_day
+            overlap = np.minimum(end, centre + finite) - np.maximum(start, centre - finite)
+            observable += np.clip(overlap, 0.0, None)
+
+    # Rows without coordinates never count as observable.
+    observable = np.where(np.isnan(transit), 0.0, observable)
+    if windows is None:
+        observable = np.full_like(transit, np.nan)
+    return Observability(
+        transit=transit,
+        transit_altitude=90.0 - np.abs(latitude_deg - dec),
+        rise=rise,
+        set=set_,
+        observable_hours=observable / 3600.0,
+    )
+
+
+def solar_dark_window(
+    latitude_deg: float, longitude_deg: float, midnight: float, altitude_deg: float = -18.0
+) -> tuple[float, float] | None:
+    """Analytic ``(dusk, dawn)`` unix times around ``midnight`` for a Sun altitude.
+
+    Uses the Sun's position at ``midnight`` for the whole night, which is good
+    to a few minutes; returns ``None`` if the Sun never gets that low, and the
+    whole day around ``midnight`` if it never rises above it.
+    """
+    jd = midnight / _SECONDS_PER_DAY + _UNIX_EPOCH_JD
+    ra, dec, _ = fast_ephemeris.sun_position(jd)
+    lst = fast_ephemeris.sidereal_time_deg(jd) + longitude_deg
+    # Hour angle from lower culmination, where the Sun is lowest.
+    from_lower = np.mod(lst - ra, 360.0) - 180.0
+    lower = midnight - float(from_lower) / SOLAR_RATE_DEG * _SECONDS_PER_DAY
+
+    above = float(_half_arc_seconds(dec, latitude_deg, altitude_deg, SOLAR_RATE_DEG))
+    if above == np.inf:
+        return None
+    half_day = _SECONDS_PER_DAY / 2
+    below = half_day if np.isnan(above) else half_day - above
+    return lower - below, lower + below
+
+
+def catalog_observability(
+    catalog: ColumnarCatalog,
+    latitude_deg: float,
+    longitude_deg: float,
+    reference: float,
+    windows: Sequence[tuple[float, float]] | None = None,
+    min_altitude_deg: float = DEFAULT_MIN_ALTITUDE,
+) -> Observability:
+    """:func:`compute_observability` for every row of a columnar catalog."""
+    return compute_observability(
+        catalog.column('ra'),
+        catalog.column('dec'),
+        latitude_deg,
+        longitude_deg,
+        reference,
+        windows,
+        min_altitude_deg,
+    )
+
+
+def night_observability(
+    ra_deg: np.ndarray,
+    dec_deg: np.ndarray,
+    location: EarthLocation,
+    moment: datetime,
+    almanac: NightAlmanac | None = None,
+    min_altitude_deg: float = DEFAULT_MIN_ALTITUDE,
+) -> Observability:
+    """Closed-form visibility of J2000 positions on the night containing ``moment``.
+
+    Transits are the ones nearest local midnight.  Observable hours count the
+    time above ``min_altitude_deg`` inside astronomical darkness, taken from
+    the almanac or, without one (fast mode), from the analytic Sun; on nights
+    that never get astronomically dark they are left unknown (NaN).
+    """
+    lat = location.lat.deg
+    lon = location.lon.deg
+    midnight = night_midnight(moment)
+    if almanac is not None:
+        windows = night_windows(almanac)
+    else:
+        window = solar_dark_window(lat, lon, midnight, TWILIGHT_ALTITUDES['astronomical'])
+        windows = [window] if window is not None else []
+    return compute_observability(
+        ra_deg, dec_deg, lat, lon, midnight, windows or None, min_altitude_deg
+    )
+
+
+def night_midnight(moment: datetime) -> float:
+    """Unix time of the local midnight inside the night containing ``moment``."""
+    return localize(
+        moment.tzinfo, datetime.combine(night_of(moment) + timedelta(days=1), dt_time(0))
+    ).timestamp()
+
+
+def night_windows(almanac: NightAlmanac) -> list[tuple[float, float]]:
+    """Astronomical darkness of an almanac night as unix intervals (empty if none)."""
+    night = almanac.astronomical_night()
+    if night is None:
+        return []
+    start, end = night
+    return [(start.timestamp(), end.timestamp())]
+
+
+def _half_arc_seconds(
+    dec: np.ndarray, latitude_deg: float, altitude_deg: float, rate_deg: float
+) -> np.ndarray:
+    """Seconds from transit to the ``altitude_deg`` crossing.
+
+    ``inf`` where the object never drops below that altitude, NaN where it
+    never reaches it.
+    """
+    lat = np.radians(latitude_deg)
+    dec = np.radians(dec)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_h = (np.sin(np.radians(altitude_deg)) - np.sin(lat) * np.sin(dec)) / (
+            np.cos(lat) * np.cos(dec)
+        )
+    seconds = np.degrees(np.arccos(np.clip(cos_h, -1.0, 1.0))) / rate_deg * _SECONDS_PER_DAY
+    return np.where(cos_h <= -1.0, np.inf, np.where(cos_h > 1.0, np.nan, seconds))
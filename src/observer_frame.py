@@ -0,0 +1,120 @@
+"""Precomputed ICRS → topocentric rotation for fixed catalog objects.
+
+For an object at a fixed ICRS position, astropy's ``AltAz`` transform is
+light deflection and annual aberration (small per-object corrections) followed
+by a pure rotation: frame bias/precession/nutation, Earth rotation, polar
+motion and the observer's latitude.  :class:`ObserverFrame` asks astropy for
+those parameters once per time step, folds the rotations into one 3×3 matrix,
+and then transforms any number of objects with a single batched matmul.
+
+The per-object corrections use the same ERFA routines and parameters as
+``AltAz`` (whose observer velocity already includes diurnal aberration), so
+results agree with astropy to numerical precision.
+"""
+
+import astropy.units as u
+import erfa
+import numpy as np
+from astropy.coordinates import AltAz, EarthLocation
+from astropy.coordinates.erfa_astrom import erfa_astrom
+from astropy.time import Time
+
+# Conditions used when refraction is requested (ERFA's standard atmosphere).
+STANDARD_ATMOSPHERE = {
+    'pressure': 1013.25 * u.hPa,
+    'temperature': 10.0 * u.deg_C,
+    'relative_humidity': 0.5,
+    'obswl': 0.55 * u.micron,
+}
+
+# Limits used by ERFA's refraction model near the horizon (see eraAtioq).
+_CELMIN = 1e-6
+_SELMIN = 0.05
+
+
+class ObserverFrame:
+    """Horizontal coordinates of fixed ICRS objects for one observer.
+
+    Args:
+        location: Observer's EarthLocation.
+        times: Observation instant(s); results gain the shape of ``times``.
+        refraction: Apply atmospheric refraction for ``STANDARD_ATMOSPHERE``
+            (matching an ``AltAz`` frame with those attributes).  Off by
+            default, like ``AltAz``.
+    """
+
+    def __init__(self, location: EarthLocation, times: Time, refraction: bool = False):
+        self.location = location
+        self.times = times
+        self.refraction = refraction
+        attributes = STANDARD_ATMOSPHERE if refraction else {}
+        frame = AltAz(obstime=times, location=location, **attributes)
+        astrom = np.atleast_1d(erfa_astrom.get().apco(frame)).ravel()
+        self._astrom = astrom
+        self.rotation = _topocentric_rotation(astrom)
+
+    def altaz(self, ra_deg: np.ndarray, dec_deg: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(altitude, azimuth)`` in degrees, shape ``(n_objects, *times.shape)``."""
+        ra = np.radians(np.atleast_1d(np.asarray(ra_deg, dtype=np.float64)))
+        dec = np.radians(np.atleast_1d(np.asarray(dec_deg, dtype=np.float64)))
+        natural = np.stack(
+            [np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)], axis=-1
+        )
+
+        astrom = self._astrom
+        # (n_objects, n_times, 3) proper directions as seen from the moving Earth.
+        direction = erfa.ldsun(natural[:, np.newaxis, :], astrom['eh'], astrom['em'])
+        direction = erfa.ab(direction, astrom['v'], astrom['em'], astrom['bm1'])
+        x, y, z = np.einsum('tij,ntj->int', self.rotation, direction)
+
+        if self.refraction:
+            x, y, z = _refract(x, y, z, astrom['refa'], astrom['refb'])
+
+        altitude = np.degrees(np.arctan2(z, np.hypot(x, y)))
+        azimuth = np.degrees(np.arctan2(y, -x)) % 360.0
+        shape = (len(ra), *np.shape(self.times))
+        return altitude.reshape(shape), azimuth.reshape(shape)
+
+
+def _topocentric_rotation(astrom: np.ndarray) -> np.ndarray:
+    """Fold BPN, Earth rotation, polar motion and latitude into ``(n_times, 3, 3)``."""
+    n = len(astrom)
+    era = astrom['eral']
+    earth = np.zeros((n, 3, 3))
+    earth[:, 0, 0] = earth[:, 1, 1] = np.cos(era)
+    earth[:, 0, 1] = np.sin(era)
+    earth[:, 1, 0] = -np.sin(era)
+    earth[:, 2, 2] = 1.0
+
+    sx, cx = np.sin(astrom['xpl']), np.cos(astrom['xpl'])
+    sy, cy = np.sin(astrom['ypl']), np.cos(astrom['ypl'])
+    polar = np.stack(
+        [
+            np.stack([cx, np.zeros(n), sx], axis=-1),
+            np.stack([sx * sy, cy, -cx * sy], axis=-1),
+            np.stack([-sx * cy, sy, cx * cy], axis=-1),
+        ],
+        axis=1,
+    )
+
+    sphi, cphi = astrom['sphi'], astrom['cphi']
+    horizon = np.zeros((n, 3, 3))
+    horizon[:, 0, 0] = sphi
+    horizon[:, 0, 2] = -cphi
+    horizon[:, 1, 1] = 1.0
+    horizon[:, 2, 0] = cphi
+    horizon[:, 2, 2] = sphi
+
+    return horizon @ polar @ earth @ astrom['bpn']
+
+
+def _refract(x, y, z, refa, refb):
+    """ERFA's A tan z + B tan³ z refraction, applied to horizon-frame vectors."""
+    r = np.maximum(np.hypot(x, y), _CELMIN)
+    zc = np.maximum(z, _SELMIN)
+    tz = r / zc
+    w = refb * tz * tz
+    delta = (refa + w) * tz / (1.0 + (refa + 3.0 * w) / (zc * zc))
+    cosdel = 1.0 - delta * delta / 2.0
+    f = cosdel - delta * zc / r
+    return x * f, y * f, cosdel * z + delta * r
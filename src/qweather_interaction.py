@@ -5,12 +5,17 @@
 - 从官方文档 2026 年起公共域名将逐步停止服务，推荐使用你账号专属的 API Host。
 - 本模块支持两种鉴权：JWT（推荐）与 API KEY（兼容旧用法）。
 - 默认启用“fast failure”：关键配置缺失或 API 返回非 200 会直接抛错，尽早暴露问题。
+- 实时天气与 10 天预报并发请求；10 天预报失败时仍返回实时天气，错误记录在 `errors` 中。
 """
 
+import asyncio
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 import requests
 
+from src.http_client import async_http_get, http_get, raise_for_status, run_sync
 from src.response import MCPError
 
 
@@ -84,9 +89,34 @@ def fetch_gzipped_json(
     """
 
     headers = _build_qweather_headers(api_key=api_token, jwt_token=jwt_token)
+    with _qweather_errors(api_url, timeout_s):
+        response = http_get(api_url, headers=headers, timeout=timeout_s)
+        raise_for_status(response)
+    return _decode_qweather_json(response, api_url)
+
+
+async def fetch_gzipped_json_async(
+    api_url: str,
+    api_token: str | None = None,
+    *,
+    jwt_token: str | None = None,
+    timeout_s: float = 15.0,
+) -> dict | None:
+    """`fetch_gzipped_json` 的异步版本，经由事件循环上的连接池发送请求。"""
+
+    headers = _build_qweather_headers(api_key=api_token, jwt_token=jwt_token)
+    with _qweather_errors(api_url, timeout_s):
+        response = await async_http_get(api_url, headers=headers, timeout=timeout_s)
+        raise_for_status(response)
+    return _decode_qweather_json(response, api_url)
+
+
+@contextmanager
+def _qweather_errors(api_url: str, timeout_s: float) -> Iterator[None]:
+    """将 HTTP 传输错误映射为 MCPError（fast failure）。"""
+
     try:
-        response = requests.get(api_url, headers=headers, timeout=timeout_s)
-        response.raise_for_status()
+        yield
     except requests.exceptions.Timeout as e:
         raise MCPError(
             MCPError.API_TIMEOUT,
@@ -100,23 +130,24 @@ def fetch_gzipped_json(
             {'url': api_url},
         ) from e
     except requests.exceptions.HTTPError as e:
-        if response.status_code == 401:
+        status_code = e.response.status_code
+        if status_code == 401:
             raise MCPError(
                 MCPError.API_AUTH_FAILURE,
                 'QWeather API authentication failed',
-                {'url': api_url, 'status_code': response.status_code},
+                {'url': api_url, 'status_code': status_code},
             ) from e
-        elif response.status_code == 429:
+        elif status_code == 429:
             raise MCPError(
                 MCPError.API_RATE_LIMIT,
                 'QWeather API rate limit exceeded',
-                {'url': api_url, 'status_code': response.status_code},
+                {'url': api_url, 'status_code': status_code},
             ) from e
         else:
             raise MCPError(
                 MCPError.EXTERNAL_API_ERROR,
-                f'QWeather API returned HTTP {response.status_code}',
-                {'url': api_url, 'status_code': response.status_code},
+                f'QWeather API returned HTTP {status_code}',
+                {'url': api_url, 'status_code': status_code},
             ) from e
     except requests.exceptions.RequestException as e:
         raise MCPError(
@@ -125,6 +156,8 @@ def fetch_gzipped_json(
             {'url': api_url},
         ) from e
 
+
+def _decode_qweather_json(response, api_url: str) -> dict:
     try:
         data = response.json()
     except ValueError as e:
@@ -160,6 +193,30 @@ def qweather_get_poi(
     return fetch_gzipped_json(api, api_token, jwt_token=jwt_token)
 
 
+def qweather_weather_url(
+    endpoint: str, lon: float, lat: float, *, api_host: str | None = None
+) -> str:
+    """构造 `/v7/weather/{endpoint}` 请求 URL（endpoint 为 now / 10d / 24h）。"""
+
+    host = (api_host or _get_api_host_or_fail('api.qweather.com')).strip().rstrip('/')
+    return f'https://{host}/v7/weather/{endpoint}?location={lon},{lat}'
+
+
+async def qweather_get_weather_by_coord_async(
+    endpoint: str,
+    lon: float,
+    lat: float,
+    api_token: str | None,
+    *,
+    api_host: str | None = None,
+    jwt_token: str | None = None,
+) -> dict | None:
+    """根据经纬度异步获取 now / 10d / 24h 天气数据。"""
+
+    api = qweather_weather_url(endpoint, lon, lat, api_host=api_host)
+    return await fetch_gzipped_json_async(api, api_token, jwt_token=jwt_token)
+
+
 def qweather_get_weather_by_coord_real_time(
     lon: float,
     lat: float,
@@ -170,8 +227,7 @@ def qweather_get_weather_by_coord_real_time(
 ) -> dict | None:
     """根据经纬度获取实时天气。"""
 
-    host = (api_host or _get_api_host_or_fail('api.qweather.com')).strip().rstrip('/')
-    api = f'https://{host}/v7/weather/now?location={lon},{lat}'
+    api = qweather_weather_url('now', lon, lat, api_host=api_host)
     return fetch_gzipped_json(api, api_token, jwt_token=jwt_token)
 
 
@@ -185,8 +241,7 @@ def qweather_get_weather_by_coord_in_ten_days(
 ) -> dict | None:
     """根据经纬度获取 10 天预报。"""
 
-    host = (api_host or _get_api_host_or_fail('api.qweather.com')).strip().rstrip('/')
-    api = f'https://{host}/v7/weather/10d?location={lon},{lat}'
+    api = qweather_weather_url('10d', lon, lat, api_host=api_host)
     return fetch_gzipped_json(api, api_token, jwt_token=jwt_token)
 
 
@@ -200,8 +255,7 @@ def qweather_get_weather_by_coord_in_twenty_four_hours(
 ) -> dict | None:
     """根据经纬度获取 24 小时逐小时预报。"""
 
-    host = (api_host or _get_api_host_or_fail('api.qweather.com')).strip().rstrip('/')
-    api = f'https://{host}/v7/weather/24h?location={lon},{lat}'
+    api = qweather_weather_url('24h', lon, lat, api_host=api_host)
     return fetch_gzipped_json(api, api_token, jwt_token=jwt_token)
 
 
@@ -223,16 +277,10 @@ def qweather_get_weather_by_name(
         return None
 
     lat, lon = res['poi'][0]['lat'], res['poi'][0]['lon']
-
-    real_time_data = qweather_get_weather_by_coord_real_time(
-        lon, lat, api_token, api_host=api_host, jwt_token=jwt_token
-    )
-    ten_days_forcasts = qweather_get_weather_by_coord_in_ten_days(
-        lon, lat, api_token, api_host=api_host, jwt_token=jwt_token
+    return qweather_get_weather_by_position(
+        lat, lon, api_token, api_host=api_host, jwt_token=jwt_token
     )
 
-    return {'real_time': real_time_data, 'ten_days_forcasts': ten_days_forcasts}
-
 
 def qweather_get_weather_by_position(
     lat: float,
@@ -244,11 +292,39 @@ def qweather_get_weather_by_position(
 ) -> dict | None:
     """根据经纬度获取天气（实时 + 10 天预报）。"""
 
-    real_time_data = qweather_get_weather_by_coord_real_time(
-        lon, lat, api_token, api_host=api_host, jwt_token=jwt_token
-    )
-    ten_days_forcasts = qweather_get_weather_by_coord_in_ten_days(
-        lon, lat, api_token, api_host=api_host, jwt_token=jwt_token
+    return run_sync(
+        _qweather_get_weather_by_position_async(
+            lat, lon, api_token, api_host=api_host, jwt_token=jwt_token
+        )
     )
 
-    return {'real_time': real_time_data, 'ten_days_forcasts': ten_days_forcasts}
+
+async def _qweather_get_weather_by_position_async(
+    lat: float,
+    lon: float,
+    api_token: str | None,
+    *,
+    api_host: str | None = None,
+    jwt_token: str | None = None,
+) -> dict:
+    """并发请求实时天气与 10 天预报；实时天气失败时抛错，10 天预报失败时置为 None。"""
+
+    real_time_data, ten_days_forcasts = await asyncio.gather(
+        *(
+            qweather_get_weather_by_coord_async(
+                endpoint, lon, lat, api_token, api_host=api_host, jwt_token=jwt_token
+            )
+            for endpoint in ('now', '10d')
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(real_time_data, BaseException):
+        raise real_time_data
+
+    result = {'real_time': real_time_data, 'ten_days_forcasts': ten_days_forcasts}
+    if isinstance(ten_days_forcasts, MCPError):
+        result['ten_days_forcasts'] = None
+        result['errors'] = {'ten_days_forcasts': ten_days_forcasts.to_response()['error']}
+    elif isinstance(ten_days_forcasts, BaseException):
+        raise ten_days_forcasts
+    return result
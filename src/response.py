@@ -72,6 +72,7 @@ class MCPError(Exception):
     EXTERNAL_API_ERROR = ErrorCode.EXTERNAL_API_ERROR.value
     NETWORK_ERROR = ErrorCode.NETWORK_ERROR.value
     CONFIGURATION_ERROR = ErrorCode.CONFIGURATION_ERROR.value
+    DEADLINE_EXCEEDED = ErrorCode.DEADLINE_EXCEEDED.value
 
     def __init__(
         self,
@@ -11,12 +11,22 @@ from src.schemas.base import (
     TimeInfo,
 )
 from src.schemas.celestial import (
+    AltitudePoint,
     CelestialPosition,
+    CelestialPositions,
     ConstellationInfo,
+    ConstellationLookup,
+    ConstellationObject,
+    ConstellationObjects,
+    DarkInterval,
     DeepSkyObject,
     MoonInfo,
+    NightContext,
     NightlyForecast,
+    NightSummary,
     RiseSet,
+    RiseSetEvent,
+    RiseSetEvents,
     VisiblePlanet,
 )
 from src.schemas.error import ErrorCode
@@ -43,11 +53,13 @@ from src.schemas.weather import (
     HourlyForecastItem,
     LocationInfo,
     NormalizedWeatherData,
+    ProviderCacheStatus,
     ProviderError,
     ProviderErrorDetail,
     ProviderResult,
     ProviderSuccess,
     SourceMeta,
+    WeatherCacheInfo,
     WeatherSummary,
 )
 
@@ -59,12 +71,22 @@ __all__ = [
     'ErrorCode',
     'PaginatedResult',
     # Celestial
+    'AltitudePoint',
     'CelestialPosition',
+    'CelestialPositions',
     'RiseSet',
+    'RiseSetEvent',
+    'RiseSetEvents',
     'MoonInfo',
     'VisiblePlanet',
     'ConstellationInfo',
+    'ConstellationObject',
+    'ConstellationObjects',
+    'ConstellationLookup',
     'DeepSkyObject',
+    'DarkInterval',
+    'NightContext',
+    'NightSummary',
     'NightlyForecast',
     # Planning
     'PlanningQuery',
@@ -92,4 +114,6 @@ __all__ = [
     'WeatherSummary',
     'SourceMeta',
     'AggregatedWeatherResponse',
+    'ProviderCacheStatus',
+    'WeatherCacheInfo',
 ]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 from stargazing_core import CelestialPosition, MoonInfo, RiseSet, VisiblePlanet  # noqa: F401
 
@@ -12,6 +14,69 @@ class ConstellationInfo(CelestialPosition):
     name: str = Field(description='Constellation name')
 
 
+class ConstellationObject(CelestialPosition):
+    """A catalog object inside a constellation, with its current position."""
+
+    name: str = Field(description='Object name')
+    type: str = Field(description='Object type (galaxy, nebula, cluster, etc.)')
+    magnitude: float | None = Field(default=None, description='Apparent magnitude, if known')
+    catalog: str = Field(description='Catalog identifier (Messier, NGC, etc.)')
+    angular_size_arcmin: float | None = Field(
+        default=None, description='Major axis angular size in arcminutes'
+    )
+
+
+class ConstellationObjects(BaseModel):
+    """Catalog objects in one constellation above an altitude, brightest first."""
+
+    constellation: str = Field(description='Full IAU constellation name')
+    abbreviation: str = Field(description='IAU constellation abbreviation')
+    min_altitude: float = Field(description='Altitude threshold in degrees')
+    total: int = Field(description='Catalog objects in the constellation')
+    visible: int = Field(description='Of those, objects at or above the altitude threshold')
+    objects: list[ConstellationObject] = Field(
+        default_factory=list, description='Objects above the threshold, brightest first'
+    )
+
+
+class ConstellationLookup(BaseModel):
+    """Constellations containing a batch of coordinates."""
+
+    constellations: list[str] = Field(description='Full IAU name, one per coordinate')
+    abbreviations: list[str] = Field(description='IAU abbreviation, one per coordinate')
+
+
+class RiseSetEvent(BaseModel):
+    """A single horizon crossing."""
+
+    event: Literal['rise', 'set'] = Field(description='Crossing direction')
+    time: str = Field(description='Crossing time as ISO string (local timezone)')
+
+
+class RiseSetEvents(RiseSet):
+    """Rise/set pair plus every horizon crossing found in the day."""
+
+    events: list[RiseSetEvent] = Field(
+        default_factory=list, description='All rises and sets in the day, in time order'
+    )
+
+
+class CelestialPositions(BaseModel):
+    """Altitude/azimuth matrices for several objects at several times."""
+
+    objects: list[str] = Field(description='Object names, one per matrix row')
+    times: list[str] = Field(description='ISO 8601 observation times, one per matrix column')
+    altitude: list[list[float]] = Field(description='Altitude in degrees, [object][time]')
+    azimuth: list[list[float]] = Field(description='Azimuth in degrees, [object][time]')
+
+
+class AltitudePoint(BaseModel):
+    """One sample of an altitude curve."""
+
+    time: float = Field(description='UTC unix timestamp')
+    alt: float = Field(description='Altitude in degrees')
+
+
 class DeepSkyObject(CelestialPosition):
     """A deep sky object (Messier/NGC) with viewing score."""
 
@@ -37,6 +102,75 @@ class DeepSkyObject(CelestialPosition):
     angular_size_arcmin: float | None = Field(
         default=None, description='Major axis angular size in arcminutes'
     )
+    constellation: str | None = Field(
+        default=None, description='IAU abbreviation of the constellation'
+    )
+    observable_hours: float | None = Field(
+        default=None,
+        description='Hours above 20° altitude during astronomical darkness on this night',
+    )
+    altitude_curve: list[AltitudePoint] | None = Field(
+        default=None,
+        description='Altitude from civil dusk to civil dawn (only with include_curves)',
+    )
+
+
+class DarkInterval(BaseModel):
+    """A stretch of astronomical darkness with the Moon below the horizon."""
+
+    start: str = Field(description='Interval start as ISO string (local timezone)')
+    end: str = Field(description='Interval end as ISO string (local timezone)')
+
+
+class NightContext(BaseModel):
+    """Almanac for one night at a site: twilight, rise/set and dark time."""
+
+    night_of: str = Field(description='Local date on which the night begins (YYYY-MM-DD)')
+    latitude: float = Field(description='Latitude of the almanac cell centre in degrees')
+    longitude: float = Field(description='Longitude of the almanac cell centre in degrees')
+    time_zone: str = Field(description='IANA timezone of the event times')
+    sunset: str | None = Field(default=None, description='Sunset (ISO, local)')
+    sunrise: str | None = Field(default=None, description='Next sunrise (ISO, local)')
+    civil_dusk: str | None = Field(default=None, description='Sun reaches -6° (ISO, local)')
+    civil_dawn: str | None = Field(default=None, description='Sun back at -6° (ISO, local)')
+    nautical_dusk: str | None = Field(default=None, description='Sun reaches -12° (ISO, local)')
+    nautical_dawn: str | None = Field(default=None, description='Sun back at -12° (ISO, local)')
+    astronomical_dusk: str | None = Field(default=None, description='Sun reaches -18° (ISO, local)')
+    astronomical_dawn: str | None = Field(default=None, description='Sun back at -18° (ISO, local)')
+    moonrise: str | None = Field(default=None, description='Moonrise during the night (ISO)')
+    moonset: str | None = Field(default=None, description='Moonset during the night (ISO)')
+    moon_illumination: float = Field(description='Moon illumination near the middle of the night')
+    moon_phase_name: str = Field(description='Moon phase near the middle of the night')
+    dark_intervals: list[DarkInterval] = Field(
+        default_factory=list, description='Moon-free astronomical darkness windows'
+    )
+    dark_hours: float = Field(description='Total hours of Moon-free astronomical darkness')
+    astronomical_hours: float = Field(
+        default=0.0, description='Total hours with the Sun below -18° during the night'
+    )
+    darkness_score: float = Field(
+        default=0.0, description='Percentage of the astronomical night free of moonlight (0-100)'
+    )
+
+
+class NightSummary(BaseModel):
+    """Forecast for one night of a multi-night request."""
+
+    night_of: str = Field(description='Local date on which the night begins (YYYY-MM-DD)')
+    time: str = Field(description='Forecast time on this night as ISO string (local timezone)')
+    moon_phase: MoonInfo = Field(description='Moon phase details')
+    planets: list[VisiblePlanet] = Field(default_factory=list, description='Visible planets')
+    deep_sky: list[DeepSkyObject] = Field(
+        default_factory=list, description='Recommended deep sky objects'
+    )
+    night: NightContext | None = Field(
+        default=None,
+        description='Twilight, rise/set and dark-time almanac (omitted in fast precision mode)',
+    )
+    dark_hours: float = Field(description='Total hours of Moon-free astronomical darkness')
+    darkness_score: float = Field(
+        description='Percentage of the astronomical night free of moonlight (0-100)'
+    )
 
 
 class NightlyForecast(BaseModel):
@@ -47,3 +181,13 @@ class NightlyForecast(BaseModel):
     deep_sky: list[DeepSkyObject] = Field(
         default_factory=list, description='Recommended deep sky objects'
     )
+    night: NightContext | None = Field(
+        default=None,
+        description='Twilight, rise/set and dark-time almanac (omitted in fast precision mode)',
+    )
+    nights: list[NightSummary] | None = Field(
+        default=None, description='Per-night forecasts when more than one night is requested'
+    )
+    best_night: str | None = Field(
+        default=None, description='night_of of the darkest requested night (multi-night only)'
+    )
@@ -19,3 +19,4 @@ class ErrorCode(StrEnum):
     EXTERNAL_API_ERROR = 'EXTERNAL_API_ERROR'
     NETWORK_ERROR = 'NETWORK_ERROR'
     CONFIGURATION_ERROR = 'CONFIGURATION_ERROR'
+    DEADLINE_EXCEEDED = 'DEADLINE_EXCEEDED'
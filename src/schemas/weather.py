@@ -116,14 +116,6 @@ class NormalizedWeatherData(BaseModel):
     )
 
 
-class ProviderSuccess(BaseModel):
-    """A successful provider query result."""
-
-    status: str = Field(default='success', description='Status indicator')
-    provider: str = Field(description='Provider name')
-    data: NormalizedWeatherData = Field(description='Normalized weather data from this provider')
-
-
 class ProviderErrorDetail(BaseModel):
     """Details of a provider error."""
 
@@ -132,6 +124,18 @@ class ProviderErrorDetail(BaseModel):
     details: dict[str, Any] | None = Field(default=None, description='Additional error context')
 
 
+class ProviderSuccess(BaseModel):
+    """A successful provider query result."""
+
+    status: str = Field(default='success', description='Status indicator')
+    provider: str = Field(description='Provider name')
+    data: NormalizedWeatherData = Field(description='Normalized weather data from this provider')
+    partial_errors: dict[str, ProviderErrorDetail] = Field(
+        default_factory=dict,
+        description='Sections (current/daily/hourly) that failed while the others succeeded',
+    )
+
+
 class ProviderError(BaseModel):
     """A failed provider query result."""
 
@@ -174,6 +178,24 @@ class SourceMeta(BaseModel):
     )
 
 
+class ProviderCacheStatus(BaseModel):
+    """How one provider's result was served by the weather cache."""
+
+    status: str = Field(description="'hit' (fresh), 'stale' (refreshing in background) or 'miss'")
+    age_seconds: float = Field(description='Seconds since the result was fetched upstream')
+
+
+class WeatherCacheInfo(BaseModel):
+    """Weather cache summary for one aggregated response (reported in ``_meta``)."""
+
+    hit: bool = Field(description='True when every provider result came from the cache')
+    stale: bool = Field(description='True when any result is stale and being refreshed')
+    age_seconds: float = Field(description='Age of the oldest provider result, in seconds')
+    providers: dict[str, ProviderCacheStatus] = Field(
+        default_factory=dict, description='Per-provider cache status'
+    )
+
+
 class AggregatedWeatherResponse(BaseModel):
     """The top-level aggregated weather response."""
 
@@ -183,3 +205,8 @@ class AggregatedWeatherResponse(BaseModel):
         description='Per-provider raw results (success or error)'
     )
     source: SourceMeta = Field(description='Provider source metadata')
+    cache: WeatherCacheInfo | None = Field(
+        default=None,
+        exclude=True,
+        description='Cache status; reported in the response _meta, not the data',
+    )
@@ -0,0 +1,110 @@
+"""Coalescing of identical in-flight calls ("single flight").
+
+When several requests ask for the same thing at once — an agent fanning out,
+or sessions asking about the same city — only the first caller for a key
+runs the upstream call; the others wait for it and receive the same result
+(or exception).  Keys are held only while the call runs, so this never
+serves old results; caching is a separate concern.
+
+A :class:`SingleFlight` group coalesces across threads and event loops: the
+in-flight slot is a ``concurrent.futures.Future``, which blocking callers
+(:meth:`SingleFlight.do`) wait on directly and async callers
+(:meth:`SingleFlight.do_async`) await through ``asyncio.wrap_future``.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+_groups: dict[str, 'SingleFlight'] = {}
+_groups_lock = threading.Lock()
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def _join(self, key: Hashable) -> tuple[Future, bool]:
+        """Return the in-flight future for ``key`` and whether the caller leads it."""
+        with self._lock:
+            self.calls += 1
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def _release(self, key: Hashable, future: Future) -> None:
+        """Stop routing new callers to ``future``; later calls for ``key`` start afresh."""
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Call ``func()``, or wait for the identical call already running for ``key``."""
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as exc:
+            self._release(key, future)
+            future.set_exception(exc)
+            raise
+        self._release(key, future)
+        future.set_result(result)
+        return result
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Async :meth:`do`.
+
+        The shared call runs in its own task, so cancelling one waiter (even
+        the one that started it) does not cancel it for the others.
+        """
+        future, leader = self._join(key)
+        if leader:
+            task = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._settle(key, future, done))
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _settle(self, key: Hashable, future: Future, task: asyncio.Task) -> None:
+        self._release(key, future)
+        if task.cancelled():
+            future.set_exception(asyncio.CancelledError())
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls),
+            }
+
+
+def single_flight(name: str) -> SingleFlight:
+    """Return the process-wide group called ``name``, creating it on first use."""
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = _groups[name] = SingleFlight(name)
+        return group
+
+
+def single_flight_stats() -> dict[str, dict[str, int]]:
+    """Counters of every named group, e.g. for ``/health``."""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {group.name: group.stats() for group in groups}
@@ -0,0 +1,224 @@
+"""Startup warm-up: pay the one-off astropy and catalog costs before serving.
+
+The first celestial request in a fresh process otherwise initialises ERFA,
+loads the IERS tables, selects the solar-system ephemeris, maps the
+catalogs and evaluates the first ``get_body``.  :func:`run_warmup` performs
+those steps up front (and waits for the compute worker pool, if any, to do
+the same) and records how long each took; :class:`WarmupState`
+backs the readiness side of ``/health`` and ``/ready``.
+
+Modes (``--warmup`` or ``STARGAZING_WARMUP``):
+
+- ``off`` (default): no warm-up; the server reports ready immediately.
+- ``blocking``: warm up before the transport starts listening.
+- ``background``: start listening at once, report not-ready until done.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+WARMUP_MODES = ('off', 'blocking', 'background')
+DEFAULT_WARMUP_MODE = 'off'
+
+
+@dataclass
+class WarmupStep:
+    name: str
+    seconds: float
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'name': self.name, 'seconds': round(self.seconds, 4), 'error': self.error}
+
+
+class WarmupState:
+    """Progress of the warm-up phase, shared between the runner and probes.
+
+    ``status`` is ``'disabled'`` (no warm-up configured), ``'pending'``,
+    ``'running'`` or ``'complete'``.  A failing step is recorded and skipped;
+    it does not keep the worker out of rotation, since every step is only an
+    optimisation of work a request would otherwise do lazily.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.status = 'disabled'
+        self.steps: list[WarmupStep] = []
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status in ('disabled', 'complete')
+
+    def mark_pending(self) -> None:
+        with self._lock:
+            self.status = 'pending'
+            self.steps = []
+            self.started_at = self.finished_at = None
+
+    def record(self, step: WarmupStep) -> None:
+        with self._lock:
+            self.steps.append(step)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            total = None
+            if self.started_at is not None and self.finished_at is not None:
+                total = round(self.finished_at - self.started_at, 4)
+            return {
+                'ready': self.ready,
+                'status': self.status,
+                'total_seconds': total,
+                'steps': [step.to_dict() for step in self.steps],
+            }
+
+    def _set_status(self, status: str) -> None:
+        with self._lock:
+            self.status = status
+            if status == 'running':
+                self.started_at = time.perf_counter()
+            elif status == 'complete':
+                self.finished_at = time.perf_counter()
+
+
+def _init_astropy() -> None:
+    from astropy.time import Time
+
+    # Any scale conversion initialises ERFA and the leap-second table.
+    Time('2000-01-01T12:00:00', scale='utc').tt.jd
+
+
+def _load_iers() -> None:
+    from astropy.time import Time
+
+    # UT1 needs the IERS tables (downloaded or bundled, per iers_conf).
+    Time.now().ut1
+
+
+def _select_solar_system_ephemeris() -> None:
+    from astropy.coordinates import solar_system_ephemeris
+
+    solar_system_ephemeris.set('builtin')
+
+
+def _load_catalogs() -> None:
+    from src.celestial import _load_bright_stars, _load_objects
+
+    catalog = _load_objects()
+    # The indexes and the decoded columns are cached on first access.
+    catalog.sky_index
+    catalog.alias_index
+    catalog.constellation_index
+    for name in ('ra', 'dec', 'magnitude'):
+        catalog.values(name)
+    _load_bright_stars()
+
+
+def _prime_ephemeris() -> None:
+    from astropy.coordinates import AltAz, EarthLocation
+    from astropy.time import Time
+
+    from src.ephemeris import EPHEMERIS_BODIES, get_ephemeris_cache
+    from src.observer_frame import ObserverFrame
+
+    now = Time.now()
+    location = EarthLocation.from_geodetic(0.0, 0.0)
+    bodies = get_ephemeris_cache().bodies(EPHEMERIS_BODIES, now)
+    bodies.transform_to(AltAz(obstime=now, location=location))
+    ObserverFrame(location, now).altaz([0.0], [0.0])
+
+
+def _prewarm_workers() -> None:
+    from src.executor import get_compute_executor
+
+    # No-op without a process pool (STARGAZING_WORKERS / --workers).
+    get_compute_executor().prewarm()
+
+
+# Steps that warm the current process; compute workers run these on start.
+PROCESS_WARMUP_STEPS: tuple[tuple[str, Callable[[], None]], ...] = (
+    ('astropy', _init_astropy),
+    ('iers', _load_iers),
+    ('solar_system_ephemeris', _select_solar_system_ephemeris),
+    ('catalogs', _load_catalogs),
+    ('ephemeris', _prime_ephemeris),
+)
+
+WARMUP_STEPS: tuple[tuple[str, Callable[[], None]], ...] = (
+    *PROCESS_WARMUP_STEPS,
+    ('workers', _prewarm_workers),
+)
+
+
+def resolve_warmup_mode(mode: str | None = None) -> str:
+    """Return the effective warm-up mode; ``None`` reads ``STARGAZING_WARMUP``.
+
+    Raises:
+        ValueError: If the mode is not one of ``WARMUP_MODES``.
+    """
+    mode = mode if mode is not None else os.getenv('STARGAZING_WARMUP')
+    mode = (mode or DEFAULT_WARMUP_MODE).strip().lower()
+    if mode not in WARMUP_MODES:
+        raise ValueError(f'Unknown warm-up mode {mode!r}; expected one of {WARMUP_MODES}.')
+    return mode
+
+
+def run_warmup(
+    state: WarmupState | None = None,
+    steps: tuple[tuple[str, Callable[[], None]], ...] = WARMUP_STEPS,
+) -> WarmupState:
+    """Run every warm-up step in order, recording per-step timings on ``state``."""
+    state = state if state is not None else get_warmup_state()
+    state._set_status('running')
+    for name, step in steps:
+        start = time.perf_counter()
+        error = None
+        try:
+            step()
+        except Exception as exc:  # a failed step must not stop startup
+            error = f'{type(exc).__name__}: {exc}'
+            logger.warning('Warm-up step failed', step=name, error=error)
+        elapsed = time.perf_counter() - start
+        state.record(WarmupStep(name=name, seconds=elapsed, error=error))
+        logger.info('Warm-up step finished', step=name, seconds=round(elapsed, 4))
+    state._set_status('complete')
+    logger.info('Warm-up complete', total_seconds=state.snapshot()['total_seconds'])
+    return state
+
+
+def start_warmup(mode: str | None = None, state: WarmupState | None = None) -> str:
+    """Start warm-up according to ``mode``; returns the effective mode.
+
+    ``blocking`` runs to completion before returning; ``background`` runs in a
+    daemon thread and leaves the state not-ready until it finishes.
+    """
+    mode = resolve_warmup_mode(mode)
+    state = state if state is not None else get_warmup_state()
+    if mode == 'off':
+        return mode
+
+    state.mark_pending()
+    if mode == 'blocking':
+        run_warmup(state)
+    else:
+        threading.Thread(
+            target=run_warmup, args=(state,), name='stargazing-warmup', daemon=True
+        ).start()
+    return mode
+
+
+_warmup_state = WarmupState()
+
+
+def get_warmup_state() -> WarmupState:
+    """Return the process-wide warm-up state."""
+    return _warmup_state
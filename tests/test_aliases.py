@@ -0,0 +1,123 @@
+import pytest
+
+import src.celestial as celestial_module
+from src.aliases import build_alias_index, build_star_index, normalize_object_name
+
+
+@pytest.mark.parametrize(
+    'name',
+    ['M 31', 'm31', 'M-31', 'messier 31', 'Messier_031', '  M   31 '],
+)
+def test_messier_spellings_share_one_key(name):
+    assert normalize_object_name(name) == 'm31'
+
+
+def test_common_names_ignore_case_spacing_and_punctuation():
+    assert normalize_object_name('Orion_Nebula') == normalize_object_name('orion nebula')
+    assert normalize_object_name("Bode's Galaxy") == normalize_object_name('bodes galaxy')
+    assert normalize_object_name('NAME SMC') == normalize_object_name('SMC')
+
+
+def test_build_alias_index_links_designations_and_common_names():
+    index = build_alias_index(['M 31', 'NGC 6405', 'NGC 7000'])
+
+    assert index['ngc224'] == 0  # NGC duplicate of a Messier entry
+    assert index['m6'] == 1  # Messier object named by its NGC id
+    assert index[normalize_object_name('andromeda galaxy')] == 0
+    assert index[normalize_object_name('north america nebula')] == 2
+    # Aliases for objects missing from the catalog are skipped.
+    assert normalize_object_name('orion nebula') not in index
+
+
+@pytest.mark.parametrize(
+    ('query', 'expected'),
+    [
+        ('M 42', 'M 42'),
+        ('orion nebula', 'M 42'),
+        ('NGC 1976', 'M 42'),
+        ('ngc7000', 'NGC 7000'),
+        ('pleiades', 'Cl Melotte 22'),
+        ('M 44', 'NGC 2632'),
+        ('IC434', 'IC 434'),
+    ],
+)
+def test_packaged_catalog_aliases(query, expected):
+    catalog = celestial_module._load_objects()
+    assert catalog[catalog.find(query)]['name'] == expected
+
+
+def test_unknown_and_empty_names_are_not_found():
+    catalog = celestial_module._load_objects()
+    assert catalog.find('definitely not an object') is None
+    assert catalog.find('   ') is None
+
+
+def test_catalog_objects_resolve_without_simbad(monkeypatch):
+    """Names known to the local catalog never reach the SIMBAD resolver."""
+
+    def fail(name):
+        raise AssertionError(f'SIMBAD queried for {name!r}')
+
+    monkeypatch.setattr(celestial_module, '_resolve_simbad_object', fail)
+
+    coord = celestial_module._get_celestial_object('NGC 224', time=None)
+    assert coord.ra.deg == pytest.approx(10.6847, abs=1e-3)
+    assert coord.dec.deg == pytest.approx(41.2687, abs=1e-3)
+
+
+@pytest.mark.parametrize(
+    'name', ['Alpha CMa', 'alf CMa', 'α CMa', '9 CMa', 'HR 2491', 'HIP 32349', 'dog star']
+)
+def test_star_designations_resolve_to_sirius(name):
+    assert celestial_module._find_bright_star(name)['name'] == 'Sirius'
+
+
+def test_unsuffixed_bayer_name_picks_brightest_component():
+    index = build_star_index(
+        [
+            {'name': 'Rigil Kentaurus', 'bayer': 'alf1 Cen', 'hr': 5459},
+            {'bayer': 'alf2 Cen', 'hr': 5460},
+        ]
+    )
+    assert index[normalize_object_name('alpha Cen')] == 0
+    assert index[normalize_object_name('alpha centauri')] == 0
+    assert index[normalize_object_name('alf2 Cen')] == 1
+
+
+@pytest.mark.parametrize(
+    'name', ['Sirius', 'vega', 'Alioth', 'Polaris', 'Betelgeuse', 'Acrux', 'Schedar']
+)
+def test_star_names_resolve_without_simbad(monkeypatch, name):
+    """Named stars (incl. constellation fallbacks) are answered from bright_stars.json."""
+
+    def fail(name):
+        raise AssertionError(f'SIMBAD queried for {name!r}')
+
+    monkeypatch.setattr(celestial_module, '_resolve_simbad_object', fail)
+    coord = celestial_module._get_celestial_object(name, time=None)
+    star = celestial_module._find_bright_star(name)
+    assert coord.ra.deg == pytest.approx(star['ra'])
+    assert coord.dec.deg == pytest.approx(star['dec'])
+
+
+def test_packaged_star_table_reaches_naked_eye_limit():
+    """The packaged table covers the sky to about V 6.5, not just the named stars."""
+    stars, _ = celestial_module._load_bright_stars()
+    assert len(stars) > 8000
+    assert max(star['magnitude'] for star in stars) == pytest.approx(6.5, abs=0.05)
+    assert sum(1 for star in stars if star.get('bayer') or star.get('flamsteed')) > 3000
+
+
+@pytest.mark.parametrize('name', ['tau Cet', '61 Cyg', 'eps1 Lyr', 'Alcor', 'Keid'])
+def test_fainter_designated_stars_resolve_offline(name):
+    assert celestial_module._find_bright_star(name) is not None
+
+
+def test_packaged_star_designations_match_constellation():
+    """Each star's Bayer/Flamsteed constellation agrees with its computed position."""
+    stars, _ = celestial_module._load_bright_stars()
+    assert stars
+    for star in stars:
+        designation = star.get('bayer') or star.get('flamsteed')
+        if designation:
+            assert designation.split()[-1] == star['constellation'], star
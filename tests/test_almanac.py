@@ -0,0 +1,136 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytz
+
+from src.almanac import (
+    AlmanacCache,
+    NightAlmanac,
+    compute_night_almanac,
+    create_almanac_cache,
+    night_of,
+)
+from src.celestial import celestial_rise_set
+from src.utils import create_earth_location
+
+NEW_YORK = pytz.timezone('America/New_York')
+NYC = create_earth_location(lat=40.7, lon=-74.0)
+
+
+@pytest.fixture(scope='module')
+def winter_night() -> NightAlmanac:
+    return compute_night_almanac(40.7, -74.0, date(2024, 1, 20), NEW_YORK)
+
+
+def test_night_is_named_by_the_evening_it_starts():
+    assert night_of(NEW_YORK.localize(datetime(2024, 1, 21, 2, 0))) == date(2024, 1, 20)
+    assert night_of(NEW_YORK.localize(datetime(2024, 1, 20, 21, 0))) == date(2024, 1, 20)
+    with pytest.raises(ValueError, match='timezone-aware'):
+        night_of(datetime(2024, 1, 20, 21, 0))
+
+
+def test_twilight_events_are_ordered(winter_night):
+    order = [
+        winter_night.sunset,
+        winter_night.civil_dusk,
+        winter_night.nautical_dusk,
+        winter_night.astronomical_dusk,
+        winter_night.astronomical_dawn,
+        winter_night.nautical_dawn,
+        winter_night.civil_dawn,
+        winter_night.sunrise,
+    ]
+    assert all(moment is not None for moment in order)
+    assert order == sorted(order)
+    assert winter_night.sunset.date() == date(2024, 1, 20)
+    assert winter_night.sunrise.date() == date(2024, 1, 21)
+    assert winter_night.sunset.tzinfo is not None
+
+
+def test_sunset_agrees_with_rise_set_search(winter_night):
+    _, sunset = celestial_rise_set(
+        'sun', NYC, NEW_YORK.localize(datetime(2024, 1, 20, 12, 0)), horizon=-0.833
+    )
+    assert abs((winter_night.sunset - sunset).total_seconds()) < 5
+
+
+def test_dark_intervals_need_astronomical_night_and_no_moon(winter_night):
+    """A waxing gibbous Moon sets before dawn, leaving one dark window."""
+    assert winter_night.moon_phase_name == 'Waxing Gibbous'
+    assert len(winter_night.dark_intervals) == 1
+    start, end = winter_night.dark_intervals[0]
+    assert abs((start - winter_night.moonset).total_seconds()) < 1
+    assert abs((end - winter_night.astronomical_dawn).total_seconds()) < 1
+    assert winter_night.dark_hours == pytest.approx((end - start).total_seconds() / 3600)
+
+
+def test_polar_summer_has_no_night():
+    almanac = compute_night_almanac(
+        78.2, 15.6, date(2024, 6, 21), pytz.timezone('Arctic/Longyearbyen')
+    )
+
+    assert almanac.sunset is None and almanac.sunrise is None
+    assert almanac.astronomical_dusk is None
+    assert almanac.dark_intervals == []
+
+
+def test_to_dict_serialises_times():
+    almanac = compute_night_almanac(
+        -33.9, 151.2, date(2024, 3, 9), pytz.timezone('Australia/Sydney')
+    )
+
+    data = almanac.to_dict()
+    assert data['night_of'] == '2024-03-09'
+    assert data['time_zone'] == 'Australia/Sydney'
+    assert datetime.fromisoformat(data['astronomical_dusk']) == almanac.astronomical_dusk
+    assert data['dark_intervals'][0]['start'] == almanac.dark_intervals[0][0].isoformat()
+
+
+class TestAlmanacCache:
+    def test_sites_in_the_same_cell_share_an_entry(self):
+        cache = AlmanacCache(cell_deg=0.1)
+        evening = NEW_YORK.localize(datetime(2024, 1, 20, 21, 0))
+
+        first = cache.get(NYC, evening)
+        second = cache.get(
+            create_earth_location(lat=40.72, lon=-74.02), evening + timedelta(hours=5)
+        )
+
+        assert second is first
+        assert cache.stats() == {'entries': 1, 'hits': 1, 'misses': 1}
+        assert (first.latitude, first.longitude) == pytest.approx((40.7, -74.0))
+
+    def test_other_nights_and_cells_are_separate_entries(self):
+        cache = AlmanacCache(cell_deg=0.1)
+        evening = NEW_YORK.localize(datetime(2024, 1, 20, 21, 0))
+
+        cache.get(NYC, evening)
+        cache.get(NYC, evening + timedelta(days=1))
+        cache.get(create_earth_location(lat=41.0, lon=-74.0), evening)
+
+        assert cache.stats()['misses'] == 3
+
+    def test_evicts_least_recently_used(self):
+        cache = AlmanacCache(cell_deg=0.1, max_entries=1)
+        evening = NEW_YORK.localize(datetime(2024, 1, 20, 21, 0))
+
+        cache.get(NYC, evening)
+        cache.get(NYC, evening + timedelta(days=1))
+        cache.get(NYC, evening)
+
+        assert cache.stats() == {'entries': 1, 'hits': 0, 'misses': 3}
+
+    @pytest.mark.parametrize(
+        ('name', 'value'),
+        [
+            ('STARGAZING_ALMANAC_CELL_DEG', '0'),
+            ('STARGAZING_ALMANAC_CELL_DEG', 'coarse'),
+            ('STARGAZING_ALMANAC_CACHE_SIZE', '-5'),
+            ('STARGAZING_ALMANAC_CACHE_SIZE', '1.5'),
+        ],
+    )
+    def test_create_rejects_invalid_environment(self, monkeypatch, name, value):
+        monkeypatch.setenv(name, value)
+
+        with pytest.raises(ValueError, match=name):
+            create_almanac_cache()
@@ -0,0 +1,119 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+import astropy.units as u
+import numpy as np
+import pytest
+import pytz
+from astropy.coordinates import EarthLocation
+from astropy.time import Time
+
+import src.celestial as celestial_module
+from src.almanac import compute_night_almanac
+from src.altitude_matrix import compute_altitude_matrix, night_grid
+from src.observer_frame import ObserverFrame
+from src.schemas import NightlyForecast
+
+NEW_YORK = pytz.timezone('America/New_York')
+NYC = EarthLocation.from_geodetic(-74.0 * u.deg, 40.7 * u.deg)
+EVENING = NEW_YORK.localize(datetime(2024, 1, 20, 22, 0))
+
+
+@pytest.fixture(scope='module')
+def winter_night():
+    return compute_night_almanac(40.7, -74.0, date(2024, 1, 20), NEW_YORK)
+
+
+@pytest.fixture(scope='module')
+def sample():
+    catalog = celestial_module._load_objects()
+    rows = np.arange(0, len(catalog), 53)
+    return catalog.column('ra')[rows].astype(float), catalog.column('dec')[rows].astype(float)
+
+
+def test_matrix_matches_observer_frame_in_float32(sample, winter_night):
+    ra, dec = sample
+    grid = night_grid(NYC, EVENING, winter_night)
+    matrix = compute_altitude_matrix(ra, dec, NYC, grid)
+
+    alt, az = ObserverFrame(NYC, Time(grid, format='unix')).altaz(ra, dec)
+    assert matrix.altitude.dtype == np.float32
+    assert matrix.altitude.shape == (len(ra), len(grid))
+    assert matrix.nbytes == 3 * 4 * len(ra) * len(grid)
+    np.testing.assert_allclose(matrix.altitude, alt, atol=1e-4)
+    wrapped = (matrix.azimuth - az + 180.0) % 360.0 - 180.0
+    assert np.abs(wrapped).max() < 1e-3
+
+
+def test_fast_matrix_is_within_curve_rounding(sample, winter_night):
+    ra, dec = sample
+    grid = night_grid(NYC, EVENING, winter_night)
+
+    full = compute_altitude_matrix(ra, dec, NYC, grid)
+    fast = compute_altitude_matrix(ra, dec, NYC, grid, fast=True)
+
+    assert np.abs(fast.altitude - full.altitude).max() < 0.05
+
+
+def test_airmass_only_above_horizon():
+    grid = np.array([EVENING.timestamp()])
+    matrix = compute_altitude_matrix(np.array([37.95, 120.0]), np.array([89.26, -80.0]), NYC, grid)
+
+    zenith_angle = np.radians(90.0 - matrix.altitude[0, 0])
+    assert matrix.airmass[0, 0] == pytest.approx(1.0 / np.cos(zenith_angle), rel=0.01)
+    assert np.isnan(matrix.airmass[1, 0])
+
+
+def test_curve_slices_rows_and_columns(sample):
+    ra, dec = sample
+    grid = EVENING.timestamp() + np.arange(6) * 900.0
+    matrix = compute_altitude_matrix(ra, dec, NYC, grid)
+
+    curve = matrix.curve(3, slice(2, 5))
+    assert [point['time'] for point in curve] == grid[2:5].tolist()
+    assert [point['alt'] for point in curve] == [
+        round(float(alt), 1) for alt in matrix.altitude[3, 2:5]
+    ]
+    assert matrix.take(np.array([3])).curve(0) == matrix.curve(3)
+
+
+def test_night_grid_spans_civil_night(winter_night):
+    grid = night_grid(NYC, EVENING, winter_night)
+    analytic = night_grid(NYC, EVENING)
+
+    assert grid[0] == winter_night.civil_dusk.timestamp()
+    assert grid[-1] == winter_night.civil_dawn.timestamp()
+    assert np.all(np.diff(grid) <= 900.0)
+    assert analytic[0] == pytest.approx(grid[0], abs=300)
+    assert analytic[-1] == pytest.approx(grid[-1], abs=300)
+
+
+@pytest.mark.parametrize('precision', ['full', 'fast'])
+def test_forecast_targets_carry_altitude_curves(precision):
+    forecast = celestial_module.calculate_nightly_forecast(
+        NYC, EVENING, limit=10, precision=precision, nights=2, include_curves=True
+    )
+
+    NightlyForecast.model_validate(forecast)
+    for night in forecast['nights']:
+        for obj in night['deep_sky']:
+            curve = obj['altitude_curve']
+            assert len(curve) > 40
+            if curve[0]['time'] < obj['transit_time'] < curve[-1]['time']:
+                peak = max(point['alt'] for point in curve)
+                assert peak == pytest.approx(obj['transit_alt'], abs=0.5)
+    first = forecast['nights'][1]['deep_sky'][0]['altitude_curve'][0]['time']
+    assert first - forecast['nights'][0]['deep_sky'][0]['altitude_curve'][0]['time'] > 23 * 3600
+
+
+def test_forecast_curves_are_opt_in():
+    with patch.object(celestial_module, 'compute_altitude_matrix') as matrix:
+        forecast = celestial_module.calculate_nightly_forecast(
+            NYC, EVENING, limit=5, precision='fast'
+        )
+
+    matrix.assert_not_called()
+    assert forecast['deep_sky']
+    assert all('altitude_curve' not in obj for obj in forecast['deep_sky'])
+    dumped = NightlyForecast.model_validate(forecast).model_dump()
+    assert all(obj['altitude_curve'] is None for obj in dumped['deep_sky'])
@@ -1,6 +1,23 @@
+import json
 import time
 
-from src.cache import AnalysisCache, generate_cache_key
+import pytest
+from astropy.table import Table
+
+import src.cache as cache_module
+import src.celestial as celestial_module
+from src.cache import (
+    AnalysisCache,
+    MemoryResolutionCache,
+    ResolutionCache,
+    SQLiteResolutionCache,
+    create_resolution_cache,
+    generate_cache_key,
+)
+
+# Captured at import time: the autouse ``no_simbad_network`` fixture replaces
+# the module attribute with a fake resolver for every test.
+_real_resolve_simbad_object = celestial_module._resolve_simbad_object
 
 
 class TestAnalysisCache:
@@ -95,3 +112,122 @@ class TestGenerateCacheKey:
         k1 = generate_cache_key(a=1)
         k2 = generate_cache_key(a=2)
         assert k1 != k2
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def resolution_cache(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryResolutionCache(negative_ttl_seconds=60)
+    return SQLiteResolutionCache(tmp_path / 'resolutions.sqlite3', negative_ttl_seconds=60)
+
+
+class TestResolutionCache:
+    def test_positive_entry_round_trip(self, resolution_cache):
+        """Stored coordinates are returned for case/spacing variants of the name."""
+        resolution_cache.store('M 31', 10.6847, 41.2687)
+        entry = resolution_cache.lookup('  m   31 ')
+        assert entry.found
+        assert (entry.ra_deg, entry.dec_deg) == (10.6847, 41.2687)
+
+    def test_negative_entry_expires(self, resolution_cache):
+        """Cached misses are reported as not found until their TTL passes."""
+        resolution_cache.store_negative('no such object')
+        assert resolution_cache.lookup('no such object').found is False
+
+        resolution_cache.negative_ttl = 0
+        resolution_cache.store_negative('no such object')
+        time.sleep(0.001)
+        assert resolution_cache.lookup('no such object') is None
+
+    def test_counters(self, resolution_cache):
+        resolution_cache.store('vega', 279.2347, 38.7837)
+        resolution_cache.store_negative('vegaa')
+        resolution_cache.lookup('vega')
+        resolution_cache.lookup('vegaa')
+        resolution_cache.lookup('deneb')
+        stats = resolution_cache.stats()
+        assert (stats['hits'], stats['negative_hits'], stats['misses']) == (1, 1, 1)
+        assert stats['entries'] == 2
+
+    def test_seed_from_file(self, resolution_cache, tmp_path):
+        seed = tmp_path / 'seed.json'
+        seed.write_text(json.dumps([{'name': 'Polaris', 'ra': 37.9546, 'dec': 89.2641}]))
+        assert resolution_cache.seed_from_file(seed) == 1
+        assert resolution_cache.lookup('polaris').dec_deg == 89.2641
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    """Two cache objects on the same file (i.e. two workers) see each other's writes."""
+    path = tmp_path / 'shared.sqlite3'
+    SQLiteResolutionCache(path).store('sirius', 101.2872, -16.7161)
+    assert SQLiteResolutionCache(path).lookup('Sirius').found
+
+
+def test_incomplete_resolution_cache_backend_cannot_be_instantiated():
+    class HalfBackend(ResolutionCache):
+        def clear(self) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        ResolutionCache()
+    with pytest.raises(TypeError):
+        HalfBackend()
+
+
+def test_create_resolution_cache_from_env(monkeypatch, tmp_path):
+    seed = tmp_path / 'seed.json'
+    seed.write_text(json.dumps([{'name': 'Vega', 'ra': 279.2347, 'dec': 38.7837}]))
+    monkeypatch.setenv('STARGAZING_RESOLVER_CACHE_PATH', str(tmp_path / 'env.sqlite3'))
+    monkeypatch.setenv('STARGAZING_RESOLVER_NEGATIVE_TTL', '30')
+    monkeypatch.setenv('STARGAZING_RESOLVER_SEED', str(seed))
+
+    cache = create_resolution_cache()
+
+    assert isinstance(cache, SQLiteResolutionCache)
+    assert cache.negative_ttl == 30
+    assert cache.lookup('vega').found
+
+    monkeypatch.setenv('STARGAZING_RESOLVER_CACHE', 'memory')
+    assert isinstance(create_resolution_cache(), MemoryResolutionCache)
+
+
+@pytest.mark.parametrize('value', ['-1', 'abc'])
+def test_create_resolution_cache_rejects_invalid_negative_ttl(monkeypatch, value):
+    monkeypatch.setenv('STARGAZING_RESOLVER_CACHE', 'memory')
+    monkeypatch.setenv('STARGAZING_RESOLVER_NEGATIVE_TTL', value)
+
+    with pytest.raises(ValueError, match='STARGAZING_RESOLVER_NEGATIVE_TTL'):
+        create_resolution_cache()
+
+
+class TestResolveSimbadObjectCaching:
+    @pytest.fixture
+    def simbad_calls(self, monkeypatch):
+        calls = []
+
+        class FakeSimbad:
+            @staticmethod
+            def query_object(name):
+                calls.append(name)
+                if name.lower() == 'vega':
+                    return Table({'ra': [279.2347], 'dec': [38.7837]})
+                return Table({'ra': [], 'dec': []})
+
+        monkeypatch.setattr(celestial_module, 'Simbad', FakeSimbad)
+        monkeypatch.setattr(cache_module, '_resolution_cache', MemoryResolutionCache())
+        return calls
+
+    def test_resolved_coordinates_are_cached(self, simbad_calls):
+        first = _real_resolve_simbad_object('vega')
+        second = _real_resolve_simbad_object('Vega')
+        assert simbad_calls == ['vega']
+        assert second.ra.deg == pytest.approx(first.ra.deg)
+        assert first.dec.deg == pytest.approx(38.7837)
+
+    def test_unknown_names_are_negatively_cached(self, simbad_calls):
+        for _ in range(3):
+            with pytest.raises(ValueError, match='not found'):
+                _real_resolve_simbad_object('vgea')
+        # Plain + capitalized attempt once; later calls are answered from the cache.
+        assert simbad_calls == ['vgea', 'Vgea']
+        assert cache_module.get_resolution_cache().negative_hits == 2
@@ -0,0 +1,193 @@
+import json
+import math
+
+import numpy as np
+import pytest
+from stargazing_core import filter_candidates_by_lst
+
+import src.celestial as celestial_module
+from src.catalog import (
+    ColumnarCatalog,
+    SkyIndex,
+    load_columnar_catalog,
+    write_columnar_catalog,
+)
+from src.paths import DATA_DIR
+
+RECORDS = [
+    {
+        'name': 'M 42',
+        'type': 'HII',
+        'ra': 83.8221,
+        'dec': -5.3911,
+        'magnitude': 4.0,
+        'catalog': 'Messier',
+        'angular_size_maj_arcmin': 85.0,
+        'angular_size_min_arcmin': 60.0,
+        'angular_size_pa_deg': 90,
+        'constellation': 'Ori',
+    },
+    {
+        'name': 'NGC 7000',
+        'type': 'HII',
+        'ra': 314.75,
+        'dec': 44.37,
+        'magnitude': math.nan,
+        'catalog': 'NGC',
+        'angular_size_maj_arcmin': None,
+        'angular_size_min_arcmin': None,
+        'angular_size_pa_deg': None,
+        'constellation': 'Cyg',
+    },
+]
+
+
+def _same_record(left: dict, right: dict) -> bool:
+    if list(left) != list(right):
+        return False
+    for key, value in right.items():
+        other = left[key]
+        if isinstance(value, float) and math.isnan(value):
+            if not (isinstance(other, float) and math.isnan(other)):
+                return False
+        elif other != value:
+            return False
+    return True
+
+
+class TestColumnarCatalog:
+    def test_round_trip_preserves_records(self, tmp_path):
+        """Binary records decode back to the JSON shape, including None/NaN."""
+        path = write_columnar_catalog(RECORDS, tmp_path / 'objects.bin')
+        catalog = load_columnar_catalog(path)
+
+        assert len(catalog) == 2
+        assert all(_same_record(row, rec) for row, rec in zip(catalog, RECORDS, strict=True))
+        assert catalog[-1]['name'] == 'NGC 7000'
+        assert [row['name'] for row in catalog.rows(np.array([1, 0]))] == ['NGC 7000', 'M 42']
+
+    def test_columns_are_memory_mapped(self, tmp_path):
+        """Loaded columns are typed views into the mapped file, not parsed copies."""
+        catalog = load_columnar_catalog(write_columnar_catalog(RECORDS, tmp_path / 'o.bin'))
+
+        assert catalog.column('ra').dtype == np.dtype('<f4')
+        assert isinstance(catalog.column('ra').base, np.memmap)
+        assert catalog.column('catalog').tolist() == [b'Messier', b'NGC']
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / 'objects.bin'
+        path.write_bytes(b'not a catalog file at all')
+        with pytest.raises(ValueError, match='bad magic'):
+            load_columnar_catalog(path)
+
+    def test_index_out_of_range(self):
+        catalog = ColumnarCatalog.from_records(RECORDS)
+        with pytest.raises(IndexError):
+            catalog[2]
+
+    def test_values_match_decoded_records(self):
+        """Typed numeric columns carry exactly the values the records do."""
+        catalog = ColumnarCatalog.from_records(RECORDS)
+
+        assert catalog.values('ra').tolist() == [83.8221, 314.75]
+        assert catalog.values('magnitude')[0] == 4.0
+        assert math.isnan(catalog.values('magnitude')[1])
+        assert catalog.values('ra') is catalog.values('ra')
+        with pytest.raises(KeyError):
+            catalog.values('name')
+
+    def test_store_is_immutable(self):
+        catalog = ColumnarCatalog.from_records(RECORDS)
+
+        with pytest.raises(ValueError):
+            catalog.column('ra')[0] = 0.0
+        with pytest.raises(ValueError):
+            catalog.values('dec')[0] = 0.0
+        with pytest.raises(TypeError):
+            catalog.alias_index['m99'] = 0
+
+    def test_record_by_designation_or_common_name(self):
+        catalog = ColumnarCatalog.from_records(RECORDS)
+
+        assert catalog.record('M42')['name'] == 'M 42'
+        assert catalog.record('ngc 1976')['name'] == 'M 42'
+        assert catalog.record('North America Nebula')['name'] == 'NGC 7000'
+        assert catalog.record('M 99') is None
+
+
+def test_packaged_binary_matches_json():
+    """The shipped objects.bin must be regenerated whenever objects.json changes."""
+    with (DATA_DIR / 'objects.json').open(encoding='utf-8') as f:
+        records = json.load(f)
+    catalog = load_columnar_catalog(DATA_DIR / 'objects.bin')
+
+    assert len(catalog) == len(records)
+    for index in (0, len(records) // 2, len(records) - 1):
+        assert _same_record(catalog[index], records[index])
+
+
+def test_load_objects_falls_back_to_json(monkeypatch):
+    """A missing binary catalog degrades to parsing objects.json."""
+    original_cache = celestial_module.OBJECTS_CACHE
+    celestial_module.OBJECTS_CACHE = None
+    monkeypatch.setattr(
+        celestial_module,
+        '_load_catalog_resource',
+        lambda filename: (_ for _ in ()).throw(FileNotFoundError(filename)),
+    )
+    monkeypatch.setattr(celestial_module, '_load_data_resource', lambda filename: RECORDS)
+
+    try:
+        catalog = celestial_module._load_objects()
+        assert [row['name'] for row in catalog] == ['M 42', 'NGC 7000']
+    finally:
+        celestial_module.OBJECTS_CACHE = original_cache
+
+
+@pytest.mark.parametrize('lst_deg', [0.0, 83.0, 200.0, 314.0])
+def test_filter_candidate_indices_matches_core_filter(lst_deg):
+    """The column filter selects the same objects as the dict-based core filter."""
+    catalog = celestial_module._load_objects()
+    records = list(catalog)
+
+    indices = celestial_module._filter_candidate_indices(catalog, lst_deg)
+    expected = {obj['name'] for obj in filter_candidates_by_lst(records, lst_deg)}
+
+    assert {records[i]['name'] for i in indices} == expected
+
+
+class TestSkyIndex:
+    @pytest.mark.parametrize('lst_deg', [0.0, 7.5, 183.2, 352.0])
+    @pytest.mark.parametrize('latitude_deg', [-33.9, 0.0, 51.5, 89.0])
+    def test_query_matches_linear_scan(self, lst_deg, latitude_deg):
+        """Bucketed queries return exactly what a full scan with the same rules returns."""
+        catalog = celestial_module._load_objects()
+        ra = catalog.column('ra').astype(np.float64)
+        dec = catalog.column('dec').astype(np.float64)
+
+        diff = np.abs(ra - lst_deg)
+        diff = np.where(diff > 180, 360 - diff, diff)
+        transit_alt = 90.0 - np.abs(latitude_deg - dec)
+        expected = np.flatnonzero((diff <= 120) & (transit_alt >= 20.0))
+
+        result = catalog.sky_index.query(lst_deg, latitude_deg, min_altitude_deg=20.0)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_query_returns_sorted_indices_across_ra_wrap(self):
+        index = SkyIndex(np.array([359.0, 1.0, 180.0, 14.0]), np.array([0.0, 0.0, 0.0, 0.0]))
+        np.testing.assert_array_equal(index.query(0.0, 0.0, max_hour_angle_deg=15.0), [0, 1, 3])
+
+    def test_rows_without_coordinates_are_never_returned(self):
+        index = SkyIndex(np.array([10.0, np.nan]), np.array([5.0, 5.0]))
+        np.testing.assert_array_equal(index.query(10.0, 0.0, max_hour_angle_deg=180.0), [0])
+
+
+def test_filter_candidate_indices_skips_objects_that_never_rise():
+    """With a latitude, the filter only drops objects that can't reach scoring altitude."""
+    catalog = celestial_module._load_objects()
+    unrestricted = set(celestial_module._filter_candidate_indices(catalog, 90.0).tolist())
+    restricted = set(celestial_module._filter_candidate_indices(catalog, 90.0, 51.5).tolist())
+
+    assert restricted < unrestricted
+    dropped_dec = catalog.column('dec')[sorted(unrestricted - restricted)]
+    assert np.all(90.0 - np.abs(51.5 - dropped_dec) < 20.0)
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 import astropy.units as u
+import numpy as np
 import pytest
 import pytz
 from astropy.coordinates import EarthLocation, SkyCoord
@@ -8,9 +9,12 @@ from astropy.time import Time
 
 import src.celestial as celestial_module
 from src.celestial import (
+    _altitude_function,
     _generate_time_grid,
     _get_celestial_object,
+    _refine_crossings,
     celestial_pos,
+    celestial_positions,
     celestial_rise_set,
 )
 
@@ -63,6 +67,48 @@ def test_calculate_rise_set_deepspace():
     assert rise is not None or set_ is not None
 
 
+def test_rise_set_times_are_refined_to_the_horizon():
+    """Refined crossings sit on the horizon to within about a second of motion."""
+    date = UTC.localize(datetime(2023, 10, 1))
+    altitude_at = _altitude_function('sun', NYC)
+
+    result = celestial_rise_set('sun', NYC, date)
+
+    assert [kind for kind, _ in result.events] == ['rise', 'set']
+    for _, when in result.events:
+        assert abs(altitude_at(Time(when))[0]) < 0.003  # the Sun moves ~0.003 deg/s
+
+
+def test_rise_set_reports_every_crossing_for_the_moon():
+    """A day where the Moon sets in the morning and rises at night yields both events."""
+    date = UTC.localize(datetime(2023, 10, 1))
+
+    result = celestial_rise_set('moon', NYC, date)
+
+    assert [kind for kind, _ in result.events] == ['set', 'rise']
+    assert result.rise_time == result.events[1][1]
+    assert result.set_time == result.events[0][1]
+
+
+def test_rise_set_circumpolar_object_has_no_events():
+    date = UTC.localize(datetime(2023, 10, 1))
+    rise, set_ = result = celestial_rise_set('polaris', NYC, date)
+    assert rise is None and set_ is None
+    assert result.events == []
+
+
+def test_refine_crossings_finds_roots_of_each_bracket():
+    roots = _refine_crossings(
+        np.cos,
+        np.array([1.0, 4.0]),
+        np.array([2.0, 5.0]),
+        np.cos([1.0, 4.0]),
+        np.cos([2.0, 5.0]),
+        tolerance=1e-9,
+    )
+    np.testing.assert_allclose(roots, [np.pi / 2, 3 * np.pi / 2], atol=1e-9)
+
+
 def test_calculate_rise_set_invalid_horizon():
     """Test invalid horizon elevation."""
     with pytest.raises(ValueError, match='Horizon must be between'):
@@ -119,6 +165,11 @@ def test_load_objects_returns_empty_list_when_resource_missing(monkeypatch, caps
     original_cache = celestial_module.OBJECTS_CACHE
     celestial_module.OBJECTS_CACHE = None
 
+    monkeypatch.setattr(
+        celestial_module,
+        '_load_catalog_resource',
+        lambda filename: (_ for _ in ()).throw(FileNotFoundError(filename)),
+    )
     monkeypatch.setattr(
         celestial_module,
         '_load_data_resource',
@@ -126,7 +177,7 @@ def test_load_objects_returns_empty_list_when_resource_missing(monkeypatch, caps
     )
 
     try:
-        assert celestial_module._load_objects() == []
+        assert list(celestial_module._load_objects()) == []
         assert 'objects.json' in capsys.readouterr().out
     finally:
         celestial_module.OBJECTS_CACHE = original_cache
@@ -149,5 +200,29 @@ def test_load_constellation_centers_returns_empty_list_when_resource_missing(mon
         celestial_module.CONSTELLATIONS_CACHE = original_cache
 
 
+def test_celestial_positions_matches_single_object_calls():
+    """Each matrix cell equals the per-object, per-time ``celestial_pos`` result."""
+    objects = ['sun', 'moon', 'jupiter', 'andromeda', 'sirius']
+    times = [UTC.localize(datetime(2024, 1, 15, hour, 0)) for hour in (6, 12, 22)]
+
+    altitudes, azimuths = celestial_positions(objects, NYC, times)
+
+    assert altitudes.shape == azimuths.shape == (5, 3)
+    for i, name in enumerate(objects):
+        for j, time in enumerate(times):
+            alt, az = celestial_pos(name, NYC, time)
+            assert altitudes[i, j] == pytest.approx(alt, abs=1e-6)
+            assert azimuths[i, j] == pytest.approx(az, abs=1e-6)
+
+
+def test_celestial_positions_rejects_invalid_requests():
+    with pytest.raises(ValueError, match='At least one'):
+        celestial_positions([], NYC, [Time('2024-01-15 12:00:00')])
+    with pytest.raises(ValueError, match='timezone-aware'):
+        celestial_positions(['sun'], NYC, [datetime(2024, 1, 15, 12, 0)])
+    with pytest.raises(ValueError, match='Too many positions'):
+        celestial_positions(['sun'] * 101, NYC, [Time('2024-01-15 12:00:00')] * 100)
+
+
 if __name__ == '__main__':
     pytest.main()
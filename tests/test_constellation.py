@@ -1,11 +1,20 @@
 from datetime import datetime
 
+import astropy.units as u
+import numpy as np
 import pytest
 import pytz
+from astropy.coordinates import SkyCoord, get_constellation
 
-from src.celestial import get_constellation_center
+import src.celestial as celestial_module
+from src.celestial import constellation_objects, get_constellation_center
+from src.constellations import identify_constellations, resolve_constellation
+from src.functions.celestial.impl import get_constellation_objects
+from src.functions.celestial.impl import identify_constellations as identify_constellations_tool
 from src.utils import create_earth_location
 
+SUMMER_EVENING = pytz.timezone('America/New_York').localize(datetime(2024, 8, 10, 22))
+
 
 @pytest.mark.asyncio
 async def test_constellation_center():
@@ -42,3 +51,97 @@ async def test_constellation_center():
     ursa_minor = get_constellation_center('Ursa Minor', loc, time_val)
     print(f'DEBUG: Ursa Minor position: {ursa_minor}')
     assert ursa_minor['altitude'] > 0
+
+
+def test_center_lookup_accepts_abbreviations():
+    loc = create_earth_location(lat=-33.9, lon=151.2)
+    time_val = datetime(2024, 5, 1, 12, 0, tzinfo=pytz.UTC)
+
+    by_abbreviation = get_constellation_center('Cru', loc, time_val)
+    by_name = get_constellation_center('crux', loc, time_val)
+
+    assert by_abbreviation['altitude'] == by_name['altitude']
+
+
+@pytest.mark.parametrize(
+    ('name', 'expected'),
+    [('Cygnus', 'Cyg'), ('cyg', 'Cyg'), ('ursa  major', 'UMa'), ('Orion Nebula', None)],
+)
+def test_resolve_constellation(name, expected):
+    assert resolve_constellation(name) == expected
+
+
+def test_batch_identification_matches_scalar_lookups():
+    rng = np.random.default_rng(7)
+    ra = rng.uniform(0.0, 360.0, 40)
+    dec = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, 40)))
+
+    batch = identify_constellations(ra, dec, short_name=True)
+
+    expected = [
+        get_constellation(SkyCoord(r * u.deg, d * u.deg), short_name=True)
+        for r, d in zip(ra, dec, strict=True)
+    ]
+    assert batch.tolist() == expected
+
+
+@pytest.mark.parametrize(('ra', 'dec'), [([10.0], [1.0, 2.0]), ([10.0], [95.0])])
+def test_batch_identification_rejects_bad_coordinates(ra, dec):
+    with pytest.raises(ValueError):
+        identify_constellations(ra, dec)
+
+
+def test_catalog_constellations_are_precomputed():
+    catalog = celestial_module._load_objects()
+    rows = np.arange(0, len(catalog), 97)
+
+    stored = catalog.column('constellation')[rows].astype(str).tolist()
+
+    computed = identify_constellations(
+        catalog.values('ra')[rows], catalog.values('dec')[rows], short_name=True
+    )
+    assert stored == computed.tolist()
+    assert len(catalog.constellation_index) == 88
+
+
+def test_constellation_objects_above_altitude():
+    loc = create_earth_location(lat=40.7, lon=-74.0)
+
+    result = constellation_objects('Cygnus', loc, SUMMER_EVENING, min_altitude=30.0, limit=10)
+
+    catalog = celestial_module._load_objects()
+    assert result['abbreviation'] == 'Cyg'
+    assert result['total'] == len(catalog.in_constellation('Cyg'))
+    assert 0 < len(result['objects']) <= 10 <= result['visible']
+    names = {obj['name'] for obj in result['objects']}
+    assert all(catalog.record(name)['constellation'] == 'Cyg' for name in names)
+    assert all(obj['altitude'] >= 30.0 for obj in result['objects'])
+    magnitudes = [obj['magnitude'] for obj in result['objects'] if obj['magnitude'] is not None]
+    assert magnitudes == sorted(magnitudes)
+
+
+def test_constellation_objects_rejects_unknown_names():
+    loc = create_earth_location(lat=40.7, lon=-74.0)
+    with pytest.raises(ValueError, match='Unknown constellation'):
+        constellation_objects('Andromeda Galaxy', loc, SUMMER_EVENING)
+
+
+@pytest.mark.asyncio
+async def test_constellation_tools():
+    objects = await get_constellation_objects.fn(
+        constellation='Lyr',
+        lon=-74.0,
+        lat=40.7,
+        time='2024-08-10 22:00:00',
+        time_zone='America/New_York',
+        min_altitude=20.0,
+        limit=3,
+    )
+    lookup = await identify_constellations_tool.fn(ra=[279.23, 83.82], dec=[38.78, -5.39])
+
+    assert objects['data']['constellation'] == 'Lyra'
+    assert len(objects['data']['objects']) == 3
+    assert lookup['data'] == {
+        'constellations': ['Lyra', 'Orion'],
+        'abbreviations': ['Lyr', 'Ori'],
+    }
@@ -0,0 +1,135 @@
+import asyncio
+import pickle
+import threading
+import time
+from datetime import datetime
+
+import pytest
+import pytz
+from fastmcp import Client
+
+import src.celestial as celestial_module
+import src.main  # noqa: F401  (registers every tool)
+from src.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    check_deadline,
+    deadline_scope,
+    request_deadline,
+)
+from src.executor import ComputeExecutor
+from src.server_instance import mcp
+from src.utils import create_earth_location
+
+EVENING = pytz.timezone('America/New_York').localize(datetime(2024, 1, 20, 22))
+
+
+def test_expired_deadline_raises_structured_error():
+    deadline = Deadline(time.time() - 1.0, 5.0)
+
+    with pytest.raises(DeadlineExceededError) as excinfo:
+        deadline.check('scoring')
+
+    response = excinfo.value.to_response()
+    assert response['error']['code'] == 'DEADLINE_EXCEEDED'
+    assert response['error']['details'] == {'stage': 'scoring', 'deadline_seconds': 5.0}
+
+
+def test_deadline_and_error_survive_pickling():
+    deadline = pickle.loads(pickle.dumps(Deadline.after(30.0)))
+    error = pickle.loads(pickle.dumps(DeadlineExceededError('night 2 of 7', 1.5)))
+
+    assert 0 < deadline.remaining() <= 30.0
+    assert (error.code, error.stage, error.budget_seconds) == (
+        'DEADLINE_EXCEEDED',
+        'night 2 of 7',
+        1.5,
+    )
+
+
+def test_cancel_expires_early():
+    deadline = Deadline.after(60.0)
+    deadline.cancel()
+
+    assert deadline.expired
+    with deadline_scope(deadline), pytest.raises(DeadlineExceededError):
+        check_deadline('anything')
+
+
+def test_check_without_deadline_is_a_no_op():
+    check_deadline('anything')
+
+
+class TestRequestDeadline:
+    def test_reads_environment_default(self, monkeypatch):
+        monkeypatch.setenv('STARGAZING_DEADLINE_SECONDS', '12')
+        assert request_deadline().budget_seconds == 12.0
+
+    def test_zero_disables(self, monkeypatch):
+        monkeypatch.setenv('STARGAZING_DEADLINE_SECONDS', '0')
+        assert request_deadline() is None
+
+    @pytest.mark.parametrize('value', ['-1', 'soon'])
+    def test_rejects_invalid_environment(self, monkeypatch, value):
+        monkeypatch.setenv('STARGAZING_DEADLINE_SECONDS', value)
+        with pytest.raises(ValueError, match='STARGAZING_DEADLINE_SECONDS'):
+            request_deadline()
+
+    def test_tool_default_overrides_environment(self, monkeypatch):
+        monkeypatch.setenv('STARGAZING_DEADLINE_SECONDS', '12')
+        assert request_deadline(300.0).budget_seconds == 300.0
+
+    def test_enclosing_deadline_can_only_shorten(self):
+        outer = Deadline.after(5.0)
+        with deadline_scope(outer):
+            assert request_deadline(60.0) is outer
+            assert request_deadline(1.0) is not outer
+
+
+def test_forecast_stops_between_stages():
+    location = create_earth_location(lat=40.7, lon=-74.0)
+
+    with (
+        deadline_scope(Deadline(time.time() - 1.0, 0.5)),
+        pytest.raises(DeadlineExceededError) as excinfo,
+    ):
+        celestial_module.calculate_nightly_forecast(location, EVENING, limit=5)
+
+    assert excinfo.value.stage == 'moon and planets'
+
+
+@pytest.mark.asyncio
+async def test_executor_abandons_work_and_stops_the_thread():
+    progress = []
+    finished = threading.Event()
+
+    def slow_pipeline():
+        try:
+            for stage in range(50):
+                check_deadline(f'stage {stage}')
+                progress.append(stage)
+                time.sleep(0.02)
+        finally:
+            finished.set()
+
+    with deadline_scope(Deadline.after(0.1)), pytest.raises(DeadlineExceededError):
+        await ComputeExecutor(0).run(slow_pipeline)
+
+    assert await asyncio.to_thread(finished.wait, 2.0)
+    assert 0 < len(progress) < 50
+
+
+@pytest.mark.asyncio
+async def test_client_timeout_meta_reaches_the_tool():
+    """A tiny ``_meta.timeout_ms`` turns a forecast into a DEADLINE_EXCEEDED response."""
+    arguments = {
+        'lon': -74.0,
+        'lat': 40.7,
+        'time': '2024-01-20 22:00:00',
+        'time_zone': 'America/New_York',
+    }
+
+    async with Client(mcp._mcp) as client:
+        result = await client.call_tool('get_nightly_forecast', arguments, meta={'timeout_ms': 1})
+
+    assert result.structured_content['error']['code'] == 'DEADLINE_EXCEEDED'
@@ -0,0 +1,84 @@
+import astropy.units as u
+import numpy as np
+import pytest
+import stargazing_core
+from astropy.coordinates import EarthLocation, get_body, get_sun
+from astropy.time import Time
+
+from src.celestial import get_visible_planets
+from src.ephemeris import EPHEMERIS_BODIES, EphemerisCache, create_ephemeris_cache
+
+TIMES = Time('2024-06-15 02:17:33.25') + np.arange(12) * 7.3 * u.min
+NYC = EarthLocation(lat=40.7128 * u.deg, lon=-74.0060 * u.deg)
+
+
+@pytest.mark.parametrize('name', EPHEMERIS_BODIES)
+def test_cached_positions_match_astropy(name):
+    """Interpolated bucket positions agree with a direct ephemeris evaluation."""
+    expected = get_sun(TIMES) if name == 'sun' else get_body(name, TIMES)
+
+    result = EphemerisCache().body(name, TIMES)
+
+    assert result.shape == TIMES.shape
+    assert np.all(result.obstime == TIMES)
+    assert np.max(result.separation(expected).arcsec) < 1e-3
+    np.testing.assert_allclose(
+        result.distance.to_value(u.km), expected.distance.to_value(u.km), rtol=1e-8
+    )
+
+
+def test_repeat_requests_are_served_from_cache():
+    cache = EphemerisCache()
+    cache.body('moon', TIMES)
+    misses = cache.stats()['misses']
+
+    cache.body('moon', TIMES[3])
+
+    stats = cache.stats()
+    assert stats['misses'] == misses
+    assert stats['hits'] == 2
+
+
+def test_bodies_stacks_names_along_first_axis():
+    coords = EphemerisCache().bodies(['sun', 'Moon'], TIMES[:4])
+    assert coords.shape == (2, 4)
+    assert coords[1, 2].separation(get_body('moon', TIMES[2])).arcsec < 1e-3
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = EphemerisCache(max_entries=4)
+    cache.body('sun', Time('2024-06-15 00:00:30'))
+    cache.body('sun', Time('2024-06-15 01:00:30'))
+    cache.body('sun', Time('2024-06-15 02:00:30'))
+
+    assert cache.stats()['entries'] == 4
+    cache.body('sun', Time('2024-06-15 00:00:30'))
+    assert cache.stats()['hits'] == 0
+
+
+def test_unknown_body_is_rejected():
+    with pytest.raises(ValueError, match='No ephemeris'):
+        EphemerisCache().body('pluto', TIMES)
+
+
+@pytest.mark.parametrize(
+    ('name', 'value'),
+    [('STARGAZING_EPHEMERIS_BUCKET_SECONDS', '0'), ('STARGAZING_EPHEMERIS_CACHE_SIZE', 'lots')],
+)
+def test_create_rejects_invalid_environment(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValueError, match=name):
+        create_ephemeris_cache()
+
+
+def test_visible_planets_match_core_implementation():
+    time = Time('2024-06-15 08:00:00')
+    expected = stargazing_core.get_visible_planets(NYC, time)
+
+    result = get_visible_planets(NYC, time)
+
+    assert [p['name'] for p in result] == [p['name'] for p in expected]
+    for ours, theirs in zip(result, expected, strict=True):
+        assert ours['altitude'] == pytest.approx(theirs['altitude'], abs=1e-6)
+        assert ours['azimuth'] == pytest.approx(theirs['azimuth'], abs=1e-6)
@@ -0,0 +1,73 @@
+import os
+import threading
+from datetime import datetime
+
+import pytest
+import pytz
+
+from src import executor
+from src.celestial import celestial_rise_set
+from src.executor import ComputeExecutor, configure_compute_executor, resolve_worker_count
+from src.utils import create_earth_location
+
+
+class TestResolveWorkerCount:
+    def test_defaults_to_threads(self, monkeypatch):
+        monkeypatch.delenv('STARGAZING_WORKERS', raising=False)
+        assert resolve_worker_count() == 0
+
+    def test_reads_environment(self, monkeypatch):
+        monkeypatch.setenv('STARGAZING_WORKERS', '4')
+        assert resolve_worker_count() == 4
+
+    def test_explicit_value_wins_over_environment(self, monkeypatch):
+        monkeypatch.setenv('STARGAZING_WORKERS', '4')
+        assert resolve_worker_count('2') == 2
+
+    def test_auto_uses_every_cpu(self):
+        assert resolve_worker_count('auto') == (os.cpu_count() or 1)
+
+    @pytest.mark.parametrize('value', ['many', '-1'])
+    def test_rejects_invalid_values(self, value):
+        with pytest.raises(ValueError):
+            resolve_worker_count(value)
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_runs_off_the_event_loop():
+    pool = ComputeExecutor(0)
+
+    thread = await pool.run(threading.current_thread)
+
+    assert thread is not threading.main_thread()
+    assert pool.stats() == {'mode': 'thread', 'workers': 0, 'started': False}
+
+
+@pytest.mark.asyncio
+async def test_process_pool_matches_in_process_results():
+    """Workers warm up, and results (including RiseSetTimes) pickle back intact."""
+    location = create_earth_location(lat=40.7, lon=-74.0)
+    moment = pytz.timezone('America/New_York').localize(datetime(2024, 1, 20, 22))
+    pool = ComputeExecutor(1)
+    try:
+        pool.prewarm()
+        result = await pool.run(celestial_rise_set, 'moon', location, moment)
+        worker_pid = await pool.run(os.getpid)
+    finally:
+        pool.shutdown()
+
+    expected = celestial_rise_set('moon', location, moment)
+    assert worker_pid != os.getpid()
+    assert tuple(result) == tuple(expected)
+    assert result.events == expected.events
+    assert pool.stats()['started'] is False
+
+
+def test_configure_replaces_the_process_wide_executor(monkeypatch):
+    monkeypatch.setattr(executor, '_compute_executor', None)
+
+    configured = configure_compute_executor('3')
+
+    assert executor.get_compute_executor() is configured
+    assert configured.workers == 3
+    assert not configured.stats()['started']
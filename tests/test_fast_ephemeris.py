@@ -0,0 +1,133 @@
+from datetime import datetime
+
+import astropy.units as u
+import numpy as np
+import pytest
+import pytz
+import stargazing_core
+from astropy.coordinates import AltAz, EarthLocation, SkyCoord, get_body, get_sun
+from astropy.time import Time
+
+from src import fast_ephemeris
+from src.celestial import calculate_nightly_forecast, celestial_positions, get_visible_planets
+
+# Sample instants spread over the engine's supported range (2000-2050).
+TIMES = Time('2000-01-01') + np.random.default_rng(7).uniform(0, 50 * 365.25, 120) * u.day
+NYC = EarthLocation(lat=40.7128 * u.deg, lon=-74.0060 * u.deg)
+
+# Worst-case on-sky error in arcminutes, with margin over the measured maxima.
+MAX_ERROR_ARCMIN = {
+    'sun': 1.0,
+    'moon': 2.5,
+    'mercury': 4.0,
+    'venus': 4.0,
+    'mars': 4.0,
+    'jupiter': 4.0,
+    'saturn': 4.0,
+    'uranus': 4.0,
+    'neptune': 4.0,
+}
+
+
+def _sky_error_arcmin(alt, az, reference: AltAz) -> np.ndarray:
+    return fast_ephemeris.angular_separation(az, alt, reference.az.deg, reference.alt.deg) * 60.0
+
+
+@pytest.mark.parametrize('name', fast_ephemeris.FAST_BODIES)
+def test_body_altaz_error_is_bounded(name):
+    """Analytic topocentric positions stay within the documented error of astropy."""
+    reference = get_sun(TIMES) if name == 'sun' else get_body(name, TIMES)
+    reference = reference.transform_to(AltAz(obstime=TIMES, location=NYC))
+
+    jd = fast_ephemeris.julian_date(TIMES)
+    ra, dec, distance = fast_ephemeris.body_position(name, jd)
+    alt, az = fast_ephemeris.horizontal(ra, dec, jd, NYC.lat.deg, NYC.lon.deg, distance)
+
+    assert np.max(_sky_error_arcmin(alt, az, reference)) < MAX_ERROR_ARCMIN[name]
+
+
+def test_fixed_object_altaz_error_is_bounded():
+    rng = np.random.default_rng(3)
+    ra = rng.uniform(0, 360, TIMES.size)
+    dec = rng.uniform(-80, 80, TIMES.size)
+    reference = SkyCoord(ra=ra * u.deg, dec=dec * u.deg).transform_to(
+        AltAz(obstime=TIMES, location=NYC)
+    )
+
+    jd = fast_ephemeris.julian_date(TIMES)
+    ra_date, dec_date = fast_ephemeris.precess_from_j2000(ra, dec, jd)
+    alt, az = fast_ephemeris.horizontal(ra_date, dec_date, jd, NYC.lat.deg, NYC.lon.deg)
+
+    assert np.max(_sky_error_arcmin(alt, az, reference)) < 1.0
+
+
+@pytest.mark.parametrize('day', ['2024-01-11', '2024-01-18', '2024-01-25', '2024-02-02'])
+def test_moon_info_matches_core(day):
+    """Phase name and illumination agree with the astropy-based core calculation."""
+    when = pytz.UTC.localize(datetime.fromisoformat(f'{day} 04:00:00'))
+
+    expected = stargazing_core.calculate_moon_info(when)
+    result = fast_ephemeris.moon_info(fast_ephemeris.julian_date(when))
+
+    assert set(result) == set(expected)
+    assert result['phase_name'] == expected['phase_name']
+    assert result['illumination'] == pytest.approx(expected['illumination'], abs=0.01)
+
+
+def test_julian_date_requires_timezone_aware_datetimes():
+    with pytest.raises(ValueError, match='timezone-aware'):
+        fast_ephemeris.julian_date(datetime(2024, 1, 1))
+
+
+class TestResolvePrecision:
+    def test_defaults_to_full(self, monkeypatch):
+        monkeypatch.delenv('STARGAZING_PRECISION', raising=False)
+        assert fast_ephemeris.resolve_precision() == 'full'
+
+    def test_environment_sets_the_default(self, monkeypatch):
+        monkeypatch.setenv('STARGAZING_PRECISION', 'FAST')
+        assert fast_ephemeris.resolve_precision() == 'fast'
+        assert fast_ephemeris.resolve_precision('full') == 'full'
+
+    def test_rejects_unknown_modes(self):
+        with pytest.raises(ValueError, match='precision'):
+            fast_ephemeris.resolve_precision('medium')
+
+
+def test_fast_positions_match_full_positions():
+    times = [pytz.UTC.localize(datetime(2025, 3, 1, hour, 0)) for hour in (1, 3, 5)]
+    objects = ['moon', 'jupiter', 'M31', 'vega']
+
+    full_alt, full_az = celestial_positions(objects, NYC, times, precision='full')
+    fast_alt, fast_az = celestial_positions(objects, NYC, times, precision='fast')
+
+    assert fast_alt.shape == full_alt.shape
+    np.testing.assert_allclose(fast_alt, full_alt, atol=0.05)
+    azimuth_diff = (fast_az - full_az + 180.0) % 360.0 - 180.0
+    assert np.max(np.abs(azimuth_diff)) < 0.1
+
+
+def test_fast_visible_planets_match_full():
+    when = pytz.UTC.localize(datetime(2025, 3, 1, 3, 0))
+
+    full = get_visible_planets(NYC, when, precision='full')
+    fast = get_visible_planets(NYC, when, precision='fast')
+
+    assert [p['name'] for p in fast] == [p['name'] for p in full]
+    for fast_planet, full_planet in zip(fast, full, strict=True):
+        assert fast_planet['altitude'] == pytest.approx(full_planet['altitude'], abs=0.05)
+
+
+def test_fast_forecast_matches_full_forecast():
+    """Fast scoring applies the core rules, so the curated list is the same."""
+    when = pytz.UTC.localize(datetime(2024, 1, 20, 3, 0))
+
+    full = calculate_nightly_forecast(NYC, when, limit=20, precision='full')
+    fast = calculate_nightly_forecast(NYC, when, limit=20, precision='fast')
+
+    assert fast['moon_phase']['phase_name'] == full['moon_phase']['phase_name']
+    full_names = [obj['name'] for obj in full['deep_sky']]
+    fast_names = [obj['name'] for obj in fast['deep_sky']]
+    assert len(set(fast_names) & set(full_names)) >= 18
+    for obj in fast['deep_sky']:
+        assert set(obj) >= {'name', 'type', 'magnitude', 'altitude', 'azimuth', 'catalog'}
@@ -1,9 +1,10 @@
+import math
 from datetime import datetime
 
 import pytest
 import pytz
 
-from src.celestial import calculate_nightly_forecast
+from src.celestial import calculate_nightly_forecast, iter_nightly_forecast
 from src.utils import create_earth_location
 
 
@@ -81,3 +82,94 @@ async def test_moon_penalty():
 
     # Verify we still get results
     assert len(deep_sky) > 0
+
+
+@pytest.mark.parametrize('precision', ['full', 'fast'])
+def test_multi_night_forecast_matches_single_nights(precision):
+    """Each night of a multi-night forecast agrees with a one-night forecast for it."""
+    loc = create_earth_location(lat=40.7, lon=-74.0)
+    zone = pytz.timezone('America/New_York')
+    start = zone.localize(datetime(2024, 3, 8, 22, 0))  # nights span the DST change
+
+    forecast = calculate_nightly_forecast(loc, start, limit=10, precision=precision, nights=4)
+
+    nights = forecast['nights']
+    assert [night['night_of'] for night in nights] == [
+        '2024-03-08',
+        '2024-03-09',
+        '2024-03-10',
+        '2024-03-11',
+    ]
+    assert nights[3]['time'] == '2024-03-11T22:00:00-04:00'
+    assert forecast['deep_sky'] == nights[0]['deep_sky']
+
+    for night in nights:
+        single = calculate_nightly_forecast(
+            loc, datetime.fromisoformat(night['time']), limit=10, precision=precision
+        )
+        assert [o['name'] for o in night['deep_sky']] == [o['name'] for o in single['deep_sky']]
+        assert night['moon_phase']['illumination'] == pytest.approx(
+            single['moon_phase']['illumination'], abs=1e-6
+        )
+        assert [p['name'] for p in night['planets']] == [p['name'] for p in single['planets']]
+        if precision == 'full':
+            assert night['dark_hours'] == single['night']['dark_hours']
+            assert night['darkness_score'] == single['night']['darkness_score']
+        else:
+            assert night['night'] is None
+
+
+def test_multi_night_forecast_picks_the_darkest_night():
+    loc = create_earth_location(lat=51.5, lon=0.0)
+    # Full Moon on Jan 25, new Moon on Feb 9.
+    start = datetime(2024, 1, 25, 22, 0, tzinfo=pytz.UTC)
+
+    forecast = calculate_nightly_forecast(loc, start, limit=5, precision='fast', nights=16)
+
+    scores = {night['night_of']: night['darkness_score'] for night in forecast['nights']}
+    assert scores['2024-01-25'] < 10
+    assert scores[forecast['best_night']] == max(scores.values())
+    assert forecast['best_night'] >= '2024-02-01'
+
+
+@pytest.mark.parametrize('nights', [0, 32])
+def test_multi_night_forecast_rejects_out_of_range_nights(nights):
+    loc = create_earth_location(lat=51.5, lon=0.0)
+    with pytest.raises(ValueError, match='nights'):
+        calculate_nightly_forecast(
+            loc, datetime(2024, 1, 15, 22, 0, tzinfo=pytz.UTC), nights=nights
+        )
+
+
+@pytest.mark.parametrize('precision', ['full', 'fast'])
+def test_streamed_forecast_matches_one_shot(precision):
+    """Batches arrive best-so-far; the final ranking does not depend on batch size."""
+    loc = create_earth_location(lat=40.7, lon=-74.0)
+    moment = pytz.timezone('America/New_York').localize(datetime(2024, 3, 10, 22))
+
+    events = list(iter_nightly_forecast(loc, moment, limit=15, precision=precision, batch_size=400))
+
+    stages = [event['stage'] for event in events]
+    assert stages[0] == 'context' and stages[-1] == 'complete'
+    assert set(stages[1:-1]) == {'deep_sky'} and len(stages) > 3
+    assert events[0]['forecast']['deep_sky'] == []
+    progress = [event['progress'] for event in events]
+    assert progress == sorted(progress) and progress[-1] == 1.0
+
+    one_shot = calculate_nightly_forecast(loc, moment, limit=15, precision=precision)
+    assert events[-1]['forecast'] == one_shot
+    assert all(obj['constellation'] for obj in one_shot['deep_sky'])
+    scores = [obj['score'] for obj in events[-2]['forecast']['deep_sky']]
+    assert scores == sorted(scores)
+
+
+def test_objects_without_magnitude_rank_last():
+    loc = create_earth_location(lat=40.7, lon=-74.0)
+    moment = pytz.timezone('America/New_York').localize(datetime(2024, 3, 10, 22))
+
+    deep_sky = calculate_nightly_forecast(loc, moment, limit=100)['deep_sky']
+
+    unknown = [math.isnan(obj['score']) for obj in deep_sky]
+    assert unknown == sorted(unknown)
+    scores = [obj['score'] for obj in deep_sky if not math.isnan(obj['score'])]
+    assert scores == sorted(scores)
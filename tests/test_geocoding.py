@@ -15,6 +15,7 @@ from src.functions.weather.geocoding import (
     _geocode_nominatim,
     _geocode_photon,
     resolve_place_name,
+    resolve_place_name_async,
 )
 from src.response import MCPError
 
@@ -57,7 +58,7 @@ def test_resolve_place_name_empty():
 
 
 def test_geocode_amap_success():
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
             'status': '1',
@@ -77,7 +78,7 @@ def test_geocode_amap_success():
 
 
 def test_geocode_amap_empty_geocodes():
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {'status': '1', 'geocodes': []}
         mock_get.return_value = mock_resp
@@ -88,7 +89,7 @@ def test_geocode_amap_empty_geocodes():
 
 
 def test_geocode_amap_http_error():
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_get.side_effect = requests.ConnectionError('unreachable')
 
         result = _geocode_amap('北京', 'test_key')
@@ -97,7 +98,7 @@ def test_geocode_amap_http_error():
 
 
 def test_geocode_amap_malformed_location():
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
             'status': '1',
@@ -112,7 +113,7 @@ def test_geocode_amap_malformed_location():
 
 def test_geocode_amap_non_success_status():
     """Amap returns a non-1 status code → treated as failure."""
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {'status': '0', 'info': 'INVALID_KEY'}
         mock_get.return_value = mock_resp
@@ -124,7 +125,7 @@ def test_geocode_amap_non_success_status():
 
 def test_geocode_amap_province_level_ok():
     """Short province query (e.g. '浙江') → returns province-level result ok."""
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
             'status': '1',
@@ -145,7 +146,7 @@ def test_geocode_amap_province_level_ok():
 
 def test_geocode_amap_structured_address():
     """Structured address like '浙江安吉' → resolved by Amap's own parser."""
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
             'status': '1',
@@ -168,7 +169,7 @@ def test_geocode_amap_structured_address():
 
 
 def test_geocode_photon_success():
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
             'features': [
@@ -187,7 +188,7 @@ def test_geocode_photon_success():
 
 def test_geocode_photon_display_name_construction():
     """Display name includes all available properties."""
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
             'features': [
@@ -210,7 +211,7 @@ def test_geocode_photon_display_name_construction():
 
 
 def test_geocode_photon_empty_features():
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {'features': []}
         mock_get.return_value = mock_resp
@@ -221,7 +222,7 @@ def test_geocode_photon_empty_features():
 
 
 def test_geocode_photon_missing_coordinates():
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
             'features': [
@@ -239,7 +240,7 @@ def test_geocode_photon_missing_coordinates():
 
 
 def test_geocode_photon_http_error():
-    with patch('src.functions.weather.geocoding.requests.get') as mock_get:
+    with patch('src.functions.weather.geocoding.http_get') as mock_get:
         mock_get.side_effect = requests.ConnectionError('unreachable')
 
         result = _geocode_photon('Tokyo')
@@ -447,3 +448,72 @@ def test_resolve_place_name_success():
     assert loc.lat == 39.9
     assert loc.lon == 116.4
     assert loc.timezone is None
+
+
+# ── async path ───────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_resolve_place_name_async_uses_photon():
+    import httpx
+
+    response = httpx.Response(
+        200,
+        json={
+            'features': [
+                {
+                    'properties': {'name': 'Paris', 'country': 'France'},
+                    'geometry': {'coordinates': [2.35, 48.86]},
+                }
+            ]
+        },
+        request=httpx.Request('GET', _gc._PHOTON_API),
+    )
+    with patch('src.functions.weather.geocoding.async_http_get', return_value=response):
+        loc = await resolve_place_name_async('Paris')
+
+    assert (loc.name, loc.lat, loc.lon) == ('Paris, France', 48.86, 2.35)
+
+
+@pytest.mark.asyncio
+async def test_resolve_place_name_async_falls_back_to_nominatim():
+    with (
+        patch(
+            'src.functions.weather.geocoding.async_http_get',
+            side_effect=requests.ConnectionError('unreachable'),
+        ),
+        patch(
+            'src.functions.weather.geocoding._geocode_nominatim',
+            return_value=('Somewhere', 1.0, 2.0, 'nominatim'),
+        ),
+    ):
+        loc = await resolve_place_name_async('Somewhere')
+
+    assert (loc.lat, loc.lon) == (1.0, 2.0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_of_one_place_share_a_request():
+    import asyncio
+
+    import httpx
+
+    async def slow_photon(url, **kwargs):
+        await asyncio.sleep(0.05)
+        return httpx.Response(
+            200,
+            json={
+                'features': [
+                    {'properties': {'name': 'Oslo'}, 'geometry': {'coordinates': [10.7, 59.9]}}
+                ]
+            },
+            request=httpx.Request('GET', url),
+        )
+
+    with patch('src.functions.weather.geocoding.async_http_get', side_effect=slow_photon) as get:
+        places = await asyncio.gather(
+            resolve_place_name_async('Oslo'), resolve_place_name_async('  oslo ')
+        )
+
+    assert get.call_count == 1
+    assert places[0] == places[1]
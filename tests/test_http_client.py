@@ -0,0 +1,141 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from src.http_client import AsyncHttpClient, HttpClient, create_http_client, run_sync
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_GET(self):
+        body = json.dumps({'path': self.path, 'agent': self.headers['User-Agent']}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', 'session=abc')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _JsonHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_repeat_requests_reuse_one_connection(server_url):
+    client = HttpClient()
+
+    for index in range(3):
+        response = client.get(f'{server_url}/item/{index}')
+        assert response.json()['path'] == f'/item/{index}'
+
+    host = server_url.removeprefix('http://')
+    usage = client.stats()['hosts'][host]
+    assert usage['requests'] == 3
+    assert usage['failures'] == 0
+    assert usage['connections_opened'] == 1
+    assert usage['idle_connections'] == 1
+    client.close()
+
+
+def test_sends_user_agent_and_drops_cookies(server_url):
+    client = HttpClient()
+
+    assert client.get(server_url).json()['agent'] == 'mcp-stargazing/1.0'
+    assert len(client._session.cookies) == 0
+    client.close()
+
+
+def test_counts_failures_and_keeps_requests_exceptions():
+    client = HttpClient(connect_timeout=0.5, read_timeout=0.5)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get('http://127.0.0.1:9/unreachable')
+
+    usage = client.stats()['hosts']['127.0.0.1:9']
+    assert (usage['requests'], usage['failures']) == (1, 1)
+
+
+def test_default_timeout_applies_unless_given():
+    client = HttpClient(connect_timeout=2.0, read_timeout=7.0)
+
+    with patch.object(client._session, 'get') as session_get:
+        client.get('https://example.org/a')
+        client.get('https://example.org/b', timeout=3)
+
+    assert session_get.call_args_list[0].kwargs['timeout'] == (2.0, 7.0)
+    assert session_get.call_args_list[1].kwargs['timeout'] == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_reuses_one_connection(server_url):
+    client = AsyncHttpClient()
+
+    responses = [await client.get(f'{server_url}/item/{index}') for index in range(3)]
+
+    assert [response.json()['path'] for response in responses] == ['/item/0', '/item/1', '/item/2']
+    usage = client.stats()['hosts'][server_url.removeprefix('http://')]
+    assert (usage['requests'], usage['connections_opened']) == (3, 1)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_client_raises_requests_exceptions():
+    client = AsyncHttpClient(connect_timeout=0.5, read_timeout=0.5)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        await client.get('http://127.0.0.1:9/unreachable')
+
+    assert client.stats()['hosts']['127.0.0.1:9']['failures'] == 1
+    await client.aclose()
+
+
+def test_run_sync_shares_one_background_loop():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert run_sync(current_loop()) is run_sync(current_loop())
+
+
+def test_run_sync_refuses_to_block_its_own_loop():
+    async def noop():
+        return None
+
+    async def nested():
+        with pytest.raises(RuntimeError, match='background loop'):
+            run_sync(noop())
+        return True
+
+    assert run_sync(nested())
+
+
+class TestCreateHttpClient:
+    def test_reads_environment(self, monkeypatch):
+        monkeypatch.setenv('STARGAZING_HTTP_POOL_SIZE', '4')
+        monkeypatch.setenv('STARGAZING_HTTP_READ_TIMEOUT', '30')
+
+        stats = create_http_client().stats()
+
+        assert stats['pool_size'] == 4
+        assert stats['timeout_seconds'] == [5.0, 30.0]
+
+    @pytest.mark.parametrize('value', ['0', '-1', 'many'])
+    def test_rejects_invalid_values(self, monkeypatch, value):
+        monkeypatch.setenv('STARGAZING_HTTP_POOL_SIZE', value)
+
+        with pytest.raises(ValueError, match='STARGAZING_HTTP_POOL_SIZE'):
+            create_http_client()
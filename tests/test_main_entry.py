@@ -20,6 +20,8 @@ class TestArgParse:
             assert args.port == 3001
             assert args.path == '/shttp'
             assert args.proxy is None
+            assert args.warmup is None
+            assert args.workers is None
 
     def test_custom_mode_port_path(self):
         """Custom mode, port, and path are parsed correctly."""
@@ -215,3 +217,91 @@ class TestHealthCheck:
         assert body['status'] == 'healthy'
         assert body['service'] == 'mcp-stargazing'
         assert 'version' in body
+        assert body['http']['sync']['pool_size'] > 0
+        assert body['http']['async']['pool_size'] > 0
+
+    def test_health_reports_readiness_separately(self):
+        """Liveness stays 200 while readiness follows the warm-up state."""
+        import asyncio
+        import json
+
+        from src.main import health_check
+
+        with patch('src.main.get_warmup_state') as mock_state:
+            mock_state.return_value.ready = False
+            response = asyncio.run(health_check(self._make_mock_request()))
+
+        body = json.loads(response.body)
+        assert response.status_code == 200
+        assert body['status'] == 'healthy'
+        assert body['ready'] is False
+
+
+class TestReadinessCheck:
+    """Tests for the /ready HTTP endpoint."""
+
+    @staticmethod
+    def _call(state):
+        import asyncio
+        import json
+        from unittest.mock import MagicMock
+
+        from src.main import readiness_check
+
+        with patch('src.main.get_warmup_state', return_value=state):
+            response = asyncio.run(readiness_check(MagicMock()))
+        return response.status_code, json.loads(response.body)
+
+    def test_not_ready_while_warming_up(self):
+        from src.warmup import WarmupState
+
+        state = WarmupState()
+        state.mark_pending()
+
+        status_code, body = self._call(state)
+        assert status_code == 503
+        assert body['status'] == 'warming_up'
+        assert body['warmup']['status'] == 'pending'
+
+    def test_ready_after_warmup_with_step_timings(self):
+        from src.warmup import WarmupState, run_warmup
+
+        state = run_warmup(WarmupState(), steps=(('astropy', lambda: None),))
+
+        status_code, body = self._call(state)
+        assert status_code == 200
+        assert body['status'] == 'ready'
+        assert [step['name'] for step in body['warmup']['steps']] == ['astropy']
+
+
+def test_main_starts_warmup_with_cli_mode():
+    """``--warmup`` is forwarded to the warm-up runner before the transport starts."""
+    with (
+        patch.object(sys, 'argv', ['mcp-stargazing', '--mode', 'local', '--warmup', 'blocking']),
+        patch('src.main.mcp.run') as mock_run,
+        patch('src.main.start_warmup') as mock_warmup,
+    ):
+        from src.main import main
+
+        mock_warmup.side_effect = lambda mode: mock_run.assert_not_called()
+        main()
+
+    mock_warmup.assert_called_once_with('blocking')
+    mock_run.assert_called_once()
+
+
+def test_main_configures_worker_pool_from_cli():
+    """``--workers`` sizes the compute pool, which starts before the transport."""
+    with (
+        patch.object(sys, 'argv', ['mcp-stargazing', '--mode', 'local', '--workers', '4']),
+        patch('src.main.mcp.run') as mock_run,
+        patch('src.main.start_warmup'),
+        patch('src.main.configure_compute_executor') as mock_configure,
+    ):
+        from src.main import main
+
+        main()
+
+    mock_configure.assert_called_once_with('4')
+    mock_configure.return_value.start.assert_called_once_with()
+    mock_run.assert_called_once()
@@ -17,9 +17,11 @@ from conftest import (
 EXPECTED_TOOLS = {
     'analysis_area',
     'get_celestial_pos',
+    'get_celestial_positions',
     'get_celestial_rise_set',
     'get_best_stargazing_plan',
     'get_constellation',
+    'get_constellation_objects',
     'get_local_datetime_info',
     'get_moon_info',
     'get_nightly_forecast',
@@ -28,8 +30,10 @@ EXPECTED_TOOLS = {
     'get_tool_catalog',
     'get_weather_by_name',
     'get_weather_by_position',
+    'identify_constellations',
     'light_pollution_map',
     'list_visible_planets',
+    'stream_nightly_forecast',
 }
 
 
@@ -320,9 +324,11 @@ def test_tools_list_returns_all_expected_tools(running_mcp_server):
     expected = {
         'analysis_area',
         'get_celestial_pos',
+        'get_celestial_positions',
         'get_celestial_rise_set',
         'get_best_stargazing_plan',
         'get_constellation',
+        'get_constellation_objects',
         'get_local_datetime_info',
         'get_moon_info',
         'get_nightly_forecast',
@@ -331,7 +337,9 @@ def test_tools_list_returns_all_expected_tools(running_mcp_server):
         'get_tool_catalog',
         'get_weather_by_name',
         'get_weather_by_position',
+        'identify_constellations',
         'light_pollution_map',
         'list_visible_planets',
+        'stream_nightly_forecast',
     }
     assert tools == expected
@@ -1,15 +1,17 @@
 """Tests for MCP tool wrappers not covered by other test files."""
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastmcp import Client
 
 from src.functions.celestial.impl import (
     get_constellation,
     get_moon_info,
     get_nightly_forecast,
     list_visible_planets,
+    stream_nightly_forecast,
 )
 from src.functions.metadata.impl import get_tool_catalog
 from src.functions.places.impl import analysis_area, light_pollution_map
@@ -18,13 +20,16 @@ from src.functions.telescope.impl import get_shooting_plan, get_telescope_target
 from src.functions.time.impl import get_local_datetime_info
 from src.functions.weather.impl import get_weather_by_name, get_weather_by_position
 from src.response import MCPError
+from src.server_instance import mcp
 
 EXPECTED_TOOLS = {
     'analysis_area',
     'get_celestial_pos',
+    'get_celestial_positions',
     'get_celestial_rise_set',
     'get_best_stargazing_plan',
     'get_constellation',
+    'get_constellation_objects',
     'get_local_datetime_info',
     'get_moon_info',
     'get_nightly_forecast',
@@ -33,8 +38,10 @@ EXPECTED_TOOLS = {
     'get_tool_catalog',
     'get_weather_by_name',
     'get_weather_by_position',
+    'identify_constellations',
     'light_pollution_map',
     'list_visible_planets',
+    'stream_nightly_forecast',
 }
 
 # ---------------------------------------------------------------------------
@@ -76,7 +83,7 @@ async def test_get_best_stargazing_plan_fn():
                 '_meta': {'status': 'success'},
             }
         )
-        mock_weather.fn = Mock(
+        mock_weather.fn = AsyncMock(
             side_effect=lambda lat, lon, provider: {
                 'data': {
                     'summary': {
@@ -177,7 +184,7 @@ async def test_get_best_stargazing_plan_keeps_partial_results_when_weather_fails
                 '_meta': {'status': 'success'},
             }
         )
-        mock_weather.fn = Mock(
+        mock_weather.fn = AsyncMock(
             return_value={
                 'error': {'code': 'EXTERNAL_API_ERROR', 'message': '天气查询失败: timeout'},
                 '_meta': {'status': 'error'},
@@ -268,6 +275,84 @@ async def test_get_nightly_forecast_fn():
     assert len(data['deep_sky']) == 1
     assert data['deep_sky'][0]['name'] == 'M31'
     assert data['deep_sky'][0]['catalog'] == 'M'
+    assert data['nights'] is None
+
+
+@pytest.mark.asyncio
+async def test_get_nightly_forecast_fn_multiple_nights():
+    """``nights`` returns one summary per night plus the darkest night."""
+    result = await get_nightly_forecast.fn(
+        lon=-74.0,
+        lat=40.7,
+        time='2024-06-15 22:00:00',
+        time_zone='America/New_York',
+        limit=3,
+        precision='fast',
+        nights=3,
+    )
+
+    assert result['_meta']['status'] == 'success'
+    data = result['data']
+    assert [night['night_of'] for night in data['nights']] == [
+        '2024-06-15',
+        '2024-06-16',
+        '2024-06-17',
+    ]
+    assert data['best_night'] in {night['night_of'] for night in data['nights']}
+    assert all(len(night['deep_sky']) <= 3 for night in data['nights'])
+    assert data['deep_sky'] == data['nights'][0]['deep_sky']
+
+
+@pytest.mark.asyncio
+async def test_stream_nightly_forecast_sends_partials_before_the_result():
+    """Moon and planets arrive first, then ranked batches, then the full response."""
+    progress, partials = [], []
+
+    async def on_progress(value, total, message):
+        progress.append((value, total, message))
+
+    async def on_log(message):
+        partials.append(message.data['extra'])
+
+    arguments = {
+        'lon': -74.0,
+        'lat': 40.7,
+        'time': '2024-03-10 22:00:00',
+        'time_zone': 'America/New_York',
+        'limit': 5,
+        'precision': 'fast',
+    }
+    async with Client(mcp._mcp, log_handler=on_log) as client:
+        result = await client.call_tool(
+            'stream_nightly_forecast', arguments, progress_handler=on_progress
+        )
+
+    final = result.structured_content
+    assert final['_meta']['progress'] == 1.0
+    assert progress[0] == (0.0, 1.0, 'Moon, planets and night almanac ready')
+    assert len(progress) == len(partials) > 2
+    assert partials[0]['data']['deep_sky'] == []
+    assert partials[0]['data']['moon_phase'] == final['data']['moon_phase']
+    assert [p['name'] for p in partials[-1]['data']['deep_sky']] == [
+        p['name'] for p in final['data']['deep_sky']
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_nightly_forecast_fn_returns_the_final_forecast():
+    """Called directly (no MCP request), the tool just returns the result."""
+    result = await stream_nightly_forecast.fn(
+        lon=-74.0,
+        lat=40.7,
+        time='2024-03-10 22:00:00',
+        time_zone='America/New_York',
+        limit=3,
+        precision='fast',
+    )
+
+    assert result['_meta']['progress'] == 1.0
+    assert len(result['data']['deep_sky']) == 3
+    assert result['data']['nights'] is None
 
 
 @pytest.mark.asyncio
@@ -653,58 +738,64 @@ def test_get_tool_catalog_fn():
 # ---------------------------------------------------------------------------
 
 
-def test_get_weather_by_name_empty_place():
+@pytest.mark.asyncio
+async def test_get_weather_by_name_empty_place():
     """``get_weather_by_name`` returns error for empty place_name."""
-    result = get_weather_by_name.fn('')
+    result = await get_weather_by_name.fn('')
 
     assert result['_meta']['status'] == 'error'
     assert result['error']['code'] == MCPError.CONFIGURATION_ERROR
     assert '不能为空' in result['error']['message']
 
 
-def test_get_weather_by_name_invalid_provider():
+@pytest.mark.asyncio
+async def test_get_weather_by_name_invalid_provider():
     """``get_weather_by_name`` returns error for unsupported provider."""
-    result = get_weather_by_name.fn('Beijing', provider='invalid_provider')
+    result = await get_weather_by_name.fn('Beijing', provider='invalid_provider')
 
     assert result['_meta']['status'] == 'error'
     assert result['error']['code'] == MCPError.CONFIGURATION_ERROR
     assert 'Unsupported provider' in result['error']['message']
 
 
-def test_get_weather_by_position_invalid_coords():
+@pytest.mark.asyncio
+async def test_get_weather_by_position_invalid_coords():
     """``get_weather_by_position`` returns error for invalid coordinates."""
-    result = get_weather_by_position.fn(lat=91.0, lon=0.0)  # latitude > 90
+    result = await get_weather_by_position.fn(lat=91.0, lon=0.0)  # latitude > 90
 
     assert result['_meta']['status'] == 'error'
     assert result['error']['code'] == MCPError.INVALID_COORDINATES
 
 
-def test_get_weather_by_position_invalid_provider():
+@pytest.mark.asyncio
+async def test_get_weather_by_position_invalid_provider():
     """``get_weather_by_position`` returns error for unsupported provider."""
-    result = get_weather_by_position.fn(lat=40.0, lon=116.0, provider='unknown')
+    result = await get_weather_by_position.fn(lat=40.0, lon=116.0, provider='unknown')
 
     assert result['_meta']['status'] == 'error'
     assert result['error']['code'] == MCPError.CONFIGURATION_ERROR
 
 
-@patch('src.functions.weather.impl.get_aggregated_weather_by_name')
-def test_get_weather_by_name_generic_exception(mock_service):
+@patch('src.functions.weather.impl.get_aggregated_weather_by_name_async')
+@pytest.mark.asyncio
+async def test_get_weather_by_name_generic_exception(mock_service):
     """``get_weather_by_name`` catches generic Exception and returns error response."""
     mock_service.side_effect = RuntimeError('Something unexpected')
 
-    result = get_weather_by_name.fn('Beijing')
+    result = await get_weather_by_name.fn('Beijing')
 
     assert result['_meta']['status'] == 'error'
     assert result['error']['code'] == MCPError.EXTERNAL_API_ERROR
     assert '天气查询失败' in result['error']['message']
 
 
-@patch('src.functions.weather.impl.get_aggregated_weather_by_position')
-def test_get_weather_by_position_generic_exception(mock_service):
+@patch('src.functions.weather.impl.get_aggregated_weather_by_position_async')
+@pytest.mark.asyncio
+async def test_get_weather_by_position_generic_exception(mock_service):
     """``get_weather_by_position`` catches generic Exception and returns error response."""
     mock_service.side_effect = RuntimeError('Boom')
 
-    result = get_weather_by_position.fn(lat=40.0, lon=116.0)
+    result = await get_weather_by_position.fn(lat=40.0, lon=116.0)
 
     assert result['_meta']['status'] == 'error'
     assert result['error']['code'] == MCPError.EXTERNAL_API_ERROR
@@ -1009,6 +1100,35 @@ async def test_get_celestial_pos_fn():
     assert data['azimuth'] == 180.0
 
 
+@pytest.mark.asyncio
+async def test_get_celestial_positions_fn():
+    """``get_celestial_positions.fn`` returns object × time altitude/azimuth matrices."""
+    import numpy as np
+
+    from src.functions.celestial.impl import get_celestial_positions
+
+    with patch('src.functions.celestial.impl.celestial_positions') as mock_calc:
+        mock_calc.return_value = (
+            np.array([[10.0, 20.0], [30.0, 40.0]]),
+            np.array([[90.0, 100.0], [180.0, 190.0]]),
+        )
+
+        result = await get_celestial_positions.fn(
+            celestial_objects=['moon', 'M31'],
+            lon=-74.0,
+            lat=40.0,
+            times=['2024-06-15 22:00:00', '2024-06-15 23:00:00'],
+            time_zone='America/New_York',
+        )
+
+    assert result['_meta']['status'] == 'success'
+    data = result['data']
+    assert data['objects'] == ['moon', 'M31']
+    assert data['times'] == ['2024-06-15T22:00:00-04:00', '2024-06-15T23:00:00-04:00']
+    assert data['altitude'] == [[10.0, 20.0], [30.0, 40.0]]
+    assert data['azimuth'][1] == [180.0, 190.0]
+
+
 @pytest.mark.asyncio
 async def test_get_celestial_rise_set_fn():
     """``get_celestial_rise_set.fn`` returns rise/set times."""
@@ -1039,6 +1159,33 @@ async def test_get_celestial_rise_set_fn():
     data = result['data']
     assert data['rise_time'] is not None
     assert data['set_time'] is not None
+    assert data['events'] == []
+
+
+@pytest.mark.asyncio
+async def test_get_celestial_rise_set_fn_lists_every_crossing():
+    """Crossings carried by ``RiseSetTimes.events`` are returned in order."""
+    from datetime import UTC, datetime
+
+    from src.celestial import RiseSetTimes
+    from src.functions.celestial.impl import get_celestial_rise_set
+
+    moonset = datetime(2023, 10, 1, 13, 21, tzinfo=UTC)
+    moonrise = datetime(2023, 10, 1, 23, 58, tzinfo=UTC)
+    with patch('src.functions.celestial.impl.celestial_rise_set') as mock_calc:
+        mock_calc.return_value = RiseSetTimes(
+            moonrise, moonset, [('set', moonset), ('rise', moonrise)]
+        )
+        result = await get_celestial_rise_set.fn(
+            celestial_object='moon',
+            lon=-74.0,
+            lat=40.7,
+            time='2023-10-01 00:00:00',
+            time_zone='UTC',
+        )
+
+    assert [e['event'] for e in result['data']['events']] == ['set', 'rise']
+    assert result['data']['events'][0]['time'] == moonset.isoformat()
 
 
 # ---------------------------------------------------------------------------
@@ -1307,3 +1454,18 @@ async def test_light_pollution_map_spf_data_error():
         )
     except ImportError:
         pytest.skip('stargazingplacefinder not available in this environment')
+
+
+@pytest.mark.asyncio
+async def test_get_moon_info_reports_moonrise_and_moonset_for_the_night():
+    """With a location, moonrise/moonset come from the night almanac as unix timestamps."""
+    result = await get_moon_info.fn(
+        time='2024-01-20 22:00:00', time_zone='America/New_York', lat=40.7, lon=-74.0
+    )
+
+    data = result['data']
+    assert result['_meta']['status'] == 'success'
+    assert data['moonset'] == pytest.approx(
+        datetime(2024, 1, 21, 8, 59, 8, tzinfo=UTC).timestamp(), abs=120
+    )
+    assert data['moonrise'] is not None
@@ -0,0 +1,161 @@
+from datetime import date, datetime
+
+import astropy.units as u
+import numpy as np
+import pytest
+import pytz
+from astropy.coordinates import EarthLocation
+from astropy.time import Time
+
+import src.celestial as celestial_module
+from src.almanac import compute_night_almanac
+from src.functions.telescope.impl import _rank_by_observability
+from src.observability import (
+    catalog_observability,
+    compute_observability,
+    night_observability,
+    night_windows,
+    solar_dark_window,
+)
+from src.observer_frame import ObserverFrame
+
+NEW_YORK = pytz.timezone('America/New_York')
+LAT, LON = 40.7, -74.0
+NYC = EarthLocation.from_geodetic(LON * u.deg, LAT * u.deg)
+MIDNIGHT = NEW_YORK.localize(datetime(2024, 1, 21, 0, 0)).timestamp()
+
+
+@pytest.fixture(scope='module')
+def winter_night():
+    return compute_night_almanac(LAT, LON, date(2024, 1, 20), NEW_YORK)
+
+
+@pytest.fixture(scope='module')
+def sample():
+    catalog = celestial_module._load_objects()
+    rows = np.arange(0, len(catalog), 97)
+    return catalog.column('ra')[rows].astype(float), catalog.column('dec')[rows].astype(float)
+
+
+def _altitudes(ra, dec, unix_times):
+    alt, _ = ObserverFrame(NYC, Time(unix_times, format='unix')).altaz(ra, dec)
+    return alt
+
+
+def test_rise_set_and_transit_match_astropy(sample):
+    ra, dec = sample
+    result = compute_observability(ra, dec, LAT, LON, MIDNIGHT)
+
+    crosses = np.isfinite(result.rise)
+    assert crosses.sum() > 50
+    for times in (result.rise, result.set):
+        alt = np.diagonal(_altitudes(ra[crosses], dec[crosses], times[crosses]))
+        assert np.max(np.abs(alt)) < 0.02  # about 5 s of time
+
+    # Altitude one minute either side of transit is lower than at transit.
+    peak = np.diagonal(_altitudes(ra, dec, result.transit))
+    for offset in (-60.0, 60.0):
+        assert np.all(np.diagonal(_altitudes(ra, dec, result.transit + offset)) < peak)
+    assert np.abs(result.transit - MIDNIGHT).max() <= 12 * 3600
+    np.testing.assert_allclose(result.transit_altitude, peak, atol=0.02)
+
+
+def test_observable_hours_match_a_minute_grid(sample, winter_night):
+    ra, dec = sample
+    windows = night_windows(winter_night)
+    result = compute_observability(ra, dec, LAT, LON, MIDNIGHT, windows, min_altitude_deg=20.0)
+
+    start, end = windows[0]
+    grid = np.arange(start, end, 60.0) + 30.0
+    expected = (_altitudes(ra, dec, grid) > 20.0).sum(axis=1) / 60.0
+    np.testing.assert_allclose(result.observable_hours, expected, atol=0.03)
+
+
+def test_circumpolar_and_never_rising_objects():
+    windows = [(MIDNIGHT - 5 * 3600, MIDNIGHT + 5 * 3600)]
+    result = compute_observability(
+        np.array([37.95, 120.0]), np.array([89.26, -80.0]), LAT, LON, MIDNIGHT, windows
+    )
+
+    polaris, southern = result.row(0), result.row(1)
+    assert polaris['rise_time'] is None and polaris['set_time'] is None
+    assert polaris['observable_hours'] == pytest.approx(10.0)
+    assert southern['rise_time'] is None
+    assert southern['observable_hours'] == 0.0
+    assert southern['transit_alt'] < 0
+
+
+def test_observable_hours_need_windows():
+    ra, dec = np.array([10.0]), np.array([41.0])
+    assert compute_observability(ra, dec, LAT, LON, MIDNIGHT).row(0)['observable_hours'] is None
+    assert compute_observability(ra, dec, LAT, LON, MIDNIGHT, []).row(0)['observable_hours'] == 0
+
+
+def test_whole_catalog_in_one_pass():
+    catalog = celestial_module._load_objects()
+    result = catalog_observability(catalog, LAT, LON, MIDNIGHT, [(MIDNIGHT, MIDNIGHT + 3600)])
+
+    assert len(result) == len(catalog)
+    subset = result.take(np.array([5, 1]))
+    assert subset.row(0) == result.row(5)
+    assert subset.row(1) == result.row(1)
+
+
+def test_solar_dark_window_matches_almanac(winter_night):
+    dusk, dawn = solar_dark_window(LAT, LON, MIDNIGHT)
+
+    assert dusk == pytest.approx(winter_night.astronomical_dusk.timestamp(), abs=120)
+    assert dawn == pytest.approx(winter_night.astronomical_dawn.timestamp(), abs=120)
+
+
+def test_solar_dark_window_at_high_latitude():
+    zone = pytz.timezone('Arctic/Longyearbyen')
+    summer = zone.localize(datetime(2024, 6, 22, 0, 0)).timestamp()
+    winter = zone.localize(datetime(2024, 12, 22, 0, 0)).timestamp()
+
+    assert solar_dark_window(78.2, 15.6, summer) is None
+    # Svalbard's polar night still has twilight; near the pole it is dark all day.
+    dusk, dawn = solar_dark_window(78.2, 15.6, winter)
+    assert 12 * 3600 < dawn - dusk < 18 * 3600
+    dusk, dawn = solar_dark_window(89.0, 0.0, winter)
+    assert dawn - dusk == pytest.approx(86400.0)
+
+
+def test_night_observability_uses_analytic_sun_without_almanac(winter_night):
+    ra, dec = np.array([10.68]), np.array([41.27])  # M31
+    moment = NEW_YORK.localize(datetime(2024, 1, 20, 21, 0))
+
+    with_almanac = night_observability(ra, dec, NYC, moment, winter_night).row(0)
+    analytic = night_observability(ra, dec, NYC, moment).row(0)
+
+    assert with_almanac['transit_time'] == analytic['transit_time']
+    assert analytic['observable_hours'] == pytest.approx(with_almanac['observable_hours'], abs=0.05)
+
+
+def test_forecast_only_recommends_objects_up_in_darkness():
+    """Before dusk, objects that set before astronomical darkness are skipped."""
+    location = EarthLocation.from_geodetic(LON * u.deg, LAT * u.deg)
+    early = NEW_YORK.localize(datetime(2024, 1, 20, 17, 0))
+
+    forecast = celestial_module.calculate_nightly_forecast(location, early, limit=200)
+
+    assert forecast['deep_sky']
+    for obj in forecast['deep_sky']:
+        assert obj['observable_hours'] > 0
+        assert obj['transit_alt'] >= obj['altitude'] - 0.1
+        assert obj['rise_time'] is None or obj['rise_time'] < obj['transit_time']
+
+
+def test_telescope_targets_break_ties_by_dark_time():
+    moment = NEW_YORK.localize(datetime(2024, 1, 20, 21, 0))
+    targets = [
+        {'name': 'M 31', 'ra': 10.68, 'dec': 41.27, 'suitability_score': 50.0},
+        {'name': 'M 42', 'ra': 83.82, 'dec': -5.39, 'suitability_score': 50.0},
+        {'name': 'no coordinates', 'suitability_score': 90.0},
+    ]
+
+    ranked = _rank_by_observability(targets, NYC, moment)
+
+    assert [t['name'] for t in ranked] == ['no coordinates', 'M 42', 'M 31']
+    assert ranked[1]['observable_hours'] > ranked[2]['observable_hours'] > 0
+    assert 'observable_hours' not in ranked[0]
@@ -0,0 +1,79 @@
+import math
+from datetime import datetime
+
+import astropy.units as u
+import numpy as np
+import pytest
+import pytz
+import stargazing_core
+from astropy.coordinates import AltAz, EarthLocation, SkyCoord
+from astropy.time import Time
+
+import src.celestial as celestial_module
+from src.observer_frame import STANDARD_ATMOSPHERE, ObserverFrame
+
+NYC = EarthLocation(lat=40.7128 * u.deg, lon=-74.0060 * u.deg, height=10 * u.m)
+RNG = np.random.default_rng(11)
+RA = RNG.uniform(0, 360, 500)
+DEC = RNG.uniform(-89, 89, 500)
+
+
+def _max_error_arcsec(alt, az, reference) -> float:
+    ours = SkyCoord(az * u.deg, alt * u.deg, frame='altaz')
+    theirs = SkyCoord(reference.az, reference.alt, frame='altaz')
+    return float(np.max(ours.separation(theirs).arcsec))
+
+
+@pytest.mark.parametrize('refraction', [False, True])
+def test_matches_astropy_altaz(refraction):
+    times = Time('2024-06-16 02:00:00') + np.arange(5) * 37 * u.min
+    attributes = STANDARD_ATMOSPHERE if refraction else {}
+    reference = SkyCoord(ra=RA * u.deg, dec=DEC * u.deg)[:, np.newaxis].transform_to(
+        AltAz(obstime=times, location=NYC, **attributes)
+    )
+
+    alt, az = ObserverFrame(NYC, times, refraction=refraction).altaz(RA, DEC)
+
+    assert alt.shape == az.shape == (len(RA), len(times))
+    assert _max_error_arcsec(alt, az, reference) < 0.01
+
+
+def test_scalar_time_gives_one_value_per_object():
+    time = Time('2024-01-20 03:00:00')
+    alt, az = ObserverFrame(NYC, time).altaz(RA[:3], DEC[:3])
+
+    assert alt.shape == az.shape == (3,)
+
+
+def test_refraction_lifts_objects_near_the_horizon():
+    time = Time('2024-01-20 03:00:00')
+    plain, _ = ObserverFrame(NYC, time).altaz(RA, DEC)
+    refracted, _ = ObserverFrame(NYC, time, refraction=True).altaz(RA, DEC)
+
+    low = (plain > 1) & (plain < 10)
+    assert low.any()
+    assert np.all(refracted[low] - plain[low] > 0.05)
+
+
+def test_forecast_scoring_matches_core_when_moon_is_down():
+    """Without moon glare the rotation-based scorer reproduces the core scores."""
+    location = EarthLocation(lat=51.5 * u.deg, lon=0.0 * u.deg)
+    time = Time(datetime(2024, 1, 11, 22, 0, tzinfo=pytz.UTC))  # new moon
+    catalog = celestial_module._load_objects()
+    candidate_idx = np.arange(0, len(catalog), 7)
+    candidates = catalog.rows(candidate_idx)
+    moon = celestial_module.get_ephemeris_cache().body('moon', time)
+
+    expected = stargazing_core.score_deep_sky_objects(candidates, time, location, moon, 0.0)
+    result = celestial_module._score_deep_sky_objects(catalog, candidate_idx, time, location, 0.0)
+
+    # Same objects and scores; the core's order is undefined around NaN scores
+    # (no magnitude), which we rank last.
+    theirs = {obj['name']: obj for obj in expected}
+    assert sorted(obj['name'] for obj in result) == sorted(theirs)
+    for ours in result:
+        assert ours['score'] == pytest.approx(theirs[ours['name']]['score'], abs=1e-6, nan_ok=True)
+        assert ours['altitude'] == pytest.approx(theirs[ours['name']]['altitude'], abs=0.1)
+    unknown = [math.isnan(obj['score']) for obj in result]
+    known = [obj['score'] for obj in result if not math.isnan(obj['score'])]
+    assert unknown == sorted(unknown) and known == sorted(known)
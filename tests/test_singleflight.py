@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.singleflight import SingleFlight, single_flight, single_flight_stats
+
+
+def test_concurrent_threads_share_one_call():
+    group = SingleFlight('test')
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(2.0)
+        return {'answer': 42}
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(group.do, 'key', slow) for _ in range(5)]
+        while group.stats()['calls'] < 5:
+            time.sleep(0.005)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert group.stats() == {'calls': 5, 'coalesced': 4, 'in_flight': 0}
+
+
+def test_failure_reaches_every_waiter_and_releases_the_key():
+    group = SingleFlight('test')
+    release = threading.Event()
+
+    def failing():
+        release.wait(2.0)
+        raise ValueError('upstream down')
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(group.do, 'key', failing) for _ in range(3)]
+        while group.stats()['calls'] < 3:
+            time.sleep(0.005)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError, match='upstream down'):
+                future.result()
+
+    assert group.do('key', lambda: 'recovered') == 'recovered'
+
+
+@pytest.mark.asyncio
+async def test_concurrent_coroutines_share_one_call():
+    group = SingleFlight('test')
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'result'
+
+    results = await asyncio.gather(*(group.do_async(('lat', 'lon'), fetch) for _ in range(10)))
+
+    assert results == ['result'] * 10
+    assert len(calls) == 1
+    assert group.stats()['coalesced'] == 9
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_the_shared_call():
+    group = SingleFlight('test')
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return 'done'
+
+    leader = asyncio.ensure_future(group.do_async('key', fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(group.do_async('key', fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 'done'
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_blocking_caller_joins_an_async_call_in_flight():
+    group = SingleFlight('test')
+    started = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        await asyncio.sleep(0.05)
+        return 'shared'
+
+    leader = asyncio.ensure_future(group.do_async('key', fetch))
+    await started.wait()
+    joined = await asyncio.to_thread(group.do, 'key', lambda: 'not called')
+
+    assert (await leader, joined) == ('shared', 'shared')
+    assert group.stats()['coalesced'] == 1
+
+
+def test_named_groups_are_process_wide():
+    assert single_flight('test-registry') is single_flight('test-registry')
+    assert 'test-registry' in single_flight_stats()
@@ -197,8 +197,9 @@ def test_missing_api_key_error():
     assert 'QWEATHER_API_KEY' in error.message
 
 
-@patch('src.functions.weather.impl.get_aggregated_weather_by_name')
-def test_weather_api_error_handling(mock_service):
+@patch('src.functions.weather.impl.get_aggregated_weather_by_name_async')
+@pytest.mark.asyncio
+async def test_weather_api_error_handling(mock_service):
     """Test that weather API errors return structured error responses."""
     mock_service.side_effect = MCPError(
         MCPError.EXTERNAL_API_ERROR,
@@ -206,7 +207,7 @@ def test_weather_api_error_handling(mock_service):
         {'place_name': 'Test City'},
     )
 
-    result = get_weather_by_name.fn('Test City')
+    result = await get_weather_by_name.fn('Test City')
 
     assert 'error' in result
     assert '_meta' in result
@@ -215,9 +216,10 @@ def test_weather_api_error_handling(mock_service):
     assert result['error']['details']['place_name'] == 'Test City'
 
 
-@patch('src.retry.time.sleep')  # Mock sleep to speed up test
-@patch('src.functions.weather.impl.get_aggregated_weather_by_name')
-def test_weather_retry_logic(mock_service, mock_sleep):
+@patch('src.retry.asyncio.sleep')  # Mock sleep to speed up test
+@patch('src.functions.weather.impl.get_aggregated_weather_by_name_async')
+@pytest.mark.asyncio
+async def test_weather_retry_logic(mock_service, mock_sleep):
     """Test that weather functions retry on network errors and eventually succeed."""
     # First two calls fail with network error, third succeeds
     mock_service.side_effect = [
@@ -235,7 +237,7 @@ def test_weather_retry_logic(mock_service, mock_sleep):
         },
     ]
 
-    result = get_weather_by_name.fn('Test City')
+    result = await get_weather_by_name.fn('Test City')
 
     # Should have been called 3 times (initial + 2 retries)
     assert mock_service.call_count == 3
@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+
+from src import warmup
+from src.warmup import WarmupState, resolve_warmup_mode, run_warmup, start_warmup
+
+
+def test_new_state_is_ready_when_warmup_is_disabled():
+    state = WarmupState()
+
+    assert state.ready
+    assert state.snapshot() == {
+        'ready': True,
+        'status': 'disabled',
+        'total_seconds': None,
+        'steps': [],
+    }
+
+
+def test_run_warmup_records_each_step_in_order():
+    calls = []
+    state = WarmupState()
+    state.mark_pending()
+    assert not state.ready
+
+    run_warmup(
+        state, steps=(('first', lambda: calls.append(1)), ('second', lambda: calls.append(2)))
+    )
+
+    snapshot = state.snapshot()
+    assert calls == [1, 2]
+    assert snapshot['ready'] is True
+    assert snapshot['status'] == 'complete'
+    assert [step['name'] for step in snapshot['steps']] == ['first', 'second']
+    assert all(step['seconds'] >= 0 and step['error'] is None for step in snapshot['steps'])
+    assert snapshot['total_seconds'] >= 0
+
+
+def test_failed_step_is_recorded_and_later_steps_still_run():
+    calls = []
+
+    def broken():
+        raise OSError('IERS download failed')
+
+    state = run_warmup(
+        WarmupState(), steps=(('iers', broken), ('catalogs', lambda: calls.append('catalogs')))
+    )
+
+    steps = state.snapshot()['steps']
+    assert steps[0]['error'] == 'OSError: IERS download failed'
+    assert calls == ['catalogs']
+    assert state.ready
+
+
+def test_default_steps_warm_the_real_caches():
+    state = run_warmup(WarmupState())
+
+    steps = state.snapshot()['steps']
+    assert [step['name'] for step in steps] == [name for name, _ in warmup.WARMUP_STEPS]
+    assert all(step['error'] is None for step in steps)
+
+
+class TestResolveWarmupMode:
+    def test_defaults_to_off(self, monkeypatch):
+        monkeypatch.delenv('STARGAZING_WARMUP', raising=False)
+        assert resolve_warmup_mode() == 'off'
+
+    def test_reads_environment(self, monkeypatch):
+        monkeypatch.setenv('STARGAZING_WARMUP', 'Background')
+        assert resolve_warmup_mode() == 'background'
+        assert resolve_warmup_mode('blocking') == 'blocking'
+
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError, match='warm-up mode'):
+            resolve_warmup_mode('eager')
+
+
+class TestStartWarmup:
+    def test_off_leaves_state_untouched(self, monkeypatch):
+        monkeypatch.setattr(warmup, 'run_warmup', lambda state: pytest.fail('should not run'))
+        state = WarmupState()
+
+        assert start_warmup('off', state) == 'off'
+        assert state.status == 'disabled'
+
+    def test_blocking_completes_before_returning(self, monkeypatch):
+        monkeypatch.setattr(warmup, 'run_warmup', lambda state: state._set_status('complete'))
+        state = WarmupState()
+
+        start_warmup('blocking', state)
+        assert state.ready
+
+    def test_background_reports_not_ready_until_done(self, monkeypatch):
+        release = threading.Event()
+        finished = threading.Event()
+
+        def slow_run(state):
+            release.wait(timeout=5)
+            state._set_status('complete')
+            finished.set()
+
+        monkeypatch.setattr(warmup, 'run_warmup', slow_run)
+        state = WarmupState()
+
+        assert start_warmup('background', state) == 'background'
+        assert not state.ready
+        release.set()
+        assert finished.wait(timeout=5)
+        assert state.ready
@@ -20,7 +20,8 @@ def test_get_weather_by_name_no_api_key():
             _get_qweather_auth_from_env()
 
 
-def test_get_weather_by_name_success():
+@pytest.mark.asyncio
+async def test_get_weather_by_name_success():
     aggregated_result = {
         'location': {'name': 'Beijing', 'lat': 39.9, 'lon': 116.4, 'timezone': 'Asia/Shanghai'},
         'summary': {
@@ -35,9 +36,9 @@ def test_get_weather_by_name_success():
             'failed_providers': [],
         },
     }
-    with patch('src.functions.weather.impl.get_aggregated_weather_by_name') as mock_service:
+    with patch('src.functions.weather.impl.get_aggregated_weather_by_name_async') as mock_service:
         mock_service.return_value = aggregated_result
-        result = get_weather_by_name.fn('Beijing')
+        result = await get_weather_by_name.fn('Beijing')
 
         assert 'data' in result
         assert result['data'] == aggregated_result
@@ -45,7 +46,8 @@ def test_get_weather_by_name_success():
         mock_service.assert_called_with('Beijing', provider='all')
 
 
-def test_get_weather_by_position_success():
+@pytest.mark.asyncio
+async def test_get_weather_by_position_success():
     aggregated_result = {
         'location': {'name': None, 'lat': 40.0, 'lon': 116.0, 'timezone': 'Asia/Shanghai'},
         'summary': {
@@ -60,46 +62,53 @@ def test_get_weather_by_position_success():
             'failed_providers': [],
         },
     }
-    with patch('src.functions.weather.impl.get_aggregated_weather_by_position') as mock_service:
+    with patch(
+        'src.functions.weather.impl.get_aggregated_weather_by_position_async'
+    ) as mock_service:
         mock_service.return_value = aggregated_result
-        result = get_weather_by_position.fn(40.0, 116.0)
+        result = await get_weather_by_position.fn(40.0, 116.0)
 
         assert 'data' in result
         assert result['data'] == aggregated_result
         mock_service.assert_called_with(40.0, 116.0, provider='all')
 
 
-def test_get_weather_by_name_mcperror_returns_structured_error():
-    with patch('src.functions.weather.impl.get_aggregated_weather_by_name') as mock_service:
+@pytest.mark.asyncio
+async def test_get_weather_by_name_mcperror_returns_structured_error():
+    with patch('src.functions.weather.impl.get_aggregated_weather_by_name_async') as mock_service:
         mock_service.side_effect = MCPError(
             MCPError.API_TIMEOUT,
             'provider timeout',
             {'place_name': 'Beijing'},
         )
 
-        result = get_weather_by_name.fn('Beijing')
+        result = await get_weather_by_name.fn('Beijing')
 
     assert result['_meta']['status'] == 'error'
     assert result['error']['code'] == MCPError.API_TIMEOUT
     assert result['error']['details']['place_name'] == 'Beijing'
 
 
-def test_get_weather_by_position_mcperror_returns_structured_error():
-    with patch('src.functions.weather.impl.get_aggregated_weather_by_position') as mock_service:
+@pytest.mark.asyncio
+async def test_get_weather_by_position_mcperror_returns_structured_error():
+    with patch(
+        'src.functions.weather.impl.get_aggregated_weather_by_position_async'
+    ) as mock_service:
         mock_service.side_effect = MCPError(
             MCPError.API_RATE_LIMIT,
             'provider rate limited',
             {'lat': 40.0, 'lon': 116.0},
         )
 
-        result = get_weather_by_position.fn(40.0, 116.0)
+        result = await get_weather_by_position.fn(40.0, 116.0)
 
     assert result['_meta']['status'] == 'error'
     assert result['error']['code'] == MCPError.API_RATE_LIMIT
     assert result['error']['details'] == {'lat': 40.0, 'lon': 116.0}
 
 
-def test_get_weather_by_name_aggregated_model_is_dumped():
+@pytest.mark.asyncio
+async def test_get_weather_by_name_aggregated_model_is_dumped():
     aggregated_result = AggregatedWeatherResponse(
         location={'name': 'Beijing', 'lat': 39.9, 'lon': 116.4, 'timezone': 'Asia/Shanghai'},
         summary={'current': {'temperature_c': 20.0}, 'daily': [], 'hourly': []},
@@ -111,15 +120,16 @@ def test_get_weather_by_name_aggregated_model_is_dumped():
         },
     )
 
-    with patch('src.functions.weather.impl.get_aggregated_weather_by_name') as mock_service:
+    with patch('src.functions.weather.impl.get_aggregated_weather_by_name_async') as mock_service:
         mock_service.return_value = aggregated_result
-        result = get_weather_by_name.fn('Beijing')
+        result = await get_weather_by_name.fn('Beijing')
 
     assert result['_meta']['status'] == 'success'
     assert result['data'] == aggregated_result.model_dump()
 
 
-def test_get_weather_by_position_aggregated_model_is_dumped():
+@pytest.mark.asyncio
+async def test_get_weather_by_position_aggregated_model_is_dumped():
     aggregated_result = AggregatedWeatherResponse(
         location={'name': None, 'lat': 40.0, 'lon': 116.0, 'timezone': 'Asia/Shanghai'},
         summary={'current': {'temperature_c': 18.0}, 'daily': [], 'hourly': []},
@@ -131,9 +141,11 @@ def test_get_weather_by_position_aggregated_model_is_dumped():
         },
     )
 
-    with patch('src.functions.weather.impl.get_aggregated_weather_by_position') as mock_service:
+    with patch(
+        'src.functions.weather.impl.get_aggregated_weather_by_position_async'
+    ) as mock_service:
         mock_service.return_value = aggregated_result
-        result = get_weather_by_position.fn(40.0, 116.0)
+        result = await get_weather_by_position.fn(40.0, 116.0)
 
     assert result['_meta']['status'] == 'success'
     assert result['data'] == aggregated_result.model_dump()
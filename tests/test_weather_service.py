@@ -1,6 +1,20 @@
+import asyncio
+import time
 from unittest.mock import patch
 
-from src.functions.weather.service import get_aggregated_weather_by_position
+import httpx
+import pytest
+
+from src.functions.weather import service
+from src.functions.weather.impl import get_weather_by_position
+from src.functions.weather.providers import open_meteo, qweather
+from src.functions.weather.service import (
+    WeatherCache,
+    create_weather_cache,
+    get_aggregated_weather_by_position,
+    get_aggregated_weather_by_position_async,
+)
+from src.qweather_interaction import qweather_get_weather_by_position
 from src.response import MCPError
 from src.schemas.weather import (
     CurrentWeather,
@@ -13,6 +27,17 @@ from src.schemas.weather import (
 )
 
 
+@pytest.fixture(autouse=True)
+def weather_cache(monkeypatch):
+    """A fresh cache on a controllable clock (``cache.clock['now']``) for every test."""
+    clock = {'now': 1_750_000_000.0}  # 15:06:40 UTC
+    cache = WeatherCache(clock=lambda: clock['now'])
+    cache.clock = clock
+    monkeypatch.setattr(service, '_weather_cache', cache)
+    monkeypatch.setattr(service, '_weather_cache_ready', True)
+    return cache
+
+
 def test_aggregated_weather_by_position_uses_open_meteo_hourly_first():
     open_meteo_result = ProviderSuccess(
         provider='open-meteo',
@@ -35,15 +60,16 @@ def test_aggregated_weather_by_position_uses_open_meteo_hourly_first():
 
     with (
         patch(
-            'src.functions.weather.service.open_meteo.get_weather_by_position',
+            'src.functions.weather.service.open_meteo.get_weather_by_position_async',
             return_value=open_meteo_result,
         ),
         patch(
-            'src.functions.weather.service.qweather.get_weather_by_position',
+            'src.functions.weather.service.qweather.get_weather_by_position_async',
             side_effect=Exception('should not be called'),
         ),
         patch(
-            'src.functions.weather.service.wttr.get_weather_by_position', return_value=wttr_result
+            'src.functions.weather.service.wttr.get_weather_by_position_async',
+            return_value=wttr_result,
         ),
     ):
         result = get_aggregated_weather_by_position(
@@ -68,15 +94,15 @@ def test_aggregated_weather_by_position_keeps_partial_provider_failures():
 
     with (
         patch(
-            'src.functions.weather.service.open_meteo.get_weather_by_position',
+            'src.functions.weather.service.open_meteo.get_weather_by_position_async',
             return_value=open_meteo_result,
         ),
         patch(
-            'src.functions.weather.service.qweather.get_weather_by_position',
+            'src.functions.weather.service.qweather.get_weather_by_position_async',
             side_effect=Exception('qweather down'),
         ),
         patch(
-            'src.functions.weather.service.wttr.get_weather_by_position',
+            'src.functions.weather.service.wttr.get_weather_by_position_async',
             side_effect=Exception('wttr down'),
         ),
     ):
@@ -100,15 +126,15 @@ def test_aggregated_weather_handles_mcperror_from_provider():
 
     with (
         patch(
-            'src.functions.weather.service.open_meteo.get_weather_by_position',
+            'src.functions.weather.service.open_meteo.get_weather_by_position_async',
             return_value=open_meteo_result,
         ),
         patch(
-            'src.functions.weather.service.qweather.get_weather_by_position',
+            'src.functions.weather.service.qweather.get_weather_by_position_async',
             side_effect=MCPError(MCPError.CONFIGURATION_ERROR, 'Bad API key', {'key': 'x'}),
         ),
         patch(
-            'src.functions.weather.service.wttr.get_weather_by_position',
+            'src.functions.weather.service.wttr.get_weather_by_position_async',
             side_effect=Exception('wttr down'),
         ),
     ):
@@ -120,3 +146,301 @@ def test_aggregated_weather_handles_mcperror_from_provider():
     qw = result.providers['qweather']
     assert isinstance(qw, ProviderError)
     assert qw.error.code == 'CONFIGURATION_ERROR'
+
+
+@pytest.mark.asyncio
+async def test_async_aggregation_queries_providers_concurrently():
+    def provider(name: str):
+        async def fetch(lat, lon, location_name=None, timezone=None):
+            await asyncio.sleep(0.2)
+            return ProviderSuccess(
+                provider=name,
+                data=NormalizedWeatherData(
+                    location=LocationInfo(name=None, lat=lat, lon=lon, timezone=None),
+                    current=CurrentWeather(temperature_c=20.0),
+                    daily=[],
+                    hourly=[],
+                ),
+            )
+
+        return fetch
+
+    with (
+        patch(
+            'src.functions.weather.service.open_meteo.get_weather_by_position_async',
+            provider('open-meteo'),
+        ),
+        patch(
+            'src.functions.weather.service.qweather.get_weather_by_position_async',
+            provider('qweather'),
+        ),
+        patch(
+            'src.functions.weather.service.wttr.get_weather_by_position_async',
+            provider('wttr'),
+        ),
+    ):
+        started = time.perf_counter()
+        result = await get_aggregated_weather_by_position_async(40.0, 116.0)
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert list(result.providers) == ['open-meteo', 'qweather', 'wttr']
+
+
+@pytest.mark.asyncio
+async def test_async_provider_maps_http_errors_like_the_sync_path():
+    request = httpx.Request('GET', open_meteo.OPEN_METEO_URL)
+
+    with (
+        patch(
+            'src.functions.weather.providers.open_meteo.async_http_get',
+            return_value=httpx.Response(503, request=request),
+        ),
+        pytest.raises(MCPError) as excinfo,
+    ):
+        await open_meteo.fetch_open_meteo_raw_weather_async(40.0, 116.0)
+
+    assert excinfo.value.code == MCPError.EXTERNAL_API_ERROR
+    assert excinfo.value.details['status_code'] == 503
+
+
+def _open_meteo_only(temperature_c: float):
+    return _provider_result('open-meteo', temperature_c)
+
+
+def _provider_result(provider: str, temperature_c: float):
+    return ProviderSuccess(
+        provider=provider,
+        data=NormalizedWeatherData(
+            location=LocationInfo(name=None, lat=40.0, lon=116.0, timezone='Asia/Shanghai'),
+            current=CurrentWeather(temperature_c=temperature_c),
+            daily=[],
+            hourly=[],
+        ),
+    )
+
+
+def _patch_open_meteo(*results):
+    return patch(
+        'src.functions.weather.service.open_meteo.get_weather_by_position_async',
+        side_effect=list(results),
+    )
+
+
+class TestWeatherCache:
+    @pytest.mark.asyncio
+    async def test_repeat_query_in_the_same_cell_is_served_from_cache(self, weather_cache):
+        with _patch_open_meteo(_open_meteo_only(21.0)) as provider:
+            first = await get_aggregated_weather_by_position_async(40.0, 116.0, 'open-meteo')
+            weather_cache.clock['now'] += 600
+            second = await get_aggregated_weather_by_position_async(40.01, 116.02, 'open-meteo')
+
+        assert provider.call_count == 1
+        assert first.cache.hit is False
+        assert second.cache.hit is True
+        assert second.cache.age_seconds == 600.0
+        relabelled = second.providers['open-meteo'].data.location
+        assert (relabelled.lat, relabelled.lon) == (40.01, 116.02)
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_served_stale_and_refreshed(self, weather_cache):
+        with patch(
+            'src.functions.weather.service.wttr.get_weather_by_position_async',
+            side_effect=[_provider_result('wttr', 21.0), _provider_result('wttr', 17.0)],
+        ) as provider:
+            await get_aggregated_weather_by_position_async(40.0, 116.0, 'wttr')
+            weather_cache.clock['now'] += 1860  # past wttr's 30 min TTL, same hour
+
+            stale = await get_aggregated_weather_by_position_async(40.0, 116.0, 'wttr')
+            await weather_cache.drain()
+            fresh = await get_aggregated_weather_by_position_async(40.0, 116.0, 'wttr')
+
+        assert provider.call_count == 2
+        assert stale.cache.stale is True
+        assert stale.cache.age_seconds == 1860.0
+        assert stale.summary.current['temperature_c'] == 21.0
+        assert fresh.cache.hit is True and fresh.cache.stale is False
+        assert fresh.summary.current['temperature_c'] == 17.0
+
+    @pytest.mark.asyncio
+    async def test_previous_hour_is_served_stale_after_the_hour_rolls_over(self, weather_cache):
+        with _patch_open_meteo(_open_meteo_only(21.0), _open_meteo_only(19.0)) as provider:
+            await get_aggregated_weather_by_position_async(40.0, 116.0, 'open-meteo')
+            weather_cache.clock['now'] += 3600  # next UTC hour, new cache key
+            rolled = await get_aggregated_weather_by_position_async(40.0, 116.0, 'open-meteo')
+            await weather_cache.drain()
+
+        assert rolled.cache.providers['open-meteo'].status == 'stale'
+        assert provider.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_too_old_entries_and_failures_are_not_served(self, weather_cache):
+        with (
+            _patch_open_meteo(_open_meteo_only(21.0), _open_meteo_only(18.0)) as provider,
+            patch(
+                'src.functions.weather.service.wttr.get_weather_by_position_async',
+                side_effect=Exception('wttr down'),
+            ) as wttr_provider,
+        ):
+            await get_aggregated_weather_by_position_async(40.0, 116.0, 'open-meteo')
+            with pytest.raises(MCPError):
+                await get_aggregated_weather_by_position_async(40.0, 116.0, 'wttr')
+            weather_cache.clock['now'] += 3 * 3600
+            result = await get_aggregated_weather_by_position_async(40.0, 116.0, 'open-meteo')
+
+        assert provider.call_count == 2
+        assert result.cache.hit is False
+        assert wttr_provider.call_count == 1
+        assert weather_cache.lookup('wttr', 40.0, 116.0).status == 'miss'
+
+    @pytest.mark.asyncio
+    async def test_tool_reports_cache_age_in_meta(self, weather_cache):
+        with _patch_open_meteo(_open_meteo_only(21.0)):
+            await get_weather_by_position.fn(40.0, 116.0, provider='open-meteo')
+            weather_cache.clock['now'] += 90
+            response = await get_weather_by_position.fn(40.0, 116.0, provider='open-meteo')
+
+        assert response['_meta']['cache']['hit'] is True
+        assert response['_meta']['cache']['age_seconds'] == 90.0
+        assert 'cache' not in response['data']
+
+    def test_create_reads_environment(self, monkeypatch):
+        monkeypatch.setenv('STARGAZING_WEATHER_TTL_WTTR', '600')
+        monkeypatch.setenv('STARGAZING_WEATHER_MAX_STALE_SECONDS', '0')
+
+        cache = create_weather_cache()
+
+        assert cache.ttl_seconds['wttr'] == 600.0
+        assert cache.max_stale_seconds == 0.0
+
+        monkeypatch.setenv('STARGAZING_WEATHER_CACHE_SIZE', '0')
+        assert create_weather_cache() is None
+
+    @pytest.mark.parametrize(
+        ('name', 'value'),
+        [
+            ('STARGAZING_WEATHER_CACHE_SIZE', 'big'),
+            ('STARGAZING_WEATHER_CACHE_SIZE', '-1'),
+            ('STARGAZING_WEATHER_TTL_OPEN_METEO', '0'),
+            ('STARGAZING_WEATHER_TTL_QWEATHER', 'hourly'),
+            ('STARGAZING_WEATHER_MAX_STALE_SECONDS', '-60'),
+        ],
+    )
+    def test_create_rejects_invalid_environment(self, monkeypatch, name, value):
+        monkeypatch.setenv(name, value)
+
+        with pytest.raises(ValueError, match=name):
+            create_weather_cache()
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_queries_share_one_upstream_round():
+    async def slow_open_meteo(lat, lon, location_name=None, timezone=None):
+        await asyncio.sleep(0.05)
+        return _open_meteo_only(20.0)
+
+    with patch(
+        'src.functions.weather.service.open_meteo.get_weather_by_position_async',
+        side_effect=slow_open_meteo,
+    ) as provider:
+        results = await asyncio.gather(
+            *(
+                get_aggregated_weather_by_position_async(40.0, 116.0, 'open-meteo')
+                for _ in range(5)
+            ),
+            asyncio.to_thread(get_aggregated_weather_by_position, 40.0, 116.0, 'open-meteo'),
+        )
+
+    assert provider.call_count == 1
+    assert all(result.summary.current['temperature_c'] == 20.0 for result in results)
+
+
+class TestQWeatherEndpoints:
+    PAYLOADS = {
+        'now': {'now': {'temp': '18', 'text': 'Clear'}},
+        '10d': {'daily': [{'fxDate': '2024-05-01', 'tempMin': '9', 'tempMax': '21'}]},
+        '24h': {'hourly': [{'fxTime': '2024-05-01T22:00+08:00', 'temp': '15'}]},
+    }
+
+    @pytest.fixture(autouse=True)
+    def credentials(self, monkeypatch):
+        monkeypatch.setenv('QWEATHER_API_KEY', 'test-key')
+        monkeypatch.setenv('QWEATHER_API_HOST', 'example.qweatherapi.com')
+
+    def _patch_endpoints(self, failures=(), delay=0.0):
+        async def fetch(endpoint, lon, lat, api_token, *, api_host=None, jwt_token=None):
+            await asyncio.sleep(delay)
+            if endpoint in failures:
+                raise MCPError(
+                    MCPError.API_TIMEOUT, f'{endpoint} timed out', {'endpoint': endpoint}
+                )
+            return self.PAYLOADS[endpoint]
+
+        return patch(
+            'src.functions.weather.providers.qweather.qweather_get_weather_by_coord_async',
+            side_effect=fetch,
+        )
+
+    @pytest.mark.asyncio
+    async def test_endpoints_are_requested_concurrently(self):
+        with self._patch_endpoints(delay=0.1) as fetch:
+            started = time.perf_counter()
+            result = await qweather.get_weather_by_position_async(40.0, 116.0)
+            elapsed = time.perf_counter() - started
+
+        assert {call.args[0] for call in fetch.call_args_list} == {'now', '10d', '24h'}
+        assert elapsed < 0.25
+        assert result.data.current.temperature_c == 18.0
+        assert len(result.data.daily) == len(result.data.hourly) == 1
+        assert result.partial_errors == {}
+
+    @pytest.mark.asyncio
+    async def test_daily_failure_keeps_current_conditions(self):
+        with self._patch_endpoints(failures={'10d'}):
+            result = await qweather.get_weather_by_position_async(40.0, 116.0)
+
+        assert result.data.current.temperature_c == 18.0
+        assert result.data.daily == []
+        assert len(result.data.hourly) == 1
+        assert list(result.partial_errors) == ['daily']
+        assert result.partial_errors['daily'].code == MCPError.API_TIMEOUT
+        assert result.partial_errors['daily'].details == {'endpoint': '10d'}
+
+    @pytest.mark.asyncio
+    async def test_all_endpoints_failing_raises(self):
+        with self._patch_endpoints(failures={'now', '10d', '24h'}):
+            with pytest.raises(MCPError, match='now timed out'):
+                await qweather.get_weather_by_position_async(40.0, 116.0)
+
+    @pytest.mark.asyncio
+    async def test_partial_results_are_not_cached(self):
+        with (
+            self._patch_endpoints(failures={'24h'}),
+            patch(
+                'src.functions.weather.service.open_meteo.get_weather_by_position_async',
+                side_effect=Exception('open-meteo down'),
+            ),
+            patch(
+                'src.functions.weather.service.wttr.get_weather_by_position_async',
+                side_effect=Exception('wttr down'),
+            ),
+        ):
+            result = await get_aggregated_weather_by_position_async(40.0, 116.0)
+
+        assert result.providers['qweather'].partial_errors['hourly'].code == MCPError.API_TIMEOUT
+        assert service.get_weather_cache().stats()['size'] == 0
+
+    def test_legacy_helper_returns_current_when_ten_day_fails(self):
+        async def fetch(api, api_token, *, jwt_token=None):
+            if '/10d' in api:
+                raise MCPError(MCPError.API_RATE_LIMIT, 'slow down')
+            return self.PAYLOADS['now']
+
+        with patch('src.qweather_interaction.fetch_gzipped_json_async', side_effect=fetch):
+            result = qweather_get_weather_by_position(
+                40.0, 116.0, 'test-key', api_host='example.qweatherapi.com'
+            )
+
+        assert result['real_time'] == self.PAYLOADS['now']
+        assert result['ten_days_forcasts'] is None
+        assert result['errors']['ten_days_forcasts']['code'] == MCPError.API_RATE_LIMIT